@@ -54,11 +54,14 @@ class AllocationParadigm(PydanticEnum):
                       until the sum of assets among all received allocations is sufficient
         ROUND_ROBIN - obtain allocations of assets from available resource nodes in a round-robin manner
         SINGLE_NODE - require all allocation of assets to be from a single resource/host
+        BEST_FIT    - obtain allocations from the resources the assets fit most tightly, packing all pending requests
+                      together (largest first) to leave as few assets stranded as possible
     """
 
     FILL_NODES = 0
     ROUND_ROBIN = 1
     SINGLE_NODE = 2
+    BEST_FIT = 3
 
     @classmethod
     def get_default_selection(cls) -> AllocationParadigm:
@@ -0,0 +1,312 @@
+"""
+Defines an on-disk cache for the frames produced by retrievers so that the same inputs aren't parsed for every
+evaluation
+
+The cache is opt-in and is configured through the environment:
+
+    EVALUATION_CACHE_DIRECTORY: The directory to store retrieved frames in. Nothing is cached if this isn't set
+    EVALUATION_CACHE_LIMIT: The maximum number of megabytes the cache may hold before the least recently used
+        frames are removed. Defaults to 1024
+
+Frames are stored as Parquet when pyarrow is installed so that they may be memory mapped when they are loaded again;
+they are pickled otherwise, or when they can't be represented in Parquet. Entries are keyed by the retriever, its
+specification, and the path, size, and modification time of every file it reads, so changing any of those produces a
+new entry.
+"""
+import typing
+import os
+import json
+import hashlib
+import logging
+
+import pandas
+
+from . import retrieval
+from . import util
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+util.configure_logging()
+
+CACHE_DIRECTORY_VARIABLE = "EVALUATION_CACHE_DIRECTORY"
+CACHE_LIMIT_VARIABLE = "EVALUATION_CACHE_LIMIT"
+DEFAULT_CACHE_LIMIT = 1024
+"""The default number of megabytes that the cache may hold"""
+
+CACHE_VERSION = 1
+"""The version of the layout of cached frames; changing this invalidates every existing entry"""
+
+PARQUET_EXTENSION = ".parquet"
+PICKLE_EXTENSION = ".pickle"
+
+
+class RetrievalCache:
+    """
+    A size bounded, least recently used store of frames produced by retrievers
+    """
+    def __init__(self, directory: typing.Union[str, os.PathLike], size_limit: int = None):
+        """
+        Constructor
+
+        Args:
+            directory: Where the cached frames are stored
+            size_limit: The maximum number of bytes the cache may hold. Defaults to 1024 megabytes
+        """
+        self.__directory = str(directory)
+        self.__size_limit = size_limit if size_limit is not None else DEFAULT_CACHE_LIMIT * 1024 * 1024
+        os.makedirs(self.__directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """
+        Where the cached frames are stored
+        """
+        return self.__directory
+
+    @property
+    def size_limit(self) -> int:
+        """
+        The maximum number of bytes the cache may hold
+        """
+        return self.__size_limit
+
+    @property
+    def extension(self) -> str:
+        """
+        The extension of the files that new entries are written to
+        """
+        return PARQUET_EXTENSION if pyarrow is not None else PICKLE_EXTENSION
+
+    @staticmethod
+    def get_key(retriever: retrieval.Retriever) -> typing.Optional[str]:
+        """
+        Create an identifier for what a retriever will produce
+
+        Args:
+            retriever: The retriever whose output may be cached
+
+        Returns:
+            An identifier for the retriever's output; None if its sources aren't files that may be checked for changes
+        """
+        sources = retriever.backend.sources
+
+        if not sources:
+            return None
+
+        source_details = list()
+
+        for source in sorted(str(source) for source in sources):
+            if not os.path.isfile(source):
+                return None
+
+            details = os.stat(source)
+            source_details.append([os.path.abspath(source), details.st_size, details.st_mtime_ns])
+
+        key_data = {
+            "version": CACHE_VERSION,
+            "retriever": f"{retriever.__class__.__module__}.{retriever.__class__.__qualname__}",
+            "definition": retriever.definition.to_dict(),
+            "sources": source_details,
+        }
+
+        serialized_key = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized_key.encode()).hexdigest()
+
+    def get_path(self, key: str, extension: str = None) -> str:
+        """
+        Args:
+            key: The identifier for an entry
+            extension: The extension of the file. Defaults to the extension for new entries
+
+        Returns:
+            The path to where the entry is stored
+        """
+        return os.path.join(self.__directory, key + (extension or self.extension))
+
+    def load(self, key: str) -> typing.Optional[pandas.DataFrame]:
+        """
+        Load a cached frame
+
+        Args:
+            key: The identifier for the frame
+
+        Returns:
+            The cached frame; None if there isn't one
+        """
+        for extension in (PARQUET_EXTENSION, PICKLE_EXTENSION):
+            path = self.get_path(key, extension)
+
+            if not os.path.exists(path):
+                continue
+
+            if extension == PARQUET_EXTENSION and pyarrow is None:
+                continue
+
+            try:
+                if extension == PARQUET_EXTENSION:
+                    frame = pyarrow.parquet.read_table(path, memory_map=True).to_pandas()
+                else:
+                    frame = pandas.read_pickle(path)
+            except Exception as exception:
+                logging.warning(
+                    f"Could not load the cached frame at '{path}'; it will be retrieved again",
+                    exc_info=exception
+                )
+                self.remove(key)
+                return None
+
+            # Touching the file marks it as recently used so that it is among the last to be evicted
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                # Another process evicted it after it was read
+                pass
+
+            return frame
+
+        return None
+
+    def store(self, key: str, frame: pandas.DataFrame):
+        """
+        Add a frame to the cache, removing the least recently used frames if the cache grows too large
+
+        Frames that can't be represented in Parquet, such as those with columns of arbitrary objects, are pickled
+        instead
+
+        Args:
+            key: The identifier for the frame
+            frame: The frame to store
+        """
+        extensions = [PARQUET_EXTENSION, PICKLE_EXTENSION] if pyarrow is not None else [PICKLE_EXTENSION]
+
+        for extension in extensions:
+            path = self.get_path(key, extension)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+
+            try:
+                if extension == PARQUET_EXTENSION:
+                    frame.to_parquet(temporary_path, engine="pyarrow")
+                else:
+                    frame.to_pickle(temporary_path)
+
+                # Entries are moved into place all at once so other processes never see a partially written frame
+                os.replace(temporary_path, path)
+                break
+            except Exception as exception:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+                if extension != extensions[-1]:
+                    logging.debug(f"Could not store a frame as '{path}'; it will be stored in another format")
+                    continue
+
+                logging.warning(f"Could not add a frame to the cache at '{path}'", exc_info=exception)
+                return
+
+        self.evict()
+
+    def remove(self, key: str):
+        """
+        Remove an entry from the cache
+
+        Args:
+            key: The identifier for the entry to remove
+        """
+        for extension in (PARQUET_EXTENSION, PICKLE_EXTENSION):
+            path = self.get_path(key, extension)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits within its size limit
+        """
+        entries: typing.List[typing.Tuple[int, int, str]] = list()
+
+        for entry in os.scandir(self.__directory):
+            if not entry.is_file() or not entry.name.endswith((PARQUET_EXTENSION, PICKLE_EXTENSION)):
+                continue
+
+            details = entry.stat()
+            entries.append((details.st_mtime_ns, details.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.__size_limit:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another process already removed it
+                pass
+
+            total_size -= size
+
+    def retrieve(self, retriever: retrieval.Retriever, *args, **kwargs) -> pandas.DataFrame:
+        """
+        Get the output of a retriever, reading it from the cache if it has been stored
+
+        Args:
+            retriever: The retriever that produces the frame
+            *args: Positional arguments for the retriever
+            **kwargs: Keyword arguments for the retriever
+
+        Returns:
+            The frame produced by the retriever
+        """
+        key = self.get_key(retriever)
+
+        if key is None:
+            return retriever.retrieve(*args, **kwargs)
+
+        frame = self.load(key)
+
+        if frame is not None:
+            return frame
+
+        frame = retriever.retrieve(*args, **kwargs)
+
+        if isinstance(frame, pandas.DataFrame):
+            self.store(key, frame)
+
+        return frame
+
+
+def get_cache() -> typing.Optional[RetrievalCache]:
+    """
+    Returns:
+        The cache configured through the environment; None if caching hasn't been turned on
+    """
+    directory = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+
+    if not directory:
+        return None
+
+    size_limit = float(os.environ.get(CACHE_LIMIT_VARIABLE, DEFAULT_CACHE_LIMIT))
+    return RetrievalCache(directory, int(size_limit * 1024 * 1024))
+
+
+def retrieve(retriever: retrieval.Retriever, *args, **kwargs) -> pandas.DataFrame:
+    """
+    Get the output of a retriever, using the configured cache if there is one
+
+    Args:
+        retriever: The retriever that produces the frame
+        *args: Positional arguments for the retriever
+        **kwargs: Keyword arguments for the retriever
+
+    Returns:
+        The frame produced by the retriever
+    """
+    cache = get_cache()
+
+    if cache is None:
+        return retriever.retrieve(*args, **kwargs)
+
+    return cache.retrieve(retriever, *args, **kwargs)
@@ -16,6 +16,7 @@ import pandas
 import dmod.core.common as common
 
 from .. import specification
+from .. import caching
 
 from .retriever import CrosswalkRetriever
 
@@ -38,4 +39,4 @@ def get_crosswalk(definition: specification.CrosswalkSpecification) -> Crosswalk
 
 def get_data(definition: specification.CrosswalkSpecification) -> pandas.DataFrame:
     crosswalk_retriever = get_crosswalk(definition)
-    return crosswalk_retriever.retrieve()
+    return caching.retrieve(crosswalk_retriever)
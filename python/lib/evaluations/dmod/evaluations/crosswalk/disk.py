@@ -29,7 +29,7 @@ class JSONCrosswalkRetriever(retriever.CrosswalkRetriever):
         return "json"
 
     def retrieve(self, *args, **kwargs) -> pandas.DataFrame:
-        crosswalked_data = reader.select_values(self._document, self.field)
+        crosswalked_data = reader.select_values(self.document, self.field)
 
         if not (crosswalked_data is None or crosswalked_data.empty):
             crosswalked_data.dropna(inplace=True)
@@ -38,6 +38,17 @@ class JSONCrosswalkRetriever(retriever.CrosswalkRetriever):
 
     def __init__(self, definition: specification.CrosswalkSpecification):
         super().__init__(definition)
+        self._document: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+    @property
+    def document(self) -> typing.Dict[str, typing.Any]:
+        """
+        The combined contents of every crosswalk source
+
+        Sources are only read once the document is needed so that cached crosswalks don't have to be parsed
+        """
+        if self._document is not None:
+            return self._document
 
         full_document: typing.Dict[str, typing.Any] = dict()
 
@@ -51,5 +62,6 @@ class JSONCrosswalkRetriever(retriever.CrosswalkRetriever):
             full_document.update(document)
 
         self._document = full_document
+        return self._document
 
 
@@ -14,6 +14,7 @@ import dmod.core.common as common
 
 from .. import specification
 from .. import retrieval
+from .. import caching
 
 
 def get_datasource_retriever(datasource_definition: specification.DataSourceSpecification) -> retrieval.Retriever:
@@ -35,15 +36,17 @@ def get_datasource_retriever(datasource_definition: specification.DataSourceSpec
     return readers[0](datasource_definition)
 
 
-def read(datasource_definition: specification.DataSourceSpecification) -> pandas.DataFrame:
+def read(datasource_definition: specification.DataSourceSpecification, workers: int = None) -> pandas.DataFrame:
     """
     Get the data indicated by the DataSource definition
     Args:
         datasource_definition:
             A specification detailing what data to load
+        workers:
+            The number of processes that may be used to interpret sources at once, for retrievers that support it
     Returns:
         A DataFrame containing the data that complies with the specification
     """
     retriever = get_datasource_retriever(datasource_definition)
-    return retriever.retrieve()
+    return caching.retrieve(retriever, workers=workers)
 
@@ -4,6 +4,10 @@ import os
 import re
 import inspect
 import logging
+import itertools
+import multiprocessing
+
+from concurrent import futures
 
 import pandas
 
@@ -11,6 +15,7 @@ import dmod.core.common as common
 
 from .. import specification
 from .. import retrieval
+from .. import backends
 
 from .. import reader
 from .. import util
@@ -38,90 +43,184 @@ class JSONDataRetriever(retrieval.Retriever):
         return "json"
 
     def retrieve(self, *args, **kwargs) -> pandas.DataFrame:
-        documents = {
-            str(source): util.data_to_dictionary(self.backend.read(source))
-            for source in self.backend.sources
-        }
+        """
+        Read every JSON document from the backend and combine the values selected from each
 
-        frames = dict()
+        Args:
+            *args:
+            **kwargs: May include 'workers', the number of processes that may interpret documents at once
+
+        Returns:
+            The values selected from every document
+        """
+        # Every document is read with the same plans, so the paths within them only need to be compiled once
+        plans = [
+            reader.SelectionPlan(selector)
+            for selector in self.definition.value_selectors
+            if selector.where != "constant"
+        ]
+
+        sources = [str(source) for source in self.backend.sources]
+        workers = min(max(int(kwargs.get("workers") or 1), 1), len(sources))
+
+        # Daemonic processes, like those in a multiprocessing.Pool, may not start processes of their own
+        if workers > 1 and multiprocessing.current_process().daemon:
+            logging.warning(
+                f"{workers} workers were requested, but documents will be read within this process since "
+                f"daemonic processes may not start processes of their own"
+            )
+
+        if workers > 1 and not multiprocessing.current_process().daemon:
+            # Each worker reads its own documents so that only one copy of each document is ever held at a time
+            with futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_json_worker,
+                initargs=(self.definition.backend,)
+            ) as pool:
+                frames = list(
+                    pool.map(
+                        _read_json_source,
+                        sources,
+                        itertools.repeat(plans),
+                        itertools.repeat(self.definition)
+                    )
+                )
+        else:
+            frames = [
+                _read_json_frame(source, self.backend.read(source), plans, self.definition)
+                for source in sources
+            ]
 
-        for document_name, document in documents.items():  # type: str, typing.Dict[str, typing.Any]
-            frame = None
-            for selector in self.definition.value_selectors:
-                if selector.where == "constant":
-                    continue
+        combined_frame = pandas.concat(frames)
 
-                selected_data = reader.select_values(document, selector)
+        return combined_frame
 
-                if frame is None:
-                    frame = selected_data
-                else:
-                    if util.is_indexed(frame):
-                        frame.reset_index(inplace=True)
 
-                    if util.is_indexed(selected_data):
-                        selected_data.reset_index(inplace=True)
+_worker_backend: typing.Optional[backends.Backend] = None
+"""The backend that a worker process reads JSON documents through"""
 
-                    common_columns = [
-                        column_name
-                        for column_name in frame.keys()
-                        if column_name in selected_data.keys()
-                    ]
 
-                    if common_columns:
-                        frame.set_index(keys=common_columns, inplace=True)
-                        selected_data.set_index(keys=common_columns, inplace=True)
+def _initialize_json_worker(backend_definition: specification.BackendSpecification):
+    """
+    Prepare a worker process to read JSON documents
 
-                    frame = frame.join(selected_data)
+    Args:
+        backend_definition: The specification for the backend that the documents are read through
+    """
+    global _worker_backend
+    _worker_backend = backends.get_backend(backend_definition)
 
-                    if util.is_indexed(frame):
-                        frame.reset_index(inplace=True)
 
-            constants = [
-                selector
-                for selector in self.definition.value_selectors
-                if selector.where == 'constant'
-            ]
+def _read_json_source(
+    source: str,
+    plans: typing.Sequence[reader.SelectionPlan],
+    definition: specification.DataSourceSpecification
+) -> pandas.DataFrame:
+    """
+    Read a single JSON document within a worker process and build a frame out of the values selected from it
 
-            frame_index = frame.index
+    Args:
+        source: The name of the document within the worker's backend
+        plans: Compiled instructions for what to select from the document
+        definition: The specification for the data source that the document belongs to
 
-            for constant in constants:
-                value = constant.to_datatype(constant.path[0])
-                constant_frame = pandas.DataFrame(
-                        data={constant.name: [value for _ in range(len(frame_index))]},
-                        index=frame_index
-                )
-                frame = frame.join(constant_frame)
+    Returns:
+        The values selected from the document
+    """
+    return _read_json_frame(source, _worker_backend.read(source), plans, definition)
 
-            if self.definition.locations is not None and self.definition.locations.from_field == "filename":
-                name = None
 
-                if self.definition.locations.pattern:
-                    full_pattern = os.pathsep.join(self.definition.locations.pattern)
-                    search_results = re.search(full_pattern, document_name)
-                    if search_results:
-                        name = search_results.group()
+def _read_json_frame(
+    document_name: str,
+    raw_document: typing.Union[str, bytes, dict],
+    plans: typing.Sequence[reader.SelectionPlan],
+    definition: specification.DataSourceSpecification
+) -> pandas.DataFrame:
+    """
+    Build a frame out of the values selected from a single JSON document
 
-                if not name:
-                    name = os.path.splitext(os.path.basename(document_name))[0]
+    This is defined at the module level so that it may be run in other processes
 
-                frame['location'] = name
+    Args:
+        document_name: The name of where the document came from
+        raw_document: The unparsed document
+        plans: Compiled instructions for what to select from the document
+        definition: The specification for the data source that the document belongs to
 
+    Returns:
+        The values selected from the document
+    """
+    document: typing.Dict[str, typing.Any] = util.data_to_dictionary(raw_document)
+    frame = None
+
+    for plan in plans:
+        selected_data = plan.select(document)
+
+        if frame is None:
+            frame = selected_data
+        else:
             if util.is_indexed(frame):
-                frame = frame.reset_index()
+                frame.reset_index(inplace=True)
 
-            for mapping in self.definition.field_mapping:
-                if mapping.map_type != "column":
-                    continue
+            if util.is_indexed(selected_data):
+                selected_data.reset_index(inplace=True)
 
-                if mapping.value in frame:
-                    frame.rename(columns={mapping.value: mapping.field}, inplace=True)
+            common_columns = [
+                column_name
+                for column_name in frame.keys()
+                if column_name in selected_data.keys()
+            ]
 
-            frames[document_name] = frame
+            if common_columns:
+                frame.set_index(keys=common_columns, inplace=True)
+                selected_data.set_index(keys=common_columns, inplace=True)
 
-        combined_frame = pandas.concat([frame for frame in frames.values()])
+            frame = frame.join(selected_data)
 
-        return combined_frame
+            if util.is_indexed(frame):
+                frame.reset_index(inplace=True)
+
+    constants = [
+        selector
+        for selector in definition.value_selectors
+        if selector.where == 'constant'
+    ]
+
+    frame_index = frame.index
+
+    for constant in constants:
+        value = constant.to_datatype(constant.path[0])
+        constant_frame = pandas.DataFrame(
+                data={constant.name: [value for _ in range(len(frame_index))]},
+                index=frame_index
+        )
+        frame = frame.join(constant_frame)
+
+    if definition.locations is not None and definition.locations.from_field == "filename":
+        name = None
+
+        if definition.locations.pattern:
+            full_pattern = os.pathsep.join(definition.locations.pattern)
+            search_results = re.search(full_pattern, document_name)
+            if search_results:
+                name = search_results.group()
+
+        if not name:
+            name = os.path.splitext(os.path.basename(document_name))[0]
+
+        frame['location'] = name
+
+    if util.is_indexed(frame):
+        frame = frame.reset_index()
+
+    for mapping in definition.field_mapping:
+        if mapping.map_type != "column":
+            continue
+
+        if mapping.value in frame:
+            frame.rename(columns={mapping.value: mapping.field}, inplace=True)
+
+    return frame
 
 
 class FrameDataRetriever(retrieval.Retriever):
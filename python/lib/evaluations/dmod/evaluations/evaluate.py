@@ -2,10 +2,15 @@ import os
 import typing
 import json
 import logging
+import multiprocessing
 
+from concurrent import futures
+
+import numpy
 import pandas
 
 from dmod.metrics.communication import Verbosity
+from dmod.metrics.communication import REASON_TO_WRITE
 import dmod.metrics as metrics
 
 import dmod.core.common as common
@@ -15,9 +20,13 @@ from . import crosswalk
 from . import data_retriever
 from . import threshold
 from . import measurement_units
+from . import rules
 
 COMMUNICATORS = typing.Union[metrics.Communicator, typing.Sequence[metrics.Communicator]]
 
+SHARDS_PER_WORKER = 4
+"""The number of location shards to create for each worker process so that uneven shards balance out"""
+
 
 class UnitConverter:
     """
@@ -29,30 +38,37 @@ class UnitConverter:
         self.__from_unit_field = from_unit_field
         self.__to_unit_field = to_unit_field
 
-    def _conversion(self, row):
+    def __call__(self, rows_to_convert: pandas.DataFrame, *args, **kwargs) -> pandas.Series:
         """
-        Helper function used to convert the values in a singular row
+        Convert the values of every row into the unit of measurement named in the row
+
+        Rows are grouped by their pair of units so that each distinct conversion is only looked up once and is
+        then applied to all of its values at once
 
         Args:
-            row: A row from a data source
+            rows_to_convert: Rows containing the values to convert along with their current and desired units
 
         Returns:
-            A value converted from one measurement unit to another
+            The converted values, indexed like the passed rows
         """
-        if row[self.__from_unit_field] == row[self.__to_unit_field]:
-            return row[self.__value_field]
+        converted_values = rows_to_convert[self.__value_field].to_numpy(dtype=float, copy=True)
 
-        return measurement_units.convert(
-            row[self.__value_field],
-            row[self.__from_unit_field],
-            row[self.__to_unit_field]
+        unit_pairs = pandas.DataFrame(
+            {
+                "from_unit": rows_to_convert[self.__from_unit_field].to_numpy(),
+                "to_unit": rows_to_convert[self.__to_unit_field].to_numpy(),
+            }
         )
 
-    def __call__(self, rows_to_convert: pandas.Series, *args, **kwargs) -> float:
-        return rows_to_convert.apply(
-            self._conversion,
-            axis=1
-        )
+        unit_groups = unit_pairs.groupby(["from_unit", "to_unit"], dropna=False).indices
+
+        for (from_unit, to_unit), positions in unit_groups.items():
+            if from_unit == to_unit:
+                continue
+
+            converted_values[positions] = measurement_units.convert(converted_values[positions], from_unit, to_unit)
+
+        return pandas.Series(converted_values, index=rows_to_convert.index, name=self.__value_field)
 
 
 class Evaluator:
@@ -60,8 +76,17 @@ class Evaluator:
         self,
         instructions: typing.Union[specification.EvaluationSpecification, str, dict],
         communicators: COMMUNICATORS = None,
-        verbosity: Verbosity = None
+        verbosity: Verbosity = None,
+        workers: int = None
     ):
+        """
+        Args:
+            instructions: The specification telling the Evaluator what to do
+            communicators: The communicators to use to send messages through as the evaluation goes on
+            verbosity: How chatty the evaluation should be
+            workers: The number of processes that may score locations at once. Locations are scored in this process
+                if this is not greater than 1
+        """
         if isinstance(instructions, str):
             instructions = json.loads(instructions)
 
@@ -77,6 +102,7 @@ class Evaluator:
         self._observed_xaxis: typing.Optional[str] = None
         self._predicted_xaxis: typing.Optional[str] = None
         self._verbosity = verbosity or Verbosity.QUIET
+        self._workers = max(int(workers or 1), 1)
 
         if isinstance(communicators, metrics.CommunicatorGroup):
             self._communicators: metrics.CommunicatorGroup = communicators
@@ -95,6 +121,13 @@ class Evaluator:
         """
         return self._instructions
 
+    @property
+    def workers(self) -> int:
+        """
+        The number of processes that may score locations at once
+        """
+        return self._workers
+
     @property
     def maximum_score(self) -> float:
         """
@@ -325,7 +358,7 @@ class Evaluator:
         )
 
         for observation_definition in self._instructions.observations:
-            found_observations = data_retriever.read(observation_definition)
+            found_observations = data_retriever.read(observation_definition, workers=self._workers)
 
             if found_observations is None or found_observations.empty:
                 continue
@@ -344,7 +377,7 @@ class Evaluator:
         predictions: typing.Optional[pandas.DataFrame] = None
 
         for prediction_definition in self._instructions.predictions:
-            found_predictions = data_retriever.read(prediction_definition)
+            found_predictions = data_retriever.read(prediction_definition, workers=self._workers)
 
             if found_predictions is None or found_predictions.empty:
                 continue
@@ -413,37 +446,11 @@ class Evaluator:
             index_fields = list()
 
             if observation_rule and observation_rule.name not in data.keys():
-                def conversion_function(column_name_and_value: pandas.Series):
-                    """
-                    Converts a series of column names vs values to the desired data type
-
-                    Args:
-                        column_name_and_value:
-                            A pandas Series mapping column names to values
-                    Returns:
-                        The converted value
-                    """
-                    converted_value = observation_rule.to_datatype([value for value in column_name_and_value])
-                    return converted_value
-
-                data[observation_rule.name] = data[observation_rule.path].apply(conversion_function, axis=1)
+                data[observation_rule.name] = rules.apply_rule(observation_rule, data)
                 index_fields.append(observation_rule.name)
 
             if prediction_rule and prediction_rule.name not in data.keys():
-                def conversion_function(column_name_and_value: pandas.Series):
-                    """
-                    Converts a series of column names vs values to the desired data type
-
-                    Args:
-                        column_name_and_value:
-                            A pandas Series mapping column names to values
-                    Returns:
-                        The converted value
-                    """
-                    converted_value = prediction_rule.to_datatype([value for value in column_name_and_value])
-                    return converted_value
-
-                data[prediction_rule.name] = data[prediction_rule.path].apply(conversion_function, axis=1)
+                data[prediction_rule.name] = rules.apply_rule(prediction_rule, data)
                 index_fields.append(prediction_rule.name)
 
             data = data.set_index(keys=index_fields, drop=True)
@@ -519,61 +526,49 @@ class Evaluator:
         Returns:
             A mapping between the locations being evaluated and the results of the metrics performed on them
         """
-        scheme = self._instructions.scheme.generate_scheme(self._communicators)
-
         groupby_columns = [
             self._observed_location_field,
             self._predicted_location_field
         ]
 
-        scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = dict()
-
-        for identifiers, group in data_to_evaluate.groupby(by=groupby_columns):  # type: tuple, pandas.DataFrame
-            observed_location, predicted_location = identifiers     # type: str, str
-
-            location_thresholds = thresholds.get(observed_location)
-
-            metadata = {
-                "observed_location": observed_location,
-                "predicted_location": predicted_location,
-            }
-
-            self._communicators.info(
-                f"Creating truth tables for {str(identifiers)}",
-                verbosity=Verbosity.LOUD,
-                publish=True
-            )
+        self._communicators.info(
+            "Scoring all locations",
+            verbosity=Verbosity.LOUD,
+            publish=True
+        )
 
-            truth_tables = metrics.categorical.TruthTables(
-                group[self._observed_value_field],
-                group[self._predicted_value_field],
-                location_thresholds
+        # Daemonic processes, like those in a multiprocessing.Pool, may not start a pool of their own
+        if self._workers > 1 and multiprocessing.current_process().daemon:
+            logging.warning(
+                f"{self._workers} workers were requested, but locations will be scored within this process since "
+                f"daemonic processes may not start processes of their own"
             )
 
-            self._communicators.info(
-                f"Scoring {str(identifiers)}",
-                verbosity=Verbosity.LOUD,
-                publish=True
+        if self._workers > 1 and not multiprocessing.current_process().daemon:
+            scores = self._score_in_parallel(data_to_evaluate, thresholds, groupby_columns)
+        else:
+            scheme = self._instructions.scheme.generate_scheme(self._communicators)
+
+            # Every location is summarized and scored at once rather than filtering and scoring one location at a time
+            scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = scheme.score_groups(
+                pairs=data_to_evaluate,
+                observed_value_label=self._observed_value_field,
+                predicted_value_label=self._predicted_value_field,
+                group_by=groupby_columns,
+                thresholds=thresholds,
+                threshold_key=self._observed_location_field,
+                group_names=["observed_location", "predicted_location"]
             )
 
-            if location_thresholds:
-                location_scores = scheme.score(
-                    group,
-                    self._observed_value_field,
-                    self._predicted_value_field,
-                    location_thresholds,
-                    metadata=metadata,
-                    truth_tables=truth_tables
-                )
-                scores[identifiers] = location_scores
-                if self._verbosity == Verbosity.ALL:
-                    data = {
-                        "observed_location": observed_location,
-                        "predicted_location": predicted_location,
-                        "scores": location_scores.to_dict(),
-                    }
-                    reason = "location_scores"
-                    self._communicators.write(reason=reason, data=data)
+        if self._verbosity == Verbosity.ALL:
+            for (observed_location, predicted_location), location_scores in scores.items():
+                data = {
+                    "observed_location": observed_location,
+                    "predicted_location": predicted_location,
+                    "scores": location_scores.to_dict(),
+                }
+                reason = "location_scores"
+                self._communicators.write(reason=reason, data=data)
 
         self._communicators.info(
             "All locations have been evaluated",
@@ -583,11 +578,209 @@ class Evaluator:
 
         return scores
 
+    def _score_in_parallel(
+        self,
+        data_to_evaluate: pandas.DataFrame,
+        thresholds: typing.Dict[str, typing.Sequence[metrics.Threshold]],
+        groupby_columns: typing.Sequence[str]
+    ) -> typing.Dict[typing.Tuple[str, str], metrics.MetricResults]:
+        """
+        Score shards of locations across a pool of processes
+
+        Communicators are not sent to the worker processes. Progress is reported from this process as each
+        shard finishes instead. When a communicator expects all data, the per-metric messages written within
+        each worker are returned with its results and forwarded through this process's communicators
+
+        Args:
+            data_to_evaluate: The values ready to compare
+            thresholds: The thresholds used to compare values
+            groupby_columns: The columns identifying each pair of locations
+
+        Returns:
+            A mapping between the locations being evaluated and the results of the metrics performed on them,
+            ordered by location
+        """
+        location_indices: typing.Dict[typing.Tuple[str, str], numpy.ndarray] = data_to_evaluate.groupby(
+            groupby_columns
+        ).indices
+        location_keys = sorted(
+            key
+            for key in location_indices
+            if len(thresholds.get(key[0], [])) > 0
+        )
+
+        if len(location_keys) == 0:
+            return dict()
+
+        shards = _get_location_shards(
+            location_keys,
+            location_indices,
+            min(len(location_keys), self._workers * SHARDS_PER_WORKER)
+        )
+
+        shard_scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = dict()
+        forward_messages = self._communicators.send_all()
+
+        with futures.ProcessPoolExecutor(max_workers=min(self._workers, len(shards))) as pool:
+            pending_shards = [
+                pool.submit(
+                    _score_shard,
+                    self._instructions.scheme,
+                    data_to_evaluate.take(numpy.sort(numpy.concatenate([location_indices[key] for key in shard]))),
+                    {
+                        observed_location: thresholds[observed_location]
+                        for observed_location in {key[0] for key in shard}
+                    },
+                    self._observed_value_field,
+                    self._predicted_value_field,
+                    groupby_columns,
+                    forward_messages
+                )
+                for shard in shards
+            ]
+
+            for completed_shard in futures.as_completed(pending_shards):
+                scores, messages = completed_shard.result()
+                shard_scores.update(scores)
+
+                for message in messages:
+                    self._communicators.write(reason=message.reason, data=message.data, verbosity=Verbosity.ALL)
+
+                self._communicators.info(
+                    f"Scored {len(shard_scores)} out of {len(location_keys)} locations",
+                    verbosity=Verbosity.LOUD,
+                    publish=True
+                )
+
+        # Shards finish in any order, so results are put back in location order to keep output deterministic
+        return {
+            key: shard_scores[key]
+            for key in location_keys
+            if key in shard_scores
+        }
+
+
+def _get_location_shards(
+    location_keys: typing.Sequence[typing.Tuple[str, str]],
+    location_indices: typing.Dict[typing.Tuple[str, str], numpy.ndarray],
+    shard_count: int
+) -> typing.List[typing.List[typing.Tuple[str, str]]]:
+    """
+    Divide locations into shards with roughly the same number of rows to score
+
+    Args:
+        location_keys: The locations to divide
+        location_indices: The positions of the rows for each location
+        shard_count: The number of shards to create
+
+    Returns:
+        Lists of locations that should be scored together
+    """
+    shards: typing.List[typing.List[typing.Tuple[str, str]]] = [list() for _ in range(shard_count)]
+    shard_sizes = numpy.zeros(shard_count, dtype=numpy.int64)
+
+    # Placing the largest locations first on the smallest shard keeps one shard from holding up the rest
+    for key in sorted(location_keys, key=lambda location_key: len(location_indices[location_key]), reverse=True):
+        smallest_shard = int(numpy.argmin(shard_sizes))
+        shards[smallest_shard].append(key)
+        shard_sizes[smallest_shard] += len(location_indices[key])
+
+    return [shard for shard in shards if shard]
+
+
+class _WrittenMessage(typing.NamedTuple):
+    """
+    A message written to a communicator, kept so that it may be sent on from another process
+    """
+    reason: REASON_TO_WRITE
+    data: dict
+
+
+class _MessageCollector(metrics.Communicator):
+    """
+    A communicator that keeps everything written to it so that a worker process may return it
+    """
+    def __init__(self):
+        super().__init__("collector", verbosity=Verbosity.ALL)
+        self.messages: typing.List[_WrittenMessage] = list()
+
+    def error(self, message: str, exception: Exception = None, verbosity: Verbosity = None, publish: bool = None):
+        pass
+
+    def info(self, message: str, verbosity: Verbosity = None, publish: bool = None):
+        pass
+
+    def read_errors(self) -> typing.Iterable[str]:
+        return list()
+
+    def read_info(self) -> typing.Iterable[str]:
+        return list()
+
+    def _validate(self) -> typing.Sequence[str]:
+        return list()
+
+    def write(self, reason: REASON_TO_WRITE, data: dict):
+        self.messages.append(_WrittenMessage(reason, data))
+
+    def read(self) -> typing.Any:
+        return None
+
+    def update(self, **kwargs):
+        pass
+
+    def sunset(self, seconds: float = None):
+        pass
+
+
+def _score_shard(
+    scheme_specification: specification.SchemeSpecification,
+    data_to_evaluate: pandas.DataFrame,
+    thresholds: typing.Dict[str, typing.Sequence[metrics.Threshold]],
+    observed_value_field: str,
+    predicted_value_field: str,
+    groupby_columns: typing.Sequence[str],
+    collect_messages: bool = False
+) -> typing.Tuple[typing.Dict[typing.Tuple[str, str], metrics.MetricResults], typing.List[_WrittenMessage]]:
+    """
+    Score a shard of locations within a worker process
+
+    Args:
+        scheme_specification: The specification for the scoring scheme to score with
+        data_to_evaluate: The values for every location in the shard
+        thresholds: The thresholds for every observed location in the shard
+        observed_value_field: The name of the column containing observations
+        predicted_value_field: The name of the column containing predictions
+        groupby_columns: The columns identifying each pair of locations; the first is the observed location
+        collect_messages: Whether to keep the messages the scheme writes so that the parent process may send them
+
+    Returns:
+        A mapping between the locations in the shard and the results of the metrics performed on them,
+        along with the messages written while scoring them
+    """
+    # Communicators hold connections that can't be pickled, so the scheme only writes to a local collector
+    collector = _MessageCollector()
+    scheme = scheme_specification.generate_scheme(
+        metrics.CommunicatorGroup(collector) if collect_messages else None
+    )
+
+    scores = scheme.score_groups(
+        pairs=data_to_evaluate,
+        observed_value_label=observed_value_field,
+        predicted_value_label=predicted_value_field,
+        group_by=groupby_columns,
+        thresholds=thresholds,
+        threshold_key=groupby_columns[0],
+        group_names=["observed_location", "predicted_location"]
+    )
+
+    return scores, collector.messages
+
 
 def evaluate(
     definition: specification.EvaluationSpecification,
     communicators: COMMUNICATORS = None,
-    verbosity: Verbosity = None
+    verbosity: Verbosity = None,
+    workers: int = None
 ) -> specification.EvaluationResults:
     """
     Performs an evaluation
@@ -596,9 +789,10 @@ def evaluate(
         definition: The instructions on how to conduct the evaluation
         communicators: The communicators to use to send messages through as the evaluation goes on
         verbosity: How chatty the evaluation should be
+        workers: The number of processes that may score locations at once
 
     Returns:
         The results of the evaluation
     """
-    evaluator = Evaluator(definition, communicators, verbosity)
+    evaluator = Evaluator(definition, communicators, verbosity, workers)
     return evaluator.evaluate()
@@ -7,92 +7,354 @@ import jsonpath_ng as jsonpath
 
 from . import specification
 
+JSON_STEP = typing.Callable[[typing.Any], typing.List[typing.Any]]
 
-def select_values(document: dict, selector: specification.ValueSelector):
-    origin_expression: jsonpath.This = jsonpath.parse(".".join(selector.origin))
-    tables: typing.List[pandas.DataFrame] = list()
 
-    for element in origin_expression.find(document):
-        full_path = str(element.full_path)
+def _find_fields(fields: typing.Sequence[str]) -> JSON_STEP:
+    def find(value: typing.Any) -> typing.List[typing.Any]:
+        if not isinstance(value, dict):
+            return list()
 
-        main_path = full_path + "." + ".".join(selector.path)
-        value_expression: jsonpath.This = jsonpath.parse(main_path)
+        keys = value.keys() if "*" in fields else fields
+        return [value[key] for key in keys if key in value]
 
-        value_results = value_expression.find(document)
+    return find
 
-        if not value_results:
-            continue
 
-        columns = dict()
+def _find_slice(start: typing.Optional[int], end: typing.Optional[int], step: typing.Optional[int]) -> JSON_STEP:
+    def find(value: typing.Any) -> typing.List[typing.Any]:
+        if value is None:
+            return list()
 
-        if len(value_results) == 1:
-            if selector.where == "key":
-                columns[selector.name] = selector.to_datatype(value_results[0].path)
-            else:
-                columns[selector.name] = selector.to_datatype(value_results[0].value)
+        # Mirrors jsonpath, which treats a single object as a list holding only that object
+        if isinstance(value, (dict, int, float, str, bool)):
+            value = [value]
+
+        return list(value[start:end:step])
+
+    return find
+
+
+def _find_indices(indices: typing.Sequence[int]) -> JSON_STEP:
+    def find(value: typing.Any) -> typing.List[typing.Any]:
+        if isinstance(value, dict) or not value:
+            return list()
+
+        return [value[index] for index in indices if -len(value) <= index < len(value)]
+
+    return find
+
+
+def _compile_steps(expression: jsonpath.JSONPath, is_start: bool = True) -> typing.Optional[typing.List[JSON_STEP]]:
+    """
+    Convert a parsed jsonpath expression into plain python functions that walk loaded JSON directly
+
+    Args:
+        expression: The parsed expression to convert
+        is_start: Whether the expression is at the start of the complete path
+
+    Returns:
+        The steps to take through the data; None if the expression uses operations that require jsonpath itself
+    """
+    if isinstance(expression, jsonpath.Child):
+        left = _compile_steps(expression.left, is_start)
+        right = _compile_steps(expression.right, False)
+        return left + right if left is not None and right is not None else None
+
+    if isinstance(expression, jsonpath.This) or (isinstance(expression, jsonpath.Root) and is_start):
+        return list()
+
+    if isinstance(expression, jsonpath.Fields):
+        return [_find_fields(expression.fields)]
+
+    if isinstance(expression, jsonpath.Slice):
+        return [_find_slice(expression.start, expression.end, expression.step)]
+
+    if isinstance(expression, jsonpath.Index):
+        return [_find_indices(expression.indices)]
+
+    return None
+
+
+def _convert_values(
+    field: typing.Union[specification.ValueSelector, specification.AssociatedField],
+    values: typing.Sequence,
+    conversions: typing.Dict[typing.Tuple[type, typing.Any], typing.Any]
+) -> typing.List:
+    """
+    Convert values to the datatype of their field, only converting each distinct value once
+
+    Values like dates are often repeated for every location in a document and are expensive to parse
+
+    Args:
+        field: The field that describes what the values should be converted to
+        values: The values to convert
+        conversions: Previously converted values, keyed by their type and raw value
+
+    Returns:
+        The converted values
+    """
+    converted_values = list()
+
+    for value in values:
+        key = (type(value), value)
+
+        try:
+            converted_value = conversions[key]
+        except KeyError:
+            converted_value = field.to_datatype(value)
+            conversions[key] = converted_value
+        except TypeError:
+            # The value can't be hashed, so it can't be remembered
+            converted_value = field.to_datatype(value)
+
+        converted_values.append(converted_value)
+
+    return converted_values
+
+
+class CompiledPath:
+    """
+    A jsonpath that has been parsed once so that it may be used many times
+    """
+    def __init__(self, path: str):
+        """
+        Constructor
+
+        Args:
+            path: The jsonpath to compile
+        """
+        self.__path = path
+        self.__expression: jsonpath.JSONPath = jsonpath.parse(path)
+        self.__steps = _compile_steps(self.__expression)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def find(self, data: typing.Any) -> typing.List[jsonpath.DatumInContext]:
+        """
+        Find all matches of the path along with their locations
+
+        Args:
+            data: The data to search
+
+        Returns:
+            Every match within the data
+        """
+        return self.__expression.find(data)
+
+    def values(self, data: typing.Any) -> typing.List[typing.Any]:
+        """
+        Find the values of all matches of the path
+
+        Simple paths made up of names, wildcards, and indices are walked directly rather than through jsonpath,
+        which has to track the location of every value that it visits
+
+        Args:
+            data: The data to search
+
+        Returns:
+            The value of every match within the data
+        """
+        if self.__steps is None:
+            return [result.value for result in self.__expression.find(data)]
+
+        values = [data]
+
+        for step in self.__steps:
+            values = [found for value in values for found in step(value)]
+
+        return values
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # The compiled steps can't be pickled, so the path is compiled again wherever this is unpickled
+        return {"path": self.__path}
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]):
+        self.__init__(state["path"])
+
+    def __str__(self):
+        return self.__path
+
+
+class SelectionPlan:
+    """
+    A compiled set of instructions for pulling the values described by a `ValueSelector` out of JSON documents
+
+    Every path is parsed once and then evaluated relative to the match of the origin that it belongs to, so the
+    document is only walked below each match instead of from the top for every value and index
+    """
+    def __init__(self, selector: specification.ValueSelector):
+        """
+        Constructor
+
+        Args:
+            selector: The description of what values to select
+        """
+        self.__selector = selector
+        self.__origin_path = CompiledPath(".".join(selector.origin))
+        self.__value_path = CompiledPath(".".join(selector.path))
+        self.__index_paths: typing.List[typing.Tuple[specification.AssociatedField, CompiledPath]] = [
+            (index, CompiledPath(".".join(index.path)))
+            for index in selector.associated_fields
+        ]
+
+    @property
+    def selector(self) -> specification.ValueSelector:
+        return self.__selector
+
+    def select(self, document: dict) -> typing.Optional[pandas.DataFrame]:
+        """
+        Select values from a document
+
+        Args:
+            document: The document to select values from
+
+        Returns:
+            A table of the selected values and their associated fields; None if nothing was found
+        """
+        selector = self.__selector
+        columns: typing.Dict[str, typing.List] = {selector.name: list()}
+        columns.update({index.name: list() for index, _ in self.__index_paths})
+
+        if selector.where.lower() == "key":
+            element_tables = self.__select_keys(document)
         else:
-            if selector.where == "key":
-                columns[selector.name] = [
-                    selector.to_datatype(result.path)
-                    for result in value_results
-                ]
-            else:
-                columns[selector.name] = [
-                    selector.to_datatype(result.value)
-                    for result in value_results
-                ]
-
-        for index in selector.associated_fields:
-            if selector.where.lower() == "key":
-                column_data = list()
-                missing_entries = 0
-
-                for result in value_results:
-                    index_path = f"{str(result.full_path)}.{'.'.join(index.path)}"
-                    index_expression = jsonpath.parse(index_path)
-                    index_results = index_expression.find(document)
-
-                    if not index_results:
-                        missing_entries += 1
-                        column_data.append(None)
-                    else:
-                        column_data.append(index.to_datatype(index_results[0].value))
-
-                if len(column_data) == 0 or len(column_data) == missing_entries:
+            element_tables = self.__select_values(document)
+
+        for element_name, element_columns in element_tables:
+            # Single values apply to every row found for this element
+            row_count = max(len(values) for values in element_columns.values())
+
+            for column_name, values in element_columns.items():
+                if len(values) == 1:
+                    values = values * row_count
+                elif len(values) != row_count:
+                    raise ValueError(
+                        f"Cannot select values for '{selector.name}' - '{column_name}' has {len(values)} values at "
+                        f"'{element_name}' when {row_count} were expected"
+                    )
+
+                columns[column_name].extend(values)
+
+        if not columns[selector.name]:
+            return None
+
+        return pandas.DataFrame(data=columns)
+
+    def __select_values(self, document: dict) -> typing.Iterable[typing.Tuple[str, typing.Dict[str, typing.List]]]:
+        """
+        Select values and their associated fields from beneath each match of the origin
+
+        Args:
+            document: The document to select values from
+
+        Returns:
+            The name of each match of the origin along with the columns of data found beneath it
+        """
+        selector = self.__selector
+        conversions = {selector.name: dict()}
+        conversions.update({index.name: dict() for index, _ in self.__index_paths})
+
+        for element in self.__origin_path.values(document):
+            values = self.__value_path.values(element)
+
+            if not values:
+                continue
+
+            element_columns = {selector.name: _convert_values(selector, values, conversions[selector.name])}
+
+            for index, index_path in self.__index_paths:
+                index_values = index_path.values(element)
+
+                if not index_values:
                     raise KeyError(
-                            f"There are no values for the index named '{index.name}' at "
-                            f"'{full_path + '.*.' + '.'.join(index.path)}'"
+                        f"There are no values for the index named '{index.name}' at '{self.__origin_path}.{index_path}'"
                     )
 
-                if len(column_data) == 1:
-                    columns[index.name] = column_data[0]
-                else:
-                    columns[index.name] = column_data
+                element_columns[index.name] = _convert_values(index, index_values, conversions[index.name])
+
+            yield str(self.__origin_path), element_columns
+
+    def __select_keys(self, document: dict) -> typing.Iterable[typing.Tuple[str, typing.Dict[str, typing.List]]]:
+        """
+        Select keys and the fields associated with each of them from beneath each match of the origin
+
+        Args:
+            document: The document to select keys from
+
+        Returns:
+            The name of each match of the origin along with the columns of data found beneath it
+        """
+        selector = self.__selector
+
+        for element in self.__origin_path.find(document):
+            value_results = self.__value_path.find(element)
+
+            if not value_results:
+                continue
+
+            element_columns = {selector.name: [selector.to_datatype(result.path) for result in value_results]}
+
+            for index, index_path in self.__index_paths:
+                element_columns[index.name] = self.__select_index_per_key(element, value_results, index, index_path)
+
+            yield str(element.full_path), element_columns
+
+    @staticmethod
+    def __select_index_per_key(
+        element: jsonpath.DatumInContext,
+        value_results: typing.Sequence[jsonpath.DatumInContext],
+        index: specification.AssociatedField,
+        index_path: CompiledPath
+    ) -> typing.List:
+        """
+        Find the value of an associated field beneath each selected key
+
+        Args:
+            element: The match of the origin that the keys were found in
+            value_results: The selected keys
+            index: The associated field to find
+            index_path: The compiled path to the associated field
+
+        Returns:
+            The first value of the associated field for each key, or None if the key didn't have one
+        """
+        column_data = list()
+        missing_entries = 0
+
+        for result in value_results:
+            index_results = index_path.find(result)
+
+            if not index_results:
+                missing_entries += 1
+                column_data.append(None)
             else:
-                index_path = full_path + "." + ".".join(index.path)
+                column_data.append(index.to_datatype(index_results[0].value))
 
-                index_expression: jsonpath.This = jsonpath.parse(index_path)
-                index_results = index_expression.find(document)
+        if len(column_data) == 0 or len(column_data) == missing_entries:
+            raise KeyError(
+                    f"There are no values for the index named '{index.name}' at "
+                    f"'{element.full_path}.*.{index_path}'"
+            )
 
-                if not index_results:
-                    raise KeyError(f"There are no values for the index named '{index.name}' at '{index_path}'")
+        return column_data
 
-                if len(index_results) == 1:
-                    # We're dealing with a scalar
-                    columns[index.name] = index.to_datatype(index_results[0].value)
-                else:
-                    # we're dealing with a vector
-                    columns[index.name] = [
-                        index.to_datatype(result.value)
-                        for result in index_results
-                    ]
 
-        tables.append(pandas.DataFrame(data=columns))
+def select_values(
+    document: dict,
+    selector: typing.Union[specification.ValueSelector, SelectionPlan]
+) -> typing.Optional[pandas.DataFrame]:
+    """
+    Select values from a document
 
-    if len(tables) == 1:
-        return tables[0]
-    elif tables:
-        table = pandas.concat(tables, ignore_index=True)
-        return table
+    Args:
+        document: The document to select values from
+        selector: Either a description of what to select or an already compiled plan for selecting it
 
-    return None
+    Returns:
+        A table of the selected values and their associated fields; None if nothing was found
+    """
+    plan = selector if isinstance(selector, SelectionPlan) else SelectionPlan(selector)
+    return plan.select(document)
@@ -0,0 +1,198 @@
+"""
+Applies the fields of threshold application rules to whole tables at once
+
+Application rules describe how one or more columns should be combined into a new field, such as turning a value date
+or a month and a day into a `Day`, so that thresholds may be lined up with observations and predictions. Converting
+each row individually through `AssociatedField.to_datatype` is slow for large tables, so known conversions are done
+column-wise instead. Conversions that aren't known, or columns that can't be converted column-wise without changing
+the result, fall back to converting each row.
+"""
+import typing
+
+import numpy
+import pandas
+
+from . import specification
+from . import util
+
+DAY_DATATYPES = ("day",)
+"""The names of datatypes that produce `Day` objects"""
+
+MINIMUM_DAY = 1
+MAXIMUM_DAY = 366
+
+DAY_REFERENCE_YEAR = 2020
+"""The year that months and days are placed in when interpreting a day; leap years include every possible day"""
+
+
+def _get_days_from_dates(dates: pandas.Series) -> numpy.ndarray:
+    """
+    Get the consistent day of the year for each date
+
+    Like `Day`, every day from the first of March onward in a non-leap year is moved forward by one so that the
+    same day of the year has the same number in and out of leap years
+
+    Args:
+        dates: A column of dates
+
+    Returns:
+        The day number for each date
+    """
+    shift = (~dates.dt.is_leap_year & (dates.dt.month >= 3)).to_numpy(dtype=int)
+    return dates.dt.dayofyear.to_numpy(dtype=int) + shift
+
+
+def _get_days_from_numbers(numbers: pandas.Series) -> typing.Optional[numpy.ndarray]:
+    """
+    Interpret a column of numbers as day numbers
+
+    Args:
+        numbers: A column of numbers
+
+    Returns:
+        The day number for each number; None if the numbers can't all be interpreted as days
+    """
+    values = numbers.to_numpy(dtype=float)
+
+    if numpy.isnan(values).any():
+        return None
+
+    days = values.astype(int)
+
+    if (days < MINIMUM_DAY).any() or (days > MAXIMUM_DAY).any():
+        return None
+
+    return days
+
+
+def _get_days_from_months_and_days(months: pandas.Series, days: pandas.Series) -> typing.Optional[numpy.ndarray]:
+    """
+    Interpret a column of month numbers and a column of day of the month numbers as day numbers
+
+    Args:
+        months: The number of the month for each day
+        days: The number of the day of the month for each day
+
+    Returns:
+        The day number for each month and day; None if they can't all be interpreted as dates
+    """
+    month_values = months.to_numpy(dtype=float)
+    day_values = days.to_numpy(dtype=float)
+
+    if numpy.isnan(month_values).any() or numpy.isnan(day_values).any():
+        return None
+
+    dates = pandas.to_datetime(
+        pandas.DataFrame(
+            {
+                "year": DAY_REFERENCE_YEAR,
+                "month": month_values.astype(int),
+                "day": day_values.astype(int),
+            }
+        ),
+        errors="coerce"
+    )
+
+    if dates.isna().any():
+        return None
+
+    # The reference year is a leap year, so the day of the year is already consistent
+    return dates.dt.dayofyear.to_numpy(dtype=int)
+
+
+def _get_day_numbers(columns: typing.Sequence[pandas.Series]) -> typing.Optional[numpy.ndarray]:
+    """
+    Interpret columns the same way that `Day` interprets the values of a single row
+
+    Args:
+        columns: The columns that make up each day
+
+    Returns:
+        The day number for each row; None if the columns need to be interpreted one row at a time
+    """
+    if len(columns) == 1 and pandas.api.types.is_datetime64_any_dtype(columns[0]):
+        return _get_days_from_dates(columns[0]) if not columns[0].isna().any() else None
+
+    are_numbers = [
+        pandas.api.types.is_numeric_dtype(column) and not pandas.api.types.is_bool_dtype(column)
+        for column in columns
+    ]
+
+    if not all(are_numbers):
+        return None
+
+    if len(columns) == 1:
+        return _get_days_from_numbers(columns[0])
+
+    if len(columns) == 2:
+        return _get_days_from_months_and_days(columns[0], columns[1])
+
+    return None
+
+
+def _create_days(day_numbers: numpy.ndarray, index: pandas.Index) -> pandas.Series:
+    """
+    Create a column of `Day` objects
+
+    Only one `Day` is created for each distinct day number since there are at most 366 of them
+
+    Args:
+        day_numbers: The number of each day
+        index: The index for the new column
+
+    Returns:
+        A column of `Day` objects
+    """
+    distinct_numbers, positions = numpy.unique(day_numbers, return_inverse=True)
+
+    distinct_days = numpy.empty(len(distinct_numbers), dtype=object)
+    distinct_days[:] = [util.Day(int(number)) for number in distinct_numbers]
+
+    return pandas.Series(distinct_days[positions], index=index)
+
+
+def _convert_rows(field: specification.AssociatedField, data: pandas.DataFrame) -> pandas.Series:
+    """
+    Convert the values of a field one row at a time
+
+    Args:
+        field: The field describing what columns to use and what they should become
+        data: The table containing the columns to convert
+
+    Returns:
+        The converted value for each row
+    """
+    def conversion_function(column_name_and_value: pandas.Series):
+        """
+        Converts a series of column names vs values to the desired data type
+
+        Args:
+            column_name_and_value:
+                A pandas Series mapping column names to values
+        Returns:
+            The converted value
+        """
+        converted_value = field.to_datatype([value for value in column_name_and_value])
+        return converted_value
+
+    return data[field.path].apply(conversion_function, axis=1)
+
+
+def apply_rule(field: specification.AssociatedField, data: pandas.DataFrame) -> pandas.Series:
+    """
+    Convert the columns named by the field of an application rule into the field's datatype
+
+    Args:
+        field: The field describing what columns to use and what they should become
+        data: The table containing the columns to convert
+
+    Returns:
+        The converted value for each row, indexed like the passed data
+    """
+    if len(data) > 0 and field.datatype and field.datatype.lower() in DAY_DATATYPES:
+        day_numbers = _get_day_numbers([data[column_name] for column_name in field.path])
+
+        if day_numbers is not None:
+            return _create_days(day_numbers, data.index)
+
+    return _convert_rows(field, data)
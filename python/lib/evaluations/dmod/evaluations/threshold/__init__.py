@@ -21,6 +21,7 @@ import dmod.core.common as common
 
 from .. import specification
 from .. import retrieval
+from .. import caching
 
 
 def get_threshold_retriever(threshold_definition: specification.ThresholdSpecification) -> retrieval.Retriever:
@@ -52,7 +53,7 @@ def get_thresholds(threshold_definition: specification.ThresholdSpecification) -
         A dictionary mapping locations to their thresholds
     """
     threshold_retriever = get_threshold_retriever(threshold_definition)
-    threshold_data: pandas.DataFrame = threshold_retriever.retrieve()
+    threshold_data: pandas.DataFrame = caching.retrieve(threshold_retriever)
 
     thresholds: typing.Dict[str, typing.List[Threshold]] = defaultdict(list)
 
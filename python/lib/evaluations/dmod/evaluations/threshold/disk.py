@@ -11,6 +11,7 @@ from jsonpath_ng.ext import parse as create_expression
 
 from .. import specification
 from .. import util
+from .. import rules
 from .. import retrieval
 
 
@@ -185,20 +186,7 @@ class FrameThresholdRetriever(retrieval.Retriever):
             if custom_rules and custom_rules.threshold_field.name not in document.keys():
                 field = custom_rules.threshold_field
 
-                def conversion_function(column_name_and_value: pandas.Series):
-                    """
-                    Converts a series of column names vs values to the desired data type
-
-                    Args:
-                        column_name_and_value:
-                            A pandas Series mapping column names to values
-                    Returns:
-                        The converted value
-                    """
-                    converted_value = field.to_datatype([value for value in column_name_and_value])
-                    return converted_value
-
-                document[field.name] = document[field.path].apply(conversion_function, axis=1)
+                document[field.name] = rules.apply_rule(field, document)
                 column_names.append(field.name)
 
             # TODO: This is missing handling for value units
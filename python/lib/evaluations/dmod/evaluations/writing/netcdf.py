@@ -1,4 +1,8 @@
+import os
 import typing
+import shutil
+import pathlib
+import tempfile
 
 import numpy
 import pandas
@@ -10,6 +14,11 @@ from . import writer
 from .writer import OutputData
 from .. import specification
 
+try:
+    import netCDF4
+except ImportError:
+    netCDF4 = None
+
 
 class NetcdfOutput(writer.OutputData):
     def get_extension(self) -> str:
@@ -51,6 +60,26 @@ class NetcdfOutput(writer.OutputData):
 
 
 class NetcdfWriter(writer.OutputWriter):
+    def __init__(
+        self,
+        destination: typing.Union[pathlib.Path, str, typing.Sequence[str]] = None,
+        compression_level: int = None,
+        chunk_size: int = None,
+        **kwargs
+    ):
+        """
+        Constructor
+
+        Args:
+            destination: Where to write output if a buffer isn't given
+            compression_level: How much to compress each result, from 1 to 9. Results aren't compressed if None
+            chunk_size: The number of locations to store in each chunk of a result. Results aren't chunked if None
+            **kwargs:
+        """
+        super().__init__(destination, **kwargs)
+        self.__compression_level = compression_level
+        self.__chunk_size = chunk_size
+
     def retrieve_written_output(self, **kwargs) -> OutputData:
         if self.destination is None:
             raise ValueError("Cannot retrieve data that wasn't written to the given destination")
@@ -91,16 +120,38 @@ class NetcdfWriter(writer.OutputWriter):
             "observed_location": (('location_index',), location_data.observed_location)
         }
 
+        # Each row's position along the location and threshold dimensions is found through a hash lookup rather
+        # than a search through every location so that results may be scattered into place all at once
+        location_lookup = pandas.MultiIndex.from_frame(location_data)
+        location_positions = location_lookup.get_indexer(
+            pandas.MultiIndex.from_frame(combined_frames[['observed_location', 'predicted_location']])
+        )
+
         del location_data
 
-        for metric_name, metric_frame in combined_frames.groupby("metric"):  # type: str, pandas.DataFrame
+        # Threshold names may be repeated with different weights; rows belong to the first threshold with their name
+        threshold_names = pandas.Index(threshold_data.threshold_name)
+        first_threshold_positions = numpy.flatnonzero(~threshold_names.duplicated())
+        threshold_positions = threshold_names[first_threshold_positions].get_indexer(combined_frames.threshold_name)
+
+        if (location_positions < 0).any() or (threshold_positions < 0).any():
+            raise ValueError("Values for locations and thresholds are missing or misaligned")
+
+        threshold_positions = first_threshold_positions[threshold_positions]
+
+        result_shape = (len(coordinates['location_index']), len(coordinates['threshold_index']))
+        metric_rows = combined_frames.groupby("metric").indices
+
+        for metric_name in sorted(metric_rows):
+            row_positions = metric_rows[metric_name]
+            metric_frame = combined_frames.iloc[row_positions]
             weight = int(metric_frame.metric_weight.drop_duplicates().values[0])
             metric_function: metric_functions.scoring.Metric = metric_functions.get_metric(metric_name, weight)
             result_attributes = {
                 "long_name": metric_function.get_name(),
                 "description": metric_function.get_descriptions(),
                 "ideal_value": metric_function.ideal_value,
-                "greater_is_better": metric_function.greater_is_better,
+                "greater_is_better": int(metric_function.greater_is_better),
                 "lower_bound": metric_function.lower_bound,
                 "upper_bound": metric_function.upper_bound
             }
@@ -113,64 +164,24 @@ class NetcdfWriter(writer.OutputWriter):
             clean_metric_name = metric_name.replace(" ", "_")
             result_name = f'{clean_metric_name}_result'
             scaled_result_name = f'scaled_{clean_metric_name}_result'
-            data_variables[result_name] = (
-                ("location_index", "threshold_index"),
-                numpy.full(
-                        shape=(len(coordinates['location_index']), len(coordinates['threshold_index'])),
-                        fill_value=numpy.nan,
-                        dtype=numpy.float32
-                ),
-                result_attributes
+
+            results = numpy.full(shape=result_shape, fill_value=numpy.nan, dtype=numpy.float32)
+            scaled_results = numpy.full(shape=result_shape, fill_value=numpy.nan, dtype=numpy.float32)
+
+            metric_locations = location_positions[row_positions]
+            metric_thresholds = threshold_positions[row_positions]
+            results[metric_locations, metric_thresholds] = metric_frame.result.to_numpy(dtype=numpy.float32)
+            scaled_results[metric_locations, metric_thresholds] = metric_frame.scaled_result.to_numpy(
+                dtype=numpy.float32
             )
+
+            data_variables[result_name] = (("location_index", "threshold_index"), results, result_attributes)
             data_variables[scaled_result_name] = (
                 ("location_index", "threshold_index"),
-                numpy.full(
-                        shape=(len(coordinates['location_index']), len(coordinates['threshold_index'])),
-                        fill_value=numpy.nan,
-                        dtype=numpy.float32
-                ),
+                scaled_results,
                 scaled_result_attributes
             )
 
-            location_indices = dict()
-            threshold_indices = dict()
-
-            for row_index_value, row in metric_frame.iterrows():
-                observed_location = row.observed_location
-                predicted_location = row.predicted_location
-                threshold_name = row.threshold_name
-
-                location_index = None
-                if (observed_location, predicted_location) in location_indices:
-                    location_index = location_indices[(observed_location, predicted_location)]
-                else:
-                    for index in coordinates['location_index']:
-                        possible_matching_predicted_location = data_variables['predicted_location'][1].iloc[index]
-                        possible_matching_observed_location = data_variables['observed_location'][1].iloc[index]
-
-                        observed_locations_match = observed_location == possible_matching_observed_location
-                        predicted_locations_match = predicted_location == possible_matching_predicted_location
-                        if observed_locations_match and predicted_locations_match:
-                            location_indices[(observed_location, predicted_location)] = index
-                            location_index = index
-                            break
-
-                threshold_index = None
-                if threshold_name in threshold_indices:
-                    threshold_index = threshold_indices[threshold_name]
-                else:
-                    for index in coordinates['threshold_index']:
-                        if data_variables['threshold_name'][1].iloc[index] == threshold_name:
-                            threshold_indices[threshold_name] = index
-                            threshold_index = index
-                            break
-
-                if location_index is None or threshold_index is None:
-                    raise ValueError("Values for locations and thresholds are missing or misaligned")
-
-                data_variables[result_name][1][location_index, threshold_index] = row.result
-                data_variables[scaled_result_name][1][location_index, threshold_index] = row.scaled_result
-
         output = xarray.Dataset(
                 coords=coordinates,
                 data_vars=data_variables,
@@ -185,11 +196,66 @@ class NetcdfWriter(writer.OutputWriter):
         )
         return output
 
+    def _get_encoding(
+        self,
+        dataset: xarray.Dataset,
+        compression_level: typing.Optional[int],
+        chunk_size: typing.Optional[int]
+    ) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """
+        Describe how each result should be stored on disk
+
+        Args:
+            dataset: The results that will be written
+            compression_level: How much to compress each result, from 1 to 9. Results aren't compressed if None
+            chunk_size: The number of locations to store in each chunk. Results aren't chunked if None
+
+        Returns:
+            The encoding for each result variable
+        """
+        encoding = dict()
+
+        for variable_name, variable in dataset.data_vars.items():
+            if variable.dims != ("location_index", "threshold_index") or 0 in variable.shape:
+                continue
+
+            variable_encoding = dict()
+
+            if compression_level is not None:
+                variable_encoding["zlib"] = True
+                variable_encoding["complevel"] = int(compression_level)
+
+            if chunk_size is not None:
+                variable_encoding["chunksizes"] = (min(int(chunk_size), variable.shape[0]), variable.shape[1])
+
+            encoding[variable_name] = variable_encoding
+
+        return encoding
+
     def write(self, evaluation_results: specification.EvaluationResults, buffer: typing.IO = None, **kwargs):
+        """
+        Writes evaluation data to either disk or a given buffer
+
+        Args:
+            evaluation_results:
+                The results to write
+            buffer:
+                An optional stream to write to instead of the disk
+            **kwargs:
+                'compression_level' and 'chunk_size' may override the values given to the writer
+        """
         if self.destination is None and buffer is None:
             raise ValueError("A buffer must be passed in if no destination is declared")
 
         converted_output = self._to_xarray(evaluation_results)
+
+        compression_level = kwargs.get("compression_level", self.__compression_level)
+        chunk_size = kwargs.get("chunk_size", self.__chunk_size)
+
+        if compression_level is not None or chunk_size is not None:
+            self._write_encoded(converted_output, buffer, compression_level, chunk_size)
+            return
+
         responsible_for_buffer = buffer is None
 
         try:
@@ -202,3 +268,36 @@ class NetcdfWriter(writer.OutputWriter):
         finally:
             if responsible_for_buffer and buffer is not None and not buffer.closed:
                 buffer.close()
+
+    def _write_encoded(
+        self,
+        dataset: xarray.Dataset,
+        buffer: typing.Optional[typing.IO],
+        compression_level: typing.Optional[int],
+        chunk_size: typing.Optional[int]
+    ):
+        """
+        Write results as compressed and/or chunked NetCDF4
+
+        Args:
+            dataset: The results to write
+            buffer: An optional stream to write to instead of the destination
+            compression_level: How much to compress each result, from 1 to 9
+            chunk_size: The number of locations to store in each chunk
+        """
+        if netCDF4 is None:
+            raise ValueError("The netCDF4 library is required to write compressed or chunked NetCDF output")
+
+        encoding = self._get_encoding(dataset, compression_level, chunk_size)
+
+        if buffer is None:
+            dataset.to_netcdf(self.destination, engine="netcdf4", encoding=encoding)
+            return
+
+        # The netCDF4 library can only write to paths, so the output is staged in a temporary file
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            temporary_path = os.path.join(temporary_directory, f"output.{self.get_extension()}")
+            dataset.to_netcdf(temporary_path, engine="netcdf4", encoding=encoding)
+
+            with open(temporary_path, 'rb') as written_output:
+                shutil.copyfileobj(written_output, buffer)
@@ -1,6 +1,9 @@
 import os.path
+import json
+import pickle
 import unittest
 
+from unittest import mock
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -10,6 +13,7 @@ import pandas
 from ...evaluations import specification
 from ...evaluations.retrieval import Retriever
 from ...evaluations import data_retriever
+from ...evaluations import reader
 from ...evaluations.data_retriever import disk
 
 from ..common import get_resource_path
@@ -127,6 +131,36 @@ class TestJSONRetrieving(unittest.TestCase):
         retriever = data_retriever.get_datasource_retriever(self.__response_data_specification)
         TestJSONRetrieving.run_response_assertions(self, retriever)
 
+    def test_parallel_table_json(self):
+        retriever = disk.JSONDataRetriever(self.__table_data_specification)
+        serial_data = retriever.retrieve()
+        parallel_data = retriever.retrieve(workers=2)
+        pandas.testing.assert_frame_equal(serial_data, parallel_data)
+
+    def test_parallel_json_reading(self):
+        retriever = disk.JSONDataRetriever(self.__table_data_specification)
+        serial_data = retriever.retrieve()
+
+        # Documents should be read by the workers that interpret them rather than being passed from this process
+        with mock.patch.object(retriever.backend, "read", side_effect=AssertionError("read in the parent process")):
+            parallel_data = retriever.retrieve(workers=2)
+
+        pandas.testing.assert_frame_equal(serial_data, parallel_data)
+
+    def test_selection_plan_reuse(self):
+        selector = self.__response_data_specification.value_selectors[0]
+        plan = reader.SelectionPlan(selector)
+
+        with open(TEST_RESPONSE_PATH) as response_file:
+            document = json.load(response_file)
+
+        expected_data = plan.select(document)
+
+        # A plan should be reusable across documents and processes without changing what it selects
+        pandas.testing.assert_frame_equal(expected_data, plan.select(document))
+        pandas.testing.assert_frame_equal(expected_data, pickle.loads(pickle.dumps(plan)).select(document))
+        self.assertIsNone(plan.select({"value": {"timeSeries": []}}))
+
     def run_table_assertions(self, retriever: Retriever):
         data = retriever.retrieve()
 
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas
+
+from ..evaluations import caching
+from ..evaluations import data_retriever
+from ..evaluations import util
+
+from .data_retriever import test_csvretriever
+
+
+class TestRetrievalCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__cache_directory = tempfile.TemporaryDirectory()
+        self.__specification = test_csvretriever.TestCSVRetrieving.create_multiple_specification()
+
+    def tearDown(self) -> None:
+        self.__cache_directory.cleanup()
+
+    def test_cached_retrieval(self):
+        cache = caching.RetrievalCache(self.__cache_directory.name)
+        retriever = data_retriever.get_datasource_retriever(self.__specification)
+        key = cache.get_key(retriever)
+
+        self.assertIsNotNone(key)
+        self.assertEqual(key, cache.get_key(data_retriever.get_datasource_retriever(self.__specification)))
+        self.assertIsNone(cache.load(key))
+
+        retrieved_data = cache.retrieve(retriever)
+        self.assertTrue(os.path.exists(cache.get_path(key)))
+
+        cached_data = cache.load(key)
+        self.assertIsNotNone(cached_data)
+        pandas.testing.assert_frame_equal(retrieved_data, cached_data)
+
+        pandas.testing.assert_frame_equal(retrieved_data, cache.retrieve(retriever))
+
+        other_specification = test_csvretriever.TestCSVRetrieving.create_single_data_specification()
+        other_key = cache.get_key(data_retriever.get_datasource_retriever(other_specification))
+        self.assertNotEqual(key, other_key)
+
+    def test_eviction(self):
+        cache = caching.RetrievalCache(self.__cache_directory.name, size_limit=1)
+        retriever = data_retriever.get_datasource_retriever(self.__specification)
+        key = cache.get_key(retriever)
+
+        retrieved_data = cache.retrieve(retriever)
+
+        self.assertFalse(retrieved_data.empty)
+        self.assertIsNone(cache.load(key))
+        self.assertEqual(len(os.listdir(self.__cache_directory.name)), 0)
+
+    @unittest.skipIf(caching.pyarrow is None, "pyarrow is needed to store frames as Parquet")
+    def test_parquet_storage(self):
+        cache = caching.RetrievalCache(self.__cache_directory.name)
+        frame = pandas.DataFrame({"value": [1.0, 2.0, 3.0], "name": ["a", "b", "c"]})
+
+        cache.store("plain", frame)
+
+        self.assertTrue(os.path.exists(cache.get_path("plain", caching.PARQUET_EXTENSION)))
+        pandas.testing.assert_frame_equal(frame, cache.load("plain"))
+
+    @unittest.skipIf(caching.pyarrow is None, "pyarrow is needed to store frames as Parquet")
+    def test_object_column_storage(self):
+        cache = caching.RetrievalCache(self.__cache_directory.name)
+        frame = pandas.DataFrame({"threshold_day": [util.Day(1), util.Day(32)], "value": [4.0, 5.0]})
+
+        with self.assertNoLogs(level="WARNING"):
+            cache.store("objects", frame)
+
+        self.assertFalse(os.path.exists(cache.get_path("objects", caching.PARQUET_EXTENSION)))
+        self.assertTrue(os.path.exists(cache.get_path("objects", caching.PICKLE_EXTENSION)))
+        self.assertEqual(len(os.listdir(self.__cache_directory.name)), 1)
+        pandas.testing.assert_frame_equal(frame, cache.load("objects"))
+
+    def test_load_evicted_while_loading(self):
+        cache = caching.RetrievalCache(self.__cache_directory.name)
+        frame = pandas.DataFrame({"value": [1.0, 2.0, 3.0]})
+        cache.store("evicted", frame)
+
+        # Another process removing the entry between reading and touching it shouldn't prevent its use
+        with mock.patch.object(caching.os, "utime", side_effect=FileNotFoundError):
+            pandas.testing.assert_frame_equal(frame, cache.load("evicted"))
+
+
+if __name__ == '__main__':
+    unittest.main()
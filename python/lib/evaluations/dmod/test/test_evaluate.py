@@ -5,10 +5,13 @@ import typing
 import pathlib
 
 from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
 
 import numpy
 
 import dmod.metrics.scoring as scoring
+from dmod.metrics.communication import Verbosity
 
 from ..evaluations import evaluate
 
@@ -546,6 +549,45 @@ class TestEvaluate(unittest.TestCase):
         cfs_to_cms_evaluator = evaluate.Evaluator(self.__cfs_to_cms_specification)
         self.make_assertions(cfs_to_cms_evaluator)
 
+    def test_parallel_cfs_to_cfs(self):
+        cfs_to_cfs_evaluator = evaluate.Evaluator(self.__cfs_to_cfs_specification, workers=2)
+        self.assertEqual(cfs_to_cfs_evaluator.workers, 2)
+        self.make_assertions(cfs_to_cfs_evaluator)
+
+    def test_parallel_in_daemonic_process(self):
+        cfs_to_cfs_evaluator = evaluate.Evaluator(self.__cfs_to_cfs_specification, workers=2)
+
+        # Daemonic processes can't start a pool, so everything should be done in this process with a warning
+        with mock.patch.object(
+            evaluate.multiprocessing,
+            "current_process",
+            return_value=SimpleNamespace(daemon=True)
+        ), mock.patch.object(evaluate.futures, "ProcessPoolExecutor") as pool_type:
+            with self.assertLogs(level="WARNING") as logs:
+                self.make_assertions(cfs_to_cfs_evaluator)
+
+        pool_type.assert_not_called()
+        self.assertTrue(any("daemonic" in message for message in logs.output))
+
+    def test_parallel_metric_messages(self):
+        serial_collector = evaluate._MessageCollector()
+        evaluate.Evaluator(self.__cfs_to_cfs_specification, serial_collector, Verbosity.ALL).evaluate()
+
+        parallel_collector = evaluate._MessageCollector()
+        evaluate.Evaluator(self.__cfs_to_cfs_specification, parallel_collector, Verbosity.ALL, workers=2).evaluate()
+
+        def get_metric_messages(collector: evaluate._MessageCollector) -> typing.List[str]:
+            # Shards finish in any order, so messages are compared regardless of order
+            return sorted(
+                json.dumps(message.data, sort_keys=True, default=str)
+                for message in collector.messages
+                if message.reason == "metric"
+            )
+
+        serial_messages = get_metric_messages(serial_collector)
+        self.assertGreater(len(serial_messages), 0)
+        self.assertEqual(serial_messages, get_metric_messages(parallel_collector))
+
     def make_assertions(self, evaluator: evaluate.Evaluator):
         evaluation_results = evaluator.evaluate()
 
@@ -1,7 +1,10 @@
 import unittest
 import random
 
+import pandas
+
 from ..evaluations import measurement_units
+from ..evaluations import evaluate
 
 DELTA = 0.0001
 
@@ -191,6 +194,31 @@ class TestMeasurementUnits(unittest.TestCase):
 
             self.assertAlmostEqual(manual_conversion, library_conversion)
 
+    def test_converting_columns(self):
+        cross_conversions = [
+            ManualConversion('kcfs', 'CFS', factor=1000),
+            ManualConversion('CMS', 'CMS', factor=1),
+            ManualConversion('ft3 s-1', 'm3 s-1', factor=1/35.314666212661),
+            ManualConversion('fahrenheit', 'celsius', factor=5/9, initial_addition=-32),
+        ]
+
+        rows = pandas.DataFrame(
+            [
+                {"value": random.uniform(8.4, 29.1), "from_unit": cross.from_unit, "to_unit": cross.to_unit}
+                for _ in range(5)
+                for cross in cross_conversions
+            ],
+            index=range(100, 120)
+        )
+
+        converter = evaluate.UnitConverter("value", "from_unit", "to_unit")
+        converted_values = converter(rows)
+
+        self.assertTrue(converted_values.index.equals(rows.index))
+
+        for (row_number, row), cross in zip(rows.iterrows(), cross_conversions * 5):
+            self.assertAlmostEqual(cross(row["value"]), converted_values[row_number])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import pandas
+
+from ..evaluations import specification
+from ..evaluations import rules
+from ..evaluations import util
+
+
+def convert_each_row(field: specification.AssociatedField, data: pandas.DataFrame) -> pandas.Series:
+    return data[field.path].apply(lambda row: field.to_datatype([value for value in row]), axis=1)
+
+
+class TestApplicationRules(unittest.TestCase):
+    def assert_matches_rows(self, field: specification.AssociatedField, data: pandas.DataFrame):
+        expected_values = convert_each_row(field, data)
+        actual_values = rules.apply_rule(field, data)
+
+        self.assertTrue(expected_values.index.equals(actual_values.index))
+
+        for expected_value, actual_value in zip(expected_values, actual_values):
+            self.assertIsInstance(actual_value, type(expected_value))
+            self.assertEqual(expected_value, actual_value)
+
+    def test_days_from_dates(self):
+        field = specification.AssociatedField(name="threshold_day", path=["value_date"], datatype="Day")
+
+        # Cover leap and non-leap years along with days on either side of the end of February
+        dates = pandas.date_range("2015-12-25", "2016-03-05", freq="1D").append(
+            pandas.date_range("2017-02-25", "2017-03-05", freq="1D")
+        )
+
+        naive_data = pandas.DataFrame({"value_date": dates, "value": range(len(dates))}, index=range(5, 5 + len(dates)))
+        self.assert_matches_rows(field, naive_data)
+
+        aware_data = naive_data.assign(value_date=naive_data.value_date.dt.tz_localize("UTC"))
+        self.assert_matches_rows(field, aware_data)
+
+    def test_days_from_months_and_days(self):
+        field = specification.AssociatedField(name="threshold_day", path=["month_nu", "day_nu"], datatype="Day")
+        data = pandas.DataFrame(
+            {
+                "month_nu": [1, 2, 2, 3, 12, 7.0],
+                "day_nu": [1, 28, 29, 1, 31, 4.0],
+            }
+        )
+        self.assert_matches_rows(field, data)
+
+    def test_days_from_numbers(self):
+        field = specification.AssociatedField(name="threshold_day", path=["day_of_year"], datatype="Day")
+        data = pandas.DataFrame({"day_of_year": [1, 59, 60, 61, 366, 45.7]})
+        self.assert_matches_rows(field, data)
+
+    def test_fallback(self):
+        field = specification.AssociatedField(name="threshold_day", path=["value_date"], datatype="Day")
+
+        text_data = pandas.DataFrame({"value_date": ["2016-02-29", "2017-03-01T12:00:00"]})
+        self.assert_matches_rows(field, text_data)
+
+        # Invalid values should fail the same way that they do when converting row by row
+        out_of_range_data = pandas.DataFrame({"value_date": [5, 400]})
+
+        with self.assertRaises(ValueError):
+            rules.apply_rule(field, out_of_range_data)
+
+        self.assertIsInstance(rules.apply_rule(field, pandas.DataFrame({"value_date": [5]})).iloc[0], util.Day)
+
+
+if __name__ == '__main__':
+    unittest.main()
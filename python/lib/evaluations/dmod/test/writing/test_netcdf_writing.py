@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import tempfile
+import unittest
+
+from unittest import TestCase
+
+import numpy
+import xarray
+
+from ...evaluations import specification
+from ...evaluations.evaluate import evaluate
+from ...evaluations import writing
+from ...evaluations.writing import netcdf as netcdf_writing
+from .. import test_evaluate
+
+from ..common import EPSILON
+
+
+def get_evaluation_results() -> specification.EvaluationResults:
+    return evaluate(test_evaluate.TestEvaluate.get_cfs_to_cfs_specification())
+
+
+class TestNetcdfWriting(TestCase):
+    def setUp(self) -> None:
+        self._evaluation_results = get_evaluation_results()
+
+    def test_buffered_writing(self):
+        writer = writing.get_writer("netcdf")
+        output_buffer = io.BytesIO()
+        writer.write(self._evaluation_results, output_buffer)
+
+        # Reading NetCDF4 from a buffer needs h5netcdf, so the output is read back from a file instead
+        with tempfile.TemporaryDirectory() as output_directory:
+            output_path = os.path.join(output_directory, "buffered.nc")
+
+            with open(output_path, "wb") as output_file:
+                output_file.write(output_buffer.getvalue())
+
+            dataset = xarray.load_dataset(output_path)
+
+        # These match the expected results of the same evaluation in test_evaluate
+        self.assertAlmostEqual(dataset.attrs['grade'], 68.48, delta=EPSILON)
+        self.assertAlmostEqual(dataset.attrs['mean'], 0.6848999, delta=EPSILON)
+        self.assertAlmostEqual(dataset.attrs['median'], 0.6848999, delta=EPSILON)
+        self.assertAlmostEqual(dataset.attrs['standard_deviation'], 0.061071, delta=EPSILON)
+        self.assertAlmostEqual(dataset.attrs['result'], 1.3697998, delta=EPSILON)
+
+    @unittest.skipIf(netcdf_writing.netCDF4 is None, "netCDF4 is needed to write compressed NetCDF output")
+    def test_compressed_writing(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            plain_path = os.path.join(output_directory, "plain.nc")
+            compressed_path = os.path.join(output_directory, "compressed.nc")
+
+            writing.get_writer("netcdf", plain_path).write(self._evaluation_results)
+            writing.get_writer("netcdf", compressed_path, compression_level=4, chunk_size=1).write(
+                self._evaluation_results
+            )
+
+            plain_dataset = xarray.load_dataset(plain_path)
+            compressed_dataset = xarray.load_dataset(compressed_path)
+
+        xarray.testing.assert_identical(plain_dataset, compressed_dataset)
+        self.assertEqual(compressed_dataset.attrs['result'], self._evaluation_results.value)
+
+        for frame in self._evaluation_results.to_frames().values():
+            for _, row in frame.iterrows():
+                location_index = numpy.flatnonzero(
+                    (compressed_dataset.observed_location.values == row.observed_location)
+                    & (compressed_dataset.predicted_location.values == row.predicted_location)
+                )[0]
+                threshold_index = numpy.flatnonzero(compressed_dataset.threshold_name.values == row.threshold_name)[0]
+                result_name = f"{row.metric.replace(' ', '_')}_result"
+                written_result = compressed_dataset[result_name].values[location_index, threshold_index]
+
+                if numpy.isnan(row.result):
+                    self.assertTrue(numpy.isnan(written_result))
+                else:
+                    self.assertAlmostEqual(written_result, row.result, delta=EPSILON)
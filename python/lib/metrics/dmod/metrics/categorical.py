@@ -230,6 +230,114 @@ class CategoricalMetricMetadata(object):
         return self.__greater_is_better
 
 
+def get_events(values: pandas.Series, thresholds: typing.Sequence[Threshold]) -> numpy.ndarray:
+    """
+    Determine which values fall within each threshold
+
+    Values are compared against the values of every threshold that shares an operator at once
+
+    Args:
+        values: The values to check
+        thresholds: The thresholds to check the values against
+
+    Returns:
+        A boolean matrix with a row for each threshold and a column for each value
+
+    Raises:
+        ValueError: A threshold transforms the values into a different number of values
+    """
+    events = numpy.zeros((len(thresholds), len(values)), dtype=bool)
+    thresholds_by_operator: typing.Dict[typing.Callable, typing.List[int]] = dict()
+
+    for threshold_index, threshold in enumerate(thresholds):
+        if threshold.value_filter.transformation_function:
+            # Transformed values can't be compared positionally, so they have to be checked on their own
+            transformed_events = numpy.asarray(threshold(values), dtype=bool)
+
+            if len(transformed_events) != len(values):
+                raise ValueError(
+                    f"Cannot determine events for the '{threshold.name}' threshold alongside others - "
+                    f"its transformation turned {len(values)} values into {len(transformed_events)}"
+                )
+
+            events[threshold_index] = transformed_events
+        else:
+            thresholds_by_operator.setdefault(threshold.value_filter.operator, list()).append(threshold_index)
+
+    raw_values = values.to_numpy(dtype=float, na_value=numpy.nan)
+
+    for operator, threshold_indices in thresholds_by_operator.items():
+        threshold_values = numpy.vstack([
+            thresholds[threshold_index].value_filter.threshold_values(values.index)
+            for threshold_index in threshold_indices
+        ])
+        events[threshold_indices] = operator(raw_values[numpy.newaxis, :], threshold_values)
+
+    return events
+
+
+def _tally_events(observed_events: numpy.ndarray, predicted_events: numpy.ndarray) -> numpy.ndarray:
+    """
+    Tally the contingency table for every row of paired events
+
+    Args:
+        observed_events: A boolean matrix with a row of observed events for each threshold
+        predicted_events: A boolean matrix with a row of predicted events for each threshold
+
+    Returns:
+        A matrix with a row for each threshold whose columns are the number of hits, misses, false positives,
+        and true negatives
+    """
+    hits = numpy.count_nonzero(observed_events & predicted_events, axis=1)
+    misses = numpy.count_nonzero(observed_events & ~predicted_events, axis=1)
+    false_positives = numpy.count_nonzero(~observed_events & predicted_events, axis=1)
+    true_negatives = observed_events.shape[1] - hits - misses - false_positives
+
+    return numpy.column_stack([hits, misses, false_positives, true_negatives])
+
+
+def count_outcomes(
+    observations: pandas.Series,
+    predictions: pandas.Series,
+    thresholds: typing.Sequence[Threshold]
+) -> numpy.ndarray:
+    """
+    Tally the contingency table for every threshold at once
+
+    Thresholds that transform the data may change how many values there are, so each of them is
+    tallied on its own
+
+    Args:
+        observations: An ordered series of values representing all observations
+        predictions: An ordered series of values representing all predictions
+        thresholds: The thresholds that each define a contingency table
+
+    Returns:
+        A matrix with a row for each threshold whose columns are the number of hits, misses, false positives,
+        and true negatives
+    """
+    counts = numpy.zeros((len(thresholds), 4), dtype=numpy.int64)
+    positional_indices: typing.List[int] = list()
+
+    for threshold_index, threshold in enumerate(thresholds):
+        if threshold.value_filter.transformation_function:
+            counts[threshold_index] = _tally_events(
+                numpy.asarray(threshold(observations), dtype=bool)[numpy.newaxis, :],
+                numpy.asarray(threshold(predictions), dtype=bool)[numpy.newaxis, :]
+            )[0]
+        else:
+            positional_indices.append(threshold_index)
+
+    if positional_indices:
+        positional_thresholds = [thresholds[threshold_index] for threshold_index in positional_indices]
+        counts[positional_indices] = _tally_events(
+            get_events(observations, positional_thresholds),
+            get_events(predictions, positional_thresholds)
+        )
+
+    return counts
+
+
 class TruthTable(object):
     """
     Represents and calculates the categorical metrics for a single threshold
@@ -286,16 +394,7 @@ class TruthTable(object):
             predictions: An ordered series of values representing all predictions used to form the truth table
             threshold: The threshold used to indicate something that might constitute a notable event
         """
-        self.__name = threshold.name or "Unknown"
-        self.__threshold = threshold
-
-        observed_values_that_matter = threshold(observations)
-        predicted_values_that_matter = threshold(predictions)
-
-        self.__observation_had_activity = observed_values_that_matter.any()
-        self.__predictions_had_activity = predicted_values_that_matter.any()
-
-        # Creates a contingency table matching:
+        # Forms the four cells of a contingency table matching:
         #
         #  Observations     False                   True
         #  Predictions
@@ -310,45 +409,63 @@ class TruthTable(object):
         #  False            51          2       53
         #  True             0           1       1
         #                   51          3       54
-        # contingency_table[False] => 51, 0
-        # contingency_table[True] => 2, 1
-        #
-        #
-        # contingency_table[Observed Event][Predicted Event]
         #
-        # hits: contingency_table[True][True]
-        # misses: contingency_table[True][False]
-        # true negatives: contingency_table[False][False]
-        # False Positives: contingency_table[False][True]
-        #
-        contingency_table = pandas.crosstab(predicted_values_that_matter.values, observed_values_that_matter.values)
+        hits, misses, false_positives, true_negatives = (
+            int(count) for count in count_outcomes(observations, predictions, [threshold])[0]
+        )
 
-        # Store evaluated parameters so they don't have to be evaluated multiple times
-        self.__hits = 0
-        self.__false_positives = 0
-        self.__true_negatives = 0
-        self.__misses = 0
+        # The size of the table is the sum of all four cells; from the example above, 51 + 2 + 0 + 1 => 54
+        self._populate(threshold, hits, misses, false_positives, true_negatives)
 
-        if True in contingency_table:
-            self.__hits = contingency_table[True][True] if True in contingency_table[True] else 0
-            self.__misses = contingency_table[True][False] if False in contingency_table[True] else 0
+    @classmethod
+    def from_counts(
+        cls,
+        threshold: Threshold,
+        hits: int,
+        misses: int,
+        false_positives: int,
+        true_negatives: int
+    ) -> "TruthTable":
+        """
+        Build a truth table from an already tallied contingency table
 
-        if False in contingency_table:
-            self.__true_negatives = contingency_table[False][False] if False in contingency_table[False] else 0
-            self.__false_positives = contingency_table[False][True] if True in contingency_table[False] else 0
+        Args:
+            threshold: The threshold used to indicate something that might constitute a notable event
+            hits: The number of times both the observation and the prediction fit within the threshold
+            misses: The number of times the observation fit within the threshold but the prediction did not
+            false_positives: The number of times the prediction fit within the threshold but the observation did not
+            true_negatives: The number of times neither the observation nor the prediction fit within the threshold
 
-        # Adds the values in each column together, then adds those numbers togethers.
-        #
-        # From the Example above:
-        #
-        #  Observations     False       True
-        #  Predictions
-        #  False            51          2
-        #  True             0           1
-        #
-        #  contingency_table.sum() => (False, 51), (True, 3)
-        #  contingency_table.sum().sum() => 54
-        self.__size = contingency_table.sum().sum()
+        Returns:
+            A truth table bearing the given counts
+        """
+        table = cls.__new__(cls)
+        table._populate(threshold, hits, misses, false_positives, true_negatives)
+        return table
+
+    def _populate(self, threshold: Threshold, hits: int, misses: int, false_positives: int, true_negatives: int):
+        """
+        Store the counts of the contingency table and prepare every derived metric for lazy evaluation
+
+        Args:
+            threshold: The threshold used to indicate something that might constitute a notable event
+            hits: The number of times both the observation and the prediction fit within the threshold
+            misses: The number of times the observation fit within the threshold but the prediction did not
+            false_positives: The number of times the prediction fit within the threshold but the observation did not
+            true_negatives: The number of times neither the observation nor the prediction fit within the threshold
+        """
+        self.__name = threshold.name or "Unknown"
+        self.__threshold = threshold
+
+        # Store evaluated parameters so they don't have to be evaluated multiple times
+        self.__hits = hits
+        self.__misses = misses
+        self.__false_positives = false_positives
+        self.__true_negatives = true_negatives
+        self.__size = hits + misses + false_positives + true_negatives
+
+        self.__observation_had_activity = hits + misses > 0
+        self.__predictions_had_activity = hits + false_positives > 0
 
         self.__observed_positives = self.__hits + self.__misses
         self.__observed_negatives = self.__false_positives + self.__true_negatives
@@ -759,8 +876,11 @@ class TruthTables(object):
         has_usable_thresholds = thresholds is not None and len([val for val in thresholds]) > 0
 
         if has_usable_observations and has_usable_predictions and has_usable_thresholds:
-            for threshold in thresholds:
-                self.create_table(observations, predictions, threshold)
+            thresholds = list(thresholds)
+
+            # Every table is counted at once rather than building a contingency table for each threshold
+            for threshold, counts in zip(thresholds, count_outcomes(observations, predictions, thresholds)):
+                self.add_table(TruthTable.from_counts(threshold, *(int(count) for count in counts)))
 
         if tables is not None:
             for table in tables:
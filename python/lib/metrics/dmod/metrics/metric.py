@@ -26,6 +26,7 @@ from pandas.api import types as pandas_types
 from . import scoring
 from . import threshold
 from . import categorical
+from . import statistics
 from .threshold import Threshold
 
 NUMBER = typing.Union[int, float]
@@ -170,6 +171,39 @@ def series_to_numeric_sequence(
     return sequence
 
 
+def _get_scale(scale: typing.Optional[float]) -> float:
+    """
+    Args:
+        scale: A factor that a component of a metric should be scaled by
+
+    Returns:
+        The given scale, or 1 if no scale was given
+    """
+    if scale is None or numpy.isnan(scale):
+        return 1
+    return scale
+
+
+def filter_pairs(pairs: pandas.DataFrame, pair_threshold: Threshold, **kwargs) -> pandas.DataFrame:
+    """
+    Filter pairs by a threshold, reusing the results of other metrics if a `threshold.FilterCache` was passed
+
+    Args:
+        pairs: The pairs to filter
+        pair_threshold: The threshold to filter by
+        **kwargs: The keyword arguments passed to a metric
+
+    Returns:
+        The pairs that fall within the threshold
+    """
+    filter_cache: typing.Optional[threshold.FilterCache] = kwargs.get(threshold.FILTER_CACHE_KEY)
+
+    if filter_cache is None:
+        return pair_threshold(pairs)
+
+    return filter_cache.filter(pairs, pair_threshold)
+
+
 def find_truthtables_key(**kwargs) -> typing.Optional[str]:
     """
     Attempts to find the key corresponding to a TruthTables object within passed in keyword arguments
@@ -250,6 +284,37 @@ class CategoricalMetric(scoring.Metric, abc.ABC):
     def get_name(cls):
         return cls.get_metadata().name
 
+    @classmethod
+    def get_table_function(cls) -> typing.Callable[[categorical.TruthTable], NUMBER]:
+        """
+        Returns:
+            The function on a truth table that calculates this metric
+        """
+        identifier = cls.get_identifier()
+
+        for metric_name in categorical.TruthTable.metrics():
+            if scoring.create_identifier(metric_name) == identifier:
+                return getattr(categorical.TruthTable, metric_name)
+
+        raise KeyError(f"There is no function on a truth table that calculates '{cls.get_name()}'")
+
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return True
+
+    def score_statistics(self, summary: statistics.ThresholdStatistics, *args, **kwargs) -> numpy.ndarray:
+        table_function = self.get_table_function()
+        values = numpy.full(len(summary), numpy.nan)
+
+        for group_index, group_threshold in enumerate(summary.thresholds):
+            if group_threshold is not None:
+                values[group_index] = table_function(summary.truth_table(group_index))
+
+        return values
+
+    def get_sample_sizes(self, summary: statistics.ThresholdStatistics) -> numpy.ndarray:
+        return summary.size
+
     def __init__(self, weight: NUMBER):
         """
         Constructor
@@ -376,7 +441,7 @@ class LinearTemporalTrendAbsoluteError(scoring.Metric):
 
         for error_threshold in thresholds:
             result = numpy.nan
-            filtered_pairs = error_threshold(pairs)
+            filtered_pairs = filter_pairs(pairs, error_threshold, **kwargs)
 
             if len(filtered_pairs) > 1:
                 errors = abs(filtered_pairs[observed_value_label] - filtered_pairs[predicted_value_label])
@@ -390,6 +455,17 @@ class LinearTemporalTrendAbsoluteError(scoring.Metric):
 
         return scoring.Scores(self, scores)
 
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return True
+
+    def score_statistics(self, summary: statistics.ThresholdStatistics, *args, **kwargs) -> numpy.ndarray:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            slope = summary.position_error_products / summary.position_squared_deviations
+            result = numpy.rad2deg(numpy.arctan(slope)) / 90.0
+
+        return numpy.where(summary.sample_size > 1, result, numpy.nan)
+
 
 class PearsonCorrelationCoefficient(scoring.Metric):
     @classmethod
@@ -431,7 +507,7 @@ class PearsonCorrelationCoefficient(scoring.Metric):
 
         for pearson_threshold in thresholds:
             result = numpy.nan
-            filtered_pairs = pearson_threshold(pairs)
+            filtered_pairs = filter_pairs(pairs, pearson_threshold, **kwargs)
 
             if not filtered_pairs.empty:
                 result = numpy.corrcoef(filtered_pairs[observed_value_label], filtered_pairs[predicted_value_label])
@@ -443,6 +519,19 @@ class PearsonCorrelationCoefficient(scoring.Metric):
 
         return scoring.Scores(self, scores)
 
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return True
+
+    def score_statistics(self, summary: statistics.ThresholdStatistics, *args, **kwargs) -> numpy.ndarray:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            result = summary.deviation_products / numpy.sqrt(
+                summary.observed_squared_deviations * summary.predicted_squared_deviations
+            )
+
+        # Mirror numpy.corrcoef, which clips away any floating point error beyond the bounds of the coefficient
+        return numpy.clip(result, -1.0, 1.0)
+
 
 class KlingGuptaEfficiency(scoring.Metric):
     @classmethod
@@ -480,14 +569,9 @@ class KlingGuptaEfficiency(scoring.Metric):
         *args,
         **kwargs
     ) -> scoring.Scores:
-        if alpha_scale is None or numpy.isnan(alpha_scale):
-            alpha_scale = 1
-
-        if beta_scale is None or numpy.isnan(beta_scale):
-            beta_scale = 1
-
-        if gamma_scale is None or numpy.isnan(gamma_scale):
-            gamma_scale = 1
+        alpha_scale = _get_scale(alpha_scale)
+        beta_scale = _get_scale(beta_scale)
+        gamma_scale = _get_scale(gamma_scale)
 
         alpha_values = PearsonCorrelationCoefficient(self.weight)(
             pairs,
@@ -502,7 +586,7 @@ class KlingGuptaEfficiency(scoring.Metric):
 
         for kling_threshold in thresholds:
             result = numpy.nan
-            filtered_pairs = kling_threshold(pairs)
+            filtered_pairs = filter_pairs(pairs, kling_threshold, **kwargs)
 
             if not filtered_pairs.empty:
                 observed_values: pandas.Series = filtered_pairs[observed_value_label]
@@ -535,6 +619,34 @@ class KlingGuptaEfficiency(scoring.Metric):
 
         return scoring.Scores(self, scores)
 
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return True
+
+    def score_statistics(
+        self,
+        summary: statistics.ThresholdStatistics,
+        alpha_scale: float = None,
+        beta_scale: float = None,
+        gamma_scale: float = None,
+        *args,
+        **kwargs
+    ) -> numpy.ndarray:
+        alpha = PearsonCorrelationCoefficient(self.weight).score_statistics(summary) * _get_scale(alpha_scale)
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            beta = summary.predicted_mean / summary.observed_mean * _get_scale(beta_scale)
+
+            # The degrees of freedom cancel out, so the ratio of the standard deviations is the square root of the
+            # ratio of the squared deviations
+            gamma = numpy.sqrt(
+                summary.predicted_squared_deviations / summary.observed_squared_deviations
+            ) * _get_scale(gamma_scale)
+
+            result = 1.0 - numpy.sqrt((alpha - 1)**2 + (beta - 1)**2 + (gamma - 1)**2)
+
+        return numpy.where(summary.sample_size > 0, result, numpy.nan)
+
 
 class NormalizedNashSutcliffeEfficiency(scoring.Metric):
     @classmethod
@@ -572,7 +684,7 @@ class NormalizedNashSutcliffeEfficiency(scoring.Metric):
 
         for nnse_threshold in thresholds:
             normalized_nash_sutcliffe_efficiency = numpy.nan
-            filtered_pairs = nnse_threshold(pairs)
+            filtered_pairs = filter_pairs(pairs, nnse_threshold, **kwargs)
 
             if not filtered_pairs.empty:
                 mean_observation = filtered_pairs[observed_value_label].mean()
@@ -595,6 +707,17 @@ class NormalizedNashSutcliffeEfficiency(scoring.Metric):
 
         return scoring.Scores(self, scores)
 
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return True
+
+    def score_statistics(self, summary: statistics.ThresholdStatistics, *args, **kwargs) -> numpy.ndarray:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            nash_sutcliffe_efficiency = 1 - (summary.squared_errors / summary.observed_squared_deviations)
+            result = 1 / (2 - nash_sutcliffe_efficiency)
+
+        return numpy.where(summary.sample_size > 0, result, numpy.nan)
+
 
 class VolumeError(scoring.Metric):
     @classmethod
@@ -630,7 +753,7 @@ class VolumeError(scoring.Metric):
         scores: typing.List[scoring.Score] = list()
 
         for volume_threshold in thresholds:
-            filtered_pairs = volume_threshold(pairs)
+            filtered_pairs = filter_pairs(pairs, volume_threshold, **kwargs)
             difference = 0
             if not filtered_pairs.empty:
                 dates: typing.List[int] = [value.astype("int") for value in filtered_pairs.index.values]
@@ -641,6 +764,18 @@ class VolumeError(scoring.Metric):
 
         return scoring.Scores(self, scores)
 
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return True
+
+    def score_statistics(self, summary: statistics.ThresholdStatistics, *args, **kwargs) -> numpy.ndarray:
+        # An area cannot be formed from a single point
+        return numpy.where(
+            summary.sample_size > 1,
+            summary.area_difference,
+            numpy.where(summary.sample_size == 0, 0.0, numpy.nan)
+        )
+
 
 class ProbabilityOfDetection(CategoricalMetric):
     @classmethod
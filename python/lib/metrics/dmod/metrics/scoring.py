@@ -15,8 +15,12 @@ import numpy
 import dmod.core.common as common
 
 from .threshold import Threshold
+from .threshold import FilterCache
+from .threshold import FILTER_CACHE_KEY
 from .communication import Verbosity
 from .communication import CommunicatorGroup
+from . import categorical
+from . import statistics
 
 ARGS = typing.Optional[typing.Sequence]
 KWARGS = typing.Optional[typing.Dict[str, typing.Any]]
@@ -302,6 +306,43 @@ class Metric(
     ) -> "Scores":
         pass
 
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        """
+        Returns:
+            Whether the metric may be calculated from summary statistics through `score_statistics`
+        """
+        return False
+
+    def score_statistics(self, summary: statistics.ThresholdStatistics, *args, **kwargs) -> numpy.ndarray:
+        """
+        Calculate the metric for every group described by a set of summary statistics
+
+        Only metrics that support statistics may be calculated this way
+
+        Args:
+            summary: Statistics describing the pairs that fit within a single threshold position for every group
+            *args: All undefined positional arguments
+            **kwargs: All passed in keyword arguments
+
+        Returns:
+            The value of the metric for each group
+
+        Raises:
+            NotImplementedError: The metric cannot be derived from summary statistics
+        """
+        raise NotImplementedError(f"{self.name} cannot be calculated from summary statistics")
+
+    def get_sample_sizes(self, summary: statistics.ThresholdStatistics) -> numpy.ndarray:
+        """
+        Args:
+            summary: Statistics describing the pairs that fit within a single threshold position for every group
+
+        Returns:
+            The number of values that the metric was calculated upon for each group
+        """
+        return summary.sample_size
+
     def __str__(self) -> str:
         return self.name
 
@@ -835,6 +876,10 @@ class ScoringScheme(object):
 
         results = MetricResults(weight=weight)
 
+        # Each threshold only needs to filter the pairs once no matter how many metrics use it
+        if kwargs.get(FILTER_CACHE_KEY) is None:
+            kwargs[FILTER_CACHE_KEY] = FilterCache(pairs)
+
         for metric in self.__metrics:  # type: Metric
             self.__communicators.info(f"Calling {metric.name}", verbosity=Verbosity.LOUD, publish=True)
             scores = metric(
@@ -846,19 +891,247 @@ class ScoringScheme(object):
                 **kwargs
             )
             results.add_scores(scores)
+            self._send_scores(scores, metadata)
+
+        return results
+
+    def score_groups(
+        self,
+        pairs: pandas.DataFrame,
+        observed_value_label: str,
+        predicted_value_label: str,
+        group_by: typing.Union[str, typing.Sequence[str]],
+        thresholds: statistics.THRESHOLD_MAPPING,
+        threshold_key: str = None,
+        group_names: typing.Sequence[str] = None,
+        weight: NUMBER = None,
+        *args,
+        **kwargs
+    ) -> typing.Dict[statistics.GROUP_KEY, MetricResults]:
+        """
+        Score every group within a set of pairs at once
+
+        The pairs are summarized a single time and every metric that supports it is calculated for all groups
+        from those summaries. Metrics that cannot be derived from summary statistics, groups with thresholds
+        that transform data, and groups whose thresholds keep pairs with missing values are scored individually,
+        just like `ScoringScheme.score`
+
+        Args:
+            pairs: The observed and predicted values for every group
+            observed_value_label: The name of the column containing observations
+            predicted_value_label: The name of the column containing predictions
+            group_by: The column(s) used to divide the pairs into groups
+            thresholds: The thresholds to score with, mapped to the value of the `threshold_key` column they apply to
+            threshold_key: The grouping column whose value identifies which thresholds to use. Defaults to the first
+                grouping column
+            group_names: The names to give each grouping value when describing a group. Defaults to the names of the
+                grouping columns
+            weight: The weight for the results of each group
+            *args: Positional arguments to pass to each metric
+            **kwargs: Keyword arguments to pass to each metric
+
+        Returns:
+            The results for each group that had thresholds, keyed by the values of its grouping columns
+        """
+        summary = statistics.summarize(
+            pairs=pairs,
+            observed_value_label=observed_value_label,
+            predicted_value_label=predicted_value_label,
+            group_by=group_by,
+            thresholds=thresholds,
+            threshold_key=threshold_key
+        )
+
+        return self._score_summary(
+            summary,
+            group_names,
+            weight,
+            pairs,
+            observed_value_label,
+            predicted_value_label,
+            args,
+            kwargs
+        )
+
+    def score_summary(
+        self,
+        summary: statistics.GroupedStatistics,
+        group_names: typing.Sequence[str] = None,
+        weight: NUMBER = None,
+        *args,
+        **kwargs
+    ) -> typing.Dict[statistics.GROUP_KEY, MetricResults]:
+        """
+        Score every group described by summary statistics, such as those gathered by a `StatisticsAccumulator`
+
+        Args:
+            summary: Statistics for every threshold of every group
+            group_names: The names to give each grouping value when describing a group. Defaults to the names of the
+                grouping columns
+            weight: The weight for the results of each group
+            *args: Positional arguments to pass to each metric
+            **kwargs: Keyword arguments to pass to each metric
+
+        Returns:
+            The results for each group that had thresholds, keyed by the values of its grouping columns
+
+        Raises:
+            NotImplementedError: A metric in the scheme cannot be calculated from summary statistics
+        """
+        return self._score_summary(summary, group_names, weight, None, None, None, args, kwargs)
+
+    def _score_summary(
+        self,
+        summary: statistics.GroupedStatistics,
+        group_names: typing.Optional[typing.Sequence[str]],
+        weight: typing.Optional[NUMBER],
+        pairs: typing.Optional[pandas.DataFrame],
+        observed_value_label: typing.Optional[str],
+        predicted_value_label: typing.Optional[str],
+        args: typing.Sequence,
+        kwargs: typing.Dict[str, typing.Any]
+    ) -> typing.Dict[statistics.GROUP_KEY, MetricResults]:
+        """
+        Score every group described by summary statistics
+
+        Args:
+            summary: Statistics for every threshold of every group
+            group_names: The names to give each grouping value when describing a group
+            weight: The weight for the results of each group
+            pairs: The pairs that were summarized, if they are still available to score directly
+            observed_value_label: The name of the column containing observations within the pairs
+            predicted_value_label: The name of the column containing predictions within the pairs
+            args: Positional arguments to pass to each metric
+            kwargs: Keyword arguments to pass to each metric
+
+        Returns:
+            The results for each group that had thresholds, keyed by the values of its grouping columns
+        """
+        if len(self.__metrics) == 0:
+            raise ValueError(
+                "No metrics were attached to the scoring scheme - values cannot be scored and aggregated"
+            )
+
+        group_names = list(group_names or summary.names)
 
-            if self.__communicators.send_all():
-                message = {
-                    "metric": scores.metric.name,
-                    "description": scores.metric.get_descriptions(),
-                    "weight": scores.metric.weight,
-                    "total": scores.total,
-                    "scores": scores.to_dict()
-                }
+        if len(group_names) != len(summary.names):
+            raise ValueError(
+                f"Cannot score groups - {len(group_names)} names were given for {len(summary.names)} grouping columns"
+            )
 
-                if metadata:
-                    message['metadata'] = metadata
+        weight = 1 if not weight or numpy.isnan(weight) else weight
 
-                self.__communicators.write(reason="metric", data=message, verbosity=Verbosity.ALL)
+        # Maps each metric to its values and sample sizes for each threshold position
+        summarized_metrics: typing.Dict[Metric, typing.List[typing.Tuple[numpy.ndarray, numpy.ndarray]]] = dict()
+
+        for metric in self.__metrics:
+            if not metric.supports_statistics():
+                if pairs is None:
+                    raise NotImplementedError(f"{metric.name} cannot be calculated from summary statistics")
+                continue
+
+            self.__communicators.info(f"Calling {metric.name}", verbosity=Verbosity.LOUD, publish=True)
+            summarized_metrics[metric] = [
+                (metric.score_statistics(slot, *args, **kwargs), metric.get_sample_sizes(slot))
+                for slot in summary.slots
+            ]
+
+        results: typing.Dict[statistics.GROUP_KEY, MetricResults] = dict()
+
+        for group_index, key in enumerate(summary.keys):
+            group_thresholds = summary.get_thresholds(group_index)
+
+            if not group_thresholds:
+                continue
+
+            group_values = key if len(group_names) > 1 else (key,)
+            metadata = dict(zip(group_names, group_values))
+
+            if not summary.is_supported(group_index):
+                if pairs is None:
+                    raise ValueError(
+                        f"Cannot score {metadata} - thresholds that transform data or keep pairs with missing values "
+                        f"must be applied to the pairs"
+                    )
+
+                group = pairs.iloc[summary.get_positions(group_index)]
+                results[key] = self.score(
+                    group,
+                    observed_value_label,
+                    predicted_value_label,
+                    group_thresholds,
+                    weight,
+                    metadata,
+                    *args,
+                    truth_tables=categorical.TruthTables(
+                        group[observed_value_label],
+                        group[predicted_value_label],
+                        group_thresholds
+                    ),
+                    **kwargs
+                )
+                continue
+
+            group_results = MetricResults(weight=weight)
+            group: typing.Optional[pandas.DataFrame] = None
+            group_kwargs: typing.Dict[str, typing.Any] = kwargs
+
+            for metric in self.__metrics:
+                if metric in summarized_metrics:
+                    scores = Scores(
+                        metric,
+                        [
+                            Score(
+                                metric,
+                                values[group_index],
+                                threshold,
+                                sample_size=int(sample_sizes[group_index])
+                            )
+                            for threshold, (values, sample_sizes) in zip(group_thresholds, summarized_metrics[metric])
+                        ]
+                    )
+                else:
+                    if group is None:
+                        group = pairs.iloc[summary.get_positions(group_index)]
+                        group_kwargs = {**kwargs, FILTER_CACHE_KEY: FilterCache(group)}
+
+                    scores = metric(
+                        group,
+                        observed_value_label,
+                        predicted_value_label,
+                        group_thresholds,
+                        *args,
+                        truth_tables=summary.truth_tables(group_index),
+                        **group_kwargs
+                    )
+
+                group_results.add_scores(scores)
+                self._send_scores(scores, metadata)
+
+            results[key] = group_results
 
         return results
+
+    def _send_scores(self, scores: Scores, metadata: dict = None):
+        """
+        Send the results of a metric through the communicators if they are expecting them
+
+        Args:
+            scores: The results of a metric
+            metadata: Information describing what was scored
+        """
+        if not self.__communicators.send_all():
+            return
+
+        message = {
+            "metric": scores.metric.name,
+            "description": scores.metric.get_descriptions(),
+            "weight": scores.metric.weight,
+            "total": scores.total,
+            "scores": scores.to_dict()
+        }
+
+        if metadata:
+            message['metadata'] = metadata
+
+        self.__communicators.write(reason="metric", data=message, verbosity=Verbosity.ALL)
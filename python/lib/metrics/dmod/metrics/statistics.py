@@ -0,0 +1,927 @@
+"""
+Defines summary statistics that allow metrics to be calculated for many locations and thresholds at once
+
+Rather than filtering a frame of pairs once per threshold for every metric at every location, the pairs are grouped
+and reduced a single time into the counts, means, and sums of squares that each metric may be derived from.
+Metrics whose `Metric.supports_statistics` is true then calculate their values for every group at once via
+`Metric.score_statistics`.
+
+Summaries are mergeable, so pairs may also be read and reduced a chunk at a time through a `StatisticsAccumulator`
+and accumulators from separate processes may be combined before scoring.
+
+Groups whose thresholds transform data, or whose thresholds keep pairs that are missing an observation or a
+prediction, cannot be described by these statistics. Metrics treat missing values inconsistently, so those groups
+are scored from their pairs instead, exactly as `ScoringScheme.score` would.
+"""
+import typing
+
+import numpy
+import pandas
+
+from pandas.api import types as pandas_types
+
+from . import categorical
+from .threshold import Threshold
+
+GROUP_KEY = typing.Hashable
+THRESHOLD_MAPPING = typing.Mapping[typing.Hashable, typing.Sequence[Threshold]]
+
+_MEAN_STATISTICS = ("observed_mean", "predicted_mean", "position_mean", "absolute_error_mean")
+"""The statistics that are undefined rather than 0 for groups without pairs"""
+
+_ARRAY_STATISTICS = (
+    "size",
+    "sample_size",
+    "observed_mean",
+    "predicted_mean",
+    "observed_squared_deviations",
+    "predicted_squared_deviations",
+    "deviation_products",
+    "squared_errors",
+    "position_mean",
+    "position_squared_deviations",
+    "absolute_error_mean",
+    "position_error_products",
+    "area_difference",
+    "first_difference",
+    "last_difference",
+    "hits",
+    "misses",
+    "false_positives",
+    "true_negatives",
+)
+"""The floating point statistics that are tracked for every group"""
+
+
+class ThresholdStatistics:
+    """
+    Sufficient statistics for a single threshold position across every group of pairs
+
+    Each group may have its own thresholds, so the threshold in this position may differ from group to group. Every
+    attribute other than `thresholds` is an array bearing one entry per group. Entries for groups without a threshold
+    in this position should be ignored.
+
+    Only pairs whose observation and prediction are both present contribute to the continuous statistics.
+
+    Attributes:
+        thresholds: The threshold used for each group, or None if the group has no threshold in this position
+        size: The total number of pairs within each group, regardless of the threshold
+        sample_size: The number of complete pairs that passed the threshold
+        observed_mean: The mean of the observations that passed the threshold
+        predicted_mean: The mean of the predictions that passed the threshold
+        observed_squared_deviations: The sum of squared deviations of the observations from their mean
+        predicted_squared_deviations: The sum of squared deviations of the predictions from their mean
+        deviation_products: The sum of the products of the observed and predicted deviations from their means
+        squared_errors: The sum of the squared differences between observations and predictions
+        position_mean: The mean position of the pairs that passed the threshold along the x-axis
+        position_squared_deviations: The sum of squared deviations of the positions from their mean
+        absolute_error_mean: The mean absolute difference between observations and predictions
+        position_error_products: The sum of the products of the position and absolute error deviations
+        area_difference: The area under the predictions minus the area under the observations
+        first_position: The position along the x-axis of the first pair that passed the threshold
+        last_position: The position along the x-axis of the last pair that passed the threshold
+        first_difference: The prediction minus the observation for the first pair that passed the threshold
+        last_difference: The prediction minus the observation for the last pair that passed the threshold
+        relative_positions: Whether positions are counted from the start of the group rather than taken from the index
+        hits: The number of times both the observation and the prediction fit within the threshold
+        misses: The number of times the observation fit within the threshold but the prediction did not
+        false_positives: The number of times the prediction fit within the threshold but the observation did not
+        true_negatives: The number of times neither the observation nor the prediction fit within the threshold
+    """
+    __slots__ = [
+        "thresholds",
+        "size",
+        "sample_size",
+        "observed_mean",
+        "predicted_mean",
+        "observed_squared_deviations",
+        "predicted_squared_deviations",
+        "deviation_products",
+        "squared_errors",
+        "position_mean",
+        "position_squared_deviations",
+        "absolute_error_mean",
+        "position_error_products",
+        "area_difference",
+        "first_position",
+        "last_position",
+        "first_difference",
+        "last_difference",
+        "relative_positions",
+        "hits",
+        "misses",
+        "false_positives",
+        "true_negatives",
+        "_truth_tables",
+    ]
+
+    def __init__(self, thresholds: typing.Sequence[typing.Optional[Threshold]], **values: numpy.ndarray):
+        """
+        Constructor
+
+        Args:
+            thresholds: The threshold used for each group
+            **values: An array of values for every statistic, keyed by the name of the statistic
+        """
+        self.thresholds = list(thresholds)
+
+        for name in self.__slots__:
+            if name in ("thresholds", "_truth_tables"):
+                continue
+
+            if name not in values:
+                raise KeyError(f"Cannot build threshold statistics - no values for '{name}' were given")
+
+            setattr(self, name, values[name])
+
+        self._truth_tables: typing.Dict[int, categorical.TruthTable] = dict()
+
+    def truth_table(self, group_index: int) -> categorical.TruthTable:
+        """
+        Get the truth table for a group from its contingency counts
+
+        Args:
+            group_index: The index of the group whose truth table to build
+
+        Returns:
+            The truth table for the group's threshold in this position
+        """
+        if group_index not in self._truth_tables:
+            threshold = self.thresholds[group_index]
+
+            if threshold is None:
+                raise KeyError(f"There is no threshold for group #{group_index} to build a truth table for")
+
+            self._truth_tables[group_index] = categorical.TruthTable.from_counts(
+                threshold=threshold,
+                hits=int(self.hits[group_index]),
+                misses=int(self.misses[group_index]),
+                false_positives=int(self.false_positives[group_index]),
+                true_negatives=int(self.true_negatives[group_index])
+            )
+
+        return self._truth_tables[group_index]
+
+    @classmethod
+    def empty(cls, group_count: int) -> "ThresholdStatistics":
+        """
+        Create statistics for groups that have not seen any pairs
+
+        Args:
+            group_count: The number of groups to create statistics for
+
+        Returns:
+            Statistics with no threshold and no pairs for every group
+        """
+        return cls(
+            thresholds=[None] * group_count,
+            **{
+                name: numpy.full(group_count, numpy.nan) if name in _MEAN_STATISTICS else numpy.zeros(group_count)
+                for name in _ARRAY_STATISTICS
+            },
+            first_position=numpy.zeros(group_count, dtype=numpy.int64),
+            last_position=numpy.zeros(group_count, dtype=numpy.int64),
+            relative_positions=numpy.zeros(group_count, dtype=bool)
+        )
+
+    def reindex(self, indexer: numpy.ndarray) -> "ThresholdStatistics":
+        """
+        Rearrange the statistics into a new order of groups
+
+        Args:
+            indexer: The current index of the group to place in each new position; -1 for a group without pairs
+
+        Returns:
+            Statistics with an entry for every position in the indexer
+        """
+        indexer = numpy.asarray(indexer, dtype=numpy.int64)
+        present = indexer >= 0
+        reindexed = ThresholdStatistics.empty(len(indexer))
+        reindexed.thresholds = [
+            self.thresholds[current_index] if current_index >= 0 else None
+            for current_index in indexer
+        ]
+
+        for name in self.__slots__:
+            if name in ("thresholds", "_truth_tables"):
+                continue
+
+            values = getattr(reindexed, name).astype(getattr(self, name).dtype)
+            values[present] = getattr(self, name)[indexer[present]]
+            setattr(reindexed, name, values)
+
+        return reindexed
+
+    def merge(self, other: "ThresholdStatistics") -> "ThresholdStatistics":
+        """
+        Combine these statistics with those of pairs that came after them
+
+        Both sets of statistics must describe the same groups in the same order. Moments are combined with Chan's
+        parallel update, so the result matches what would have been found had every pair been summarized at once.
+
+        Args:
+            other: Statistics for the pairs that follow these pairs along the x-axis
+
+        Returns:
+            Statistics describing the pairs from both
+        """
+        if len(self) != len(other):
+            raise ValueError(
+                f"Cannot merge threshold statistics - {len(self)} groups cannot be merged with {len(other)} groups"
+            )
+
+        first_count = self.sample_size
+        second_count = other.sample_size
+        count = first_count + second_count
+        both = (first_count > 0) & (second_count > 0)
+
+        # Positions counted from the start of a group must continue from where the earlier pairs left off
+        shift = numpy.where(other.relative_positions, self.size, 0)
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ratio = numpy.where(both, first_count * second_count / count, 0.0)
+
+            def mean(first: numpy.ndarray, second: numpy.ndarray) -> numpy.ndarray:
+                return numpy.where(
+                    first_count == 0,
+                    second,
+                    numpy.where(second_count == 0, first, first + (second - first) * second_count / count)
+                )
+
+            def delta(first: numpy.ndarray, second: numpy.ndarray) -> numpy.ndarray:
+                return numpy.where(both, second - first, 0.0)
+
+            observed_delta = delta(self.observed_mean, other.observed_mean)
+            predicted_delta = delta(self.predicted_mean, other.predicted_mean)
+            position_delta = delta(self.position_mean, other.position_mean + shift)
+            absolute_error_delta = delta(self.absolute_error_mean, other.absolute_error_mean)
+
+            gap = (other.first_position + shift.astype(numpy.int64) - self.last_position).astype(float)
+            joining_trapezoid = numpy.where(both, gap * (self.last_difference + other.first_difference) / 2.0, 0.0)
+
+            return ThresholdStatistics(
+                thresholds=[
+                    first if first is not None else second
+                    for first, second in zip(self.thresholds, other.thresholds)
+                ],
+                size=self.size + other.size,
+                sample_size=count,
+                observed_mean=mean(self.observed_mean, other.observed_mean),
+                predicted_mean=mean(self.predicted_mean, other.predicted_mean),
+                observed_squared_deviations=(
+                    self.observed_squared_deviations
+                    + other.observed_squared_deviations
+                    + observed_delta ** 2 * ratio
+                ),
+                predicted_squared_deviations=(
+                    self.predicted_squared_deviations
+                    + other.predicted_squared_deviations
+                    + predicted_delta ** 2 * ratio
+                ),
+                deviation_products=(
+                    self.deviation_products
+                    + other.deviation_products
+                    + observed_delta * predicted_delta * ratio
+                ),
+                squared_errors=self.squared_errors + other.squared_errors,
+                position_mean=mean(self.position_mean, other.position_mean + shift),
+                position_squared_deviations=(
+                    self.position_squared_deviations
+                    + other.position_squared_deviations
+                    + position_delta ** 2 * ratio
+                ),
+                absolute_error_mean=mean(self.absolute_error_mean, other.absolute_error_mean),
+                position_error_products=(
+                    self.position_error_products
+                    + other.position_error_products
+                    + position_delta * absolute_error_delta * ratio
+                ),
+                area_difference=self.area_difference + other.area_difference + joining_trapezoid,
+                first_position=numpy.where(
+                    first_count > 0, self.first_position, other.first_position + shift.astype(numpy.int64)
+                ),
+                last_position=numpy.where(
+                    second_count > 0, other.last_position + shift.astype(numpy.int64), self.last_position
+                ),
+                first_difference=numpy.where(first_count > 0, self.first_difference, other.first_difference),
+                last_difference=numpy.where(second_count > 0, other.last_difference, self.last_difference),
+                relative_positions=self.relative_positions | other.relative_positions,
+                hits=self.hits + other.hits,
+                misses=self.misses + other.misses,
+                false_positives=self.false_positives + other.false_positives,
+                true_negatives=self.true_negatives + other.true_negatives,
+            )
+
+    def __len__(self):
+        return len(self.thresholds)
+
+
+class GroupedStatistics:
+    """
+    Summary statistics for every threshold of every group within a set of pairs
+    """
+    def __init__(
+        self,
+        keys: typing.Sequence[GROUP_KEY],
+        thresholds: typing.Sequence[typing.Sequence[Threshold]],
+        positions: typing.Sequence[numpy.ndarray],
+        slots: typing.Sequence[ThresholdStatistics],
+        unsupported: typing.Iterable[int] = None,
+        names: typing.Sequence[str] = None
+    ):
+        """
+        Constructor
+
+        Args:
+            keys: The identifier for each group
+            thresholds: The thresholds for each group
+            positions: The row positions of each group's pairs within the original frame
+            slots: The statistics for each threshold position
+            unsupported: The indices of groups that could not be summarized, either because their thresholds
+                transform data or because their thresholds keep pairs with missing values
+            names: The names of the columns that the pairs were grouped by
+        """
+        self.__names = list(names or list())
+        self.__keys = list(keys)
+        self.__thresholds = [list(group_thresholds) for group_thresholds in thresholds]
+        self.__positions = list(positions)
+        self.__slots = list(slots)
+        self.__unsupported = set(unsupported or list())
+
+    @property
+    def keys(self) -> typing.Sequence[GROUP_KEY]:
+        """
+        The identifier for each group
+        """
+        return self.__keys
+
+    @property
+    def names(self) -> typing.Sequence[str]:
+        """
+        The names of the columns that the pairs were grouped by
+        """
+        return self.__names
+
+    @property
+    def slots(self) -> typing.Sequence[ThresholdStatistics]:
+        """
+        The statistics for each threshold position
+        """
+        return self.__slots
+
+    def get_thresholds(self, group_index: int) -> typing.Sequence[Threshold]:
+        """
+        Args:
+            group_index: The index of the group of interest
+
+        Returns:
+            The thresholds that apply to the group
+        """
+        return self.__thresholds[group_index]
+
+    def get_positions(self, group_index: int) -> numpy.ndarray:
+        """
+        Args:
+            group_index: The index of the group of interest
+
+        Returns:
+            The row positions of the group's pairs within the frame that was summarized
+        """
+        return self.__positions[group_index]
+
+    def is_supported(self, group_index: int) -> bool:
+        """
+        Args:
+            group_index: The index of the group of interest
+
+        Returns:
+            Whether the statistics for the group may be used to calculate metrics
+        """
+        return group_index not in self.__unsupported
+
+    def truth_tables(self, group_index: int) -> categorical.TruthTables:
+        """
+        Build the truth tables for a group from its contingency counts
+
+        Args:
+            group_index: The index of the group of interest
+
+        Returns:
+            Truth tables for every threshold of the group
+        """
+        return categorical.TruthTables(
+            tables=[
+                slot.truth_table(group_index)
+                for slot in self.__slots
+                if slot.thresholds[group_index] is not None
+            ]
+        )
+
+    def merge(self, other: "GroupedStatistics") -> "GroupedStatistics":
+        """
+        Combine these statistics with the statistics of pairs that came after them
+
+        Groups are matched by key; groups only found in `other` are added after the groups found here. Row
+        positions only describe the frame that was summarized, so merged statistics do not retain them.
+
+        Args:
+            other: Statistics for pairs that follow these pairs along the x-axis
+
+        Returns:
+            Statistics describing the pairs from both
+        """
+        if self.__names != other.__names:
+            raise ValueError(
+                f"Cannot merge statistics grouped by {self.__names} with statistics grouped by {other.__names}"
+            )
+
+        if self.__unsupported or other.__unsupported:
+            raise ValueError(
+                "Cannot merge statistics - thresholds that transform data or keep pairs with missing values must be "
+                "applied to all pairs at once"
+            )
+
+        keys = list(self.__keys)
+        thresholds = list(self.__thresholds)
+        key_positions = {key: group_index for group_index, key in enumerate(keys)}
+
+        for key, group_thresholds in zip(other.__keys, other.__thresholds):
+            if key in key_positions:
+                thresholds[key_positions[key]] = thresholds[key_positions[key]] or group_thresholds
+            else:
+                key_positions[key] = len(keys)
+                keys.append(key)
+                thresholds.append(group_thresholds)
+
+        first_indexer = numpy.full(len(keys), -1, dtype=numpy.int64)
+        first_indexer[:len(self.__keys)] = numpy.arange(len(self.__keys))
+
+        second_indexer = numpy.full(len(keys), -1, dtype=numpy.int64)
+        second_indexer[[key_positions[key] for key in other.__keys]] = numpy.arange(len(other.__keys))
+
+        slots: typing.List[ThresholdStatistics] = list()
+
+        for slot_index in range(max(len(self.__slots), len(other.__slots))):
+            first_slot = self.__slots[slot_index] if slot_index < len(self.__slots) else None
+            second_slot = other.__slots[slot_index] if slot_index < len(other.__slots) else None
+
+            first_slot = first_slot.reindex(first_indexer) if first_slot else ThresholdStatistics.empty(len(keys))
+            second_slot = second_slot.reindex(second_indexer) if second_slot else ThresholdStatistics.empty(len(keys))
+
+            slots.append(first_slot.merge(second_slot))
+
+        return GroupedStatistics(
+            keys=keys,
+            thresholds=thresholds,
+            positions=[numpy.empty(0, dtype=numpy.int64) for _ in keys],
+            slots=slots,
+            names=self.__names
+        )
+
+    def __len__(self):
+        return len(self.__keys)
+
+
+def _get_index_positions(
+    index: pandas.Index,
+    position_in_group: numpy.ndarray
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray, bool]:
+    """
+    Convert an index into numeric positions along an x-axis
+
+    Datetimes are measured in seconds for trends and in nanoseconds for areas, numbers are used as they are,
+    and anything else is treated as evenly spaced within its group
+
+    Args:
+        index: The index of the pairs, ordered by group
+        position_in_group: The position of each row within its group
+
+    Returns:
+        Positions to use when calculating trends, positions to use when calculating areas, and whether the positions
+        are counted from the start of each group
+    """
+    if isinstance(index, pandas.MultiIndex):
+        return position_in_group.astype(float), position_in_group, True
+
+    if pandas_types.is_datetime64_any_dtype(index):
+        nanoseconds = index.asi8
+        return nanoseconds / 1e9, nanoseconds, False
+
+    if pandas_types.is_numeric_dtype(index):
+        values = index.to_numpy()
+        return values.astype(float), values.astype(numpy.int64), False
+
+    return position_in_group.astype(float), position_in_group, True
+
+
+def _summarize_position(
+    codes: numpy.ndarray,
+    group_count: int,
+    sizes: numpy.ndarray,
+    thresholds: typing.Sequence[typing.Optional[Threshold]],
+    weights: numpy.ndarray,
+    observed: numpy.ndarray,
+    predicted: numpy.ndarray,
+    trend_positions: numpy.ndarray,
+    area_positions: numpy.ndarray,
+    observed_events: numpy.ndarray,
+    predicted_events: numpy.ndarray,
+    relative_positions: numpy.ndarray
+) -> ThresholdStatistics:
+    """
+    Reduce the pairs for a single threshold position into statistics for every group
+
+    Args:
+        codes: The group number for each row
+        group_count: The number of groups
+        sizes: The number of rows in each group
+        thresholds: The threshold for each group
+        weights: Whether each row passed its group's threshold
+        observed: The observed value for each row
+        predicted: The predicted value for each row
+        trend_positions: The position of each row along the x-axis when calculating trends
+        area_positions: The position of each row along the x-axis when calculating areas
+        observed_events: Whether each observation fit within the threshold
+        predicted_events: Whether each prediction fit within the threshold
+        relative_positions: Whether each group's positions are counted from the start of the group
+
+    Returns:
+        Statistics for every group in this threshold position
+    """
+    def total(values: numpy.ndarray) -> numpy.ndarray:
+        return numpy.bincount(codes, weights=values, minlength=group_count)
+
+    def centered(values: numpy.ndarray, means: numpy.ndarray) -> numpy.ndarray:
+        return numpy.where(weights, values - means[codes], 0.0)
+
+    sample_size = total(weights.astype(float))
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        observed_values = numpy.where(weights, observed, 0.0)
+        predicted_values = numpy.where(weights, predicted, 0.0)
+        trend_values = numpy.where(weights, trend_positions, 0.0)
+        absolute_errors = numpy.abs(observed_values - predicted_values)
+
+        observed_mean = total(observed_values) / sample_size
+        predicted_mean = total(predicted_values) / sample_size
+        position_mean = total(trend_values) / sample_size
+        absolute_error_mean = total(absolute_errors) / sample_size
+
+        observed_offsets = centered(observed_values, observed_mean)
+        predicted_offsets = centered(predicted_values, predicted_mean)
+        position_offsets = centered(trend_values, position_mean)
+        absolute_error_offsets = centered(absolute_errors, absolute_error_mean)
+
+    # The area between consecutive pairs is only counted when both pairs belong to the same group
+    selected_rows = numpy.flatnonzero(weights)
+    selected_codes = codes[selected_rows]
+    differences = predicted_values[selected_rows] - observed_values[selected_rows]
+    spans = numpy.diff(area_positions[selected_rows]).astype(float)
+    trapezoids = numpy.where(
+        selected_codes[1:] == selected_codes[:-1],
+        spans * (differences[1:] + differences[:-1]) / 2.0,
+        0.0
+    )
+
+    # The first and last pairs are kept so that the area between them and neighboring chunks may be found later
+    first_position = numpy.zeros(group_count, dtype=numpy.int64)
+    last_position = numpy.zeros(group_count, dtype=numpy.int64)
+    first_difference = numpy.zeros(group_count)
+    last_difference = numpy.zeros(group_count)
+
+    if len(selected_rows) > 0:
+        boundaries = numpy.flatnonzero(selected_codes[1:] != selected_codes[:-1]) + 1
+        firsts = numpy.concatenate([[0], boundaries])
+        lasts = numpy.concatenate([boundaries - 1, [len(selected_rows) - 1]])
+        selected_groups = selected_codes[firsts]
+        selected_positions = area_positions[selected_rows].astype(numpy.int64)
+
+        first_position[selected_groups] = selected_positions[firsts]
+        last_position[selected_groups] = selected_positions[lasts]
+        first_difference[selected_groups] = differences[firsts]
+        last_difference[selected_groups] = differences[lasts]
+
+    hits = total((observed_events & predicted_events).astype(float))
+    misses = total((observed_events & ~predicted_events).astype(float))
+    false_positives = total((~observed_events & predicted_events).astype(float))
+
+    return ThresholdStatistics(
+        thresholds=thresholds,
+        size=sizes,
+        sample_size=sample_size,
+        observed_mean=observed_mean,
+        predicted_mean=predicted_mean,
+        observed_squared_deviations=total(observed_offsets ** 2),
+        predicted_squared_deviations=total(predicted_offsets ** 2),
+        deviation_products=total(observed_offsets * predicted_offsets),
+        squared_errors=total((observed_values - predicted_values) ** 2),
+        position_mean=position_mean,
+        position_squared_deviations=total(position_offsets ** 2),
+        absolute_error_mean=absolute_error_mean,
+        position_error_products=total(position_offsets * absolute_error_offsets),
+        area_difference=numpy.bincount(selected_codes[1:], weights=trapezoids, minlength=group_count),
+        first_position=first_position,
+        last_position=last_position,
+        first_difference=first_difference,
+        last_difference=last_difference,
+        relative_positions=relative_positions,
+        hits=hits,
+        misses=misses,
+        false_positives=false_positives,
+        true_negatives=sizes - hits - misses - false_positives,
+    )
+
+
+def summarize(
+    pairs: pandas.DataFrame,
+    observed_value_label: str,
+    predicted_value_label: str,
+    group_by: typing.Union[str, typing.Sequence[str]],
+    thresholds: THRESHOLD_MAPPING,
+    threshold_key: str = None
+) -> GroupedStatistics:
+    """
+    Group pairs and reduce them into the statistics needed to calculate metrics for each group and threshold
+
+    Rows are expected to be in order along the x-axis within each group. Groups with thresholds that transform data
+    or that keep pairs missing an observation or a prediction are marked as unsupported so that they may be scored
+    from their pairs.
+
+    Args:
+        pairs: The observed and predicted values to summarize
+        observed_value_label: The name of the column containing observations
+        predicted_value_label: The name of the column containing predictions
+        group_by: The column(s) used to divide the pairs into groups
+        thresholds: The thresholds to summarize, mapped to the value of the `threshold_key` column they apply to
+        threshold_key: The grouping column whose value identifies which thresholds to use. Defaults to the first
+            grouping column
+
+    Returns:
+        Summary statistics for every threshold of every group
+    """
+    if isinstance(group_by, str):
+        group_by = [group_by]
+
+    group_by = list(group_by)
+    threshold_key = threshold_key or group_by[0]
+
+    if threshold_key not in group_by:
+        raise KeyError(f"Cannot summarize pairs - '{threshold_key}' is not one of the grouped columns: {group_by}")
+
+    key_level = group_by.index(threshold_key)
+
+    grouper = pairs.groupby(by=group_by if len(group_by) > 1 else group_by[0], sort=True)
+    keys: typing.List[GROUP_KEY] = list(grouper.size().index)
+    group_count = len(keys)
+
+    # Order every row by its group while keeping the original order within each group. Rows with missing grouping
+    # values belong to no group, just as they would be left out when grouping; depending on the version of pandas,
+    # their group number is either NaN or -1
+    all_codes = grouper.ngroup().fillna(-1).to_numpy(dtype=numpy.int64)
+    order = numpy.argsort(all_codes, kind="stable")
+    order = order[all_codes[order] >= 0]
+    codes = all_codes[order]
+
+    sizes = numpy.bincount(codes, minlength=group_count)
+    ends = numpy.cumsum(sizes)
+    starts = ends - sizes
+    positions = [order[start:end] for start, end in zip(starts, ends)]
+
+    group_thresholds: typing.List[typing.List[Threshold]] = list()
+    unsupported: typing.Set[int] = set()
+
+    for group_index, key in enumerate(keys):
+        lookup_key = key[key_level] if len(group_by) > 1 else key
+        found_thresholds = list(thresholds.get(lookup_key) or list())
+        group_thresholds.append(found_thresholds)
+
+        if any(threshold.value_filter.transformation_function for threshold in found_thresholds):
+            unsupported.add(group_index)
+
+    column_cache: typing.Dict[str, numpy.ndarray] = dict()
+
+    def get_column(column_name: str) -> numpy.ndarray:
+        if column_name not in column_cache:
+            column_cache[column_name] = pairs[column_name].to_numpy(dtype=float, na_value=numpy.nan)[order]
+        return column_cache[column_name]
+
+    observed = get_column(observed_value_label)
+    predicted = get_column(predicted_value_label)
+    complete = ~(numpy.isnan(observed) | numpy.isnan(predicted))
+
+    index = pairs.index[order]
+    position_in_group = numpy.arange(len(codes)) - starts[codes]
+    trend_index_positions, area_index_positions, index_is_relative = _get_index_positions(index, position_in_group)
+
+    slot_count = max(
+        [len(found) for group_index, found in enumerate(group_thresholds) if group_index not in unsupported],
+        default=0
+    )
+
+    slots: typing.List[ThresholdStatistics] = list()
+    has_missing_values = numpy.zeros(group_count, dtype=bool)
+
+    for slot_index in range(slot_count):
+        slot_thresholds: typing.List[typing.Optional[Threshold]] = [
+            found[slot_index] if group_index not in unsupported and slot_index < len(found) else None
+            for group_index, found in enumerate(group_thresholds)
+        ]
+
+        threshold_values = numpy.full(len(codes), numpy.nan)
+        scalar_values = numpy.full(group_count, numpy.nan)
+        filter_groups: typing.Dict[tuple, typing.List[int]] = dict()
+
+        for group_index, slot_threshold in enumerate(slot_thresholds):
+            if slot_threshold is None:
+                continue
+
+            value_filter = slot_threshold.value_filter
+
+            if value_filter.scalar_value is None:
+                group_slice = slice(starts[group_index], ends[group_index])
+                threshold_values[group_slice] = value_filter.threshold_values(index[group_slice])
+            else:
+                scalar_values[group_index] = value_filter.scalar_value
+
+            filter_key = (value_filter.operator, value_filter.observation_key, value_filter.prediction_key)
+            filter_groups.setdefault(filter_key, list()).append(group_index)
+
+        scalar_rows = ~numpy.isnan(scalar_values[codes])
+        threshold_values[scalar_rows] = scalar_values[codes][scalar_rows]
+
+        observed_events = numpy.zeros(len(codes), dtype=bool)
+        predicted_events = numpy.zeros(len(codes), dtype=bool)
+        passed = numpy.zeros(len(codes), dtype=bool)
+        positioned_in_group = numpy.zeros(len(codes), dtype=bool)
+        relative_positions = numpy.zeros(group_count, dtype=bool)
+
+        # Nearly every group shares the same kind of filter, so each comparison is usually made across every row at once
+        for (operator, observation_key, prediction_key), member_groups in filter_groups.items():
+            is_member = numpy.zeros(group_count, dtype=bool)
+            is_member[member_groups] = True
+            rows = is_member[codes]
+            values_to_compare = threshold_values[rows]
+
+            with numpy.errstate(invalid="ignore"):
+                observed_events[rows] = operator(observed[rows], values_to_compare)
+                predicted_events[rows] = operator(predicted[rows], values_to_compare)
+
+                keep = numpy.ones(numpy.count_nonzero(rows), dtype=bool)
+
+                if observation_key == observed_value_label:
+                    keep &= observed_events[rows]
+                elif observation_key:
+                    keep &= operator(get_column(observation_key)[rows], values_to_compare)
+
+                if prediction_key == predicted_value_label:
+                    keep &= predicted_events[rows]
+                elif prediction_key:
+                    keep &= operator(get_column(prediction_key)[rows], values_to_compare)
+
+            passed[rows] = keep
+
+            # Filtering pairs replaces their index, so their positions become their places within the group
+            positioned_in_group[rows] = bool(observation_key or prediction_key)
+            relative_positions[member_groups] = bool(observation_key or prediction_key) or index_is_relative
+
+        # Metrics handle missing values in their own ways, so groups that keep them can't be described by statistics
+        has_missing_values |= numpy.bincount(codes[passed & ~complete], minlength=group_count) > 0
+
+        slots.append(
+            _summarize_position(
+                codes=codes,
+                group_count=group_count,
+                sizes=sizes.astype(float),
+                thresholds=slot_thresholds,
+                weights=passed & complete,
+                observed=observed,
+                predicted=predicted,
+                trend_positions=numpy.where(positioned_in_group, position_in_group, trend_index_positions),
+                area_positions=numpy.where(positioned_in_group, position_in_group, area_index_positions),
+                observed_events=observed_events,
+                predicted_events=predicted_events,
+                relative_positions=relative_positions
+            )
+        )
+
+    unsupported.update(int(group_index) for group_index in numpy.flatnonzero(has_missing_values))
+
+    return GroupedStatistics(
+        keys=keys,
+        thresholds=group_thresholds,
+        positions=positions,
+        slots=slots,
+        unsupported=unsupported,
+        names=group_by
+    )
+
+
+class StatisticsAccumulator:
+    """
+    Summarizes pairs a chunk at a time so that metrics may be calculated without holding every pair in memory
+
+    Chunks for each group must arrive in order along the x-axis. Accumulators for the same groups built in
+    different processes may be combined with `merge`. Pairs that are missing an observation or a prediction
+    can't be accumulated and should be dropped or filled beforehand.
+
+    Example:
+        >>> accumulator = StatisticsAccumulator("observed", "predicted", "location", thresholds)
+        >>> for chunk in chunks:
+        ...     accumulator.update(chunk)
+        >>> results = scheme.score_summary(accumulator.summary)
+    """
+    def __init__(
+        self,
+        observed_value_label: str,
+        predicted_value_label: str,
+        group_by: typing.Union[str, typing.Sequence[str]],
+        thresholds: THRESHOLD_MAPPING,
+        threshold_key: str = None
+    ):
+        """
+        Constructor
+
+        Args:
+            observed_value_label: The name of the column containing observations
+            predicted_value_label: The name of the column containing predictions
+            group_by: The column(s) used to divide the pairs into groups
+            thresholds: The thresholds to summarize, mapped to the value of the `threshold_key` column they apply to
+            threshold_key: The grouping column whose value identifies which thresholds to use. Defaults to the first
+                grouping column
+        """
+        if isinstance(group_by, str):
+            group_by = [group_by]
+
+        self.__observed_value_label = observed_value_label
+        self.__predicted_value_label = predicted_value_label
+        self.__group_by = list(group_by)
+        self.__thresholds = thresholds
+        self.__threshold_key = threshold_key or self.__group_by[0]
+        self.__summary: typing.Optional[GroupedStatistics] = None
+
+    @property
+    def summary(self) -> GroupedStatistics:
+        """
+        Statistics for every pair that has been accumulated
+        """
+        if self.__summary is None:
+            return GroupedStatistics(
+                keys=list(),
+                thresholds=list(),
+                positions=list(),
+                slots=list(),
+                names=self.__group_by
+            )
+        return self.__summary
+
+    def update(self, chunk: pandas.DataFrame) -> "StatisticsAccumulator":
+        """
+        Add the statistics for a chunk of pairs that follow every pair accumulated so far
+
+        Args:
+            chunk: The next observed and predicted values for one or more groups
+
+        Returns:
+            The updated accumulator
+        """
+        chunk_summary = summarize(
+            pairs=chunk,
+            observed_value_label=self.__observed_value_label,
+            predicted_value_label=self.__predicted_value_label,
+            group_by=self.__group_by,
+            thresholds=self.__thresholds,
+            threshold_key=self.__threshold_key
+        )
+
+        if not all(chunk_summary.is_supported(group_index) for group_index in range(len(chunk_summary))):
+            raise ValueError(
+                "Cannot accumulate statistics - thresholds that transform data must be applied to all pairs at once "
+                "and pairs with missing values must be dropped or filled first"
+            )
+
+        self.__summary = chunk_summary if self.__summary is None else self.__summary.merge(chunk_summary)
+        return self
+
+    def merge(self, other: "StatisticsAccumulator") -> "StatisticsAccumulator":
+        """
+        Add the statistics accumulated elsewhere for pairs that follow every pair accumulated here
+
+        Args:
+            other: An accumulator for the same columns
+
+        Returns:
+            The updated accumulator
+        """
+        own_columns = (self.__observed_value_label, self.__predicted_value_label, self.__group_by)
+        other_columns = (other.__observed_value_label, other.__predicted_value_label, other.__group_by)
+
+        if own_columns != other_columns:
+            raise ValueError(
+                f"Cannot merge accumulated statistics - statistics for {other_columns} cannot be added to "
+                f"statistics for {own_columns}"
+            )
+
+        if other.__summary is not None:
+            self.__summary = other.__summary if self.__summary is None else self.__summary.merge(other.__summary)
+
+        return self
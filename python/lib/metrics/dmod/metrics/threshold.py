@@ -16,6 +16,9 @@ NUMERIC_FILTER = typing.Callable[[NUMBER, NUMBER], bool]
 FRAME_FILTER = typing.Callable[[PANDAS_DATA], PANDAS_DATA]
 INDEX_TRANSFORMATION_FUNCTION = typing.Callable[[PANDAS_DATA, typing.Optional[str], typing.Optional[str]], PANDAS_DATA]
 
+FILTER_CACHE_KEY = "filter_cache"
+"""The name of the keyword argument used to share a `FilterCache` between metrics"""
+
 
 def value_is_indexible(value) -> bool:
     is_indexible = not isinstance(value, (str, bytes))
@@ -137,6 +140,62 @@ class ValueFilter(typing.Callable[[PANDAS_DATA], PANDAS_DATA]):
         self._threshold_value = threshold_value
         self._threshold_is_indexible = threshold_is_indexible
 
+    @property
+    def operator(self) -> NUMERIC_FILTER:
+        """
+        The function used to compare values against the threshold value
+        """
+        return self._operator
+
+    @property
+    def observation_key(self) -> typing.Optional[str]:
+        """
+        The name of the observed column that the filter is applied to, if any
+        """
+        if self._observation_key and not isinstance(self._observation_key, str):
+            return self._observation_key.name
+        return self._observation_key or None
+
+    @property
+    def prediction_key(self) -> typing.Optional[str]:
+        """
+        The name of the predicted column that the filter is applied to, if any
+        """
+        if self._prediction_key and not isinstance(self._prediction_key, str):
+            return self._prediction_key.name
+        return self._prediction_key or None
+
+    @property
+    def transformation_function(self) -> typing.Optional[INDEX_TRANSFORMATION_FUNCTION]:
+        """
+        A function that will alter data prior to filtering, if any
+        """
+        return self._transformation_function
+
+    @property
+    def scalar_value(self) -> typing.Optional[float]:
+        """
+        The single value that every row is compared against; None if the value varies based on the index
+        """
+        if isinstance(self._threshold_value, pandas.Series):
+            return None
+        return self._threshold_value
+
+    def threshold_values(self, index: pandas.Index) -> numpy.ndarray:
+        """
+        Lay out the value each row with the given index will be compared against
+
+        Args:
+            index: The index of the data that will be compared
+
+        Returns:
+            An array with one threshold value per entry in the index
+        """
+        if isinstance(self._threshold_value, pandas.Series):
+            return self._threshold_value.reindex(index).to_numpy(dtype=float, na_value=numpy.nan)
+
+        return numpy.full(len(index), self._threshold_value, dtype=float)
+
     def filter_series(self, series: pandas.Series) -> pandas.Series:
         """
         Apply the threshold to a single series
@@ -154,44 +213,50 @@ class ValueFilter(typing.Callable[[PANDAS_DATA], PANDAS_DATA]):
             filtered_series = self._operator(series, self._threshold_value)
         return filtered_series
 
-    def filter_dataframe(self, frame: pandas.DataFrame) -> pandas.DataFrame:
-        if not self._observation_key and not self._prediction_key:
-            return frame
+    def get_mask(self, frame: pandas.DataFrame) -> typing.Optional[numpy.ndarray]:
+        """
+        Determine which rows of a frame fall within the threshold
 
-        if isinstance(self._threshold_value, pandas.Series):
-            threshold_name = self._threshold_value.name
-        else:
-            threshold_name = 'threshold_value'
+        Args:
+            frame: The frame whose rows should be checked
 
-        joined_data = frame.assign(**{threshold_name: self._threshold_value}).reset_index()
+        Returns:
+            A boolean array with one entry per row; None if the filter doesn't look at any columns
+        """
+        observation_key = self.observation_key
+        prediction_key = self.prediction_key
 
-        if self._observation_key and isinstance(self._observation_key, str):
-            observation_key = self._observation_key
-        elif self._observation_key:
-            observation_key = self._observation_key.name
-        else:
-            observation_key = None
+        if not observation_key and not prediction_key:
+            return None
 
-        if observation_key:
-            keep_or_drop_observation = self._operator(joined_data[observation_key], joined_data[threshold_name])
-        else:
-            keep_or_drop_observation = True
+        threshold_values = self.threshold_values(frame.index)
+        mask = numpy.ones(len(frame), dtype=bool)
 
-        if self._prediction_key and isinstance(self._prediction_key, str):
-            prediction_key = self._prediction_key
-        elif self._prediction_key:
-            prediction_key = self._prediction_key.name
-        else:
-            prediction_key = None
+        if observation_key:
+            mask &= numpy.asarray(self._operator(frame[observation_key].to_numpy(), threshold_values), dtype=bool)
 
         if prediction_key:
-            keep_or_drop_prediction = self._operator(joined_data[prediction_key], joined_data[threshold_name])
-        else:
-            keep_or_drop_prediction = True
+            mask &= numpy.asarray(self._operator(frame[prediction_key].to_numpy(), threshold_values), dtype=bool)
+
+        return mask
+
+    def filter_dataframe(self, frame: pandas.DataFrame) -> pandas.DataFrame:
+        mask = self.get_mask(frame)
+
+        if mask is None:
+            return frame
 
-        keep_or_drop = keep_or_drop_observation & keep_or_drop_prediction
+        if isinstance(self._threshold_value, pandas.Series):
+            threshold_name = self._threshold_value.name
+        else:
+            threshold_name = 'threshold_value'
 
-        filtered_frame = joined_data[keep_or_drop]
+        # Only the rows that are kept are copied; they are labeled by their position within the original frame
+        positions = numpy.flatnonzero(mask)
+        filtered_frame = frame.take(positions).assign(
+            **{threshold_name: self.threshold_values(frame.index)[positions]}
+        ).reset_index()
+        filtered_frame.index = pandas.RangeIndex(len(frame))[positions]
         return filtered_frame
 
     def __call__(self, frame: PANDAS_DATA, *args, **kwargs) -> PANDAS_DATA:
@@ -287,6 +352,13 @@ class Threshold(FRAME_FILTER):
     def __call__(self, pairs: PANDAS_DATA) -> PANDAS_DATA:
         return self._allow(pairs)
 
+    @property
+    def value_filter(self) -> ValueFilter:
+        """
+        The filter that decides what data falls within the threshold
+        """
+        return self._allow
+
     @property
     def name(self) -> str:
         return self._name
@@ -304,3 +376,45 @@ class Threshold(FRAME_FILTER):
 
     def __repr__(self) -> str:
         return f"Threshold(name={self.name}, value={self.value}, weight={self.weight})"
+
+
+class FilterCache:
+    """
+    Filters a single frame of pairs by each threshold at most once so that every metric may share the results
+    """
+    def __init__(self, pairs: pandas.DataFrame):
+        """
+        Args:
+            pairs: The pairs that will be filtered
+        """
+        self.__pairs = pairs
+        self.__filtered_pairs: typing.Dict[Threshold, PANDAS_DATA] = dict()
+
+    @property
+    def pairs(self) -> pandas.DataFrame:
+        """
+        The pairs that are filtered
+        """
+        return self.__pairs
+
+    def filter(self, pairs: PANDAS_DATA, threshold: Threshold) -> PANDAS_DATA:
+        """
+        Filter pairs by a threshold, reusing earlier results if the pairs are the ones being cached
+
+        Args:
+            pairs: The pairs to filter
+            threshold: The threshold to filter by
+
+        Returns:
+            The pairs that fall within the threshold
+        """
+        if pairs is not self.__pairs:
+            return threshold(pairs)
+
+        if threshold not in self.__filtered_pairs:
+            self.__filtered_pairs[threshold] = threshold(pairs)
+
+        return self.__filtered_pairs[threshold]
+
+    def __len__(self) -> int:
+        return len(self.__filtered_pairs)
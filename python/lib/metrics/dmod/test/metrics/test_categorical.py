@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+import pandas
+
+from ...metrics import categorical
+from ...metrics.threshold import Threshold
+
+TEST_DIRECTORY = os.path.dirname(__file__)
+
+OBSERVATION_VALUE_KEY = "Observations"
+MODEL_VALUE_KEY = "value"
+
+OBSERVATION_DATA_PATH = os.path.join(TEST_DIRECTORY, "observations.csv")
+MODEL_DATA_PATH = os.path.join(TEST_DIRECTORY, "model_3.csv")
+
+
+class TestCategorical(unittest.TestCase):
+    def setUp(self):
+        observations = pandas.read_csv(OBSERVATION_DATA_PATH, index_col="date", parse_dates=["date"])
+        model = pandas.read_csv(MODEL_DATA_PATH, index_col="date", parse_dates=["date"])
+        self.pairs = observations.join(model).dropna(subset=[MODEL_VALUE_KEY])
+
+        self.thresholds = [Threshold.default()]
+
+        for name, value in (("Minor", 27), ("Moderate", 36), ("Major", 43), ("Record", 60)):
+            self.thresholds.append(
+                Threshold(
+                    name=name,
+                    value=value,
+                    weight=1,
+                    observed_value_key=OBSERVATION_VALUE_KEY,
+                    predicted_value_key=MODEL_VALUE_KEY
+                )
+            )
+
+        self.thresholds.append(
+            Threshold(
+                name="Varying Minor",
+                value=self.pairs["Minor"],
+                weight=1,
+                observed_value_key=OBSERVATION_VALUE_KEY
+            )
+        )
+
+    def test_count_outcomes(self):
+        observations = self.pairs[OBSERVATION_VALUE_KEY]
+        predictions = self.pairs[MODEL_VALUE_KEY]
+
+        counts = categorical.count_outcomes(observations, predictions, self.thresholds)
+        self.assertEqual(counts.shape, (len(self.thresholds), 4))
+
+        for threshold, (hits, misses, false_positives, true_negatives) in zip(self.thresholds, counts):
+            contingency_table = pandas.crosstab(threshold(predictions).values, threshold(observations).values)
+            contingency_table = contingency_table.reindex(index=[False, True], columns=[False, True], fill_value=0)
+
+            self.assertEqual(hits, contingency_table[True][True])
+            self.assertEqual(misses, contingency_table[True][False])
+            self.assertEqual(false_positives, contingency_table[False][True])
+            self.assertEqual(true_negatives, contingency_table[False][False])
+
+        tables = categorical.TruthTables(observations, predictions, self.thresholds)
+
+        for threshold, (hits, misses, false_positives, true_negatives) in zip(self.thresholds, counts):
+            table = tables[threshold.name]
+            single_table = categorical.TruthTable(observations, predictions, threshold)
+
+            self.assertEqual(table.hits(), hits)
+            self.assertEqual(single_table.hits(), hits)
+            self.assertEqual(table.misses(), misses)
+            self.assertEqual(single_table.false_positives(), false_positives)
+            self.assertEqual(len(table), len(observations))
+
+    def test_count_outcomes_with_resampling(self):
+        observations = self.pairs[OBSERVATION_VALUE_KEY]
+        predictions = self.pairs[MODEL_VALUE_KEY]
+
+        def to_daily_maximum(values, observed_value_key, predicted_value_key):
+            return values.resample("1D").max()
+
+        daily_threshold = Threshold(
+            name="Daily Minor",
+            value=27,
+            weight=1,
+            observed_value_key=OBSERVATION_VALUE_KEY,
+            predicted_value_key=MODEL_VALUE_KEY,
+            transformation_function=to_daily_maximum
+        )
+        thresholds = self.thresholds + [daily_threshold]
+
+        with self.assertRaises(ValueError):
+            categorical.get_events(observations, thresholds)
+
+        counts = categorical.count_outcomes(observations, predictions, thresholds)
+        self.assertEqual(counts.shape, (len(thresholds), 4))
+
+        expected_counts = categorical.count_outcomes(observations, predictions, self.thresholds)
+        self.assertEqual(counts[:-1].tolist(), expected_counts.tolist())
+
+        daily_observations = daily_threshold(observations)
+        daily_predictions = daily_threshold(predictions)
+        contingency_table = pandas.crosstab(daily_predictions.values, daily_observations.values)
+        contingency_table = contingency_table.reindex(index=[False, True], columns=[False, True], fill_value=0)
+
+        hits, misses, false_positives, true_negatives = counts[-1]
+        self.assertEqual(hits, contingency_table[True][True])
+        self.assertEqual(misses, contingency_table[True][False])
+        self.assertEqual(false_positives, contingency_table[False][True])
+        self.assertEqual(true_negatives, contingency_table[False][False])
+        self.assertEqual(sum(counts[-1]), len(daily_observations))
+        self.assertLess(len(daily_observations), len(observations))
+
+        tables = categorical.TruthTables(observations, predictions, thresholds)
+        single_table = categorical.TruthTable(observations, predictions, daily_threshold)
+        self.assertEqual(tables[daily_threshold.name].hits(), hits)
+        self.assertEqual(single_table.misses(), misses)
+        self.assertEqual(len(single_table), len(daily_observations))
+
+
+def main():
+    """
+    Define your initial application code here
+    """
+    unittest.main()
+
+
+# Run the following if the script was run directly
+if __name__ == "__main__":
+    main()
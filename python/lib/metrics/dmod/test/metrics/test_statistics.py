@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+import os
+import typing
+import unittest
+
+import pandas
+import numpy
+
+from ...metrics import metric as metrics
+from ...metrics import scoring
+from ...metrics import statistics
+from ...metrics.threshold import Threshold
+
+TEST_DIRECTORY = os.path.dirname(__file__)
+EPSILON = 0.0001
+
+OBSERVATION_VALUE_KEY = "Observations"
+MODEL_VALUE_KEY = "value"
+LOCATION_KEY = "location"
+
+OBSERVATION_DATA_PATH = os.path.join(TEST_DIRECTORY, "observations.csv")
+MODEL_DATA_PATHS = {
+    f"model_{model_number}": os.path.join(TEST_DIRECTORY, f"model_{model_number}.csv")
+    for model_number in range(1, 6)
+}
+
+
+def get_thresholds() -> typing.List[Threshold]:
+    thresholds: typing.List[Threshold] = [Threshold.default()]
+
+    for name, value in (("Minor", 27), ("Moderate", 36), ("Major", 43), ("Record", 60)):
+        thresholds.append(
+            Threshold(
+                name=name,
+                value=value,
+                weight=1,
+                observed_value_key=OBSERVATION_VALUE_KEY,
+                predicted_value_key=MODEL_VALUE_KEY
+            )
+        )
+
+    return thresholds
+
+
+def get_all_metrics() -> typing.List[scoring.Metric]:
+    return [metric_type(1) for metric_type in metrics.get_all_metrics()]
+
+
+class PairwiseAccuracy(metrics.Accuracy):
+    """
+    Accuracy that must be calculated from the pairs themselves
+    """
+    @classmethod
+    def supports_statistics(cls) -> bool:
+        return False
+
+
+def values_match(first: float, second: float) -> bool:
+    if numpy.isnan(first) or numpy.isnan(second):
+        return bool(numpy.isnan(first) and numpy.isnan(second))
+    return abs(first - second) <= EPSILON * max(1.0, abs(first))
+
+
+class TestStatistics(unittest.TestCase):
+    def setUp(self):
+        observations = pandas.read_csv(OBSERVATION_DATA_PATH, index_col="date", parse_dates=["date"])
+
+        location_pairs: typing.List[pandas.DataFrame] = list()
+
+        for location, path in MODEL_DATA_PATHS.items():
+            model = pandas.read_csv(path, index_col="date", parse_dates=["date"])
+            pairs = observations.join(model).dropna(subset=[MODEL_VALUE_KEY])
+            location_pairs.append(pairs.assign(**{LOCATION_KEY: location}))
+
+        self.pairs = pandas.concat(location_pairs)
+        self.thresholds = get_thresholds()
+        self.location_thresholds = {location: self.thresholds for location in MODEL_DATA_PATHS}
+
+    def assert_results_match(self, expected: scoring.MetricResults, actual: scoring.MetricResults):
+        for threshold, expected_scores in expected:
+            actual_scores = actual[threshold.name]
+            self.assertEqual(len(expected_scores), len(actual_scores))
+
+            for expected_score, actual_score in zip(expected_scores, actual_scores):
+                self.assertEqual(expected_score.metric.name, actual_score.metric.name)
+                self.assertTrue(
+                    values_match(expected_score.value, actual_score.value),
+                    f"{expected_score.metric.name} for the {threshold.name} threshold was {actual_score.value} "
+                    f"instead of {expected_score.value}"
+                )
+                self.assertTrue(values_match(expected_score.sample_size, actual_score.sample_size))
+
+                # Scores without a sample size record it as NaN
+                if not numpy.isnan(actual_score.sample_size):
+                    self.assertIsInstance(actual_score.sample_size, int)
+
+        self.assertTrue(values_match(expected.scaled_value, actual.scaled_value))
+
+    def test_summarize(self):
+        summary = statistics.summarize(
+            self.pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        self.assertEqual(len(summary), len(MODEL_DATA_PATHS))
+        self.assertEqual(len(summary.slots), len(self.thresholds))
+        self.assertEqual(list(summary.keys), sorted(MODEL_DATA_PATHS))
+
+        for group_index, location in enumerate(summary.keys):
+            location_pairs = self.pairs[self.pairs[LOCATION_KEY] == location]
+            all_statistics = summary.slots[0]
+
+            self.assertEqual(all_statistics.size[group_index], len(location_pairs))
+            self.assertEqual(all_statistics.sample_size[group_index], len(location_pairs))
+            self.assertAlmostEqual(
+                all_statistics.observed_mean[group_index],
+                location_pairs[OBSERVATION_VALUE_KEY].mean(),
+                delta=EPSILON
+            )
+            self.assertAlmostEqual(
+                all_statistics.predicted_squared_deviations[group_index],
+                location_pairs[MODEL_VALUE_KEY].var() * (len(location_pairs) - 1),
+                delta=EPSILON
+            )
+
+            for slot in summary.slots:
+                expected_table = metrics.categorical.TruthTable(
+                    location_pairs[OBSERVATION_VALUE_KEY],
+                    location_pairs[MODEL_VALUE_KEY],
+                    slot.thresholds[group_index]
+                )
+                actual_table = slot.truth_table(group_index)
+
+                self.assertEqual(expected_table.hits(), actual_table.hits())
+                self.assertEqual(expected_table.misses(), actual_table.misses())
+                self.assertEqual(expected_table.false_positives(), actual_table.false_positives())
+                self.assertEqual(expected_table.true_negatives(), actual_table.true_negatives())
+                self.assertEqual(len(expected_table), len(actual_table))
+
+    def test_score_groups_matches_score(self):
+        scheme = scoring.ScoringScheme(get_all_metrics())
+
+        grouped_results = scheme.score_groups(
+            self.pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        self.assertEqual(sorted(grouped_results), sorted(MODEL_DATA_PATHS))
+
+        for location, actual_results in grouped_results.items():
+            location_pairs = self.pairs[self.pairs[LOCATION_KEY] == location]
+            expected_results = scheme.score(
+                location_pairs,
+                OBSERVATION_VALUE_KEY,
+                MODEL_VALUE_KEY,
+                self.thresholds,
+                truth_tables=metrics.categorical.TruthTables(
+                    location_pairs[OBSERVATION_VALUE_KEY],
+                    location_pairs[MODEL_VALUE_KEY],
+                    self.thresholds
+                )
+            )
+            self.assert_results_match(expected_results, actual_results)
+
+    def test_score_groups_with_missing_values(self):
+        """
+        Test that groups with missing observations or predictions are scored just like `ScoringScheme.score`
+        """
+        scheme = scoring.ScoringScheme(get_all_metrics())
+        pairs = self.pairs.copy()
+        locations = pairs[LOCATION_KEY].to_numpy()
+
+        # Every tenth prediction is missing for one location and every tenth observation is missing for another
+        for location, column in (("model_1", MODEL_VALUE_KEY), ("model_2", OBSERVATION_VALUE_KEY)):
+            missing_rows = numpy.flatnonzero(locations == location)[::10]
+            pairs.iloc[missing_rows, pairs.columns.get_loc(column)] = numpy.nan
+
+        summary = statistics.summarize(
+            pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        for group_index, location in enumerate(summary.keys):
+            self.assertEqual(summary.is_supported(group_index), location not in ("model_1", "model_2"))
+
+        grouped_results = scheme.score_groups(
+            pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        self.assertEqual(sorted(grouped_results), sorted(MODEL_DATA_PATHS))
+
+        for location, actual_results in grouped_results.items():
+            location_pairs = pairs[pairs[LOCATION_KEY] == location]
+            expected_results = scheme.score(
+                location_pairs,
+                OBSERVATION_VALUE_KEY,
+                MODEL_VALUE_KEY,
+                self.thresholds,
+                truth_tables=metrics.categorical.TruthTables(
+                    location_pairs[OBSERVATION_VALUE_KEY],
+                    location_pairs[MODEL_VALUE_KEY],
+                    self.thresholds
+                )
+            )
+            self.assert_results_match(expected_results, actual_results)
+
+        with self.assertRaises(ValueError):
+            scheme.score_summary(summary)
+
+        accumulator = statistics.StatisticsAccumulator(
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        with self.assertRaises(ValueError):
+            accumulator.update(pairs)
+
+    def test_score_groups_without_statistics_support(self):
+        """
+        Test that metrics that don't support summary statistics are scored from the pairs of each group
+        """
+        self.assertTrue(all(metric.supports_statistics() for metric in get_all_metrics()))
+
+        scheme = scoring.ScoringScheme([metrics.PearsonCorrelationCoefficient(1), PairwiseAccuracy(1)])
+
+        grouped_results = scheme.score_groups(
+            self.pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        for location, actual_results in grouped_results.items():
+            location_pairs = self.pairs[self.pairs[LOCATION_KEY] == location]
+            expected_results = scheme.score(location_pairs, OBSERVATION_VALUE_KEY, MODEL_VALUE_KEY, self.thresholds)
+            self.assert_results_match(expected_results, actual_results)
+
+        summary = statistics.summarize(
+            self.pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        with self.assertRaises(NotImplementedError):
+            scheme.score_summary(summary)
+
+    def test_score_groups_with_missing_group_values(self):
+        """
+        Test that pairs without a value for the grouping column are left out of every group rather than failing
+        """
+        scheme = scoring.ScoringScheme(get_all_metrics())
+        pairs = self.pairs.copy()
+        locations = pairs[LOCATION_KEY].to_numpy(dtype=object)
+        locations[numpy.flatnonzero(locations == "model_1")[::10]] = None
+        pairs[LOCATION_KEY] = locations
+
+        grouped_results = scheme.score_groups(
+            pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        self.assertEqual(sorted(grouped_results), sorted(MODEL_DATA_PATHS))
+
+        for location, actual_results in grouped_results.items():
+            location_pairs = pairs[pairs[LOCATION_KEY] == location]
+            expected_results = scheme.score(location_pairs, OBSERVATION_VALUE_KEY, MODEL_VALUE_KEY, self.thresholds)
+            self.assert_results_match(expected_results, actual_results)
+
+    def test_score_groups_with_uneven_thresholds(self):
+        """
+        Test that groups without thresholds are skipped and groups with fewer thresholds are only scored on theirs
+        """
+        scheme = scoring.ScoringScheme([metrics.PearsonCorrelationCoefficient(1), metrics.ProbabilityOfDetection(1)])
+        location_thresholds = {
+            "model_1": self.thresholds,
+            "model_2": self.thresholds[:2],
+        }
+
+        grouped_results = scheme.score_groups(
+            self.pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=location_thresholds
+        )
+
+        self.assertEqual(sorted(grouped_results), ["model_1", "model_2"])
+        self.assertEqual(len(list(grouped_results["model_1"].keys())), len(self.thresholds))
+        self.assertEqual(len(list(grouped_results["model_2"].keys())), 2)
+
+    def test_accumulated_statistics_match_score_groups(self):
+        scheme = scoring.ScoringScheme(get_all_metrics())
+
+        expected_results = scheme.score_groups(
+            self.pairs,
+            OBSERVATION_VALUE_KEY,
+            MODEL_VALUE_KEY,
+            group_by=LOCATION_KEY,
+            thresholds=self.location_thresholds
+        )
+
+        # Split the data by time so that every location is spread across each chunk
+        dates = numpy.sort(self.pairs.index.unique())
+        boundaries = [dates[len(dates) // 3], dates[2 * len(dates) // 3]]
+        chunks = [
+            self.pairs[self.pairs.index < boundaries[0]],
+            self.pairs[(self.pairs.index >= boundaries[0]) & (self.pairs.index < boundaries[1])],
+            self.pairs[self.pairs.index >= boundaries[1]],
+        ]
+
+        def create_accumulator() -> statistics.StatisticsAccumulator:
+            return statistics.StatisticsAccumulator(
+                OBSERVATION_VALUE_KEY,
+                MODEL_VALUE_KEY,
+                group_by=LOCATION_KEY,
+                thresholds=self.location_thresholds
+            )
+
+        streamed = create_accumulator()
+
+        for chunk in chunks:
+            streamed.update(chunk)
+
+        # Accumulators built separately, like in other processes, should combine into the same statistics
+        merged = create_accumulator().update(chunks[0])
+        merged.merge(create_accumulator().update(chunks[1]).update(chunks[2]))
+
+        for accumulator in (streamed, merged):
+            actual_results = scheme.score_summary(accumulator.summary)
+            self.assertEqual(sorted(actual_results), sorted(expected_results))
+
+            for location, location_results in expected_results.items():
+                self.assert_results_match(location_results, actual_results[location])
+
+
+def main():
+    """
+    Define your initial application code here
+    """
+    unittest.main()
+
+
+# Run the following if the script was run directly
+if __name__ == "__main__":
+    main()
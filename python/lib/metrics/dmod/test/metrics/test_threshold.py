@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+import pandas
+import numpy
+
+from ...metrics import metric as metrics
+from ...metrics import scoring
+from ...metrics import threshold
+
+TEST_DIRECTORY = os.path.dirname(__file__)
+
+OBSERVATION_VALUE_KEY = "Observations"
+MODEL_VALUE_KEY = "value"
+
+OBSERVATION_DATA_PATH = os.path.join(TEST_DIRECTORY, "observations.csv")
+MODEL_DATA_PATH = os.path.join(TEST_DIRECTORY, "model_1.csv")
+
+
+class CountingThreshold(threshold.Threshold):
+    """
+    A threshold that records how many times it has filtered data
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def __call__(self, pairs):
+        self.calls += 1
+        return super().__call__(pairs)
+
+
+class TestThreshold(unittest.TestCase):
+    def setUp(self):
+        observations = pandas.read_csv(OBSERVATION_DATA_PATH, index_col="date", parse_dates=["date"])
+        model = pandas.read_csv(MODEL_DATA_PATH, index_col="date", parse_dates=["date"])
+        self.pairs = observations.join(model).dropna(subset=[MODEL_VALUE_KEY])
+
+    def test_filter_dataframe(self):
+        minor = threshold.Threshold(
+            name="Minor",
+            value=27,
+            weight=1,
+            observed_value_key=OBSERVATION_VALUE_KEY,
+            predicted_value_key=MODEL_VALUE_KEY
+        )
+
+        filtered_pairs = minor(self.pairs)
+        expected_pairs = self.pairs.assign(threshold_value=27).reset_index()
+        expected_pairs = expected_pairs[expected_pairs[OBSERVATION_VALUE_KEY] >= 27]
+
+        self.assertEqual(list(filtered_pairs.columns), list(expected_pairs.columns))
+        self.assertEqual(list(filtered_pairs.index), list(expected_pairs.index))
+        self.assertTrue(numpy.array_equal(filtered_pairs["date"].values, expected_pairs["date"].values))
+        self.assertTrue(
+            numpy.array_equal(filtered_pairs[MODEL_VALUE_KEY].values, expected_pairs[MODEL_VALUE_KEY].values)
+        )
+
+        self.assertIs(threshold.Threshold.default()(self.pairs), self.pairs)
+
+    def test_filter_cache(self):
+        minor = CountingThreshold(
+            name="Minor",
+            value=27,
+            weight=1,
+            observed_value_key=OBSERVATION_VALUE_KEY,
+            predicted_value_key=MODEL_VALUE_KEY
+        )
+
+        scheme = scoring.ScoringScheme(
+            [
+                metrics.PearsonCorrelationCoefficient(1),
+                metrics.KlingGuptaEfficiency(1),
+                metrics.NormalizedNashSutcliffeEfficiency(1),
+                metrics.VolumeError(1),
+            ]
+        )
+        scheme.score(self.pairs, OBSERVATION_VALUE_KEY, MODEL_VALUE_KEY, [minor])
+
+        self.assertEqual(minor.calls, 1)
+
+        filter_cache = threshold.FilterCache(self.pairs)
+        self.assertIs(filter_cache.filter(self.pairs, minor), filter_cache.filter(self.pairs, minor))
+        self.assertEqual(len(filter_cache), 1)
+
+        other_pairs = self.pairs.copy()
+        self.assertIsNot(filter_cache.filter(other_pairs, minor), filter_cache.filter(other_pairs, minor))
+        self.assertEqual(len(filter_cache), 1)
+
+
+def main():
+    """
+    Define your initial application code here
+    """
+    unittest.main()
+
+
+# Run the following if the script was run directly
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,4 @@ from .hydrofabric import Hydrofabric, HydrofabricFilesManager, GeoJsonHydrofabri
     MappedGraphHydrofabric
 from .partition import Partition, PartitionConfig
 from .geopackage_hydrofabric import GeoPackageHydrofabric
+from .topology import AdjacencyIndex, HydrofabricTopology, HydrofabricTopologyCache
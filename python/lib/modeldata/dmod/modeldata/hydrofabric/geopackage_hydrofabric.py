@@ -1,14 +1,134 @@
 import pyogrio
 import geopandas as gpd
 import hashlib
+import pandas as pd
 from pandas.util import hash_pandas_object
 from pathlib import Path
-from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from typing import Callable, Collection, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from hypy import Catchment, Nexus, Realization
 from .hydrofabric import Hydrofabric
+from .sidecar import SourceStampedSidecar
+from .topology import HydrofabricTopology
 from ..subset import SubsetDefinition
 
 
+class GeoPackageLayers(Mapping[str, gpd.GeoDataFrame]):
+    """
+    Mapping of GeoPackage layer names to layer dataframes, which may be read from the GeoPackage only when needed.
+
+    An instance is either backed by already-read dataframes for all layers, or is lazy and backed by a GeoPackage file
+    (or the contents of one).  For a lazy instance, a layer's full dataframe is read the first time it is accessed by
+    name, and then kept.  Regardless, ::method:`read` gets just some of the columns and/or rows of a layer; for a lazy
+    instance, if the layer has not been fully read, this projection and filtering are pushed down to ``pyogrio``, so
+    that only the requested data is read from the GeoPackage.
+    """
+
+    _MAX_WHERE_IDS = 5000
+    """ The maximum number of ids to put in the ``where`` clause of a single filtered read. """
+
+    def __init__(self, layer_names: List[str], dataframes: Optional[Dict[str, gpd.GeoDataFrame]] = None,
+                 geopackage_file: Optional[Union[str, Path, bytes]] = None):
+        """
+        Initialize this instance.
+
+        Parameters
+        ----------
+        layer_names : List[str]
+            The names of the layers.
+        dataframes : Optional[Dict[str, gpd.GeoDataFrame]]
+            The already-read dataframe for each layer, keyed by layer name, or ``None`` for a lazy instance.
+        geopackage_file : Optional[Union[str, Path, bytes]]
+            The GeoPackage file, or the raw data of one, from which a lazy instance reads layers.
+        """
+        if dataframes is None and geopackage_file is None:
+            raise ValueError("Cannot create {} with neither dataframes nor a file".format(self.__class__.__name__))
+        self._layer_names: List[str] = layer_names
+        self._dataframes: Dict[str, gpd.GeoDataFrame] = dict() if dataframes is None else dataframes
+        self._geopackage_file = geopackage_file
+
+    def __getitem__(self, layer_name: str) -> gpd.GeoDataFrame:
+        if layer_name not in self._dataframes:
+            if layer_name not in self._layer_names or self._geopackage_file is None:
+                raise KeyError(layer_name)
+            self._dataframes[layer_name] = gpd.read_file(self._geopackage_file, layer=layer_name, engine="pyogrio")
+        return self._dataframes[layer_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layer_names)
+
+    def __len__(self) -> int:
+        return len(self._layer_names)
+
+    def is_loaded(self, layer_name: str) -> bool:
+        """
+        Whether the full dataframe for a layer has already been read.
+
+        Parameters
+        ----------
+        layer_name : str
+            The name of the layer.
+
+        Returns
+        -------
+        bool
+            Whether the full dataframe for a layer has already been read.
+        """
+        return layer_name in self._dataframes
+
+    def read(self, layer_name: str, columns: Optional[List[str]] = None, read_geometry: bool = True,
+             id_column: Optional[str] = None, ids: Optional[Collection[str]] = None) -> pd.DataFrame:
+        """
+        Read some of the columns and/or rows of a layer, without reading (or keeping) the full layer if not necessary.
+
+        Parameters
+        ----------
+        layer_name : str
+            The name of the layer.
+        columns : Optional[List[str]]
+            The non-geometry columns to read, or ``None`` (the default) for all of them.
+        read_geometry : bool
+            Whether to read the geometry column (``True`` by default); if ``False``, a plain ``DataFrame`` is returned.
+        id_column : Optional[str]
+            The column holding ids, when filtering rows by ``ids``.
+        ids : Optional[Collection[str]]
+            The ids of the rows to read, by the values in ``id_column``, or ``None`` (the default) to read all rows.
+
+        Returns
+        -------
+        pd.DataFrame
+            The requested layer data, with rows in the order of the full layer's dataframe and a new ``RangeIndex``.
+        """
+        if self.is_loaded(layer_name) or self._geopackage_file is None:
+            dataframe = self[layer_name]
+            if ids is not None:
+                dataframe = dataframe.loc[dataframe[id_column].isin(ids)]
+            has_geometry = isinstance(dataframe, gpd.GeoDataFrame)
+            if columns is not None and has_geometry and read_geometry:
+                dataframe = dataframe[columns + [dataframe.geometry.name]]
+            elif columns is not None:
+                dataframe = dataframe[columns]
+            elif has_geometry and not read_geometry:
+                dataframe = pd.DataFrame(dataframe.drop(columns=dataframe.geometry.name))
+            return dataframe.reset_index(drop=True)
+
+        if layer_name not in self._layer_names:
+            raise KeyError(layer_name)
+        read_args = {'layer': layer_name, 'columns': columns, 'read_geometry': read_geometry, 'fid_as_index': True}
+        if ids is None:
+            dataframe = pyogrio.read_dataframe(self._geopackage_file, **read_args)
+        else:
+            ids = list(ids)
+            # Quote ids as SQL strings (doubling embedded quotes), in batches to keep each where clause a sensible size
+            where = '"{}" IN ({})'
+            batches = [ids[i:i + self._MAX_WHERE_IDS] for i in range(0, len(ids), self._MAX_WHERE_IDS)] or [[]]
+            dataframe = pd.concat([pyogrio.read_dataframe(
+                self._geopackage_file, where=where.format(id_column, ','.join(
+                    "'{}'".format(str(i).replace("'", "''")) for i in batch)) if batch else '0 = 1', **read_args)
+                for batch in batches])
+        # Feature ids need not be contiguous, so they only give the row order of a full read of the layer
+        return dataframe.sort_index().reset_index(drop=True)
+
+
 class GeoPackageCatchment(Catchment):
     """
     Customized subtype of ::class:`Catchment` backed by dataframes from a parent ::class:`GeoPackageHydrofabric`.
@@ -21,8 +141,9 @@ class GeoPackageCatchment(Catchment):
     __slots__ = ["_cat_id", "_hydrofabric", "_catchments_df", "_nexuses_df", "_realization", "_col_cat_id",
                  "_col_nex_id", "_col_to_cat", "_col_to_nex"]
 
-    def __init__(self, cat_id: str, hydrofabric: 'GeoPackageHydrofabric', catchments_df: gpd.GeoDataFrame,
-                 nexuses_df: gpd.GeoDataFrame, col_cat_id: str, col_nex_id: str, col_to_cat: str, col_to_nex: str):
+    def __init__(self, cat_id: str, hydrofabric: 'GeoPackageHydrofabric', catchments_df: Optional[gpd.GeoDataFrame],
+                 nexuses_df: Optional[gpd.GeoDataFrame], col_cat_id: str, col_nex_id: str, col_to_cat: str,
+                 col_to_nex: str):
         """
         Initialize this instance.
 
@@ -32,10 +153,12 @@ class GeoPackageCatchment(Catchment):
             The id of the represented catchment.
         hydrofabric : GeoPackageHydrofabric
             The backing package hydrofabric.
-        catchments_df : gpd.GeoDataFrame
-            The geodataframe from parent hydrofabric specifically containing catchment data (for hydrologic modeling).
-        nexuses_df : gpd.GeoDataFrame
-            The geodataframe from parent hydrofabric specifically containing nexus data.
+        catchments_df : Optional[gpd.GeoDataFrame]
+            The geodataframe from parent hydrofabric specifically containing catchment data (for hydrologic modeling),
+            or ``None`` if records should instead be read from the parent only when needed.
+        nexuses_df : Optional[gpd.GeoDataFrame]
+            The geodataframe from parent hydrofabric specifically containing nexus data, or ``None`` if records should
+            instead be read from the parent only when needed.
         col_cat_id : str
             The name of the column within ``catchments_df`` that holds catchment ids.
         col_nex_id : str
@@ -47,8 +170,8 @@ class GeoPackageCatchment(Catchment):
         """
         self._cat_id: str = cat_id
         self._hydrofabric: GeoPackageHydrofabric = hydrofabric
-        self._catchments_df: gpd.GeoDataFrame = catchments_df
-        self._nexuses_df: gpd.GeoDataFrame = nexuses_df
+        self._catchments_df: Optional[gpd.GeoDataFrame] = catchments_df
+        self._nexuses_df: Optional[gpd.GeoDataFrame] = nexuses_df
         self._col_cat_id = col_cat_id
         self._col_nex_id = col_nex_id
         self._col_to_cat = col_to_cat
@@ -89,7 +212,10 @@ class GeoPackageCatchment(Catchment):
         gpd.GeoDataFrame
             The (1-line) sub-dataframe from the catchments layer dataframe for this particular catchment.
         """
-        df = self._catchments_df.loc[self._catchments_df[self._col_cat_id] == self._cat_id]
+        if self._catchments_df is None:
+            df = self._hydrofabric.read_catchment_records([self._cat_id])
+        else:
+            df = self._catchments_df.loc[self._catchments_df[self._col_cat_id] == self._cat_id]
         if df.shape[0] == 0:
             msg = 'No backing records in {} data for {} {}'
             raise RuntimeError(msg.format(self._hydrofabric.__class__.__name__, self.__class__.__name__, self._cat_id))
@@ -159,13 +285,13 @@ class GeoPackageCatchment(Catchment):
         Optional[GeoPackageNexus]
             In-flowing connected Nexus.
         """
-        matches_df = self._nexuses_df.loc[self._nexuses_df[self._col_to_cat] == self._cat_id]
-        if matches_df.shape[0] > 1:
+        nex_ids = self._hydrofabric.topology.get_inflow_nexus_ids(self._cat_id)
+        if len(nex_ids) > 1:
             raise RuntimeError("Invalid catchment {} with multiple inflow nexuses".format(self._cat_id))
-        elif matches_df.shape[0] == 0:
+        elif len(nex_ids) == 0:
             return None
         else:
-            return self._hydrofabric.get_nexus_by_id(matches_df[self._col_nex_id].values[0])
+            return self._hydrofabric.get_nexus_by_id(nex_ids[0])
 
     @property
     def outflow(self) -> Optional['GeoPackageNexus']:
@@ -177,8 +303,10 @@ class GeoPackageCatchment(Catchment):
         Optional[GeoPackageNexus]
             Out-flowing connected nexus.
         """
-        nex_id = self._get_catchment_record()[self._col_to_nex].values[0]
-        return self._hydrofabric.get_nexus_by_id(nex_id)
+        nex_ids = self._hydrofabric.topology.get_outflow_nexus_ids(self._cat_id)
+        if len(nex_ids) > 1:
+            raise RuntimeError("Invalid catchment {} with multiple outflow nexuses".format(self._cat_id))
+        return self._hydrofabric.get_nexus_by_id(nex_ids[0]) if len(nex_ids) == 1 else None
 
     @property
     def realization(self) -> Optional[Realization]:
@@ -210,8 +338,9 @@ class GeoPackageNexus(Nexus):
     __slots__ = ["_nex_id", "_hydrofabric", "_catchments_df", "_nexuses_df", "_col_cat_id", "_col_nex_id",
                  "_col_to_cat", "_col_to_nex"]
 
-    def __init__(self, nex_id: str, hydrofabric: 'GeoPackageHydrofabric', catchments_df: gpd.GeoDataFrame,
-                 nexuses_df: gpd.GeoDataFrame, col_cat_id: str, col_nex_id: str, col_to_cat: str, col_to_nex: str):
+    def __init__(self, nex_id: str, hydrofabric: 'GeoPackageHydrofabric', catchments_df: Optional[gpd.GeoDataFrame],
+                 nexuses_df: Optional[gpd.GeoDataFrame], col_cat_id: str, col_nex_id: str, col_to_cat: str,
+                 col_to_nex: str):
         """
         Initialize this instance.
 
@@ -221,10 +350,12 @@ class GeoPackageNexus(Nexus):
             The id of the represented nexus.
         hydrofabric : GeoPackageHydrofabric
             The backing package hydrofabric.
-        catchments_df : gpd.GeoDataFrame
-            The geodataframe from parent hydrofabric specifically containing catchment data (for hydrologic modeling).
-        nexuses_df : gpd.GeoDataFrame
-            The geodataframe from parent hydrofabric specifically containing nexus data.
+        catchments_df : Optional[gpd.GeoDataFrame]
+            The geodataframe from parent hydrofabric specifically containing catchment data (for hydrologic modeling),
+            or ``None`` if records should instead be read from the parent only when needed.
+        nexuses_df : Optional[gpd.GeoDataFrame]
+            The geodataframe from parent hydrofabric specifically containing nexus data, or ``None`` if records should
+            instead be read from the parent only when needed.
         col_cat_id : str
             The name of the column within ``catchments_df`` that holds catchment ids.
         col_nex_id : str
@@ -236,8 +367,8 @@ class GeoPackageNexus(Nexus):
         """
         self._nex_id: str = nex_id
         self._hydrofabric: GeoPackageHydrofabric = hydrofabric
-        self._catchments_df: gpd.GeoDataFrame = catchments_df
-        self._nexuses_df: gpd.GeoDataFrame = nexuses_df
+        self._catchments_df: Optional[gpd.GeoDataFrame] = catchments_df
+        self._nexuses_df: Optional[gpd.GeoDataFrame] = nexuses_df
         self._col_cat_id = col_cat_id
         self._col_nex_id = col_nex_id
         self._col_to_cat = col_to_cat
@@ -252,7 +383,10 @@ class GeoPackageNexus(Nexus):
         gpd.GeoDataFrame
             The (1-line) ssub-dataframe from the ``nexus`` layer dataframe for this particular nexus.
         """
-        df = self._nexuses_df.loc[self._nexuses_df[self._col_nex_id] == self._nex_id]
+        if self._nexuses_df is None:
+            df = self._hydrofabric.read_nexus_records([self._nex_id])
+        else:
+            df = self._nexuses_df.loc[self._nexuses_df[self._col_nex_id] == self._nex_id]
         if df.shape[0] == 0:
             msg = 'No backing records in {} data for {} {}'
             raise RuntimeError(msg.format(self._hydrofabric.__class__.__name__, self.__class__.__name__, self._nex_id))
@@ -285,7 +419,7 @@ class GeoPackageNexus(Nexus):
             Tuple of GeoPackageCatchment object(s) receiving water from nexus
         """
         catchments = [self._hydrofabric.get_catchment_by_id(cid) for cid in
-                      self._get_nexus_record()[self._col_to_cat].values]
+                      self._hydrofabric.topology.get_receiving_catchment_ids(self._nex_id)]
         return tuple([c for c in catchments if c is not None])
 
     @property
@@ -298,9 +432,8 @@ class GeoPackageNexus(Nexus):
         Tuple['GeoPackageCatchment']
             Tuple of GeoPackageCatchment object(s) contributing water to nexus
         """
-        cat_rows = self._catchments_df.loc[self._catchments_df[self._col_to_nex] == self._nex_id]
         cat_lookups = [self._hydrofabric.get_catchment_by_id(cid) for cid in
-                       cat_rows[self._col_cat_id].values]
+                       self._hydrofabric.topology.get_contributing_catchment_ids(self._nex_id)]
         return tuple([c for c in cat_lookups if c is not None])
 
 
@@ -323,14 +456,73 @@ class GeoPackageHydrofabric(Hydrofabric):
     _NEXUS_NEX_ID_COL = 'id'
     _NEXUS_TO_CAT_COL = 'toid'
 
+    _UID_CACHE_SUFFIX = '.uid'
+    """ Suffix appended to a GeoPackage file's name to get the name of the sidecar file caching its uid. """
+    _UID_CHUNK_SIZE = 1024 * 1024
+    """ Size in bytes of the chunks in which a GeoPackage file is read when hashing it for its uid. """
+
     @classmethod
-    def from_file(cls, geopackage_file: Union[str, Path, bytes], vpu: Optional[int] = None, is_conus: bool = False) -> 'GeoPackageHydrofabric':
+    def _get_uid_cache(cls, geopackage_file: Path) -> SourceStampedSidecar:
+        sidecar_file = geopackage_file.with_name(geopackage_file.name + cls._UID_CACHE_SUFFIX)
+        return SourceStampedSidecar(sidecar_file=sidecar_file, source_files=[geopackage_file])
+
+    @classmethod
+    def get_uid_for_file(cls, geopackage_file: Union[str, Path, bytes], use_cache: bool = True) -> str:
+        """
+        Get the uid of a hydrofabric instance from the given GeoPackage file, or contents of such a file.
+
+        The uid is a hash of the raw bytes of the file, which is much cheaper than reading and hashing its layers.  For
+        a file path, the file is hashed in chunks, and the result is saved in a small JSON sidecar file next to it (see
+        ::class:`SourceStampedSidecar`).  Later calls reuse the cached uid, including from other processes, as long as
+        the file is unchanged; otherwise, the file is hashed again and the sidecar is replaced.
+
+        Parameters
+        ----------
+        geopackage_file: Union[str, Path, bytes]
+            The GeoPackage file, or raw data from such a file.
+        use_cache: bool
+            Whether to read and write the uid sidecar file for a file path (defaults to ``True``).
+
+        Returns
+        -------
+        str
+            The uid of a hydrofabric instance from the given GeoPackage file.
+        """
+        if isinstance(geopackage_file, bytes):
+            return hashlib.sha1(geopackage_file).hexdigest()
+
+        geopackage_file = Path(geopackage_file)
+        uid_cache = cls._get_uid_cache(geopackage_file)
+        # Stamp the file before hashing it, so a change while hashing leaves the sidecar stale rather than wrong
+        stamp = uid_cache.get_source_stamp()
+        cached = uid_cache.read_json() if use_cache else None
+        if cached is not None and isinstance(cached.get('uid'), str):
+            return cached['uid']
+
+        file_hash = hashlib.sha1()
+        with geopackage_file.open('rb') as gpkg:
+            for chunk in iter(lambda: gpkg.read(cls._UID_CHUNK_SIZE), b''):
+                file_hash.update(chunk)
+        uid = file_hash.hexdigest()
+
+        if use_cache:
+            uid_cache.write_json({'uid': uid}, stamp=stamp)
+        return uid
+
+    @classmethod
+    def from_file(cls, geopackage_file: Union[str, Path, bytes], vpu: Optional[int] = None, is_conus: bool = False,
+                  lazy: bool = False) -> 'GeoPackageHydrofabric':
         """
         Initialize a new instance from a GeoPackage file or contents of such a file (as ``bytes``).
 
         Note that while a warning may appear because of implementation details in ``pyogrio``, this should work
         perfectly well if passed raw bytes from a file.
 
+        By default, all layers are read in full.  Alternatively, a lazy instance can be created, which initially reads
+        only the id and topology columns of the ``divides`` and ``nexus`` layers, without geometries, and reads other
+        layer data only when needed.  Note that a lazy instance reads from the file after creation, so the file should
+        not change or be removed while the instance is in use.
+
         Parameters
         ----------
         geopackage_file: Union[str, Path, bytes]
@@ -339,6 +531,8 @@ class GeoPackageHydrofabric(Hydrofabric):
             The VPU of the hydrofabric to create, if it is known (defaults to ``None``).
         is_conus: bool
             Whether this hydrofabric is for all of CONUS (defaults to ``False``).
+        lazy: bool
+            Whether to create a lazy instance that reads layer data only when needed (defaults to ``False``).
 
         Returns
         -------
@@ -348,22 +542,67 @@ class GeoPackageHydrofabric(Hydrofabric):
         # pyogrio's function returns an ndarry of ndarrays, with inner layer info array containing layer name and type
         # We only need a list of layer names, though
         layer_names = [layer_info[0] for layer_info in pyogrio.list_layers(geopackage_file)]
-        return cls(layer_names=layer_names,
-                   layer_dataframes={ln: gpd.read_file(geopackage_file, layer=ln, engine="pyogrio") for ln in layer_names},
-                   vpu=vpu,
-                   is_conus=is_conus)
+        if lazy:
+            layers = GeoPackageLayers(layer_names=layer_names, geopackage_file=geopackage_file)
+        else:
+            layers = {ln: gpd.read_file(geopackage_file, layer=ln, engine="pyogrio") for ln in layer_names}
+        return cls(layer_names=layer_names, layer_dataframes=layers, vpu=vpu, is_conus=is_conus,
+                   geopackage_file=geopackage_file)
 
-    def __init__(self, layer_names: List[str], layer_dataframes: Dict[str, gpd.GeoDataFrame], vpu: Optional[int] = None,
-                 is_conus: bool = False):
+    def __init__(self, layer_names: List[str], layer_dataframes: Union[Dict[str, gpd.GeoDataFrame], GeoPackageLayers],
+                 vpu: Optional[int] = None, is_conus: bool = False, topology: Optional[HydrofabricTopology] = None,
+                 geopackage_file: Optional[Union[str, Path, bytes]] = None):
+        """
+        Initialize this instance.
+
+        Parameters
+        ----------
+        layer_names : List[str]
+            The names of the GeoPackage layers.
+        layer_dataframes : Union[Dict[str, gpd.GeoDataFrame], GeoPackageLayers]
+            The dataframe for each layer, keyed by layer name, either already read or as a lazy
+            ::class:`GeoPackageLayers` object.
+        vpu : Optional[int]
+            The VPU of the hydrofabric, if it is known (defaults to ``None``).
+        is_conus : bool
+            Whether this hydrofabric is for all of CONUS (defaults to ``False``).
+        topology : Optional[HydrofabricTopology]
+            The already-built topology index of the layer data, if available, to avoid building it again from the
+            ``divides`` and ``nexus`` layers.
+        geopackage_file : Optional[Union[str, Path, bytes]]
+            The unmodified GeoPackage file, or raw data from such a file, from which the layer data was read, if any,
+            so that the uid can be derived from it (see ::method:`get_uid_for_file`).
+        """
+        self._geopackage_file = geopackage_file
+        self._file_uid: Optional[str] = None
+        self._hash: Optional[int] = None
         self._layer_names: List[str] = layer_names
-        self._dataframes: Dict[str, gpd.GeoDataFrame] = layer_dataframes
+        if not isinstance(layer_dataframes, GeoPackageLayers):
+            layer_dataframes = GeoPackageLayers(layer_names=layer_names, dataframes=layer_dataframes)
+        self._dataframes: GeoPackageLayers = layer_dataframes
         self._roots = None
         self._vpu = vpu
         self._is_conus = is_conus
 
         #flowpaths = self._dataframes[self._FLOWPATHS_LAYER_NAME]
-        divides = self._dataframes[self._DIVIDES_LAYER_NAME]
-        nexuses = self._dataframes[self._NEXUS_LAYER_NAME]
+        # Only the id and topology columns are needed here, so this avoids reading full layers for lazy instances
+        self._divides_links: pd.DataFrame = self._dataframes.read(
+            self._DIVIDES_LAYER_NAME, columns=[self._DIVIDES_CAT_ID_COL, self._DIVIDES_TO_NEX_COL], read_geometry=False)
+        self._nexus_links: pd.DataFrame = self._dataframes.read(
+            self._NEXUS_LAYER_NAME, columns=[self._NEXUS_NEX_ID_COL, self._NEXUS_TO_CAT_COL], read_geometry=False)
+        # Catchments and nexuses read their records when needed if the full layers have not been read
+        divides = self._dataframes[self._DIVIDES_LAYER_NAME] if self._dataframes.is_loaded(
+            self._DIVIDES_LAYER_NAME) else None
+        nexuses = self._dataframes[self._NEXUS_LAYER_NAME] if self._dataframes.is_loaded(
+            self._NEXUS_LAYER_NAME) else None
+
+        if topology is None:
+            topology = HydrofabricTopology.from_links(
+                catchment_ids=self._divides_links[self._DIVIDES_CAT_ID_COL].values,
+                catchment_to_ids=self._divides_links[self._DIVIDES_TO_NEX_COL].values,
+                nexus_ids=self._nexus_links[self._NEXUS_NEX_ID_COL].values,
+                nexus_to_ids=self._nexus_links[self._NEXUS_TO_CAT_COL].values)
+        self._topology: HydrofabricTopology = topology
 
         col_args = {'col_cat_id': self._DIVIDES_CAT_ID_COL, 'col_nex_id': self._NEXUS_NEX_ID_COL,
                     'col_to_cat': self._NEXUS_TO_CAT_COL, 'col_to_nex': self._DIVIDES_TO_NEX_COL}
@@ -376,7 +615,13 @@ class GeoPackageHydrofabric(Hydrofabric):
             [(nid, GeoPackageNexus(nid, self, divides, nexuses, **col_args)) for nid in self.get_all_nexus_ids()])
 
     def __eq__(self, other):
-        if not isinstance(other, GeoPackageHydrofabric) or self.uid != other.uid:
+        if not isinstance(other, GeoPackageHydrofabric):
+            return False
+        # Identical files mean identical layers, but uids from files can't otherwise be compared with layer data
+        is_from_file = self._geopackage_file is not None
+        if is_from_file and other._geopackage_file is not None and self.uid == other.uid:
+            return True
+        if not is_from_file and other._geopackage_file is None and self.uid != other.uid:
             return False
         if len(self._layer_names) != len(other._layer_names):
             return False
@@ -388,7 +633,11 @@ class GeoPackageHydrofabric(Hydrofabric):
         return True
 
     def __hash__(self) -> int:
-        return hash(self.uid)
+        # Instances with different kinds of uids may still be equal, so hash something both will always have in common
+        # Since this requires going through all ids, only do it once; instances are not modified after creation
+        if self._hash is None:
+            self._hash = hash((frozenset(self.get_all_catchment_ids()), frozenset(self.get_all_nexus_ids())))
+        return self._hash
 
     def get_all_catchment_ids(self) -> Tuple[str, ...]:
         """
@@ -399,7 +648,7 @@ class GeoPackageHydrofabric(Hydrofabric):
         Tuple[str, ...]
             Ids for all contained catchments.
         """
-        return tuple(self._dataframes[self._DIVIDES_LAYER_NAME][self._DIVIDES_CAT_ID_COL].values)
+        return tuple(self._divides_links[self._DIVIDES_CAT_ID_COL].values)
 
     def get_all_nexus_ids(self) -> Tuple[str, ...]:
         """
@@ -410,7 +659,7 @@ class GeoPackageHydrofabric(Hydrofabric):
         Tuple[str, ...]
             Ids for all contained nexuses.
         """
-        return tuple(self._dataframes[self._NEXUS_LAYER_NAME][self._NEXUS_NEX_ID_COL].values)
+        return tuple(self._nexus_links[self._NEXUS_NEX_ID_COL].values)
 
     def get_catchment_by_id(self, catchment_id: str) -> Optional[GeoPackageCatchment]:
         return self._catchments.get(catchment_id)
@@ -457,11 +706,11 @@ class GeoPackageHydrofabric(Hydrofabric):
         }
 
         # Then, apply this logic to every encountered layer to create subset layer/dataframe to use to init new instance
+        # For lazy instances, this reads only the applicable rows of layers that have not already been fully read
         def subset_layer(layer_name: str):
-            dataframe = self._dataframes[layer_name]
             id_search_col = subset_query_setups[layer_name][0]
             applicable_ids = subset_query_setups[layer_name][1]()
-            new_dfs[layer_name] = dataframe.loc[dataframe[id_search_col].isin(applicable_ids)]
+            new_dfs[layer_name] = self._dataframes.read(layer_name, id_column=id_search_col, ids=applicable_ids)
 
         # Subset 'flowpaths' layer first; it's ids may be needed for subsetting other things like 'flowpath_edge_list'
         if 'flowpaths' in self._layer_names:
@@ -471,7 +720,8 @@ class GeoPackageHydrofabric(Hydrofabric):
         for layer in [ln for ln in self._layer_names if ln != 'flowpaths']:
             subset_layer(layer)
 
-        return GeoPackageHydrofabric(layer_names=self._layer_names, layer_dataframes=new_dfs)
+        return GeoPackageHydrofabric(layer_names=self._layer_names, layer_dataframes=new_dfs,
+                                     topology=self._topology.get_subset(subset.catchment_ids, subset.nexus_ids))
 
     def is_catchment_recognized(self, catchment_id: str) -> bool:
         """
@@ -487,7 +737,7 @@ class GeoPackageHydrofabric(Hydrofabric):
         bool
             Whether the catchment is recognized.
         """
-        return catchment_id in self._dataframes[self._DIVIDES_LAYER_NAME][self._DIVIDES_CAT_ID_COL].values
+        return self._topology.is_catchment_recognized(catchment_id)
 
     @property
     def is_conus(self) -> bool:
@@ -515,7 +765,51 @@ class GeoPackageHydrofabric(Hydrofabric):
        bool
            Whether the nexus is recognized.
        """
-        return nexus_id in self._dataframes[self._NEXUS_LAYER_NAME][self._NEXUS_NEX_ID_COL].values
+        return self._topology.is_nexus_recognized(nexus_id)
+
+    def read_catchment_records(self, catchment_ids: Collection[str], columns: Optional[List[str]] = None,
+                               read_geometry: bool = True) -> pd.DataFrame:
+        """
+        Read the ``divides`` layer records for some catchments, without reading the full layer if it is not needed.
+
+        Parameters
+        ----------
+        catchment_ids : Collection[str]
+            The ids of the catchments.
+        columns : Optional[List[str]]
+            The non-geometry columns to read, or ``None`` (the default) for all of them.
+        read_geometry : bool
+            Whether to read the geometry column (``True`` by default).
+
+        Returns
+        -------
+        pd.DataFrame
+            The ``divides`` layer records for the catchments.
+        """
+        return self._dataframes.read(self._DIVIDES_LAYER_NAME, columns=columns, read_geometry=read_geometry,
+                                     id_column=self._DIVIDES_CAT_ID_COL, ids=catchment_ids)
+
+    def read_nexus_records(self, nexus_ids: Collection[str], columns: Optional[List[str]] = None,
+                           read_geometry: bool = True) -> pd.DataFrame:
+        """
+        Read the ``nexus`` layer records for some nexuses, without reading the full layer if it is not needed.
+
+        Parameters
+        ----------
+        nexus_ids : Collection[str]
+            The ids of the nexuses.
+        columns : Optional[List[str]]
+            The non-geometry columns to read, or ``None`` (the default) for all of them.
+        read_geometry : bool
+            Whether to read the geometry column (``True`` by default).
+
+        Returns
+        -------
+        pd.DataFrame
+            The ``nexus`` layer records for the nexuses.
+        """
+        return self._dataframes.read(self._NEXUS_LAYER_NAME, columns=columns, read_geometry=read_geometry,
+                                     id_column=self._NEXUS_NEX_ID_COL, ids=nexus_ids)
 
     @property
     def roots(self) -> FrozenSet[str]:
@@ -532,24 +826,39 @@ class GeoPackageHydrofabric(Hydrofabric):
         ::attribute:`hydrofabric_graph`
         """
         if self._roots is None:
-            divides_df = self._dataframes[self._DIVIDES_LAYER_NAME]
-            nexuses_df = self._dataframes[self._NEXUS_LAYER_NAME]
-            self._roots = frozenset(divides_df.loc[~divides_df[self._DIVIDES_CAT_ID_COL].isin(
-                nexuses_df[self._NEXUS_TO_CAT_COL].values)][self._DIVIDES_CAT_ID_COL].values)
+            self._roots = self._topology.roots
         return self._roots
 
+    @property
+    def topology(self) -> HydrofabricTopology:
+        """
+        The integer-coded index of the catchment/nexus connections of this hydrofabric.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The integer-coded index of the catchment/nexus connections of this hydrofabric.
+        """
+        return self._topology
+
     @property
     def uid(self) -> str:
         """
         Get a unique id for this instance.
 
-        Ids are generated from in a deterministic manner from the underlying data.
+        Ids are generated from in a deterministic manner from the underlying data.  For an instance created from a
+        GeoPackage file, this is a hash of the file's contents (see ::method:`get_uid_for_file`); otherwise, it is a
+        hash of the data in the layer dataframes.
 
         Returns
         -------
-        int
+        str
             A unique id for this instance.
         """
+        if self._geopackage_file is not None:
+            if self._file_uid is None:
+                self._file_uid = self.get_uid_for_file(self._geopackage_file)
+            return self._file_uid
         layer_hashes = [hash_pandas_object(self._dataframes[layer]).values.sum() for layer in sorted(self._layer_names)]
         return hashlib.sha1(','.join([str(h) for h in layer_hashes]).encode('UTF-8')).hexdigest()
 
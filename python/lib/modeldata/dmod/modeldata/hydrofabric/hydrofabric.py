@@ -6,6 +6,7 @@ from collections import defaultdict
 from hypy import Catchment, HydroLocation, Nexus
 from pathlib import Path
 from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+from .topology import HydrofabricTopology, HydrofabricTopologyCache
 from ..subset import SubsetDefinition
 
 
@@ -344,6 +345,33 @@ class Hydrofabric(ABC):
         """
         pass
 
+    @property
+    def topology(self) -> HydrofabricTopology:
+        """
+        The integer-coded index of the catchment/nexus connections of this hydrofabric.
+
+        The default implementation builds a new index from the downstream connections of the feature objects every time
+        it is accessed; subtypes should override this to keep and reuse the index where that is possible.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The integer-coded index of the catchment/nexus connections of this hydrofabric.
+        """
+        cat_ids, cat_to_ids, nex_ids, nex_to_ids = [], [], [], []
+        for cid in self.get_all_catchment_ids():
+            outflow = self.get_catchment_by_id(cid).outflow
+            cat_ids.append(cid)
+            cat_to_ids.append(None if outflow is None else outflow.id)
+        for nid in self.get_all_nexus_ids():
+            receiving = self.get_nexus_by_id(nid).receiving_catchments
+            # Nexuses may have several receiving catchments, which are given as repeated records for the nexus
+            receiving_ids = [c.id for c in receiving] if receiving else [None]
+            nex_ids.extend([nid] * len(receiving_ids))
+            nex_to_ids.extend(receiving_ids)
+        return HydrofabricTopology.from_links(catchment_ids=cat_ids, catchment_to_ids=cat_to_ids, nexus_ids=nex_ids,
+                                              nexus_to_ids=nex_to_ids)
+
     @property
     def uid(self) -> str:
         """
@@ -384,8 +412,15 @@ class HydrofabricFilesManager(ABC):
     initially setting ``None`` to a corresponding hydrofabric's index.  This is to avoid loading all found hydrofabrics
     initially.
 
+    To avoid fully parsing hydrofabric files just for their uid or topology, each hydrofabric's uid and
+    ::class:`HydrofabricTopology` are also cached in a ::class:`HydrofabricTopologyCache` sidecar file, next to the first
+    file in its files tuple.  These are loaded from the cache while the hydrofabric files are unchanged, and otherwise
+    are obtained from a newly instantiated hydrofabric object and written back to the cache.
     """
 
+    _TOPOLOGY_CACHE_SUFFIX = '.topology'
+    """ The suffix appended to the name of a hydrofabric's first file for the name of its topology cache file. """
+
     def __init__(self, *args, **kwargs):
         self._hydrofabric_files: List[Tuple[Path, ...]] = []
         self._hydrofabric_initializers: List[Callable[[Any, ...], Hydrofabric]] = []
@@ -582,10 +617,82 @@ class HydrofabricFilesManager(ABC):
         """
         if hf_index >= self.number_of_hydrofabrics:
             raise RuntimeError("Attempting to obtain hydrofabric uid at invalid index: {}".format(hf_index))
+        if self._hydrofabric_uids[hf_index] is None and not recheck:
+            self._hydrofabric_uids[hf_index] = self.get_topology_cache(hf_index).load_uid()
         if self._hydrofabric_uids[hf_index] is None or recheck:
-            self._hydrofabric_uids[hf_index] = self.get_hydrofabric(hf_index, discard_cached=recheck).uid
+            self._load_and_cache_topology(hf_index, discard_cached=recheck)
         return self._hydrofabric_uids[hf_index]
 
+    def _load_and_cache_topology(self, hf_index: int, discard_cached: bool = False) -> HydrofabricTopology:
+        """
+        Get the uid and topology of the hydrofabric at the given index from a full load, and write them to its cache.
+
+        The uid is also stored in the instance's list of hydrofabric uid values.
+
+        Parameters
+        ----------
+        hf_index : int
+            The lookup index of the hydrofabric.
+        discard_cached : bool
+            Whether any cached hydrofabric object should be discarded and replaced with a newly created one.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The topology of the hydrofabric.
+        """
+        hydrofabric = self.get_hydrofabric(hf_index, discard_cached=discard_cached)
+        self._hydrofabric_uids[hf_index] = hydrofabric.uid
+        topology = hydrofabric.topology
+        self.get_topology_cache(hf_index).save(uid=self._hydrofabric_uids[hf_index], topology=topology)
+        return topology
+
+    def get_hydrofabric_topology(self, hf_index: int, recheck: bool = False) -> HydrofabricTopology:
+        """
+        Get the topology of the hydrofabric at the given index, loading it from the hydrofabric's cache when possible.
+
+        When the hydrofabric's cache is current, the topology is loaded from it (along with the uid, if that was not yet
+        known) without instantiating the hydrofabric.  Otherwise, or if the optional ``recheck`` parameter is set to
+        ``True``, the topology is obtained from a newly instantiated hydrofabric object and written to the cache.
+
+        Parameters
+        ----------
+        hf_index : int
+            The lookup index of the hydrofabric.
+        recheck : bool
+            Whether to ignore the cache and obtain the topology from a newly instantiated hydrofabric object.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The topology of the hydrofabric.
+        """
+        if hf_index >= self.number_of_hydrofabrics:
+            raise RuntimeError("Attempting to obtain hydrofabric topology at invalid index: {}".format(hf_index))
+        cached = None if recheck else self.get_topology_cache(hf_index).load()
+        if cached is None:
+            return self._load_and_cache_topology(hf_index, discard_cached=recheck)
+        self._hydrofabric_uids[hf_index], topology = cached
+        return topology
+
+    def get_topology_cache(self, hf_index: int) -> HydrofabricTopologyCache:
+        """
+        Get the topology cache for the hydrofabric at the given index.
+
+        Parameters
+        ----------
+        hf_index : int
+            The lookup index of the hydrofabric.
+
+        Returns
+        -------
+        HydrofabricTopologyCache
+            The topology cache for the hydrofabric, which is a sidecar file next to the first of its files.
+        """
+        files = self.get_hydrofabric_files_tuple(hf_index)
+        return HydrofabricTopologyCache(cache_file=files[0].with_name(files[0].name + self._TOPOLOGY_CACHE_SUFFIX),
+                                        source_files=files)
+
     @property
     @abstractmethod
     def hydrofabric_data_root_dir(self) -> Path:
@@ -869,6 +976,7 @@ class MappedGraphHydrofabric(Hydrofabric):
         self._catchment_ids = set()
         self._nexus_ids = set()
         self._roots = roots
+        self._topology: Optional[HydrofabricTopology] = None
         for obj_id, obj in self._hydrofabric_graph.items():
             if isinstance(obj, Catchment):
                 self._catchment_ids.add(obj_id)
@@ -1120,6 +1228,22 @@ class MappedGraphHydrofabric(Hydrofabric):
         """
         return self._roots
 
+    @property
+    def topology(self) -> HydrofabricTopology:
+        """
+        The integer-coded index of the catchment/nexus connections of this hydrofabric.
+
+        The index is built from the object graph the first time it is needed, and then kept.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The integer-coded index of the catchment/nexus connections of this hydrofabric.
+        """
+        if self._topology is None:
+            self._topology = super().topology
+        return self._topology
+
 
 class GeoJsonHydrofabric(MappedGraphHydrofabric):
     """
@@ -0,0 +1,140 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional, Sequence, Tuple
+
+
+class SourceStampedSidecar:
+    """
+    Sidecar file holding data derived from some hydrofabric source files, stamped with the state of those files.
+
+    The stamp is the name, size, and modification time of each source file when the sidecar was written.  Sidecar data
+    is only current while the stamp still matches the source files, so that deriving the data again is only needed
+    when the source files change.  Sidecars are written to a temporary file and then moved into place, so that readers
+    (including in other processes) never see a partial file.
+    """
+
+    def __init__(self, sidecar_file: Path, source_files: Sequence[Path]):
+        """
+        Initialize this instance.
+
+        Parameters
+        ----------
+        sidecar_file : Path
+            The path of the sidecar file, which need not exist yet.
+        source_files : Sequence[Path]
+            The hydrofabric source files from which the sidecar data is derived.
+        """
+        self._sidecar_file: Path = sidecar_file
+        self._source_files: Tuple[Path, ...] = tuple(source_files)
+
+    @property
+    def sidecar_file(self) -> Path:
+        """
+        The path of the sidecar file.
+
+        Returns
+        -------
+        Path
+            The path of the sidecar file.
+        """
+        return self._sidecar_file
+
+    def get_source_stamp(self) -> List[List]:
+        """
+        Get the current stamp of the source files, as a JSON-serializable list of name, size, and modification time.
+
+        Returns
+        -------
+        List[List]
+            The current stamp of the source files.
+        """
+        stamp = []
+        for source in self._source_files:
+            stat_result = source.stat()
+            stamp.append([source.name, stat_result.st_size, stat_result.st_mtime_ns])
+        return stamp
+
+    def is_stamp_current(self, stamp: Optional[List[List]]) -> bool:
+        """
+        Whether the given stamp, such as one read from the sidecar file, matches the current source files.
+
+        Parameters
+        ----------
+        stamp : Optional[List[List]]
+            A stamp of the source files.
+
+        Returns
+        -------
+        bool
+            Whether the given stamp matches the current source files.
+        """
+        try:
+            return stamp == self.get_source_stamp()
+        except OSError:
+            return False
+
+    def read_json(self) -> Optional[dict]:
+        """
+        Read the data of a JSON sidecar file, if it exists and was written from the current source files.
+
+        Returns
+        -------
+        Optional[dict]
+            The sidecar data, or ``None`` if there is no valid, current sidecar file.
+        """
+        try:
+            data = json.loads(self._sidecar_file.read_text())
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) and self.is_stamp_current(data.get('sources')) else None
+
+    def write(self, write_contents: Callable[[BinaryIO], None]) -> bool:
+        """
+        Write the sidecar file, replacing any existing one.
+
+        Failures to write, such as for a read-only hydrofabric directory, are logged rather than raised.
+
+        Parameters
+        ----------
+        write_contents : Callable[[BinaryIO], None]
+            Function writing the full contents of the sidecar file to the given open binary file.
+
+        Returns
+        -------
+        bool
+            Whether the sidecar file was written.
+        """
+        temp_file = self._sidecar_file.with_name('.{}.{}.tmp'.format(self._sidecar_file.name, os.getpid()))
+        try:
+            with temp_file.open('wb') as sidecar:
+                write_contents(sidecar)
+            os.replace(temp_file, self._sidecar_file)
+            return True
+        except OSError as e:
+            msg = '{} could not write sidecar file {} ({}: {})'
+            logging.warning(msg.format(self.__class__.__name__, self._sidecar_file, e.__class__.__name__, str(e)))
+            if temp_file.exists():
+                temp_file.unlink()
+            return False
+
+    def write_json(self, data: dict, stamp: Optional[List[List]] = None) -> bool:
+        """
+        Write the given data, stamped with the state of the source files, as a JSON sidecar file.
+
+        Parameters
+        ----------
+        data : dict
+            The JSON-serializable sidecar data.
+        stamp : Optional[List[List]]
+            The stamp of the source files from which the data was derived, if taken before deriving it; by default, the
+            current stamp is used.
+
+        Returns
+        -------
+        bool
+            Whether the sidecar file was written.
+        """
+        contents = json.dumps(dict(data, sources=self.get_source_stamp() if stamp is None else stamp)).encode('UTF-8')
+        return self.write(lambda sidecar: sidecar.write(contents))
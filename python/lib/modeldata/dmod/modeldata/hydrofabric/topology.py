@@ -0,0 +1,698 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import BinaryIO, FrozenSet, Iterable, Optional, Sequence, Tuple
+from .sidecar import SourceStampedSidecar
+
+
+class AdjacencyIndex:
+    """
+    Compact, compressed sparse row (CSR) adjacency structure between two integer-coded sets of nodes.
+
+    The neighbors of source node ``i`` are the target nodes ``indices[offsets[i]:offsets[i + 1]]``.
+    """
+
+    __slots__ = ["_offsets", "_indices"]
+
+    @classmethod
+    def from_edges(cls, sources: np.ndarray, targets: np.ndarray, num_sources: int) -> 'AdjacencyIndex':
+        """
+        Initialize a new instance from parallel arrays of the source and target node indices of each edge.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            The source node index of each edge.
+        targets : np.ndarray
+            The target node index of each edge.
+        num_sources : int
+            The number of source nodes.
+
+        Returns
+        -------
+        AdjacencyIndex
+            A new instance of this type.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        offsets = np.zeros(num_sources + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_sources), out=offsets[1:])
+        # Stable, so that neighbors keep the order in which their edges were given
+        indices = np.asarray(targets, dtype=np.int64)[np.argsort(sources, kind='stable')]
+        return cls(offsets=offsets, indices=indices)
+
+    def __init__(self, offsets: np.ndarray, indices: np.ndarray):
+        self._offsets: np.ndarray = offsets
+        self._indices: np.ndarray = indices
+
+    def __eq__(self, other):
+        return isinstance(other, AdjacencyIndex) and np.array_equal(self._offsets, other._offsets) \
+            and np.array_equal(self._indices, other._indices)
+
+    def degrees(self) -> np.ndarray:
+        """
+        Get the number of neighbors of each source node.
+
+        Returns
+        -------
+        np.ndarray
+            The number of neighbors of each source node, by source node index.
+        """
+        return np.diff(self._offsets)
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get parallel arrays of the source and target node indices of each edge.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The source node index array and the target node index array, ordered by source node.
+        """
+        return np.repeat(np.arange(self.num_sources, dtype=np.int64), self.degrees()), self._indices
+
+    def neighbors(self, source: int) -> np.ndarray:
+        """
+        Get the indices of the target nodes adjacent to a source node.
+
+        Parameters
+        ----------
+        source : int
+            The index of the source node.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the target nodes adjacent to the source node.
+        """
+        return self._indices[self._offsets[source]:self._offsets[source + 1]]
+
+    def neighbors_of_all(self, sources: np.ndarray) -> np.ndarray:
+        """
+        Get the indices of the target nodes adjacent to any of several source nodes, in one vectorized step.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            The indices of the source nodes.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the target nodes adjacent to each source node, concatenated, and possibly with repeats.
+        """
+        starts = self._offsets[sources]
+        lengths = self._offsets[sources + 1] - starts
+        # For the k-th edge overall, which is within the j-th source's block, the position is starts[j] plus how far k
+        # is into that block
+        block_starts = np.cumsum(lengths) - lengths
+        return self._indices[np.repeat(starts - block_starts, lengths) + np.arange(lengths.sum(), dtype=np.int64)]
+
+    def transpose(self, num_targets: int) -> 'AdjacencyIndex':
+        """
+        Get the adjacency structure with every edge reversed.
+
+        Parameters
+        ----------
+        num_targets : int
+            The number of target nodes, which become the source nodes of the transpose.
+
+        Returns
+        -------
+        AdjacencyIndex
+            The adjacency structure with every edge reversed.
+        """
+        sources, targets = self.edges()
+        return AdjacencyIndex.from_edges(sources=targets, targets=sources, num_sources=num_targets)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        The target node indices of all edges, grouped by source node.
+
+        Returns
+        -------
+        np.ndarray
+            The target node indices of all edges, grouped by source node.
+        """
+        return self._indices
+
+    @property
+    def num_sources(self) -> int:
+        """
+        The number of source nodes.
+
+        Returns
+        -------
+        int
+            The number of source nodes.
+        """
+        return self._offsets.shape[0] - 1
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        The offsets into ::attribute:`indices` at which the neighbors of each source node start.
+
+        Returns
+        -------
+        np.ndarray
+            The offsets into ::attribute:`indices` at which the neighbors of each source node start, with a final
+            element equal to the number of edges.
+        """
+        return self._offsets
+
+
+class HydrofabricTopology:
+    """
+    Integer-coded index of the catchment/nexus connections of a hydrofabric, for answering topology queries quickly.
+
+    Catchments and nexuses are each numbered by the order their ids are first encountered.  Connections are kept as
+    ::class:`AdjacencyIndex` objects in each direction, so that finding the features connected to a given feature
+    takes time proportional to the number of connections, rather than the size of the hydrofabric.
+    """
+
+    __slots__ = ["_catchment_ids", "_nexus_ids", "_catchment_positions", "_nexus_positions", "_cat_to_nex",
+                 "_nex_to_cat", "_nex_from_cat", "_cat_from_nex"]
+
+    @classmethod
+    def _encode_ids(cls, ids: Sequence[str]) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Get the distinct ids, in order of first occurrence, and the index of each given id among those.
+
+        Parameters
+        ----------
+        ids : Sequence[str]
+            A sequence of ids, possibly with repeated values.
+
+        Returns
+        -------
+        Tuple[np.ndarray, pd.Index]
+            The index of each given id among the distinct ids, and the index of distinct ids.
+        """
+        distinct = pd.Index(pd.unique(np.asarray(ids, dtype=object)))
+        return distinct.get_indexer(ids), distinct
+
+    @classmethod
+    def from_links(cls, catchment_ids: Sequence[str], catchment_to_ids: Sequence[Optional[str]],
+                   nexus_ids: Sequence[str], nexus_to_ids: Sequence[Optional[str]]) -> 'HydrofabricTopology':
+        """
+        Initialize a new instance from the downstream links of each catchment and nexus.
+
+        Downstream links to ids that are not among the given catchments or nexuses (including ``None`` or ``NaN``
+        values) are ignored.
+
+        Parameters
+        ----------
+        catchment_ids : Sequence[str]
+            The ids of the catchments, one per record.
+        catchment_to_ids : Sequence[Optional[str]]
+            The id of the downstream nexus of each record in ``catchment_ids``.
+        nexus_ids : Sequence[str]
+            The ids of the nexuses, one per record.
+        nexus_to_ids : Sequence[Optional[str]]
+            The id of the downstream catchment of each record in ``nexus_ids``.
+
+        Returns
+        -------
+        HydrofabricTopology
+            A new instance of this type.
+        """
+        cat_sources, cat_index = cls._encode_ids(catchment_ids)
+        nex_sources, nex_index = cls._encode_ids(nexus_ids)
+
+        cat_targets = nex_index.get_indexer(pd.Index(catchment_to_ids, dtype=object))
+        nex_targets = cat_index.get_indexer(pd.Index(nexus_to_ids, dtype=object))
+        cat_links = cat_targets >= 0
+        nex_links = nex_targets >= 0
+
+        cat_to_nex = AdjacencyIndex.from_edges(sources=cat_sources[cat_links], targets=cat_targets[cat_links],
+                                               num_sources=cat_index.shape[0])
+        nex_to_cat = AdjacencyIndex.from_edges(sources=nex_sources[nex_links], targets=nex_targets[nex_links],
+                                               num_sources=nex_index.shape[0])
+        return cls(catchment_ids=cat_index.values, nexus_ids=nex_index.values, cat_to_nex=cat_to_nex,
+                   nex_to_cat=nex_to_cat)
+
+    def __init__(self, catchment_ids: np.ndarray, nexus_ids: np.ndarray, cat_to_nex: AdjacencyIndex,
+                 nex_to_cat: AdjacencyIndex):
+        """
+        Initialize this instance.
+
+        Parameters
+        ----------
+        catchment_ids : np.ndarray
+            The distinct catchment ids, by catchment index.
+        nexus_ids : np.ndarray
+            The distinct nexus ids, by nexus index.
+        cat_to_nex : AdjacencyIndex
+            The downstream connections from catchments to nexuses.
+        nex_to_cat : AdjacencyIndex
+            The downstream connections from nexuses to catchments.
+        """
+        self._catchment_ids: np.ndarray = catchment_ids
+        self._nexus_ids: np.ndarray = nexus_ids
+        # Indexes for finding positions by id, which build their hash tables (in C) only when first used
+        self._catchment_positions: pd.Index = pd.Index(catchment_ids, dtype=object, copy=False)
+        self._nexus_positions: pd.Index = pd.Index(nexus_ids, dtype=object, copy=False)
+        self._cat_to_nex: AdjacencyIndex = cat_to_nex
+        self._nex_to_cat: AdjacencyIndex = nex_to_cat
+        # The upstream connections, i.e., contributing catchments of nexuses and inflow nexuses of catchments
+        self._nex_from_cat: AdjacencyIndex = cat_to_nex.transpose(num_targets=nexus_ids.shape[0])
+        self._cat_from_nex: AdjacencyIndex = nex_to_cat.transpose(num_targets=catchment_ids.shape[0])
+
+    @staticmethod
+    def _find_position(positions: pd.Index, feature_id: str) -> Optional[int]:
+        return positions.get_loc(feature_id) if feature_id in positions else None
+
+    @staticmethod
+    def _find_positions(positions: pd.Index, feature_ids: Iterable[str]) -> np.ndarray:
+        found = positions.get_indexer(pd.Index(list(feature_ids), dtype=object))
+        return found[found >= 0]
+
+    def _connected_ids(self, positions: pd.Index, adjacency: AdjacencyIndex, neighbor_ids: np.ndarray,
+                       feature_id: str) -> Tuple[str, ...]:
+        position = self._find_position(positions, feature_id)
+        if position is None:
+            return tuple()
+        return tuple(neighbor_ids[adjacency.neighbors(position)])
+
+    def find_reachable(self, catchment_ids: Iterable[str], nexus_ids: Iterable[str] = (), upstream: bool = True,
+                       link_limit: Optional[int] = None) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Find the catchments and nexuses reachable upstream or downstream from any of some starting features.
+
+        The traversal is breadth-first, a whole frontier of features at a time, with each step across a connection
+        between a catchment and a nexus counting as one link.  All starting features are at zero links, and features
+        further than ``link_limit`` links from every starting feature are excluded.  Unrecognized starting ids are
+        ignored.
+
+        Parameters
+        ----------
+        catchment_ids : Iterable[str]
+            The ids of starting catchments.
+        nexus_ids : Iterable[str]
+            The ids of starting nexuses (empty by default).
+        upstream : bool
+            Whether to traverse upstream, as opposed to downstream (``True`` by default).
+        link_limit : Optional[int]
+            The maximum number of links from a starting feature to traverse, with ``None`` (the default) or a negative
+            value meaning there is no limit.
+
+        Returns
+        -------
+        Tuple[Tuple[str, ...], Tuple[str, ...]]
+            The ids of all reached catchments, and the ids of all reached nexuses, including the starting features.
+        """
+        if upstream:
+            nexuses_of_catchments, catchments_of_nexuses = self._cat_from_nex, self._nex_from_cat
+        else:
+            nexuses_of_catchments, catchments_of_nexuses = self._cat_to_nex, self._nex_to_cat
+
+        def start(positions: pd.Index, ids: Iterable[str], size: int) -> Tuple[np.ndarray, np.ndarray]:
+            reached = np.zeros(size, dtype=bool)
+            reached[self._find_positions(positions, ids)] = True
+            return reached, np.flatnonzero(reached)
+
+        cats_reached, cat_frontier = start(self._catchment_positions, catchment_ids, self._catchment_ids.shape[0])
+        nexs_reached, nex_frontier = start(self._nexus_positions, nexus_ids, self._nexus_ids.shape[0])
+
+        links = 0
+        while (cat_frontier.shape[0] > 0 or nex_frontier.shape[0] > 0) and \
+                (link_limit is None or link_limit < 0 or links < link_limit):
+            next_nexs = nexuses_of_catchments.neighbors_of_all(cat_frontier)
+            next_cats = catchments_of_nexuses.neighbors_of_all(nex_frontier)
+            # Drop features already reached; np.unique also drops repeats among those newly reached
+            nex_frontier = np.unique(next_nexs[~nexs_reached[next_nexs]])
+            cat_frontier = np.unique(next_cats[~cats_reached[next_cats]])
+            nexs_reached[nex_frontier] = True
+            cats_reached[cat_frontier] = True
+            links += 1
+
+        return tuple(self._catchment_ids[cats_reached]), tuple(self._nexus_ids[nexs_reached])
+
+    def get_catchment_index(self, catchment_id: str) -> Optional[int]:
+        """
+        Get the integer index of a catchment.
+
+        Parameters
+        ----------
+        catchment_id : str
+            The id of the catchment.
+
+        Returns
+        -------
+        Optional[int]
+            The index of the catchment, or ``None`` if it is not recognized.
+        """
+        return self._find_position(self._catchment_positions, catchment_id)
+
+    def get_nexus_index(self, nexus_id: str) -> Optional[int]:
+        """
+        Get the integer index of a nexus.
+
+        Parameters
+        ----------
+        nexus_id : str
+            The id of the nexus.
+
+        Returns
+        -------
+        Optional[int]
+            The index of the nexus, or ``None`` if it is not recognized.
+        """
+        return self._find_position(self._nexus_positions, nexus_id)
+
+    def get_contributing_catchment_ids(self, nexus_id: str) -> Tuple[str, ...]:
+        """
+        Get the ids of the catchments flowing into a nexus.
+
+        Parameters
+        ----------
+        nexus_id : str
+            The id of the nexus.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The ids of the catchments flowing into the nexus, which is empty if the nexus is not recognized.
+        """
+        return self._connected_ids(self._nexus_positions, self._nex_from_cat, self._catchment_ids, nexus_id)
+
+    def get_inflow_nexus_ids(self, catchment_id: str) -> Tuple[str, ...]:
+        """
+        Get the ids of the nexuses flowing into a catchment.
+
+        Parameters
+        ----------
+        catchment_id : str
+            The id of the catchment.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The ids of the nexuses flowing into the catchment, which is empty if the catchment is not recognized.
+        """
+        return self._connected_ids(self._catchment_positions, self._cat_from_nex, self._nexus_ids, catchment_id)
+
+    def get_outflow_nexus_ids(self, catchment_id: str) -> Tuple[str, ...]:
+        """
+        Get the ids of the nexuses into which a catchment flows.
+
+        Parameters
+        ----------
+        catchment_id : str
+            The id of the catchment.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The ids of the nexuses into which the catchment flows, which is empty if the catchment is not recognized.
+        """
+        return self._connected_ids(self._catchment_positions, self._cat_to_nex, self._nexus_ids, catchment_id)
+
+    def get_receiving_catchment_ids(self, nexus_id: str) -> Tuple[str, ...]:
+        """
+        Get the ids of the catchments into which a nexus flows.
+
+        Parameters
+        ----------
+        nexus_id : str
+            The id of the nexus.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The ids of the catchments into which the nexus flows, which is empty if the nexus is not recognized.
+        """
+        return self._connected_ids(self._nexus_positions, self._nex_to_cat, self._catchment_ids, nexus_id)
+
+    def is_catchment_recognized(self, catchment_id: str) -> bool:
+        return catchment_id in self._catchment_positions
+
+    def is_nexus_recognized(self, nexus_id: str) -> bool:
+        return nexus_id in self._nexus_positions
+
+    def get_subset(self, catchment_ids: Iterable[str], nexus_ids: Iterable[str]) -> 'HydrofabricTopology':
+        """
+        Derive the topology of just the given catchments and nexuses, keeping only connections between those.
+
+        Parameters
+        ----------
+        catchment_ids : Iterable[str]
+            The ids of the catchments to keep; any that are not recognized are ignored.
+        nexus_ids : Iterable[str]
+            The ids of the nexuses to keep; any that are not recognized are ignored.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The topology of just the given catchments and nexuses.
+        """
+        def keep_mask(positions: pd.Index, ids: Iterable[str], size: int) -> np.ndarray:
+            mask = np.zeros(size, dtype=bool)
+            mask[self._find_positions(positions, ids)] = True
+            return mask
+
+        def renumbering(mask: np.ndarray) -> np.ndarray:
+            new_positions = np.full(mask.shape[0], -1, dtype=np.int64)
+            new_positions[mask] = np.arange(np.count_nonzero(mask), dtype=np.int64)
+            return new_positions
+
+        def subset_adjacency(adjacency: AdjacencyIndex, source_mask: np.ndarray, target_mask: np.ndarray):
+            sources, targets = adjacency.edges()
+            kept = source_mask[sources] & target_mask[targets]
+            return AdjacencyIndex.from_edges(sources=renumbering(source_mask)[sources[kept]],
+                                             targets=renumbering(target_mask)[targets[kept]],
+                                             num_sources=np.count_nonzero(source_mask))
+
+        cat_mask = keep_mask(self._catchment_positions, catchment_ids, self._catchment_ids.shape[0])
+        nex_mask = keep_mask(self._nexus_positions, nexus_ids, self._nexus_ids.shape[0])
+        return HydrofabricTopology(catchment_ids=self._catchment_ids[cat_mask], nexus_ids=self._nexus_ids[nex_mask],
+                                   cat_to_nex=subset_adjacency(self._cat_to_nex, cat_mask, nex_mask),
+                                   nex_to_cat=subset_adjacency(self._nex_to_cat, nex_mask, cat_mask))
+
+    @property
+    def catchment_ids(self) -> np.ndarray:
+        """
+        The distinct catchment ids, by catchment index.
+
+        Returns
+        -------
+        np.ndarray
+            The distinct catchment ids, by catchment index.
+        """
+        return self._catchment_ids
+
+    @property
+    def nexus_ids(self) -> np.ndarray:
+        """
+        The distinct nexus ids, by nexus index.
+
+        Returns
+        -------
+        np.ndarray
+            The distinct nexus ids, by nexus index.
+        """
+        return self._nexus_ids
+
+    @property
+    def catchment_to_nexus(self) -> AdjacencyIndex:
+        """
+        The downstream connections from catchments to nexuses.
+
+        Returns
+        -------
+        AdjacencyIndex
+            The downstream connections from catchments to nexuses.
+        """
+        return self._cat_to_nex
+
+    @property
+    def nexus_to_catchment(self) -> AdjacencyIndex:
+        """
+        The downstream connections from nexuses to catchments.
+
+        Returns
+        -------
+        AdjacencyIndex
+            The downstream connections from nexuses to catchments.
+        """
+        return self._nex_to_cat
+
+    @property
+    def roots(self) -> FrozenSet[str]:
+        """
+        The ids of the catchments that have no inflowing nexus.
+
+        Returns
+        -------
+        FrozenSet[str]
+            The ids of the catchments that have no inflowing nexus.
+        """
+        return frozenset(self._catchment_ids[self._cat_from_nex.degrees() == 0])
+
+
+class HydrofabricTopologyCache(SourceStampedSidecar):
+    """
+    Sidecar binary file caching the uid and ::class:`HydrofabricTopology` extracted from some hydrofabric source files.
+
+    The file starts with a short JSON header, giving the hydrofabric uid, the stamp of the source files when the cache
+    was written (see ::class:`SourceStampedSidecar`), and the location of each array.  The id tables and adjacency
+    arrays follow as raw, aligned array data, so that they can be memory-mapped when loaded rather than read and parsed.
+
+    A cache is only loaded while its source files are unchanged, so that a full parse of the source files is only needed
+    when they change.
+    """
+
+    _MAGIC = b'DMODTOPO'
+    """ The leading bytes of a cache file. """
+    _FORMAT_VERSION = 1
+    """ The version of the cache file format, with cache files of other versions treated as stale. """
+    _ALIGNMENT = 64
+    """ The byte alignment of each array within a cache file. """
+
+    def __init__(self, cache_file: Path, source_files: Sequence[Path]):
+        """
+        Initialize this instance.
+
+        Parameters
+        ----------
+        cache_file : Path
+            The path of the cache file, which need not exist yet.
+        source_files : Sequence[Path]
+            The hydrofabric source files from which the cached data is extracted.
+        """
+        super().__init__(sidecar_file=cache_file, source_files=source_files)
+
+    def _read_header(self) -> Optional[dict]:
+        """
+        Read the header of the cache file, if it exists and is valid for the current source files.
+
+        Returns
+        -------
+        Optional[dict]
+            The deserialized header, or ``None`` if there is no valid, current cache file.
+        """
+        try:
+            with self._sidecar_file.open('rb') as cache:
+                if cache.read(len(self._MAGIC)) != self._MAGIC:
+                    return None
+                header_length = int.from_bytes(cache.read(8), byteorder='little')
+                header = json.loads(cache.read(header_length).decode('UTF-8'))
+            if header.get('version') != self._FORMAT_VERSION:
+                return None
+            return header if self.is_stamp_current(header.get('sources')) else None
+        except (OSError, ValueError):
+            return None
+
+    @property
+    def cache_file(self) -> Path:
+        """
+        The path of the cache file.
+
+        Returns
+        -------
+        Path
+            The path of the cache file.
+        """
+        return self._sidecar_file
+
+    def is_current(self) -> bool:
+        """
+        Whether the cache file exists and was written from the current source files.
+
+        Returns
+        -------
+        bool
+            Whether the cache file exists and was written from the current source files.
+        """
+        return self._read_header() is not None
+
+    def load(self) -> Optional[Tuple[str, HydrofabricTopology]]:
+        """
+        Load the cached hydrofabric uid and topology, memory-mapping the adjacency arrays.
+
+        Returns
+        -------
+        Optional[Tuple[str, HydrofabricTopology]]
+            The cached hydrofabric uid and topology, or ``None`` if there is no valid cache for the current source files.
+        """
+        header = self._read_header()
+        if header is None:
+            return None
+        arrays = dict()
+        for name, details in header['arrays'].items():
+            dtype, shape = np.dtype(details['dtype']), tuple(details['shape'])
+            # Empty arrays cannot be memory-mapped
+            if np.prod(shape) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(self._sidecar_file, dtype=dtype, mode='r', offset=details['offset'],
+                                         shape=shape)
+        topology = HydrofabricTopology(
+            catchment_ids=np.asarray(arrays['catchment_ids']).astype(object),
+            nexus_ids=np.asarray(arrays['nexus_ids']).astype(object),
+            cat_to_nex=AdjacencyIndex(offsets=arrays['cat_to_nex_offsets'], indices=arrays['cat_to_nex_indices']),
+            nex_to_cat=AdjacencyIndex(offsets=arrays['nex_to_cat_offsets'], indices=arrays['nex_to_cat_indices']))
+        return header['uid'], topology
+
+    def load_uid(self) -> Optional[str]:
+        """
+        Load just the cached hydrofabric uid.
+
+        Returns
+        -------
+        Optional[str]
+            The cached hydrofabric uid, or ``None`` if there is no valid cache for the current source files.
+        """
+        header = self._read_header()
+        return None if header is None else header['uid']
+
+    def save(self, uid: str, topology: HydrofabricTopology) -> bool:
+        """
+        Write the cache file for the given uid and topology, replacing any existing one.
+
+        As with ::method:`write`, readers never see a partial file, and failures to write are logged rather than raised.
+
+        Parameters
+        ----------
+        uid : str
+            The uid of the hydrofabric.
+        topology : HydrofabricTopology
+            The topology of the hydrofabric.
+
+        Returns
+        -------
+        bool
+            Whether the cache file was written.
+        """
+        arrays = {
+            'catchment_ids': np.asarray(topology.catchment_ids, dtype=str),
+            'nexus_ids': np.asarray(topology.nexus_ids, dtype=str),
+            'cat_to_nex_offsets': np.ascontiguousarray(topology.catchment_to_nexus.offsets, dtype=np.int64),
+            'cat_to_nex_indices': np.ascontiguousarray(topology.catchment_to_nexus.indices, dtype=np.int64),
+            'nex_to_cat_offsets': np.ascontiguousarray(topology.nexus_to_catchment.offsets, dtype=np.int64),
+            'nex_to_cat_indices': np.ascontiguousarray(topology.nexus_to_catchment.indices, dtype=np.int64)
+        }
+        # Lay out arrays after the space reserved for the header, which is sized with placeholder offsets first
+        header = {'version': self._FORMAT_VERSION, 'uid': uid, 'sources': self.get_source_stamp(),
+                  'arrays': {name: {'dtype': a.dtype.str, 'shape': list(a.shape), 'offset': 0}
+                             for name, a in arrays.items()}}
+        # Allow room for the real offsets, which have at most 20 digits each
+        reserved = len(self._MAGIC) + 8 + len(json.dumps(header).encode('UTF-8')) + 20 * len(arrays)
+        position = reserved
+        for name, array in arrays.items():
+            position += -position % self._ALIGNMENT
+            header['arrays'][name]['offset'] = position
+            position += array.nbytes
+        header_bytes = json.dumps(header).encode('UTF-8')
+
+        def write_contents(cache: BinaryIO):
+            cache.write(self._MAGIC)
+            cache.write(len(header_bytes).to_bytes(8, byteorder='little'))
+            cache.write(header_bytes)
+            for name, array in arrays.items():
+                cache.write(b'\0' * (header['arrays'][name]['offset'] - cache.tell()))
+                cache.write(array.tobytes())
+
+        return self.write(write_contents)
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from hypy import Catchment, Nexus
-from queue import Queue
 from typing import Collection, Optional, Set, Tuple, Union
 from .subset_definition import SubsetDefinition
-from ..hydrofabric import Hydrofabric, GeoJsonHydrofabricReader, GeoJsonHydrofabric
+from ..hydrofabric import Hydrofabric, HydrofabricFilesManager, GeoJsonHydrofabricReader, GeoJsonHydrofabric
+from ..hydrofabric.topology import HydrofabricTopology
 
 
 class SubsetValidator(ABC):
@@ -142,17 +142,64 @@ class SubsetHandler:
         hydrofabric = GeoJsonHydrofabric(GeoJsonHydrofabricReader(catchment_data, nexus_data, cross_walk))
         return cls(hydrofabric=hydrofabric, validator=validator)
 
-    def __init__(self, hydrofabric: Hydrofabric, validator: Optional[SubsetValidator] = None):
+    @classmethod
+    def factory_create_from_files_manager(cls, files_manager: HydrofabricFilesManager, hf_index: int = 0,
+                                          validator: Optional[SubsetValidator] = None) -> 'SubsetHandler':
+        """
+        Create an instance for a hydrofabric managed by the given files manager, using its cached topology.
+
+        The topology used for upstream and downstream subsets is obtained from
+        ::method:`HydrofabricFilesManager.get_hydrofabric_topology`, so it is loaded from the hydrofabric's topology
+        cache when that is current, rather than derived again from the hydrofabric.
+
+        Parameters
+        ----------
+        files_manager : HydrofabricFilesManager
+            The manager of the hydrofabric.
+        hf_index : int
+            The files manager's lookup index of the hydrofabric (``0`` by default).
+        validator : Optional[SubsetValidator]
+            An optional validator for subsets, with a ::class:`BasicSubsetValidator` used by default.
+
+        Returns
+        -------
+        SubsetHandler
+            A new instance for the hydrofabric.
+        """
+        topology = files_manager.get_hydrofabric_topology(hf_index)
+        return cls(hydrofabric=files_manager.get_hydrofabric(hf_index), validator=validator, topology=topology)
+
+    def __init__(self, hydrofabric: Hydrofabric, validator: Optional[SubsetValidator] = None,
+                 topology: Optional[HydrofabricTopology] = None):
         """
 
         Parameters
         ----------
         hydrofabric
             The hydrofabric of catchments and nexuses
+        validator
+            An optional validator for subsets, with a ::class:`BasicSubsetValidator` used by default
+        topology
+            An optional, already obtained topology of the hydrofabric, to use instead of its own topology
 
         """
         self._hydrofabric = hydrofabric
         self._validator = validator if validator else BasicSubsetValidator(hydrofabric)
+        self._topology = topology
+
+    @property
+    def topology(self) -> HydrofabricTopology:
+        """
+        The topology of the hydrofabric, traversed for upstream and downstream subsets.
+
+        Returns
+        -------
+        HydrofabricTopology
+            The topology of the hydrofabric.
+        """
+        if self._topology is None:
+            self._topology = self._hydrofabric.topology
+        return self._topology
 
     def get_catchment_by_id(self, catchment_id: str) -> Optional[Catchment]:
         """
@@ -209,6 +256,36 @@ class SubsetHandler:
                 nex_ids.add(catchment.outflow.id)
         return SubsetDefinition(catchment_ids=catchment_ids, nexus_ids=nex_ids)
 
+    def get_downstream_subset(self, catchment_ids: Union[str, Collection[str]],
+                              link_limit: Optional[int] = None) -> SubsetDefinition:
+        """
+        Get the subset starting from one or more catchments and going downstream.
+
+        Function traverses the hydrofabric's ::attribute:`topology` downstream, from the given catchments through their
+        outflow nexuses and on through the catchments receiving from those, building a subset of the encountered
+        features as it goes.  The traversal proceeds for all originating catchments at once.
+
+        As with ::method:`get_upstream_subset`, each traversed connection is an incremental link, and it is possible to
+        restrict how many links away from the originating catchments to proceed.
+
+        Parameters
+        ----------
+        catchment_ids: Union[str, Collection[str]]
+            Collection of ids of one or more originating catchment from which to proceed downstream.
+        link_limit: Optional[int]
+            An optional restriction of how far from the originating catchment entities may be to be added to the subset.
+
+        Returns
+        -------
+        SubsetDefinition
+            The generated subset definition object.
+        """
+        if isinstance(catchment_ids, str):
+            catchment_ids = [catchment_ids]
+        cat_ids, nex_ids = self.topology.find_reachable(catchment_ids=catchment_ids, upstream=False,
+                                                        link_limit=link_limit)
+        return SubsetDefinition(catchment_ids=cat_ids, nexus_ids=nex_ids)
+
     def get_upstream_subset(self, catchment_ids: Union[str, Collection[str]],
                             link_limit: Optional[int] = None) -> SubsetDefinition:
         """
@@ -219,6 +296,9 @@ class SubsetHandler:
         ::attribute:`Nexus.contributing_catchments`.  Additionally, it also uses the ::attribute:`Catchment.outflow`
         property and includes the downstream nexus for every valid catchment identified in the ``catchment_ids`` param.
 
+        The traversal is over the hydrofabric's integer-coded ::attribute:`topology`, a whole frontier of features at a
+        time, and proceeds for all originating catchments at once.
+
         It is possible to restrict how many links away from the original catchment to proceed.  Each attribute
         traversal, whether ending up in a catchment or nexus, is considered an incremental link.  If ``None`` or a
         negative value is supplied, the graph is traversed completely across all recursive upstream relationships as
@@ -236,40 +316,13 @@ class SubsetHandler:
         SubsetDefinition
             The generated subset definition object.
         """
-        if link_limit and link_limit < 0:
-            link_limit = None
         if isinstance(catchment_ids, str):
             catchment_ids = [catchment_ids]
-        cat_ids: Set[str] = set()
-        nex_ids: Set[str] = set()
-        # Construct queue of graph nodes to be processed, start from initially given catchments and their downstream
-        # Nodes are tuple of catchment/nexus object, link count to it, and bool of whether node is catchment (not nexus)
-        # Third tuple item should be faster than checking instance type repeatedly
-        graph_nodes = Queue()
-        for cid in catchment_ids:
-            # Note this could return None, but that case gets handled in the queue processing loop
-            starting_catchment = self.get_catchment_by_id(cid)
-            graph_nodes.put((starting_catchment, 0, True))
-            # If an initial id did match a catchment, also include its downstream nexus
-            if isinstance(starting_catchment, Catchment):
-                graph_nodes.put((starting_catchment.outflow, 0, False))
-
-        while graph_nodes.qsize() > 0:
-            item, link_dist, is_catchment = graph_nodes.get()
-            if item is None:
-                continue
-            if is_catchment and item.id not in cat_ids:
-                cat_ids.add(item.id)
-                if link_limit is None or link_dist < link_limit:
-                    new_dist = link_dist + 1
-                    graph_nodes.put((item.inflow, new_dist, False))
-            elif not is_catchment and item.id not in nex_ids:
-                nex_ids.add(item.id)
-                if link_limit is None or link_dist < link_limit:
-                    new_dist = link_dist + 1
-                    for c in item.contributing_catchments:
-                        graph_nodes.put((c, new_dist, True))
-
+        topology = self.topology
+        # Start from the initially given catchments and, for those that are valid, their downstream nexuses
+        start_nex_ids = [nid for cid in catchment_ids for nid in topology.get_outflow_nexus_ids(cid)]
+        cat_ids, nex_ids = topology.find_reachable(catchment_ids=catchment_ids, nexus_ids=start_nex_ids,
+                                                   upstream=True, link_limit=link_limit)
         return SubsetDefinition(catchment_ids=cat_ids, nexus_ids=nex_ids)
 
     def is_catchment_recognized(self, catchment_id: str) -> bool:
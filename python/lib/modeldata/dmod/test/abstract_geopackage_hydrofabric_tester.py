@@ -1,4 +1,6 @@
 import git
+import shutil
+import tempfile
 import unittest
 from abc import ABC
 from pathlib import Path
@@ -35,9 +37,14 @@ class AbstractGeoPackageHydrofabricTester(ABC, unittest.TestCase):
     def setUp(self) -> None:
         proj_root: Path = self.find_project_root()
 
+        # Use copies of the example files, as a hydrofabric may write a uid sidecar file next to its file
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.hydrofabric_files: Dict[int, Path] = dict()
         self.hydrofabric_ex: Dict[int, GeoPackageHydrofabric] = dict()
 
         # Example 1: v1.2 VPU 1
         ex_idx = 1
-        file_path = proj_root.joinpath(self._HYDROFABRIC_1_RELATIVE_PATH)
+        file_path = Path(shutil.copy(proj_root.joinpath(self._HYDROFABRIC_1_RELATIVE_PATH), self._temp_dir.name))
+        self.hydrofabric_files[ex_idx] = file_path
         self.hydrofabric_ex[ex_idx] = GeoPackageHydrofabric.from_file(geopackage_file=file_path)
@@ -1,3 +1,5 @@
+import json
+import sqlite3
 from typing import Dict, Set
 
 from ..modeldata.hydrofabric import GeoPackageHydrofabric
@@ -18,7 +20,7 @@ class TestGeoPackageHydrofabric(AbstractGeoPackageHydrofabricTester):
 
         # Example 1: extended hydrofabric testing attributes for hydrofabric for v1.2 VPU 1
         ex_idx = 1
-        self.hydrofabric_uids[ex_idx] = 'b671cf04fdf5e1129b029663aae59abbcda7ec7a'
+        self.hydrofabric_uids[ex_idx] = '8965c78ee9869084bec52f22a09b73260cee1977'
         self.cat_id_sets[ex_idx] = {'cat-5', 'cat-6', 'cat-7', 'cat-8', 'cat-9', 'cat-10', 'cat-11'}
         self.nexus_id_sets[ex_idx] = {'nex-7', 'nex-8', 'nex-9', 'nex-10', 'nex-11', 'nex-12', 'tnx-1000000001'}
         self.subset_id_sets[ex_idx] = {'cat-7', 'cat-8', 'cat-9', 'nex-7', 'nex-8', 'nex-9', 'nex-10'}
@@ -27,6 +29,64 @@ class TestGeoPackageHydrofabric(AbstractGeoPackageHydrofabricTester):
     def tearDown(self) -> None:
         pass
 
+    def test_from_file_2_a(self):
+        """
+        Test that a lazy instance has all expected catchment ids without having read any full layer.
+        """
+        ex_index = 1
+        file_path = self.hydrofabric_files[ex_index]
+        hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=file_path, lazy=True)
+
+        self.assertEqual(set(hydrofabric.get_all_catchment_ids()), self.cat_id_sets[ex_index])
+        self.assertFalse(any(hydrofabric._dataframes.is_loaded(ln) for ln in hydrofabric._layer_names))
+
+    def test_from_file_2_b(self):
+        """
+        Test that a lazy instance reads the record of a single catchment without reading the full layer.
+        """
+        file_path = self.hydrofabric_files[1]
+        hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=file_path, lazy=True)
+
+        records = hydrofabric.read_catchment_records(['cat-10'], columns=['toid'], read_geometry=False)
+
+        self.assertEqual(list(records['toid'].values), ['nex-11'])
+        self.assertFalse(hydrofabric._dataframes.is_loaded('divides'))
+
+    def test_from_file_2_c(self):
+        """
+        Test that a subset of a lazy instance is equal to the same subset of an instance with all layers read.
+        """
+        ex_index = 1
+        file_path = self.hydrofabric_files[ex_index]
+        hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=file_path, lazy=True)
+        subset_cat_ids = self.cat_id_sets[ex_index].intersection(self.subset_id_sets[ex_index])
+        subset_nex_ids = self.nexus_id_sets[ex_index].intersection(self.subset_id_sets[ex_index])
+        subset_def = SubsetDefinition(catchment_ids=subset_cat_ids, nexus_ids=subset_nex_ids)
+
+        subset_hydrofabric = hydrofabric.get_subset_hydrofabric(subset_def)
+
+        self.assertEqual(subset_hydrofabric, self.hydrofabric_ex[ex_index].get_subset_hydrofabric(subset_def))
+
+    def test_from_file_2_d(self):
+        """
+        Test that a subset of a lazy instance is equal to the same subset of a full instance when feature ids have gaps.
+        """
+        ex_index = 1
+        file_path = self.hydrofabric_files[ex_index]
+        with sqlite3.connect(file_path) as connection:
+            connection.execute("DELETE FROM divides WHERE divide_id = 'cat-5'")
+            connection.execute("DELETE FROM nexus WHERE id = 'tnx-1000000001'")
+        connection.close()
+        hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=file_path, lazy=True)
+        subset_cat_ids = self.cat_id_sets[ex_index].intersection(self.subset_id_sets[ex_index])
+        subset_nex_ids = self.nexus_id_sets[ex_index].intersection(self.subset_id_sets[ex_index])
+        subset_def = SubsetDefinition(catchment_ids=subset_cat_ids, nexus_ids=subset_nex_ids)
+
+        subset_hydrofabric = hydrofabric.get_subset_hydrofabric(subset_def)
+
+        full_hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=file_path)
+        self.assertEqual(subset_hydrofabric, full_hydrofabric.get_subset_hydrofabric(subset_def))
+
     def test_get_all_catchment_ids_1_a(self):
         """
         Test that this function gets all expected catchment ids for the hydrofabric.
@@ -213,6 +273,27 @@ class TestGeoPackageHydrofabric(AbstractGeoPackageHydrofabricTester):
         self.assertTrue(all([isinstance(subset_hydrofabric.get_nexus_by_id(nid), GeoPackageNexus) for nid in
                              subset_hydrofabric.get_all_nexus_ids()]))
 
+    def test_subset_hydrofabric_1_f(self):
+        """
+        Test that the topology of a subset hydrofabric matches one built from the subset's layer data.
+        """
+        ex_index = 1
+
+        hydrofabric = self.hydrofabric_ex[ex_index]
+        subset_cat_ids = self.cat_id_sets[ex_index].intersection(self.subset_id_sets[ex_index])
+        subset_nex_ids = self.nexus_id_sets[ex_index].intersection(self.subset_id_sets[ex_index])
+        subset_def = SubsetDefinition(catchment_ids=subset_cat_ids, nexus_ids=subset_nex_ids)
+        subset_hydrofabric = hydrofabric.get_subset_hydrofabric(subset_def)
+        rebuilt = GeoPackageHydrofabric(layer_names=subset_hydrofabric._layer_names,
+                                        layer_dataframes=subset_hydrofabric._dataframes)
+
+        self.assertEqual(subset_hydrofabric.roots, rebuilt.roots)
+        for cat_id in subset_cat_ids:
+            self.assertEqual(subset_hydrofabric.topology.get_outflow_nexus_ids(cat_id),
+                             rebuilt.topology.get_outflow_nexus_ids(cat_id))
+            self.assertEqual(subset_hydrofabric.topology.get_inflow_nexus_ids(cat_id),
+                             rebuilt.topology.get_inflow_nexus_ids(cat_id))
+
     def test_is_catchment_recognized_1_a(self):
         """
         Test if known catchment id ``cat-10`` is recognized.
@@ -299,6 +380,18 @@ class TestGeoPackageHydrofabric(AbstractGeoPackageHydrofabricTester):
 
         self.assertEqual(root_cat_ids, expected_root_cat_ids)
 
+    def test_hash_1_a(self):
+        """
+        Test that the hash for example one is the same for an instance with a file uid and an equal subset instance.
+        """
+        ex_index = 1
+        hydrofabric = self.hydrofabric_ex[ex_index]
+        subset_def = SubsetDefinition(catchment_ids=self.cat_id_sets[ex_index], nexus_ids=self.nexus_id_sets[ex_index])
+        subset_hydrofabric = hydrofabric.get_subset_hydrofabric(subset_def)
+
+        self.assertEqual(hydrofabric, subset_hydrofabric)
+        self.assertEqual(hash(hydrofabric), hash(subset_hydrofabric))
+
     def test_uid_1_a(self):
         """
         Test that the hydrofabric instance for example one has the expected unique id.
@@ -308,6 +401,45 @@ class TestGeoPackageHydrofabric(AbstractGeoPackageHydrofabricTester):
         expected_uid = self.hydrofabric_uids[ex_index]
         self.assertEqual(hydrofabric.uid, expected_uid)
 
+    def test_uid_1_b(self):
+        """
+        Test that the uid for example one is cached in a sidecar file, which is reused by later instances.
+        """
+        ex_index = 1
+        file_path = self.hydrofabric_files[ex_index]
+        uid = self.hydrofabric_ex[ex_index].uid
+        cache_file = file_path.with_name(file_path.name + '.uid')
+        self.assertTrue(cache_file.is_file())
+
+        # Change the cached value to show it is what gets used
+        cached = json.loads(cache_file.read_text())
+        cached['uid'] = 'cached-{}'.format(uid)
+        cache_file.write_text(json.dumps(cached))
+
+        hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=file_path, lazy=True)
+        self.assertEqual(hydrofabric.uid, 'cached-{}'.format(uid))
+
+    def test_uid_1_c(self):
+        """
+        Test that the uid for example one is recomputed when the file changes after its uid was cached.
+        """
+        ex_index = 1
+        file_path = self.hydrofabric_files[ex_index]
+        uid = self.hydrofabric_ex[ex_index].uid
+        with file_path.open('ab') as gpkg:
+            gpkg.write(b'\0')
+
+        self.assertNotEqual(GeoPackageHydrofabric.get_uid_for_file(file_path), uid)
+
+    def test_uid_1_d(self):
+        """
+        Test that the uid for example one is the same when created from the raw bytes of the file.
+        """
+        ex_index = 1
+        hydrofabric = GeoPackageHydrofabric.from_file(geopackage_file=self.hydrofabric_files[ex_index].read_bytes())
+        self.assertEqual(hydrofabric.uid, self.hydrofabric_uids[ex_index])
+        self.assertEqual(hydrofabric, self.hydrofabric_ex[ex_index])
+
     def test_vpu_1_a(self):
         """
         Test that the hydrofabric instance for example one returns ``None`` for the VPU value.
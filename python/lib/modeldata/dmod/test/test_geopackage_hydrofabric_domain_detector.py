@@ -1,4 +1,7 @@
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
 
 from dmod.core.meta_data import DataFormat, StandardDatasetIndex
 from ..modeldata.data.item_domain_detector import GeoPackageHydrofabricDomainDetector
@@ -13,8 +16,13 @@ class TestGeoPackageHydrofabricDomainDetector(unittest.TestCase):
         self.expected_data_format = DataFormat.NGEN_GEOPACKAGE_HYDROFABRIC_V2
         self.hyfab_ver = "2.0.1"
 
+        # Use a copy of the example file, as the hydrofabric may write a uid sidecar file next to it
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
         # Setup example 0
-        self.example_data = {0: find_git_root_dir().joinpath("data/example_hydrofabric_2/hydrofabric.gpkg")}
+        gpkg_file = find_git_root_dir().joinpath("data/example_hydrofabric_2/hydrofabric.gpkg")
+        self.example_data = {0: Path(shutil.copy(gpkg_file, self._temp_dir.name))}
         self.example_vpu = {0: "VPU09"}
         self.example_restriction_vpu = {0: "VPU09"}
         self.example_cat_ids = {0: sorted(['cat-8', 'cat-5', 'cat-9', 'cat-6', 'cat-7', 'cat-10', 'cat-11'])}
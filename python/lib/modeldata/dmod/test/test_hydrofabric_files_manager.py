@@ -0,0 +1,84 @@
+import git
+import shutil
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ..modeldata.hydrofabric import Hydrofabric, HydrofabricFilesManager
+
+
+class CountingHydrofabricFilesManager(HydrofabricFilesManager):
+    """
+    Simple manager of the hydrofabrics in a directory, counting how many times it fully loads a hydrofabric.
+    """
+
+    def __init__(self, data_dir: Path):
+        self._data_dir = data_dir
+        self.load_count = 0
+        super().__init__()
+
+    def get_hydrofabric(self, hf_index: int, discard_cached: bool = False, **kwargs) -> Hydrofabric:
+        self.load_count += 1
+        return super().get_hydrofabric(hf_index, discard_cached, **kwargs)
+
+    @property
+    def hydrofabric_data_root_dir(self) -> Path:
+        return self._data_dir
+
+
+class TestHydrofabricFilesManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        proj_root = Path(git.Repo('.', search_parent_directories=True).git.rev_parse("--show-toplevel"))
+        self.temp_dir = TemporaryDirectory()
+        self.data_dir = Path(self.temp_dir.name)
+        for name in ['catchment_data.geojson', 'nexus_data.geojson', 'crosswalk.json']:
+            shutil.copy(proj_root.joinpath('data/example_hydrofabric_1', name), self.data_dir.joinpath(name))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_get_hydrofabric_uid_1_a(self):
+        """
+        Test that the uid from the topology cache is the uid of the hydrofabric.
+        """
+        manager = CountingHydrofabricFilesManager(self.data_dir)
+        expected_uid = manager.get_hydrofabric(0).uid
+        manager.get_hydrofabric_uid(0)
+
+        other_manager = CountingHydrofabricFilesManager(self.data_dir)
+        self.assertEqual(other_manager.get_hydrofabric_uid(0), expected_uid)
+
+    def test_get_hydrofabric_uid_1_b(self):
+        """
+        Test that a uid is found from the topology cache without loading the hydrofabric.
+        """
+        CountingHydrofabricFilesManager(self.data_dir).get_hydrofabric_uid(0)
+
+        manager = CountingHydrofabricFilesManager(self.data_dir)
+        manager.get_hydrofabric_uid(0)
+        self.assertEqual(manager.load_count, 0)
+
+    def test_get_hydrofabric_topology_1_a(self):
+        """
+        Test that a topology is loaded from the topology cache without loading the hydrofabric, and is as expected.
+        """
+        expected_roots = CountingHydrofabricFilesManager(self.data_dir).get_hydrofabric_topology(0).roots
+
+        manager = CountingHydrofabricFilesManager(self.data_dir)
+        topology = manager.get_hydrofabric_topology(0)
+        self.assertEqual(manager.load_count, 0)
+        self.assertEqual(topology.roots, expected_roots)
+        self.assertEqual(topology.get_outflow_nexus_ids('cat-27'), ('nex-26',))
+
+    def test_get_hydrofabric_topology_1_b(self):
+        """
+        Test that the hydrofabric is loaded again after its files change.
+        """
+        CountingHydrofabricFilesManager(self.data_dir).get_hydrofabric_topology(0)
+        crosswalk = self.data_dir.joinpath('crosswalk.json')
+        crosswalk.write_text(crosswalk.read_text() + '\n')
+
+        manager = CountingHydrofabricFilesManager(self.data_dir)
+        manager.get_hydrofabric_topology(0)
+        self.assertEqual(manager.load_count, 1)
@@ -0,0 +1,124 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ..modeldata.hydrofabric.topology import AdjacencyIndex, HydrofabricTopology, HydrofabricTopologyCache
+
+
+class TestHydrofabricTopology(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # cat-1 and cat-2 flow to nex-1, which flows to cat-3, which flows to terminal nexus tnx-1
+        self.topology = HydrofabricTopology.from_links(catchment_ids=['cat-1', 'cat-2', 'cat-3'],
+                                                       catchment_to_ids=['nex-1', 'nex-1', 'tnx-1'],
+                                                       nexus_ids=['nex-1', 'tnx-1'],
+                                                       nexus_to_ids=['cat-3', None])
+        self.temp_dir = TemporaryDirectory()
+        self.source_file = Path(self.temp_dir.name).joinpath('catchment_data.geojson')
+        self.source_file.write_text('{}')
+        self.cache = HydrofabricTopologyCache(cache_file=Path(self.temp_dir.name).joinpath('cache.topology'),
+                                              source_files=[self.source_file])
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_from_edges_1_a(self):
+        """
+        Test that neighbors are grouped by source node, keeping the order in which the edges were given.
+        """
+        adjacency = AdjacencyIndex.from_edges(sources=[2, 0, 2, 0], targets=[1, 3, 0, 2], num_sources=3)
+        self.assertEqual(list(adjacency.neighbors(0)), [3, 2])
+        self.assertEqual(list(adjacency.neighbors(1)), [])
+        self.assertEqual(list(adjacency.neighbors(2)), [1, 0])
+
+    def test_transpose_1_a(self):
+        """
+        Test that the transpose of the transpose is the original adjacency structure, when neighbors are in order.
+        """
+        adjacency = AdjacencyIndex.from_edges(sources=[0, 0, 2, 2], targets=[2, 3, 0, 1], num_sources=3)
+        self.assertEqual(adjacency.transpose(num_targets=4).transpose(num_targets=3), adjacency)
+
+    def test_get_contributing_catchment_ids_1_a(self):
+        """
+        Test that the contributing catchments of a nexus are all the catchments flowing into it.
+        """
+        self.assertEqual(self.topology.get_contributing_catchment_ids('nex-1'), ('cat-1', 'cat-2'))
+
+    def test_get_inflow_nexus_ids_1_a(self):
+        """
+        Test that the inflow nexuses of a catchment are found, and are empty for a headwater catchment.
+        """
+        self.assertEqual(self.topology.get_inflow_nexus_ids('cat-3'), ('nex-1',))
+        self.assertEqual(self.topology.get_inflow_nexus_ids('cat-1'), ())
+
+    def test_get_receiving_catchment_ids_1_a(self):
+        """
+        Test that a nexus with a missing downstream link has no receiving catchments.
+        """
+        self.assertEqual(self.topology.get_receiving_catchment_ids('nex-1'), ('cat-3',))
+        self.assertEqual(self.topology.get_receiving_catchment_ids('tnx-1'), ())
+
+    def test_get_outflow_nexus_ids_1_a(self):
+        """
+        Test that an unrecognized catchment has no outflow nexuses.
+        """
+        self.assertEqual(self.topology.get_outflow_nexus_ids('cat-3'), ('tnx-1',))
+        self.assertEqual(self.topology.get_outflow_nexus_ids('cat-9'), ())
+
+    def test_get_subset_1_a(self):
+        """
+        Test that a subset keeps only the connections between its own catchments and nexuses.
+        """
+        subset = self.topology.get_subset(catchment_ids=['cat-2', 'cat-3'], nexus_ids=['nex-1'])
+        self.assertEqual(subset.get_contributing_catchment_ids('nex-1'), ('cat-2',))
+        self.assertEqual(subset.get_outflow_nexus_ids('cat-3'), ())
+        self.assertFalse(subset.is_catchment_recognized('cat-1'))
+
+    def test_roots_1_a(self):
+        """
+        Test that the roots are the catchments without inflowing nexuses.
+        """
+        self.assertEqual(self.topology.roots, frozenset({'cat-1', 'cat-2'}))
+
+    def test_find_reachable_1_a(self):
+        """
+        Test that traversing upstream from the terminal nexus reaches every feature.
+        """
+        cat_ids, nex_ids = self.topology.find_reachable(catchment_ids=[], nexus_ids=['tnx-1'])
+        self.assertEqual(set(cat_ids), {'cat-1', 'cat-2', 'cat-3'})
+        self.assertEqual(set(nex_ids), {'nex-1', 'tnx-1'})
+
+    def test_find_reachable_1_b(self):
+        """
+        Test that a downstream traversal stops after the link limit.
+        """
+        cat_ids, nex_ids = self.topology.find_reachable(catchment_ids=['cat-1'], upstream=False, link_limit=2)
+        self.assertEqual(set(cat_ids), {'cat-1', 'cat-3'})
+        self.assertEqual(set(nex_ids), {'nex-1'})
+
+    def test_cache_load_1_a(self):
+        """
+        Test that a loaded cache has the saved uid and an equivalent topology.
+        """
+        self.assertTrue(self.cache.save(uid='abc', topology=self.topology))
+        uid, topology = self.cache.load()
+        self.assertEqual(uid, 'abc')
+        self.assertEqual(list(topology.catchment_ids), list(self.topology.catchment_ids))
+        self.assertEqual(topology.catchment_to_nexus, self.topology.catchment_to_nexus)
+        self.assertEqual(topology.get_contributing_catchment_ids('nex-1'), ('cat-1', 'cat-2'))
+
+    def test_cache_load_1_b(self):
+        """
+        Test that there is nothing to load from a cache that has not been saved.
+        """
+        self.assertIsNone(self.cache.load())
+        self.assertIsNone(self.cache.load_uid())
+
+    def test_cache_load_1_c(self):
+        """
+        Test that a cache is no longer loaded after its source file changes.
+        """
+        self.cache.save(uid='abc', topology=self.topology)
+        self.source_file.write_text('{"changed": true}')
+        self.assertFalse(self.cache.is_current())
+        self.assertIsNone(self.cache.load())
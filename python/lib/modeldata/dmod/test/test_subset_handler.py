@@ -1,9 +1,13 @@
 import git
+import numpy as np
+import shutil
 import unittest
 from hypy import Catchment
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Dict, Optional, Union
 from ..modeldata.subset import SubsetHandler
+from .test_hydrofabric_files_manager import CountingHydrofabricFilesManager
 
 
 class TestSubsetHandler(unittest.TestCase):
@@ -82,6 +86,26 @@ class TestSubsetHandler(unittest.TestCase):
         handler = SubsetHandler.factory_create_from_geojson(catchment_data=cf, nexus_data=nf, cross_walk=xf)
         self.assertIsInstance(handler, SubsetHandler)
 
+    # Test that a subset handler from a files manager traverses the cached topology, with the same results
+    def test_factory_create_from_files_manager_1_a(self):
+        ex_ind = 1
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        data_dir = Path(temp_dir.name)
+        for key in [self.CAT_KEY, self.NEX_KEY, self.CROSS_KEY]:
+            shutil.copy(self.hf_examples[ex_ind][key], data_dir)
+        CountingHydrofabricFilesManager(data_dir).get_hydrofabric_topology(0)
+
+        handler = SubsetHandler.factory_create_from_files_manager(CountingHydrofabricFilesManager(data_dir))
+        subset = handler.get_upstream_subset('cat-68')
+
+        self.assertIsInstance(handler.topology.catchment_to_nexus.offsets, np.memmap)
+        expected_handler = SubsetHandler.factory_create_from_geojson(
+            catchment_data=str(self.hf_examples[ex_ind][self.CAT_KEY]),
+            nexus_data=str(self.hf_examples[ex_ind][self.NEX_KEY]),
+            cross_walk=str(self.hf_examples[ex_ind][self.CROSS_KEY]))
+        self.assertEqual(subset, expected_handler.get_upstream_subset('cat-68'))
+
     # Test that catchment can be retrieved by id
     def test_get_catchment_by_id_1_a(self):
         ex_ind = 1
@@ -137,3 +161,68 @@ class TestSubsetHandler(unittest.TestCase):
         catchment = handler.get_catchment_by_id(ex_cat_id)
 
         self.assertEqual(catchment.id, ex_cat_id)
+
+    # Test that an upstream subset includes everything upstream of the catchment
+    def test_get_upstream_subset_1_a(self):
+        ex_ind = 1
+        cf = str(self.hf_examples[ex_ind][self.CAT_KEY])
+        nf = str(self.hf_examples[ex_ind][self.NEX_KEY])
+        xf = str(self.hf_examples[ex_ind][self.CROSS_KEY])
+
+        handler = SubsetHandler.factory_create_from_geojson(catchment_data=cf, nexus_data=nf, cross_walk=xf)
+        subset = handler.get_upstream_subset('cat-26')
+
+        self.assertEqual(set(subset.catchment_ids), {'cat-26', 'cat-27'})
+        self.assertEqual(set(subset.nexus_ids), {'nex-26'})
+
+    # Test that an upstream subset with a link limit of 0 includes only the catchment and its downstream nexus
+    def test_get_upstream_subset_1_b(self):
+        ex_ind = 1
+        cf = str(self.hf_examples[ex_ind][self.CAT_KEY])
+        nf = str(self.hf_examples[ex_ind][self.NEX_KEY])
+        xf = str(self.hf_examples[ex_ind][self.CROSS_KEY])
+
+        handler = SubsetHandler.factory_create_from_geojson(catchment_data=cf, nexus_data=nf, cross_walk=xf)
+        subset = handler.get_upstream_subset('cat-27', link_limit=0)
+
+        self.assertEqual(set(subset.catchment_ids), {'cat-27'})
+        self.assertEqual(set(subset.nexus_ids), {'nex-26'})
+
+    # Test that an upstream subset for several catchments includes everything upstream of each, ignoring unknown ids
+    def test_get_upstream_subset_2_a(self):
+        ex_ind = 1
+        cf = str(self.hf_examples[ex_ind][self.CAT_KEY])
+        nf = str(self.hf_examples[ex_ind][self.NEX_KEY])
+        xf = str(self.hf_examples[ex_ind][self.CROSS_KEY])
+
+        handler = SubsetHandler.factory_create_from_geojson(catchment_data=cf, nexus_data=nf, cross_walk=xf)
+        subset = handler.get_upstream_subset(['cat-26', 'cat-34', 'cat-0'])
+
+        self.assertEqual(set(subset.catchment_ids), {'cat-26', 'cat-27', 'cat-34', 'cat-52'})
+        self.assertEqual(set(subset.nexus_ids), {'nex-26', 'nex-34'})
+
+    # Test that a downstream subset includes everything downstream of the catchment
+    def test_get_downstream_subset_1_a(self):
+        ex_ind = 1
+        cf = str(self.hf_examples[ex_ind][self.CAT_KEY])
+        nf = str(self.hf_examples[ex_ind][self.NEX_KEY])
+        xf = str(self.hf_examples[ex_ind][self.CROSS_KEY])
+
+        handler = SubsetHandler.factory_create_from_geojson(catchment_data=cf, nexus_data=nf, cross_walk=xf)
+        subset = handler.get_downstream_subset('cat-67')
+
+        self.assertEqual(set(subset.catchment_ids), {'cat-67', 'cat-68'})
+        self.assertEqual(set(subset.nexus_ids), {'nex-68'})
+
+    # Test that a downstream subset with a link limit of 1 stops at the downstream nexus
+    def test_get_downstream_subset_1_b(self):
+        ex_ind = 1
+        cf = str(self.hf_examples[ex_ind][self.CAT_KEY])
+        nf = str(self.hf_examples[ex_ind][self.NEX_KEY])
+        xf = str(self.hf_examples[ex_ind][self.CROSS_KEY])
+
+        handler = SubsetHandler.factory_create_from_geojson(catchment_data=cf, nexus_data=nf, cross_walk=xf)
+        subset = handler.get_downstream_subset('cat-67', link_limit=1)
+
+        self.assertEqual(set(subset.catchment_ids), {'cat-67'})
+        self.assertEqual(set(subset.nexus_ids), {'nex-68'})
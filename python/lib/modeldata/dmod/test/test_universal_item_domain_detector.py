@@ -1,5 +1,8 @@
+import shutil
+import tempfile
 import unittest
 from datetime import datetime
+from pathlib import Path
 
 from dmod.core.meta_data import DataFormat, StandardDatasetIndex
 from dmod.core.data_domain_detectors import AbstractUniversalItemDomainDetector
@@ -30,8 +33,12 @@ class TestUniversalItemDomainDetector(unittest.TestCase):
         self.example_cat_ids = {0: "cat-12"}
 
         # Setup example 1
+        # Use a copy of the example file, as the hydrofabric may write a uid sidecar file next to it
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        gpkg_file = find_git_root_dir().joinpath("data/example_hydrofabric_2/hydrofabric.gpkg")
         self.expected_data_format[1] = DataFormat.NGEN_GEOPACKAGE_HYDROFABRIC_V2
-        self.example_data[1] = find_git_root_dir().joinpath("data/example_hydrofabric_2/hydrofabric.gpkg")
+        self.example_data[1] = Path(shutil.copy(gpkg_file, self._temp_dir.name))
         self.example_cat_ids[1] = sorted(['cat-8', 'cat-5', 'cat-9', 'cat-6', 'cat-7', 'cat-10', 'cat-11'])
 
     def test_detect_0_a(self):
@@ -2,13 +2,12 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional, Set, Tuple
-import json
+from typing import Collection, Dict, Iterator, List, Optional, Set, Tuple
 import docker
 from docker.models.services import Service
-from dmod.redis import RedisBacked
 from dmod.scheduler.job import Job, JobStatus, JobExecStep
-from dmod.scheduler.job.job_manager import RedisBackedJobManager
+from dmod.scheduler.job.job_util import RedisBackedJobUtil
+from dmod.scheduler.scheduler import Launcher
 
 MAX_JOBS = 210
 Max_Redis_Init = 5
@@ -48,6 +47,44 @@ class Monitor(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_job(self, job: Job):
+        """
+        Persist a job whose status has changed, so the change is seen by the rest of the system.
+
+        Parameters
+        ----------
+        job : Job
+            The job to save.
+        """
+        pass
+
+    def stop_watching(self):
+        """
+        Stop any iteration over ::method:`watch_changed_job_ids`, including from a different thread.
+        """
+        pass
+
+    def watch_changed_job_ids(self) -> Iterator[str]:
+        """
+        Block and iterate over the ids of jobs that may have changed, as changes happen in the runtime.
+
+        The ids are only hints of which jobs to check with ::method:`monitor_jobs`; they may include ids of jobs that
+        have not changed status or are not monitored.  Implementations that cannot observe changes as they happen do
+        not need to override this.
+
+        Returns
+        -------
+        Iterator[str]
+            Iterator over the ids of jobs that may have changed.
+
+        Raises
+        -------
+        NotImplementedError
+            If this type cannot observe changes as they happen.
+        """
+        raise NotImplementedError("{} cannot watch for changed jobs".format(self.__class__.__name__))
+
     @abstractmethod
     def monitor_job(self, job: Job) -> Optional[Tuple[JobStatus, JobStatus]]:
         """
@@ -72,7 +109,8 @@ class Monitor(ABC):
         """
         pass
 
-    def monitor_jobs(self) -> Tuple[Dict[str, Job], Dict[str, JobStatus], Dict[str, JobStatus]]:
+    def monitor_jobs(self, job_ids: Optional[Collection[str]] = None) -> Tuple[Dict[str, Job], Dict[str, JobStatus],
+                                                                                Dict[str, JobStatus]]:
         """
         Monitor jobs and return data on those that have changed.
 
@@ -80,6 +118,11 @@ class Monitor(ABC):
         observed changes as a tuple of three dictionaries.  These are all keyed by job id and contain the mapped job
         objects, original statuses, and new statuses respectively.
 
+        Parameters
+        ----------
+        job_ids : Optional[Collection[str]]
+            Optional ids of the only jobs to check, among those from ::method:`get_jobs_to_monitor`.
+
         Returns
         -------
         Tuple[Dict[str, Job], Dict[str, JobStatus], Dict[str, JobStatus]]
@@ -93,6 +136,8 @@ class Monitor(ABC):
         updated_job_statuses = dict()
 
         for job in self.get_jobs_to_monitor():
+            if job_ids is not None and str(job.job_id) not in job_ids:
+                continue
             monitor_result = self.monitor_job(job)
             if monitor_result:
                 jobs_with_changed_state[job.job_id] = job
@@ -121,8 +166,38 @@ class DockerSwarmMonitor(Monitor, ABC):
     }
     """ Map of job exec steps and the set of string forms of Docker Service Tasks ``state`` values that correspond. """
 
+    _MONITORED_EXEC_STEPS = {JobExecStep.SCHEDULED, JobExecStep.RUNNING}
+    """ The exec steps of jobs with Docker services that determine when the jobs move on to another step. """
+
+    _WATCHED_EVENT_TYPES = ['service', 'container']
+    """ The types of Docker events that may indicate a change to a job's services. """
+
     @classmethod
-    def _get_task_state_and_exec_step_counts(cls, service: Service) -> Tuple[Dict[str, int], Dict[JobExecStep, int]]:
+    def _get_service_job_id(cls, service: Service) -> str:
+        """
+        Get the id of the job that a Docker service was started for.
+
+        The id is read from the service's ::attribute:`Launcher.JOB_ID_LABEL` label, falling back to the suffix of the
+        service name (see ::attribute:`Job.allocation_service_names`) for services started without the label.
+
+        Parameters
+        ----------
+        service : Service
+            The Docker service in question.
+
+        Returns
+        -------
+        str
+            The id of the job the service was started for.
+        """
+        labels = service.attrs['Spec'].get('Labels') or {}
+        if Launcher.JOB_ID_LABEL in labels:
+            return labels[Launcher.JOB_ID_LABEL]
+        return service.name.rsplit('_', 1)[-1]
+
+    @classmethod
+    def _get_task_state_and_exec_step_counts(cls, service: Service, tasks: Optional[List[dict]] = None) -> Tuple[
+            Dict[str, int], Dict[JobExecStep, int]]:
         """
         For a given service, examine the state of its tasks, returning a dictionary of state values to number of times
         occurring and a dictionary of converted ::class:`JobExecStep` for the state values to number of times occurring.
@@ -131,6 +206,8 @@ class DockerSwarmMonitor(Monitor, ABC):
         ----------
         service : Service
             The Docker service in question.
+        tasks : Optional[List[dict]]
+            The service's tasks, if already known; by default, these are requested from Docker.
 
         Returns
         -------
@@ -140,7 +217,7 @@ class DockerSwarmMonitor(Monitor, ABC):
         """
         # First get the statuses from all tasks for this service
         task_states = dict()
-        for task in service.tasks():
+        for task in (service.tasks() if tasks is None else tasks):
             ts = task['Status']['State']
             if ts in task_states:
                 task_states[ts] += 1
@@ -261,7 +338,7 @@ class DockerSwarmMonitor(Monitor, ABC):
         """
         for exec_step in cls._EXEC_STEP_DOCKER_STATUS_MAP:
             if task_state in cls._EXEC_STEP_DOCKER_STATUS_MAP[exec_step]:
-                return task_state
+                return exec_step
         # Fall back to fail
         return JobExecStep.FAILED
 
@@ -277,6 +354,12 @@ class DockerSwarmMonitor(Monitor, ABC):
             self._api_client = docker.APIClient()
         self._last_checked: Optional[datetime] = None
         self._service_state_map = {}
+        self._services_by_job: Optional[Dict[str, List[Service]]] = None
+        """ Snapshot of Docker services, keyed by job id, when one has been taken for the current sweep. """
+        self._tasks_by_service: Dict[str, List[dict]] = {}
+        """ Snapshot of Docker service tasks, keyed by service id. """
+        self._event_stream = None
+        self._is_watching = False
 
     @property
     def api_client(self) -> docker.APIClient:
@@ -292,6 +375,54 @@ class DockerSwarmMonitor(Monitor, ABC):
         except:
             raise ConnectionError("Please check that the Docker Daemon is installed and running.")
 
+    def clear_snapshot(self):
+        """
+        Discard any snapshot of services and tasks, so that jobs are checked against Docker directly.
+        """
+        self._services_by_job = None
+        self._tasks_by_service = {}
+
+    def take_snapshot(self):
+        """
+        Take a snapshot of all Docker services and their tasks, indexed by job, for checking many jobs at once.
+
+        The snapshot takes one listing each of services and tasks, rather than the two or more Docker API calls per job
+        otherwise made by ::method:`check_implied_job_exec_step`.  It is used for checking jobs until it is replaced or
+        cleared with ::method:`clear_snapshot`.
+        """
+        services_by_job: Dict[str, List[Service]] = {}
+        for service in self.docker_client.services.list():
+            services_by_job.setdefault(self._get_service_job_id(service), []).append(service)
+        tasks_by_service: Dict[str, List[dict]] = {}
+        for task in self.docker_client.api.tasks():
+            tasks_by_service.setdefault(task['ServiceID'], []).append(task)
+        self._services_by_job = services_by_job
+        self._tasks_by_service = tasks_by_service
+        self._last_checked = datetime.now()
+
+    def get_services_for_job(self, job: Job) -> List[Service]:
+        """
+        Get the Docker services associated with a given job, from the current snapshot if there is one.
+
+        Parameters
+        ----------
+        job : Job
+            A particular job of interest.
+
+        Returns
+        -------
+        List[Service]
+            The Docker services associated with the given job.
+        """
+        if self._services_by_job is None:
+            service_names = list(job.allocation_service_names or [])
+            if len(service_names) == 0:
+                return []
+            # Docker matches name filters by prefix, so these are still filtered for exact names
+            services = self.docker_client.services.list(filters={'name': service_names})
+            return self.filter_services_for_job(job=job, services=services)
+        return self.filter_services_for_job(job=job, services=self._services_by_job.get(str(job.job_id), []))
+
     def check_implied_job_exec_step(self, job: Job) -> JobExecStep:
         """
         Infer the appropriate ::class:`JobExecStep` value for a job based on the real-time states of the services
@@ -308,13 +439,17 @@ class DockerSwarmMonitor(Monitor, ABC):
             The appropriate ::class:`JobExecStep` value for the given job.
         """
         # Start by getting the services for a given job.
-        job_alloc_services = self.filter_services_for_job(job=job, services=self.docker_client.services.list())
+        job_alloc_services = self.get_services_for_job(job)
+        # Without any services, there is nothing to imply a different step
+        if len(job_alloc_services) == 0:
+            return job.status_step
 
         # Then, process the exec step for each service, based on the states of each service's task(s)
         service_states = []
         for service in job_alloc_services:
             # Get counts for task states and counts for task mapped exec_steps
-            task_states, task_exec_steps = self._get_task_state_and_exec_step_counts(service=service)
+            tasks = None if self._services_by_job is None else self._tasks_by_service.get(service.id, [])
+            task_states, task_exec_steps = self._get_task_state_and_exec_step_counts(service=service, tasks=tasks)
             # TODO: this will need to be tested
             desired_replica_count = service.attrs['Spec']['Mode']['Replicated']['Replicas']
             # Now apply some rules to determine an exec step value for the service
@@ -351,6 +486,65 @@ class DockerSwarmMonitor(Monitor, ABC):
     def docker_client(self) -> docker.DockerClient:
         return self._docker_client
 
+    def get_job_id_for_event(self, event: dict) -> Optional[str]:
+        """
+        Get the id of the job whose services may have been changed, per a Docker event.
+
+        Container events carry the ::attribute:`Launcher.JOB_ID_LABEL` label of containers started for jobs, and both
+        container and service events carry the name of the service, which ends with the job id (see
+        ::attribute:`Job.allocation_service_names`).
+
+        Parameters
+        ----------
+        event : dict
+            A decoded Docker event.
+
+        Returns
+        -------
+        Optional[str]
+            The id of the job implied by the event, or ``None`` if the event is not for a service of any job.
+        """
+        attributes = event.get('Actor', {}).get('Attributes', {})
+        if event.get('Type') == 'container':
+            if Launcher.JOB_ID_LABEL in attributes:
+                return attributes[Launcher.JOB_ID_LABEL]
+            service_name = attributes.get('com.docker.swarm.service.name')
+        elif event.get('Type') == 'service':
+            service_name = attributes.get('name')
+        else:
+            return None
+        if not service_name or '_' not in service_name:
+            return None
+        return service_name.rsplit('_', 1)[-1]
+
+    def monitor_jobs(self, job_ids: Optional[Collection[str]] = None) -> Tuple[Dict[str, Job], Dict[str, JobStatus],
+                                                                                Dict[str, JobStatus]]:
+        """
+        Monitor jobs and return data on those that have changed.
+
+        When checking all jobs, a snapshot of the Docker services and tasks is taken once (see ::method:`take_snapshot`)
+        and all jobs are checked against it, rather than each job listing the services itself.  When checking only
+        certain jobs, they are checked directly.
+
+        Parameters
+        ----------
+        job_ids : Optional[Collection[str]]
+            Optional ids of the only jobs to check, among those from ::method:`get_jobs_to_monitor`.
+
+        Returns
+        -------
+        Tuple[Dict[str, Job], Dict[str, JobStatus], Dict[str, JobStatus]]
+            A tuple of three dictionaries for jobs with status changes, having values of job object, original status,
+            and updated status respectively, and all keyed by job id.
+        """
+        if job_ids is not None:
+            return super().monitor_jobs(job_ids)
+        self.take_snapshot()
+        try:
+            return super().monitor_jobs()
+        finally:
+            self.clear_snapshot()
+
     def monitor_job(self, job: Job) -> Optional[Tuple[JobStatus, JobStatus]]:
         """
         Monitor whether a given job has changed status.
@@ -374,6 +568,8 @@ class DockerSwarmMonitor(Monitor, ABC):
         """
         # TODO: verify that it is not necessary to examine status directory (i.e., check job phase) due to some
         #  guarantee on never jumping to the same step of a different phase between monitoring calls
+        if job.status_step not in self._MONITORED_EXEC_STEPS:
+            return None
         new_exec_step = self.check_implied_job_exec_step(job)
         if job.status_step == new_exec_step:
             return None
@@ -382,43 +578,80 @@ class DockerSwarmMonitor(Monitor, ABC):
         updated_job_status = job.status
         return previous_status, updated_job_status
 
+    def stop_watching(self):
+        """
+        Stop any iteration over ::method:`watch_changed_job_ids`, including from a different thread.
+        """
+        self._is_watching = False
+        if self._event_stream is not None:
+            self._event_stream.close()
+
+    def watch_changed_job_ids(self) -> Iterator[str]:
+        """
+        Block and iterate over the ids of jobs whose services may have changed, per Docker service and container events.
 
-class RedisBackedMonitor(Monitor, RedisBacked, ABC):
+        Service events come from the whole Swarm, but container events only come from the node of the Docker daemon
+        being used, so not every change to a job's tasks is necessarily seen.  Periodic checks of all jobs are still
+        needed to catch the rest.
+
+        Returns
+        -------
+        Iterator[str]
+            Iterator over the ids of jobs whose services may have changed.
+        """
+        self._is_watching = True
+        event_stream = self.docker_client.events(decode=True, filters={'type': self._WATCHED_EVENT_TYPES})
+        self._event_stream = event_stream
+        try:
+            for event in event_stream:
+                if not self._is_watching:
+                    break
+                job_id = self.get_job_id_for_event(event)
+                if job_id is not None:
+                    yield job_id
+        finally:
+            event_stream.close()
+            self._event_stream = None
+
+
+class RedisBackedMonitor(Monitor, RedisBackedJobUtil, ABC):
     """
-    Subtype of ::class:`Monitor` and ::class:`RedisBacked` that determines jobs to monitor from Redis.
+    Subtype of ::class:`Monitor` and ::class:`RedisBackedJobUtil` that determines jobs to monitor from Redis.
     """
+    _JOB_EVENT_SOURCE = 'monitor'
+    """ The source recorded for job saves made by the monitor. """
+
     def __init__(self, resource_pool: str,
                  redis_host: Optional[str] = None, redis_port: Optional[int] = None,
                  redis_pass: Optional[str] = None, **kwargs):
-        RedisBacked.__init__(self=self, resource_pool=resource_pool, redis_host=redis_host,
-                             redis_port=redis_port, redis_pass=redis_pass, **kwargs)
-        if 'type' in kwargs:
-            key_prefix = RedisBackedJobManager.get_key_prefix(environment_type=kwargs['type'])
-        else:
-            key_prefix = RedisBackedJobManager.get_key_prefix()
-        self._active_jobs_set_key = self.keynamehelper.create_key_name(key_prefix, 'active_jobs')
+        RedisBackedJobUtil.__init__(self, resource_pool=resource_pool, redis_host=redis_host,
+                                    redis_port=redis_port, redis_pass=redis_pass, **kwargs)
+        self._job_event_source = self._JOB_EVENT_SOURCE
 
     def get_jobs_to_monitor(self) -> List[Job]:
         """
         Get a list of the jobs currently needing monitoring.
 
-        This will likely be something akin to "active" jobs, but the particular conditions should be documented for each
-        implementation.
+        For this type, these are the jobs at the ``SCHEDULED`` or ``RUNNING`` exec steps, read from the Redis indexes
+        of jobs by exec step.
 
         Returns
         -------
         List[Job]
             A list of the job objects corresponding to executing jobs within the runtime that need to be monitored.
         """
-        active_jobs = []
-        for active_job_redis_key in self.redis.smembers(self._active_jobs_set_key):
-            # If key exists
-            if self.redis.exists(active_job_redis_key) == 1:
-                serialized_job = json.loads(self.redis.get(active_job_redis_key))
-                job = Job.factory_init_from_deserialized_json(serialized_job)
-                if isinstance(job, Job):
-                    active_jobs.append(job)
-        return active_jobs
+        return self.get_jobs_for_exec_step(JobExecStep.SCHEDULED) + self.get_jobs_for_exec_step(JobExecStep.RUNNING)
+
+    def save_job(self, job: Job):
+        """
+        Save a job whose status has changed to Redis, which also wakes anything waiting on job changes.
+
+        Parameters
+        ----------
+        job : Job
+            The job to save.
+        """
+        RedisBackedJobUtil.save_job(self, job)
 
 
 class RedisDockerSwarmMonitor(DockerSwarmMonitor, RedisBackedMonitor):
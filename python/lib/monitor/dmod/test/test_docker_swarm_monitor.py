@@ -0,0 +1,193 @@
+import unittest
+from typing import Dict, List, Optional
+
+from dmod.scheduler.job import Job, JobExecPhase, JobExecStep, JobStatus
+from dmod.scheduler.scheduler import Launcher
+from ..monitor.que_monitor import DockerSwarmMonitor
+
+
+class MockJob:
+    """
+    Simple stand-in for a ::class:`Job`, with only what the monitor uses.
+    """
+
+    def __init__(self, job_id: str, exec_step: JobExecStep, worker_count: int = 1):
+        self.job_id = job_id
+        self.status_step = exec_step
+        self.allocation_service_names = tuple('ngen-worker{}_{}'.format(i, job_id) for i in range(worker_count))
+
+    @property
+    def status(self) -> JobStatus:
+        return JobStatus(JobExecPhase.MODEL_EXEC, self.status_step)
+
+
+class MockService:
+    """
+    Simple stand-in for a Docker ::class:`Service`, which counts requests for its tasks.
+    """
+
+    def __init__(self, service_id: str, name: str, tasks: List[dict], labels: Optional[Dict[str, str]] = None):
+        self.id = service_id
+        self.name = name
+        self.attrs = {'Spec': {'Labels': labels, 'Mode': {'Replicated': {'Replicas': len(tasks)}}}}
+        self.tasks_call_count = 0
+        self._tasks = tasks
+
+    def tasks(self) -> List[dict]:
+        self.tasks_call_count += 1
+        return self._tasks
+
+
+class MockServiceCollection:
+
+    def __init__(self, services: List[MockService]):
+        self.services = services
+        self.list_filters: List[Optional[dict]] = []
+
+    def list(self, filters: Optional[dict] = None) -> List[MockService]:
+        self.list_filters.append(filters)
+        if filters is None:
+            return list(self.services)
+        # Like Docker, match names by prefix
+        return [s for s in self.services if any(s.name.startswith(n) for n in filters['name'])]
+
+
+class MockAPIClient:
+
+    def __init__(self, services: List[MockService]):
+        self._tasks = [dict(t, ServiceID=s.id) for s in services for t in s._tasks]
+        self.tasks_call_count = 0
+
+    def tasks(self) -> List[dict]:
+        self.tasks_call_count += 1
+        return self._tasks
+
+
+class MockDockerClient:
+    """
+    Simple stand-in for a ::class:`docker.DockerClient`, which records the requests made of it.
+    """
+
+    def __init__(self, services: List[MockService]):
+        self.services = MockServiceCollection(services)
+        self.api = MockAPIClient(services)
+
+
+class MockDockerSwarmMonitor(DockerSwarmMonitor):
+
+    def __init__(self, docker_client: MockDockerClient, jobs: List[MockJob]):
+        super().__init__(docker_client=docker_client)
+        self.jobs = jobs
+
+    def get_jobs_to_monitor(self) -> List[Job]:
+        return self.jobs
+
+    def save_job(self, job: Job):
+        pass
+
+
+class TestDockerSwarmMonitor(unittest.TestCase):
+
+    @classmethod
+    def _task(cls, state: str) -> dict:
+        return {'Status': {'State': state}}
+
+    def setUp(self) -> None:
+        self.jobs = [MockJob('job-0', JobExecStep.SCHEDULED),
+                     MockJob('job-1', JobExecStep.SCHEDULED, worker_count=2),
+                     MockJob('job-2', JobExecStep.RUNNING),
+                     MockJob('job-3', JobExecStep.SCHEDULED)]
+        self.services = [
+            # Labeled service, as started by the current launcher
+            MockService('s0', 'ngen-worker0_job-0', [self._task('running')], {Launcher.JOB_ID_LABEL: 'job-0'}),
+            # Unlabeled services, as started before services were labeled
+            MockService('s1', 'ngen-worker0_job-1', [self._task('running')]),
+            MockService('s2', 'ngen-worker1_job-1', [self._task('pending')]),
+            MockService('s3', 'ngen-worker0_job-2', [self._task('complete')], {Launcher.JOB_ID_LABEL: 'job-2'}),
+            # Service not started for any monitored job
+            MockService('s4', 'some_other_service', [self._task('running')])]
+        self.docker_client = MockDockerClient(self.services)
+        self.monitor = MockDockerSwarmMonitor(docker_client=self.docker_client, jobs=self.jobs)
+
+    def test__get_service_job_id_1_a(self):
+        """ Test that the job id is read from the label of a labeled service. """
+        service = MockService('s', 'ngen-worker0_unrelated', [], {Launcher.JOB_ID_LABEL: 'job-0'})
+        self.assertEqual(self.monitor._get_service_job_id(service), 'job-0')
+
+    def test__get_service_job_id_1_b(self):
+        """ Test that the job id is read from the suffix of the name of a service without the label. """
+        self.assertEqual(self.monitor._get_service_job_id(self.services[1]), 'job-1')
+
+    def test_get_exec_step_for_job_docker_task_state_1_a(self):
+        """ Test that a task state is mapped to its exec step, rather than returned itself. """
+        self.assertEqual(self.monitor.get_exec_step_for_job_docker_task_state('running'), JobExecStep.RUNNING)
+        self.assertEqual(self.monitor.get_exec_step_for_job_docker_task_state('pending'), JobExecStep.SCHEDULED)
+
+    def test_get_exec_step_for_job_docker_task_state_1_b(self):
+        """ Test that an unrecognized task state is mapped to the ``FAILED`` exec step. """
+        self.assertEqual(self.monitor.get_exec_step_for_job_docker_task_state('unknown'), JobExecStep.FAILED)
+
+    def test_take_snapshot_1_a(self):
+        """ Test that a snapshot maps services to jobs by label or by name. """
+        self.monitor.take_snapshot()
+        services_by_job = {j: sorted(s.id for s in svcs) for j, svcs in self.monitor._services_by_job.items()}
+        self.assertEqual(services_by_job, {'job-0': ['s0'], 'job-1': ['s1', 's2'], 'job-2': ['s3'],
+                                           'service': ['s4']})
+
+    def test_take_snapshot_1_b(self):
+        """ Test that a snapshot maps tasks to their services. """
+        self.monitor.take_snapshot()
+        self.assertEqual(sorted(self.monitor._tasks_by_service.keys()), ['s0', 's1', 's2', 's3', 's4'])
+
+    def test_get_services_for_job_1_a(self):
+        """ Test that services for a job come from the snapshot, without further requests, when there is one. """
+        self.monitor.take_snapshot()
+        services = self.monitor.get_services_for_job(self.jobs[1])
+        self.assertEqual(sorted(s.id for s in services), ['s1', 's2'])
+        self.assertEqual(self.docker_client.services.list_filters, [None])
+
+    def test_get_services_for_job_1_b(self):
+        """ Test that services for a job are listed by name, when there is no snapshot. """
+        services = self.monitor.get_services_for_job(self.jobs[1])
+        self.assertEqual(sorted(s.id for s in services), ['s1', 's2'])
+        self.assertEqual(self.docker_client.services.list_filters,
+                         [{'name': ['ngen-worker0_job-1', 'ngen-worker1_job-1']}])
+
+    def test_get_services_for_job_1_c(self):
+        """ Test that a job without services in the snapshot has no services. """
+        self.monitor.take_snapshot()
+        self.assertEqual(self.monitor.get_services_for_job(self.jobs[3]), [])
+
+    def test_monitor_jobs_1_a(self):
+        """ Test that checking all jobs lists services and tasks only once each, and no tasks per service. """
+        self.monitor.monitor_jobs()
+        self.assertEqual(self.docker_client.services.list_filters, [None])
+        self.assertEqual(self.docker_client.api.tasks_call_count, 1)
+        self.assertEqual(sum(s.tasks_call_count for s in self.services), 0)
+
+    def test_monitor_jobs_1_b(self):
+        """ Test that checking all jobs finds the expected changes. """
+        changed_jobs, original_statuses, updated_statuses = self.monitor.monitor_jobs()
+        self.assertEqual(sorted(changed_jobs.keys()), ['job-0', 'job-1', 'job-2'])
+        self.assertEqual(updated_statuses['job-0'].job_exec_step, JobExecStep.RUNNING)
+        self.assertEqual(updated_statuses['job-1'].job_exec_step, JobExecStep.RUNNING)
+        self.assertEqual(updated_statuses['job-2'].job_exec_step, JobExecStep.COMPLETED)
+
+    def test_monitor_jobs_1_c(self):
+        """ Test that the snapshot is dropped after checking all jobs. """
+        self.monitor.monitor_jobs()
+        self.assertIsNone(self.monitor._services_by_job)
+        self.assertEqual(self.monitor._tasks_by_service, {})
+
+    def test_monitor_jobs_1_d(self):
+        """ Test that a job without services is left unchanged. """
+        changed_jobs, _, _ = self.monitor.monitor_jobs()
+        self.assertNotIn('job-3', changed_jobs)
+        self.assertEqual(self.jobs[3].status_step, JobExecStep.SCHEDULED)
+
+    def test_monitor_jobs_2_a(self):
+        """ Test that checking only certain jobs queries Docker just for the services of those jobs. """
+        changed_jobs, _, _ = self.monitor.monitor_jobs(job_ids={'job-0'})
+        self.assertEqual(list(changed_jobs.keys()), ['job-0'])
+        self.assertEqual(self.docker_client.services.list_filters, [{'name': ['ngen-worker0_job-0']}])
+        self.assertEqual(self.docker_client.api.tasks_call_count, 0)
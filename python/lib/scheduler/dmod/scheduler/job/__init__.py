@@ -1,3 +1,3 @@
 from .job import Job, JobExecPhase, JobExecStep, JobImpl, JobStatus, RequestedJob
-from .job_util import JobUtil, DefaultJobUtilFactory
+from .job_util import JobUtil, JobUpdateConflictError, DefaultJobUtilFactory
 from .job_manager import JobManager, JobManagerFactory
\ No newline at end of file
@@ -1,13 +1,13 @@
 import uuid
 from abc import ABC, abstractmethod
-from asyncio import sleep
-from typing import Dict, List, Optional, Tuple, Union
+from asyncio import get_running_loop, sleep
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID, uuid4 as random_uuid
 from dmod.core.execution import AllocationParadigm
 from dmod.core.serializable import BasicResultIndicator
 from dmod.communication.maas_request.dmod_job_request import DmodJobRequest
 from .job import Job, JobExecPhase, JobExecStep, JobStatus, RequestedJob
-from .job_util import JobUtil, RedisBackedJobUtil
+from .job_util import JobUpdateConflictError, JobUtil, RedisBackedJobUtil
 from ..resources.resource_allocation import ResourceAllocation
 from ..resources.resource_manager import ResourceManager
 from ..scheduler import Launcher
@@ -48,6 +48,8 @@ class JobManagerFactory:
             The Redis service port.
         redis_pass : str
             The Redis service auth password.
+        backfill_allocations : bool
+            Whether ``BEST_FIT`` jobs may be allocated behind a blocked job, on resources it does not need.
 
         Returns
         -------
@@ -57,6 +59,7 @@ class JobManagerFactory:
         host = None
         port = None
         pword = None
+        backfill = False
         for key, value in kwargs.items():
             if key == 'redis_host':
                 host = value
@@ -64,8 +67,10 @@ class JobManagerFactory:
                 port = int(value)
             elif key == 'redis_pass':
                 pword = value
+            elif key == 'backfill_allocations':
+                backfill = bool(value)
         return RedisBackedJobManager(resource_manager=resource_manager, launcher=launcher, redis_host=host, redis_port=port,
-                                     redis_pass=pword)
+                                     redis_pass=pword, backfill_allocations=backfill)
 
 
 class JobManager(JobUtil, ABC):
@@ -271,6 +276,13 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
     scheduling and execution.
     """
 
+    _SWEEP_FALLBACK_SECONDS = 5
+    """ The longest time to wait between processing sweeps when no jobs are saved. """
+    _LOCK_RETRY_MINIMUM_SECONDS = 0.05
+    _LOCK_RETRY_MAXIMUM_SECONDS = 2
+    _ALLOCATION_LOCK_SHARD = 'allocation'
+    """ The shard of the active jobs lock held while sweeping, so other services' status updates are not blocked. """
+
     @classmethod
     def build_prioritized_pending_allocation_queues(cls, jobs_eligible_for_allocate: List[RequestedJob]) -> Dict[
             str, List[Tuple[int, RequestedJob]]]:
@@ -329,7 +341,8 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         return {'high': high_priority_queue, 'medium': med_priority_queue, 'low': low_priority_queue}
 
     def __init__(self, resource_manager : ResourceManager, launcher: Launcher, redis_host: Optional[str] = None,
-                 redis_port: Optional[int] = None, redis_pass: Optional[str] = None, **kwargs):
+                 redis_port: Optional[int] = None, redis_pass: Optional[str] = None, backfill_allocations: bool = False,
+                 **kwargs):
         """
         Initialize this instance.
 
@@ -345,12 +358,40 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
             Optional explicit string init param for the Redis connection port value.
         redis_pass : Optional[str]
             Optional explicit string init param for the Redis connection password value.
+        backfill_allocations : bool
+            Whether jobs with the ``BEST_FIT`` allocation paradigm may be allocated behind a blocked, higher priority or
+            larger ``BEST_FIT`` job, on resources that the blocked job does not need; ``False`` by default.
         kwargs
             Keyword args, passed through to the ::class:`RedisBackedJobUtil` superclass init function.
         """
         super().__init__(redis_host=redis_host, redis_port=redis_port, redis_pass=redis_pass, **kwargs)
         self._resource_manager = resource_manager
         self._launcher = launcher
+        self._backfill_allocations = backfill_allocations
+
+    def _save_job_if_unchanged(self, job: RequestedJob) -> bool:
+        """
+        Save a job, unless it was changed elsewhere since it was loaded, in which case the update is discarded.
+
+        The job will have been saved by something else, which also triggers another sweep, which will then process the
+        job from its newer state.
+
+        Parameters
+        ----------
+        job : RequestedJob
+            The job to save.
+
+        Returns
+        -------
+        bool
+            Whether the job was saved.
+        """
+        try:
+            self.save_job(job)
+            return True
+        except JobUpdateConflictError as e:
+            logging.info("Discarding update to job {}: {}".format(job.job_id, e))
+            return False
 
     def _organize_active_jobs(self, active_jobs: List[RequestedJob]) -> List[List[RequestedJob]]:
         """
@@ -381,7 +422,8 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
             if job.status_phase == JobExecPhase.INIT:
                 # TODO: revisit this for JobCategory (remember right now this is the only way AWAITING_DATA_CHECK is entered, via default step)
                 job.status = JobStatus(phase=JobExecPhase.MODEL_EXEC)
-                self.save_job(job)
+                if not self._save_job_if_unchanged(job):
+                    continue
 
             # Skip jobs awaiting data check handled by the data service, or partitioning handled by partitioning service
             if job.status_step == JobExecStep.AWAITING_DATA_CHECK or job.status_step == JobExecStep.AWAITING_PARTITIONING:
@@ -394,7 +436,8 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
             if job.status_step == JobExecStep.STOPPED:
                 job.set_status_step(JobExecStep.AWAITING_ALLOCATION)
                 # TODO: calculate impact on priority
-                self.save_job(job)
+                if not self._save_job_if_unchanged(job):
+                    continue
 
             # TODO: figure out for FAILED if restart should be automatic or should require manual request to restart
             # For now, assume failure requires manual re-transition
@@ -409,7 +452,7 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
                     # TODO: confirm the allocation is still valid (saving it without checking will make it so, which
                     #  could lead to inconsistencies)
                     job.set_status_step(JobExecStep.AWAITING_DATA)
-                    self.save_job(job)
+                    self._save_job_if_unchanged(job)
 
             if job.should_release_resources:
                 jobs_to_release_resources.append(job)
@@ -419,6 +462,102 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
 
         return [jobs_eligible_for_allocate, jobs_to_release_resources, jobs_completed_phase]
 
+    def _request_packed_allocations(self, priority_queues: Dict[str, List[Tuple[int, RequestedJob]]],
+                                    queue_keys: Sequence[str]) -> List[RequestedJob]:
+        """
+        Request allocations together for the jobs in the given priority queues that use the ``BEST_FIT`` paradigm.
+
+        Such jobs are removed from the queues and then packed onto resources with one call to
+        ::method:`ResourceManager.allocate_best_fit_decreasing`, with the queues serving as priority tiers in the order
+        of the given keys.  Jobs that get allocations are updated and saved in Redis.  As with
+        ::method:`_request_allocations_for_queue`, the priorities of jobs passed over in favor of lower priority jobs
+        are bumped.
+
+        Parameters
+        ----------
+        priority_queues : Dict[str, List[Tuple[int, RequestedJob]]]
+            The ``high``, ``medium``, and ``low`` priority queues from
+            ::method:`build_prioritized_pending_allocation_queues`, which are modified to remove the packed jobs.
+        queue_keys : Sequence[str]
+            The keys of the queues to pack jobs from, from highest to lowest priority.
+
+        Returns
+        -------
+        List[RequestedJob]
+            A list of the job objects that received their requested allocations.
+        """
+        packed_jobs, tiers = [], []
+        for tier, queue_key in enumerate(queue_keys):
+            queue = priority_queues[queue_key]
+            # A sorted list is still a valid heap, so the remaining jobs can stay in place
+            queue.sort()
+            packed_jobs.extend(j for _, j in queue if j.allocation_paradigm == AllocationParadigm.BEST_FIT)
+            tiers.extend(tier for _, j in queue if j.allocation_paradigm == AllocationParadigm.BEST_FIT)
+            queue[:] = [item for item in queue if item[1].allocation_paradigm != AllocationParadigm.BEST_FIT]
+        if len(packed_jobs) == 0:
+            return []
+
+        results = self._resource_manager.allocate_best_fit_decreasing(
+            [(job.cpu_count, job.memory_size) for job in packed_jobs], backfill=self._backfill_allocations, tiers=tiers)
+
+        allocated_successfully = []
+        not_allocated = []
+        priorities_to_bump = []
+        for job, alloc in zip(packed_jobs, results):
+            if isinstance(alloc[0], ResourceAllocation):
+                job.allocations = alloc
+                job.status_step = JobExecStep.AWAITING_DATA
+                if not self._save_job_if_unchanged(job):
+                    self._resource_manager.release_resources(alloc)
+                    continue
+                allocated_successfully.append(job)
+                priorities_to_bump = list(not_allocated)
+            else:
+                not_allocated.append(job)
+        for j in priorities_to_bump:
+            j.allocation_priority = j.allocation_priority + 1
+            self._save_job_if_unchanged(j)
+        return allocated_successfully
+
+    def _request_prioritized_allocations(self, priority_queues: Dict[str, List[Tuple[int, RequestedJob]]]) -> List[
+            RequestedJob]:
+        """
+        Request allocations for the jobs in the given priority queues, starting first with high priorities.
+
+        Within each queue, jobs with the ``BEST_FIT`` paradigm are packed together by
+        ::method:`_request_packed_allocations` before the rest are allocated one at a time.  The ``medium`` and ``low``
+        queues are only processed if any and all high priority jobs get allocated, so lower priority jobs never take
+        resources that a high priority job needs.
+
+        Parameters
+        ----------
+        priority_queues : Dict[str, List[Tuple[int, RequestedJob]]]
+            The ``high``, ``medium``, and ``low`` priority queues from
+            ::method:`build_prioritized_pending_allocation_queues`, which are emptied of the jobs allocations were
+            requested for.
+
+        Returns
+        -------
+        List[RequestedJob]
+            A list of the job objects that received their requested allocations.
+        """
+        high_priority_queue = priority_queues['high']
+
+        # Do this here to get size in case queue is altered below
+        initial_high_priority_queue_size = len(high_priority_queue)
+
+        allocated_high_priority = self._request_packed_allocations(priority_queues, ['high'])
+        allocated_high_priority.extend(self._request_allocations_for_queue(high_priority_queue))
+        allocated_successfully = list(allocated_high_priority)
+
+        # Only even process others if any and all high priority jobs get allocated
+        if len(allocated_high_priority) == initial_high_priority_queue_size:
+            for queue_key in ('medium', 'low'):
+                allocated_successfully.extend(self._request_packed_allocations(priority_queues, [queue_key]))
+                allocated_successfully.extend(self._request_allocations_for_queue(priority_queues[queue_key]))
+
+        return allocated_successfully
+
     def _request_allocations_for_queue(self, jobs_priority_queue: List[Tuple[int, RequestedJob]]) -> List[RequestedJob]:
         """
         Request allocations for all jobs in a provided priority queue, updating and saving in Redis any jobs that did
@@ -444,10 +583,12 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
             # Remember, the job object itself is the second item in the popped tuple, since this is a min heap
             job = heapq.heappop(jobs_priority_queue)[1]
             was_allocated = self.request_allocations(job)
+            # If the job was changed elsewhere since it was loaded, give back the allocation it just received
+            if was_allocated and not self._save_job_if_unchanged(job):
+                self._resource_manager.release_resources(job.allocations)
             # If the allocation was successful
-            if was_allocated:
+            elif was_allocated:
                 allocated_successfully.append(job)
-                self.save_job(job)
                 # Keep track of jobs that got skipped over by at least one lower priority job like this
                 # Simplest thing is to clear an rebuild list with anything "not allocated" that came before this
                 priorities_to_bump = []
@@ -458,7 +599,7 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         # Then at the end, bump priorities for skipped
         for j in priorities_to_bump:
             j.allocation_priority = j.allocation_priority + 1
-            self.save_job(j)
+            self._save_job_if_unchanged(j)
         return allocated_successfully
 
     def create_job(self, request: SchedulerRequestMessage, *args, **kwargs) -> RequestedJob:
@@ -549,6 +690,8 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
                     # Make sure not in active set
                     pipeline.srem(self._active_jobs_set_key, job_key)
                 pipeline.delete(job_key)
+                pipeline.hdel(self._job_revisions_hash_key, str(job_id))
+                self._index_job_status(pipeline, job_id, None)
                 pipeline.execute()
 
                 # Try to do this, but don't fully fail just for this part
@@ -588,7 +731,10 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
                                         message=f"{JobExecStep.STOPPED!s} required, but job was {job.status_step!s}.")
         else:
             job.set_status_step(JobExecStep.AWAITING_SCHEDULING)
-            self.save_job(job)
+            try:
+                self.save_job(job)
+            except JobUpdateConflictError as e:
+                return BasicResultIndicator(success=False, reason="Job Changed Concurrently", message=str(e))
             return BasicResultIndicator(success=True, reason="Job Restarted")
 
     def request_scheduling(self, job: RequestedJob) -> Tuple[bool, tuple]:
@@ -607,6 +753,36 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         logging.debug("Failed to start job")
         return False, ()
 
+    def request_scheduling_for_jobs(self, jobs: List[RequestedJob]) -> List[Tuple[bool, tuple]]:
+        """
+        Start several jobs together, so the launcher can create the services for all of them concurrently.
+
+        Jobs not at the ``AWAITING_SCHEDULING`` step are not started.
+
+        Parameters
+        ----------
+        jobs : List[RequestedJob]
+            The jobs to start.
+
+        Returns
+        -------
+        List[Tuple[bool, tuple]]
+            For each job, in order, the result of starting it, as from ::method:`request_scheduling`.
+        """
+        results: List[Tuple[bool, tuple]] = [(False, ())] * len(jobs)
+        ready = [i for i, job in enumerate(jobs) if job.status_step == JobExecStep.AWAITING_SCHEDULING]
+        if len(ready) == 0:
+            return results
+        try:
+            for i, result in zip(ready, self._launcher.start_jobs([jobs[i] for i in ready])):
+                results[i] = result
+        except Exception as e:
+            logging.error("launcher failed to start jobs")
+            logging.exception(e)
+            for i in ready:
+                results[i] = (False, (e,))
+        return results
+
     def request_stop(self, job_id: str) -> BasicResultIndicator:
         """
         Request a running job be stopped by the scheduler.
@@ -632,21 +808,32 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
                                         message=f"{JobExecStep.RUNNING!s} required, but job was {job.status_step!s}.")
         else:
             job.set_status_step(JobExecStep.STOPPING)
-            self.save_job(job)
+            try:
+                self.save_job(job)
+            except JobUpdateConflictError as e:
+                return BasicResultIndicator(success=False, reason="Job Changed Concurrently", message=str(e))
             return BasicResultIndicator(success=True, reason="Job Stopping")
 
     async def manage_job_processing(self):
         """
         Monitor for created jobs and perform steps for job queueing, allocation of resources, and hand-off to scheduler.
+
+        Each iteration sweeps over all active jobs, then waits until some job is saved by something other than the
+        sweep itself (e.g., a newly created job) before starting the next.  If nothing is saved, the next sweep starts
+        after ::attribute:`_SWEEP_FALLBACK_SECONDS` anyway.
         """
         logging.debug("Starting job management async task")
         while True:
             logging.info("Starting next iteration of job manager async task")
 
-            # TODO: do this better
             lock_id = str(uuid.uuid4())
-            while not self.lock_active_jobs(lock_id):
-                await sleep(2)
+            lock_retry_seconds = self._LOCK_RETRY_MINIMUM_SECONDS
+            while not self.lock_active_jobs(lock_id, shard=self._ALLOCATION_LOCK_SHARD):
+                await sleep(lock_retry_seconds)
+                lock_retry_seconds = min(lock_retry_seconds * 2, self._LOCK_RETRY_MAXIMUM_SECONDS)
+
+            # Tag saves made by this sweep so they don't immediately wake the next one
+            self._job_event_source = lock_id
 
             # Get collection of "active" jobs
             active_jobs: List[RequestedJob] = self.get_all_active_jobs()
@@ -666,7 +853,7 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
                 except Exception as e:
                     logging.error(f"Service failed to stop job {job.job_id} due to {e.__class__.__name__} ({e!s}).")
                     job.set_status_step(JobExecStep.FAILED)
-                self.save_job(job)
+                self._save_job_if_unchanged(job)
 
             for job in active_jobs:
                 if job.status_step.is_error:
@@ -674,7 +861,7 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
 
                 if job.status_step.completes_phase:
                     active_jobs.remove(job)
-                    self.save_job(job)
+                    self._save_job_if_unchanged(job)
 
             # TODO: something must transition MODEL_EXEC_RUNNING Jobs to MODEL_EXEC_COMPLETED (probably Monitor class)
             # TODO: something must transition OUTPUT_EXEC_RUNNING Jobs to OUTPUT_EXEC_COMPLETED (probably Monitor class)
@@ -696,32 +883,21 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
 
             # Build prioritized list/queue of allocation eligible Jobs
             priority_queues = self.build_prioritized_pending_allocation_queues(jobs_eligible_for_allocate)
-            high_priority_queue = priority_queues['high']
-
-            # Do this here to get size in case queue is altered below
-            initial_high_priority_queue_size = len(high_priority_queue)
-            low_priority_queue = priority_queues['low']
-            med_priority_queue = priority_queues['medium']
 
-            # Request allocations and get collection of jobs that were allocated, starting first with high priorities
-            allocated_successfully = self._request_allocations_for_queue(high_priority_queue)
-
-            # Only even process others if any and all high priority jobs get allocated
-            if len(allocated_successfully) == initial_high_priority_queue_size:
-                allocated_successfully.extend(self._request_allocations_for_queue(med_priority_queue))
-                allocated_successfully.extend(self._request_allocations_for_queue(low_priority_queue))
+            # Request allocations and get collection of jobs that were allocated
+            allocated_successfully = self._request_prioritized_allocations(priority_queues)
 
             # TODO: have data management service handle the AWAITING_DATA step so it can transition to the AWAITING_SCHEDULING step
 
-            jobs_awaiting_scheduling = (
+            jobs_awaiting_scheduling = [
                 job
                 for job in active_jobs
                 if job.status_step == JobExecStep.AWAITING_SCHEDULING
-            )
+            ]
 
-            # For each Job that is at the AWAITING_SCHEDULING, save updated state and pass to scheduler
-            for job in jobs_awaiting_scheduling:
-                scheduling_result: Tuple[bool, tuple] = self.request_scheduling(job)
+            # For each Job that is at the AWAITING_SCHEDULING, pass to scheduler (all together) and save updated state
+            scheduling_results = self.request_scheduling_for_jobs(jobs_awaiting_scheduling)
+            for job, scheduling_result in zip(jobs_awaiting_scheduling, scheduling_results):
                 if scheduling_result[0]:
                     job.status_step = JobExecStep.SCHEDULED
                 else:
@@ -729,10 +905,12 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
 
                     # TODO: Consider raising an exception instead
                     logging.error(f"The job '{job}' failed")
-                self.save_job(job)
+                self._save_job_if_unchanged(job)
 
-            self.unlock_active_jobs(lock_id)
-            await sleep(5)
+            self._job_event_source = None
+            self.unlock_active_jobs(lock_id, shard=self._ALLOCATION_LOCK_SHARD)
+            await get_running_loop().run_in_executor(None, self.wait_for_job_event, self._SWEEP_FALLBACK_SECONDS,
+                                                     lock_id)
 
     def release_allocations(self, job_ref: Union[str, Job]) -> BasicResultIndicator:
         """
@@ -763,10 +941,16 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         if not job.should_release_resources:
             return BasicResultIndicator(success=False, reason="Not Eligible",
                                         message=f"Can't release resources for job with status {job.status!s}.")
-        elif job.allocations is not None and len(job.allocations) > 0:
-            self._resource_manager.release_resources(job.allocations)
+        allocations = job.allocations
         job.allocations = None
-        self.save_job(job)
+        # Save first, so allocations are not released if the job was changed elsewhere and may still be using them
+        try:
+            self.save_job(job)
+        except JobUpdateConflictError as e:
+            job.allocations = allocations
+            return BasicResultIndicator(success=False, reason="Job Changed Concurrently", message=str(e))
+        if allocations is not None and len(allocations) > 0:
+            self._resource_manager.release_resources(allocations)
         return BasicResultIndicator(success=True, reason="Release Successful")
 
     def request_allocations(self, job: Job, require_awaiting_status: bool = True) -> bool:
@@ -801,6 +985,8 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
             alloc = self._resource_manager.allocate_fill_nodes(job.cpu_count, job.memory_size)
         elif job.allocation_paradigm == AllocationParadigm.ROUND_ROBIN:
             alloc = self._resource_manager.allocate_round_robin(job.cpu_count, job.memory_size)
+        elif job.allocation_paradigm == AllocationParadigm.BEST_FIT:
+            alloc = self._resource_manager.allocate_best_fit(job.cpu_count, job.memory_size)
         else:
             alloc = [None]
         if isinstance(alloc, list) and len(alloc) > 0 and isinstance(alloc[0], ResourceAllocation):
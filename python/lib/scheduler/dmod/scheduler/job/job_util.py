@@ -1,9 +1,24 @@
+import copy
 import json
+import time
 
-from .job import Job, JobStatus, RequestedJob
+from .job import Job, JobExecStep, JobStatus, RequestedJob
 from abc import ABC, abstractmethod
+from dmod.core.exception import DmodRuntimeError
 from dmod.redis import KeyNameHelper, RedisBacked
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+class JobUpdateConflictError(DmodRuntimeError):
+    """
+    Raised when a job cannot be saved because its backing record changed after the job object was loaded.
+
+    This happens when the job was saved elsewhere since it was loaded, or when the save was made under a lock that has
+    since expired and been acquired by someone else.  The job should be reloaded before any retry.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(JobUpdateConflictError, self).__init__(*args, **kwargs)
 
 
 class DefaultJobUtilFactory:
@@ -83,6 +98,29 @@ class JobUtil(ABC):
         """
         pass
 
+    def get_jobs_for_exec_step(self, step: JobExecStep, limit: Optional[int] = None) -> List[Job]:
+        """
+        Get the active jobs currently at the given exec step, highest allocation priority first.
+
+        This default implementation filters the results of ::method:`get_all_active_jobs`; subclasses should override it
+        if they are able to look up jobs by step more directly.
+
+        Parameters
+        ----------
+        step : JobExecStep
+            The exec step of interest.
+        limit : Optional[int]
+            An optional maximum number of jobs to return.
+
+        Returns
+        -------
+        List[Job]
+            The active jobs at the given exec step, ordered from highest to lowest allocation priority.
+        """
+        jobs = sorted((j for j in self.get_all_active_jobs() if j.status_step == step),
+                      key=lambda j: j.allocation_priority, reverse=True)
+        return jobs if limit is None else jobs[:limit]
+
     @abstractmethod
     def get_job_ids(self, only_active: bool = True) -> List[str]:
         """
@@ -101,7 +139,7 @@ class JobUtil(ABC):
         pass
 
     @abstractmethod
-    def lock_active_jobs(self, lock_id: str) -> bool:
+    def lock_active_jobs(self, lock_id: str, shard: Optional[str] = None) -> bool:
         """
         Attempt to acquire an actual or de facto lock for access to ::method:`get_all_active_jobs`.
 
@@ -111,12 +149,17 @@ class JobUtil(ABC):
         A unique identifier must be supplied for the lock.  The recommendation is for this to be a ::class:`UUID` cast
         to a string.  Regardless, implementations should associate the id with the backing mechanism for locking access.
 
+        Locks may be divided into independent shards, such that holding the lock for one shard does not prevent others
+        from acquiring the lock for another.  Without a shard, the lock covers all active jobs.
+
         Implementations may be defined such that locks expire automatically, though this should be clearly documented.
 
         Parameters
         ----------
         lock_id : str
             The string form of some unique identifier for the requested lock.
+        shard : Optional[str]
+            The optional name of the shard to lock.
 
         Returns
         -------
@@ -169,7 +212,7 @@ class JobUtil(ABC):
         pass
 
     @abstractmethod
-    def unlock_active_jobs(self, lock_id: str) -> bool:
+    def unlock_active_jobs(self, lock_id: str, shard: Optional[str] = None) -> bool:
         """
         Release a lock for access to ::method:`get_all_active_jobs` associated with the given id.
 
@@ -187,6 +230,8 @@ class JobUtil(ABC):
         ----------
         lock_id : str
             The string form of some unique identifier for the lock to release.
+        shard : Optional[str]
+            The optional name of the locked shard, which must match that given to ::method:`lock_active_jobs`.
 
         Returns
         -------
@@ -211,6 +256,94 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
     """
 
     _ACTIVE_JOBS_LOCK_KEY = b':lock:active_jobs:'
+    _ACTIVE_JOBS_LOCK_EXPIRE_MS = 30000
+    """ Milliseconds after which a lock on active jobs expires if not released. """
+    _JOB_EVENT_LIMIT = 1000
+    """ The maximum number of job change events kept in Redis while nothing is waiting on them. """
+    _JOB_EVENT_SEPARATOR = '|'
+    _UNCHECKED_REVISION = '*'
+    """ Expected revision value passed to ::attribute:`_SAVE_JOB_SCRIPT` to save a job without a revision check. """
+
+    _STATUS_INDEXES_LUA_FUNCTION = """
+    -- Moves a job between status and exec step indexes; an empty status removes the job from the indexes entirely
+    local function update_status_indexes(indexed_key, job_id, status_base, step_base, separator, status, step, score)
+        local previous = redis.call('HGET', indexed_key, job_id)
+        if previous then
+            local split_at = string.find(previous, '|', 1, true)
+            redis.call('ZREM', status_base .. separator .. string.sub(previous, 1, split_at - 1), job_id)
+            redis.call('ZREM', step_base .. separator .. string.sub(previous, split_at + 1), job_id)
+        end
+        if status == '' then
+            redis.call('HDEL', indexed_key, job_id)
+            return 0
+        end
+        redis.call('ZADD', status_base .. separator .. status, score, job_id)
+        redis.call('ZADD', step_base .. separator .. step, score, job_id)
+        redis.call('HSET', indexed_key, job_id, status .. '|' .. step)
+        return 1
+    end
+    """
+
+    _UPDATE_STATUS_INDEXES_SCRIPT = _STATUS_INDEXES_LUA_FUNCTION + """
+    -- KEYS[1]: hash of job ids to the status and exec step the job is currently indexed under
+    -- ARGV: job id, status index key base, exec step index key base, key separator, status, exec step, score
+    return update_status_indexes(KEYS[1], ARGV[1], ARGV[2], ARGV[3], ARGV[4], ARGV[5], ARGV[6], ARGV[7])
+    """
+    """ Lua script moving a job between status and exec step indexes, atomically with the rest of its save. """
+
+    _SAVE_JOB_SCRIPT = _STATUS_INDEXES_LUA_FUNCTION + """
+    -- KEYS: job record, revisions hash, all jobs set, active jobs set, indexed status hash, events list, fencing hash
+    -- ARGV: job id, serialized job, expected revision, '1' if active, status index key base, exec step index key base,
+    --       key separator, status, exec step, score, event, event limit, then pairs of held lock shards and tokens
+    local job_id = ARGV[1]
+    if ARGV[3] ~= '*' and (redis.call('HGET', KEYS[2], job_id) or '') ~= ARGV[3] then
+        return -1
+    end
+    for i = 13, #ARGV, 2 do
+        if redis.call('HGET', KEYS[7], ARGV[i]) ~= ARGV[i + 1] then
+            return -2
+        end
+    end
+    redis.call('SET', KEYS[1], ARGV[2])
+    local revision = redis.call('HINCRBY', KEYS[2], job_id, 1)
+    redis.call('SADD', KEYS[3], job_id)
+    if ARGV[4] == '1' then
+        redis.call('SADD', KEYS[4], job_id)
+    else
+        redis.call('SREM', KEYS[4], job_id)
+    end
+    update_status_indexes(KEYS[5], job_id, ARGV[5], ARGV[6], ARGV[7], ARGV[8], ARGV[9], ARGV[10])
+    redis.call('LPUSH', KEYS[6], ARGV[11])
+    redis.call('LTRIM', KEYS[6], 0, tonumber(ARGV[12]) - 1)
+    return revision
+    """
+    """ Lua script saving a job, if unchanged since loaded and saved under current locks, returning its new revision. """
+
+    _ACQUIRE_LOCK_SCRIPT = """
+    -- KEYS[1]: lock key, KEYS[2]: hash of lock shards to the fencing token of their latest holder
+    -- ARGV: lock id, shard, expiry in milliseconds
+    if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[3]) then
+        return redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+    elseif redis.call('GET', KEYS[1]) == ARGV[1] then
+        return tonumber(redis.call('HGET', KEYS[2], ARGV[2]))
+    end
+    return 0
+    """
+    """ Lua script acquiring a lock, returning a new fencing token, the current one if already held, or ``0``. """
+
+    _RELEASE_LOCK_SCRIPT = """
+    -- KEYS[1]: lock key
+    -- ARGV: lock id
+    local holder = redis.call('GET', KEYS[1])
+    if not holder then
+        return 1
+    elseif holder == ARGV[1] then
+        redis.call('DEL', KEYS[1])
+        return 1
+    end
+    return 0
+    """
+    """ Lua script releasing a lock if held by the given id, returning ``1`` if the lock is no longer held at all. """
 
     # TODO: look at either deprecating this or applying it appropriately to all managed objects
     @classmethod
@@ -246,6 +379,49 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         """ Key to Redis set containing the job ids (not keys) of active jobs. """
         self._all_jobs_set_key = self.keynamehelper.create_key_name(key_prefix, 'all_jobs')
         """ Key to Redis set containing the job ids (not keys) of all jobs. """
+        self._job_revisions_hash_key = self.keynamehelper.create_key_name(key_prefix, 'job_revisions')
+        """ Key to Redis hash of job ids to a counter incremented every time the job is saved. """
+        self._job_cache: Dict[str, Tuple[str, RequestedJob]] = dict()
+        """ Process-local cache of deserialized active jobs and the revision each was deserialized from. """
+        self._indexed_status_hash_key = self.keynamehelper.create_key_name(key_prefix, 'indexed_job_status')
+        """ Key to Redis hash of job ids to the status and exec step names that each job is indexed under. """
+        self._status_index_key_base = self.keynamehelper.create_key_name(key_prefix, 'jobs_by_status')
+        """ Base for keys of Redis sorted sets of the ids of jobs with a status, scored by allocation priority. """
+        self._step_index_key_base = self.keynamehelper.create_key_name(key_prefix, 'jobs_by_step')
+        """ Base for keys of Redis sorted sets of the ids of jobs at an exec step, scored by allocation priority. """
+        self._update_status_indexes = self.redis.register_script(self._UPDATE_STATUS_INDEXES_SCRIPT)
+        self._status_indexes_checked = False
+        self._job_events_list_key = self.keynamehelper.create_key_name(key_prefix, 'job_events')
+        """ Key to Redis list of events recording which jobs have been saved, most recent first. """
+        self._job_event_source: Optional[str] = None
+        """ Optional identifier attached to the job change events created by this instance. """
+        self._save_job_script = self.redis.register_script(self._SAVE_JOB_SCRIPT)
+        self._loaded_revisions: Dict[str, str] = dict()
+        """ Revision of each job as of when it was last loaded or saved by this instance, empty if it had none. """
+        self._lock_fencing_hash_key = self.keynamehelper.create_key_name(key_prefix, 'lock_fencing_tokens')
+        """ Key to Redis hash of lock shards to the fencing token given to the latest holder of the shard's lock. """
+        self._acquire_lock = self.redis.register_script(self._ACQUIRE_LOCK_SCRIPT)
+        self._release_lock = self.redis.register_script(self._RELEASE_LOCK_SCRIPT)
+        self._held_locks: Dict[str, Tuple[str, int]] = dict()
+        """ The id and fencing token of each lock this instance holds, keyed by shard. """
+
+    def _get_lock_key(self, shard: Optional[str]) -> bytes:
+        """
+        Get the Redis key of the lock for the given shard of active jobs.
+
+        Parameters
+        ----------
+        shard : Optional[str]
+            The name of the shard, or ``None`` for the lock covering all active jobs.
+
+        Returns
+        -------
+        bytes
+            The Redis key of the lock for the given shard.
+        """
+        if shard is None:
+            return self._ACTIVE_JOBS_LOCK_KEY
+        return self._ACTIVE_JOBS_LOCK_KEY + shard.encode() + b':'
 
     def _dev_setup(self):
         self._clean_keys()
@@ -311,8 +487,131 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         List[RequestedJob]
             A list of every job known to this util object that is considered active based on each job's status.
         """
-        return [self.retrieve_job_by_redis_key(self._get_job_key_for_id(job_id)) for job_id in
-                self.redis.smembers(self._active_jobs_set_key)]
+        active_job_ids = list(self.redis.smembers(self._active_jobs_set_key))
+        jobs = self._load_jobs(active_job_ids)
+        # Only keep active jobs cached, so the cache doesn't grow with every job ever seen
+        self._job_cache = {job_id: self._job_cache[job_id] for job_id in active_job_ids if job_id in self._job_cache}
+        return jobs
+
+    def _index_job_status(self, pipeline, job_id: str, job: Optional[RequestedJob]):
+        """
+        Add a command to the given pipeline that moves a job into the status and exec step indexes for its status.
+
+        Parameters
+        ----------
+        pipeline
+            The pipeline (usually a transaction) in which the index update should be made.
+        job_id : str
+            The id of the job.
+        job : Optional[RequestedJob]
+            The job, or ``None`` if the job should be removed from all indexes.
+        """
+        if job is None:
+            status_name, step_name, score = '', '', 0
+        else:
+            status_name, step_name, score = job.status.name, job.status_step.name, job.allocation_priority
+        self._update_status_indexes(keys=[self._indexed_status_hash_key],
+                                    args=[str(job_id), self._status_index_key_base, self._step_index_key_base,
+                                          self.keynamehelper.separator, status_name, step_name, score],
+                                    client=pipeline)
+
+    def _ensure_status_indexes(self):
+        """
+        Make sure that every known job is in the status and exec step indexes.
+
+        Jobs saved before the indexes existed are not in them, so the first index query made by an instance indexes
+        any such jobs.
+        """
+        if self._status_indexes_checked:
+            return
+        unindexed_ids = self.redis.smembers(self._all_jobs_set_key).difference(
+            self.redis.hkeys(self._indexed_status_hash_key))
+        existing_ids = [job_id for job_id in unindexed_ids if self.does_job_exist(job_id)]
+        if len(existing_ids) > 0:
+            pipeline = self.redis.pipeline()
+            try:
+                for job in self._load_jobs(existing_ids):
+                    self._index_job_status(pipeline, job.job_id, job)
+                pipeline.execute()
+            finally:
+                pipeline.reset()
+        self._status_indexes_checked = True
+
+    def _get_indexed_jobs(self, index_key: str, limit: Optional[int], only_active: bool) -> List[RequestedJob]:
+        """
+        Load the jobs in a status or exec step index, highest allocation priority first.
+
+        Parameters
+        ----------
+        index_key : str
+            The key of the index.
+        limit : Optional[int]
+            An optional maximum number of jobs to return.
+        only_active : bool
+            Whether only active jobs should be returned.
+
+        Returns
+        -------
+        List[RequestedJob]
+            The jobs in the index, highest allocation priority first.
+        """
+        self._ensure_status_indexes()
+        job_ids = self.redis.zrevrange(index_key, 0, -1 if limit is None or only_active else limit - 1)
+        jobs = self._load_jobs(job_ids)
+        if only_active:
+            jobs = [job for job in jobs if job.status.is_active]
+        return jobs if limit is None else jobs[:limit]
+
+    def _load_jobs(self, job_ids: List[str]) -> List[RequestedJob]:
+        """
+        Load the jobs with the given ids in bulk.
+
+        The serialized records and revision counters of all the jobs are read in a single round trip.  Only jobs whose
+        revision has changed since they were last loaded by this instance are deserialized; the rest come from a
+        process-local cache.  Copies of cached jobs are returned, so callers may modify them freely.
+
+        Parameters
+        ----------
+        job_ids : List[str]
+            The ids of the jobs to load.
+
+        Returns
+        -------
+        List[RequestedJob]
+            The jobs with the given ids, in the same order.
+
+        Raises
+        -------
+        ValueError
+            If no job record exists for one of the job ids.
+        """
+        if len(job_ids) == 0:
+            return []
+
+        pipeline = self.redis.pipeline()
+        try:
+            pipeline.mget([self._get_job_key_for_id(job_id) for job_id in job_ids])
+            pipeline.hmget(self._job_revisions_hash_key, job_ids)
+            serialized_jobs, revisions = pipeline.execute()
+        finally:
+            pipeline.reset()
+
+        jobs = []
+        for job_id, serialized_job, revision in zip(job_ids, serialized_jobs, revisions):
+            if serialized_job is None:
+                raise ValueError('No job record found for job with key {}'.format(self._get_job_key_for_id(job_id)))
+            cached = self._job_cache.get(job_id)
+            # Records saved before revisions were tracked have no revision, so they can't be safely cached
+            if revision is not None and cached is not None and cached[0] == revision:
+                job = cached[1]
+            else:
+                job = RequestedJob.factory_init_from_deserialized_json(json_obj=json.loads(serialized_job))
+            if revision is not None:
+                self._job_cache[job_id] = (revision, job)
+            self._loaded_revisions[job_id] = revision or ''
+            # Model copy() would turn enum fields into their names, since jobs serialize enums by name
+            jobs.append(copy.deepcopy(job))
+        return jobs
 
     def get_job_ids(self, only_active: bool = True) -> List[str]:
         """
@@ -342,9 +641,32 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         Returns
         -------
         List[Job]
-            A list of the known jobs to this object with the given ::class:`JobStatus`.
+            A list of the known jobs to this object with the given ::class:`JobStatus`, highest allocation priority
+            first.
         """
-        pass
+        return self._get_indexed_jobs(self.keynamehelper.create_derived_key(self._status_index_key_base, status.name),
+                                      limit=None, only_active=False)
+
+    def get_jobs_for_exec_step(self, step: JobExecStep, limit: Optional[int] = None) -> List[RequestedJob]:
+        """
+        Get the active jobs currently at the given exec step, highest allocation priority first.
+
+        Jobs are looked up through an index maintained by ::method:`save_job`, rather than by loading every active job.
+
+        Parameters
+        ----------
+        step : JobExecStep
+            The exec step of interest.
+        limit : Optional[int]
+            An optional maximum number of jobs to return.
+
+        Returns
+        -------
+        List[RequestedJob]
+            The active jobs at the given exec step, ordered from highest to lowest allocation priority.
+        """
+        return self._get_indexed_jobs(self.keynamehelper.create_derived_key(self._step_index_key_base, step.name),
+                                      limit=limit, only_active=True)
 
     def retrieve_job(self, job_id) -> RequestedJob:
         """
@@ -390,13 +712,21 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         ValueError
             If no job record exists with given key.
         """
-        if self._does_redis_key_exist(job_redis_key):
-            serialized_job = json.loads(self.redis.get(job_redis_key))
-            return RequestedJob.factory_init_from_deserialized_json(json_obj=serialized_job)
-        else:
+        job_id = job_redis_key.split(self.keynamehelper.separator)[-1]
+        pipeline = self.redis.pipeline()
+        try:
+            pipeline.get(job_redis_key)
+            pipeline.hget(self._job_revisions_hash_key, job_id)
+            serialized_job, revision = pipeline.execute()
+        finally:
+            pipeline.reset()
+        if serialized_job is None:
             raise ValueError('No job record found for job with key {}'.format(job_redis_key))
+        job = RequestedJob.factory_init_from_deserialized_json(json_obj=json.loads(serialized_job))
+        self._loaded_revisions[job.job_id] = revision or ''
+        return job
 
-    def lock_active_jobs(self, lock_id: str) -> bool:
+    def lock_active_jobs(self, lock_id: str, shard: Optional[str] = None) -> bool:
         """
         Attempt to acquire a de facto lock for access to ::method:`get_all_active_jobs`.
 
@@ -405,18 +735,19 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
 
         A de facto lock is implemented as the existence of a special key-value pair within the backing Redis store.  The
         value is the provided ``lock_id`` when a lock is successfully acquired (i.e., when this is called and the key is
-        not already present).  The key is the class attribute ::attribute:`_ACTIVE_JOBS_LOCK_KEY`.
-
-        The method is implemented to use the ::method:`Redis.set` function's ``nx`` param when saving a pair in an
-        attempt to acquire a new lock, thus ensuring the pair is only set if the key does not already exist.
+        not already present).  The key is the class attribute ::attribute:`_ACTIVE_JOBS_LOCK_KEY`, with the name of the
+        ``shard`` appended if one is given.  Locks expire automatically after ::attribute:`_ACTIVE_JOBS_LOCK_EXPIRE_MS`.
 
-        Additionally, the method also uses the ::method:`Redis.set` function's ``px`` to have locks expire automatically
-        after 30 seconds.
+        Each acquisition also increments a fencing token for the shard, atomically with setting the lock key.  While a
+        lock is held, ::method:`save_job` only succeeds if the token is still the shard's latest, so a holder whose lock
+        expired and was then acquired elsewhere cannot overwrite newer job state.
 
         Parameters
         ----------
         lock_id : str
             The string form of some unique identifier for the requested lock.
+        shard : Optional[str]
+            The optional name of the shard to lock.
 
         Returns
         -------
@@ -428,35 +759,100 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         get_all_active_jobs
         unlock_active_jobs
         """
-        self.redis.set(self._ACTIVE_JOBS_LOCK_KEY, lock_id, nx=True, px=30000)
-        result = self.redis.get(self._ACTIVE_JOBS_LOCK_KEY)
-        return lock_id == result
+        shard_name = '' if shard is None else shard
+        token = self._acquire_lock(keys=[self._get_lock_key(shard), self._lock_fencing_hash_key],
+                                   args=[lock_id, shard_name, self._ACTIVE_JOBS_LOCK_EXPIRE_MS])
+        if not token:
+            return False
+        self._held_locks[shard_name] = (lock_id, int(token))
+        return True
 
     def save_job(self, job: RequestedJob):
         """
         Add or update the given job object's Redis record, also maintaining a Redis set of the ids of 'active' jobs.
 
+        Each save also moves the job into the status and exec step indexes used by ::method:`get_jobs_for_status` and
+        ::method:`get_jobs_for_exec_step`, and increments the job's revision counter, used by
+        ::method:`get_all_active_jobs` to tell which jobs have changed since they were last loaded.
+
+        Saves are optimistic compare-and-set operations, performed atomically by a Lua script.  If this instance has
+        loaded the job, the save is rejected when the job's revision has changed since, i.e., when it was saved elsewhere
+        in the meantime.  Saves made while this instance holds locks from ::method:`lock_active_jobs` are also rejected
+        if any of those locks has since been acquired elsewhere.
+
         Parameters
         ----------
         job : RequestedJob
             The job to be updated or added.
+
+        Raises
+        -------
+        JobUpdateConflictError
+            If the job was changed elsewhere since this instance loaded it, or a held lock has been superseded.
+        """
+        job_id = str(job.job_id)
+        # Record the change so anything waiting on jobs (e.g., the job manager) wakes without polling
+        event = '{}{}{}'.format(self._job_event_source or '', self._JOB_EVENT_SEPARATOR, job_id)
+        args = [job_id, job.to_json(), self._loaded_revisions.get(job_id, self._UNCHECKED_REVISION),
+                '1' if job.status.is_active else '0', self._status_index_key_base, self._step_index_key_base,
+                self.keynamehelper.separator, job.status.name, job.status_step.name, job.allocation_priority, event,
+                self._JOB_EVENT_LIMIT]
+        for shard_name, (_, token) in self._held_locks.items():
+            args.extend([shard_name, token])
+        keys = [self._get_job_key_for_id(job_id), self._job_revisions_hash_key, self._all_jobs_set_key,
+                self._active_jobs_set_key, self._indexed_status_hash_key, self._job_events_list_key,
+                self._lock_fencing_hash_key]
+        revision = self._save_job_script(keys=keys, args=args)
+
+        if revision == -1:
+            raise JobUpdateConflictError("Job {} was changed elsewhere since it was loaded".format(job_id))
+        elif revision == -2:
+            raise JobUpdateConflictError("Job {} not saved, as a lock held when saving has expired".format(job_id))
+        # Inactive jobs are rarely saved again, so stop tracking them to keep this from growing indefinitely
+        if job.status.is_active:
+            self._loaded_revisions[job_id] = str(revision)
+        else:
+            self._loaded_revisions.pop(job_id, None)
+
+    def wait_for_job_event(self, timeout: float, ignored_source: Optional[str] = None) -> bool:
         """
-        pipeline = self.redis.pipeline()
-        try:
-            pipeline.set(name=self._get_job_key_for_id(job.job_id), value=job.to_json())
-            # Always add to our all-jobs set
-            pipeline.sadd(self._all_jobs_set_key, job.job_id)
-            if job.status.is_active:
-                # Add to active set
-                pipeline.sadd(self._active_jobs_set_key, job.job_id)
-            else:
-                # Make sure not in active set
-                pipeline.srem(self._active_jobs_set_key, job.job_id)
-            pipeline.execute()
-        finally:
-            pipeline.reset()
+        Block until some job is saved or the timeout passes.
+
+        Every call to ::method:`save_job` pushes an event onto a Redis list within the same transaction as the job
+        record itself, and this method waits on that list with ``BLPOP``.  Once an event is received, any others still
+        queued are discarded, as callers are expected to re-read job state anyway, which will reflect all of them.
+
+        Events created while ::attribute:`_job_event_source` was set to ``ignored_source`` are skipped, which lets a
+        caller wait on changes made by others without being woken by its own saves.
+
+        Note that this blocks the calling thread; async callers should run it within an executor.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum number of seconds to wait.
+        ignored_source : Optional[str]
+            An optional event source identifier for events that should not end the wait.
 
-    def unlock_active_jobs(self, lock_id: str) -> bool:
+        Returns
+        -------
+        bool
+            ``True`` if a job was saved before the timeout passed, or ``False`` otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            result = self.redis.blpop([self._job_events_list_key], timeout=remaining)
+            if result is None:
+                return False
+            source = result[1].split(self._JOB_EVENT_SEPARATOR, 1)[0]
+            if ignored_source is None or source != ignored_source:
+                self.redis.delete(self._job_events_list_key)
+                return True
+
+    def unlock_active_jobs(self, lock_id: str, shard: Optional[str] = None) -> bool:
         """
         Release a lock, if one exists, for access to ::method:`get_all_active_jobs` associated with the given id.
 
@@ -465,12 +861,14 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         ::method:`lock_active_jobs`.
 
         As with ::method:`lock_active_jobs`, a unique identifier must be supplied for the lock, this time to identify
-        (i.e., confirm) the lock to be released.
+        (i.e., confirm) the lock to be released.  The check and release are performed atomically by a Lua script.
 
         Parameters
         ----------
         lock_id : str
             The string form of some unique identifier for the lock to release.
+        shard : Optional[str]
+            The optional name of the locked shard, which must match that given to ::method:`lock_active_jobs`.
 
         Returns
         -------
@@ -483,11 +881,7 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         get_all_active_jobs
         lock_active_jobs
         """
-        value = self.redis.get(self._ACTIVE_JOBS_LOCK_KEY)
-        if value is None:
-            return True
-        elif lock_id == value:
-            self.redis.delete(self._ACTIVE_JOBS_LOCK_KEY)
-            return True
-        else:
-            return False
+        shard_name = '' if shard is None else shard
+        if shard_name in self._held_locks and self._held_locks[shard_name][0] == lock_id:
+            self._held_locks.pop(shard_name)
+        return self._release_lock(keys=[self._get_lock_key(shard)], args=[lock_id]) == 1
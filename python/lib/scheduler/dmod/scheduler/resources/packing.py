@@ -0,0 +1,171 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from dmod.core.execution import AllocationAssetGrouping
+from .resource import Resource
+
+AllocationPlan = List[Tuple[str, int, int]]
+""" The resource id, number of CPUs, and amount of memory for each allocation needed to fulfill a request. """
+
+
+def get_free_assets(resources: Iterable[Resource]) -> Dict[str, List[int]]:
+    """
+    Get the currently available CPUs and memory of each allocatable resource.
+
+    Parameters
+    ----------
+    resources : Iterable[Resource]
+        The resources to consider.
+
+    Returns
+    -------
+    Dict[str, List[int]]
+        Mapping of the id of each allocatable resource to a two-item list of its available CPUs and memory.
+    """
+    return {r.resource_id: [r.cpu_count, r.memory] for r in resources if r.is_allocatable()}
+
+
+def get_total_assets(resources: Iterable[Resource]) -> Dict[str, List[int]]:
+    """
+    Get the total CPUs and memory of each active, ready resource, regardless of what is currently allocated.
+
+    Parameters
+    ----------
+    resources : Iterable[Resource]
+        The resources to consider.
+
+    Returns
+    -------
+    Dict[str, List[int]]
+        Mapping of the id of each active, ready resource to a two-item list of its total CPUs and memory.
+    """
+    return {r.resource_id: [r.total_cpus, r.total_memory] for r in resources if r.is_active() and r.is_ready()}
+
+
+def _group_assets(shares: AllocationPlan, asset_grouping: AllocationAssetGrouping) -> AllocationPlan:
+    if asset_grouping == AllocationAssetGrouping.BUNDLE:
+        return shares
+    # For SILO, split each share into single-CPU allocations with an even share of the memory
+    plan = []
+    for resource_id, cpus, memory in shares:
+        plan.extend([(resource_id, 1, memory // cpus)] * cpus)
+    return plan
+
+
+def plan_best_fit(assets: Dict[str, List[int]], cpus: int, memory: int,
+                  asset_grouping: AllocationAssetGrouping = AllocationAssetGrouping.BUNDLE,
+                  excluded: Optional[Set[str]] = None) -> Optional[AllocationPlan]:
+    """
+    Plan allocations for a request from the resources where the requested assets fit most tightly.
+
+    If some single resource can fit the whole request, the resource left with the fewest CPUs (and then the least
+    memory) afterward is used.  Otherwise, the request is split across as few resources as possible:  resources with
+    the most available CPUs are used whole until what remains fits on a single resource, which is then again chosen by
+    best fit.  When split, memory is divided in proportion to CPUs.
+
+    When a plan is found, its assets are deducted from ``assets``, so that successive calls can pack several requests
+    against the same state.
+
+    Parameters
+    ----------
+    assets : Dict[str, List[int]]
+        Mapping of resource ids to two-item lists of the CPUs and memory that may be planned from each resource.
+    cpus : int
+        Total number of CPUs requested.
+    memory : int
+        Amount of memory required in bytes.
+    asset_grouping : AllocationAssetGrouping
+        The way compute assets from a single resource are grouped into allocations.
+    excluded : Optional[Set[str]]
+        Optional ids of resources that should not be used.
+
+    Returns
+    -------
+    Optional[AllocationPlan]
+        The planned allocations, or ``None`` if the request cannot currently be fit.
+    """
+    excluded = set() if excluded is None else excluded
+    free = {rid: (c, m) for rid, (c, m) in assets.items() if rid not in excluded and c > 0 and m > 0}
+
+    shares = []
+    cpus_left, mem_left = cpus, memory
+    while cpus_left > 0:
+        fitting = [rid for rid, (c, m) in free.items() if c >= cpus_left and m >= mem_left]
+        if len(fitting) > 0:
+            best = min(fitting, key=lambda rid: (free[rid][0] - cpus_left, free[rid][1] - mem_left, rid))
+            shares.append((best, cpus_left, mem_left))
+            break
+        if len(free) == 0:
+            return None
+        # Nothing fits the rest, so use as much as possible of the largest remaining resource
+        largest = min(free, key=lambda rid: (-free[rid][0], -free[rid][1], rid))
+        free_cpus, free_mem = free.pop(largest)
+        share_cpus = min(free_cpus, cpus_left, free_mem * cpus_left // mem_left)
+        if share_cpus == 0:
+            continue
+        share_mem = mem_left * share_cpus // cpus_left
+        shares.append((largest, share_cpus, share_mem))
+        cpus_left -= share_cpus
+        mem_left -= share_mem
+
+    for resource_id, share_cpus, share_mem in shares:
+        assets[resource_id][0] -= share_cpus
+        assets[resource_id][1] -= share_mem
+    return _group_assets(shares, asset_grouping)
+
+
+def plan_best_fit_decreasing(resources: Iterable[Resource], requests: Sequence[Tuple[int, int]],
+                             asset_grouping: AllocationAssetGrouping = AllocationAssetGrouping.BUNDLE,
+                             backfill: bool = False, tiers: Optional[Sequence[int]] = None) -> List[
+        Optional[AllocationPlan]]:
+    """
+    Plan allocations for a queue of requests together, packing them onto resources by best-fit-decreasing.
+
+    Requests are placed by ::func:`plan_best_fit` against the assets left over by the requests placed before them.
+    Requests in lower-numbered ``tiers`` are placed before any in higher-numbered tiers, and within a tier, larger
+    requests are placed first.
+
+    Once a request cannot be placed, it is considered blocked.  Without ``backfill``, every request after a blocked
+    request is left unplaced, so that smaller requests cannot keep a larger one waiting indefinitely.  With
+    ``backfill``, the blocked request instead reserves the resources it would best fit once they are no longer in use,
+    and later requests may still be placed, but only on unreserved resources.  Requests too large for the resources
+    even when nothing is allocated never block others.
+
+    Parameters
+    ----------
+    resources : Iterable[Resource]
+        A snapshot of the resources to plan allocations from.
+    requests : Sequence[Tuple[int, int]]
+        The number of CPUs and amount of memory of each request.
+    asset_grouping : AllocationAssetGrouping
+        The way compute assets from a single resource are grouped into allocations.
+    backfill : bool
+        Whether requests may be placed behind a blocked request, on resources that it does not need.
+    tiers : Optional[Sequence[int]]
+        Optional priority tier of each request, with ``0`` being the most important; by default, all are in one tier.
+
+    Returns
+    -------
+    List[Optional[AllocationPlan]]
+        The planned allocations for each request, ordered like ``requests``, with ``None`` for requests not placed.
+    """
+    resources = list(resources)
+    free = get_free_assets(resources)
+    unreserved = get_total_assets(resources)
+    reserved = set()
+    plans: List[Optional[AllocationPlan]] = [None] * len(requests)
+    is_blocked = False
+    tiers = [0] * len(requests) if tiers is None else tiers
+
+    # The sort is stable, so equally large requests in a tier keep their given order
+    for i in sorted(range(len(requests)), key=lambda i: (tiers[i], -requests[i][0], -requests[i][1])):
+        cpus, memory = requests[i]
+        if is_blocked and not backfill:
+            break
+        plans[i] = plan_best_fit(free, cpus, memory, asset_grouping, excluded=reserved)
+        if plans[i] is not None:
+            continue
+        reservation = plan_best_fit(unreserved, cpus, memory, excluded=reserved)
+        if reservation is not None:
+            is_blocked = True
+            reserved.update(resource_id for resource_id, _, _ in reservation)
+    return plans
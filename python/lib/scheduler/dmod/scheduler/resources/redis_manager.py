@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os
-from typing import Iterable, List, Union, Optional
+from datetime import datetime, timedelta
+from typing import Iterable, List, Sequence, Tuple, Union, Optional
 from redis import WatchError
 import logging
 
@@ -24,13 +25,81 @@ class RedisManager(ResourceManager, RedisBacked):
     Implementation of a Redis-backed ::class:`ResourceManager` that works internally with modeled objects representing
     the involved data entities (e.g., ::class:`Resource` objects), as opposed to some other raw serial data structures
     like dictionaries.
+
+    Multi-resource allocations and releases are made by Lua scripts run within Redis, which check and update every
+    involved resource at once, in a single round trip, rather than with an optimistic transaction per allocation.
+    """
+
+    _ALLOCATE_SCRIPT = """
+    -- KEYS: the resource key for each allocation, followed by the record key for each allocation
+    -- ARGV: the CPU, memory, and hostname fields of resource hashes, the number of fields in an allocation record, then
+    --       for each allocation its CPUs, its memory, and its record's fields and values
+    -- Returns the hostname for each allocation, 0 if there were insufficient assets, or the key of a missing resource
+    local count = #KEYS / 2
+    local record_size = tonumber(ARGV[4]) * 2
+    local requested = {}
+    local resource_keys = {}
+    for i = 1, count do
+        local offset = 5 + (i - 1) * (2 + record_size)
+        if requested[KEYS[i]] == nil then
+            requested[KEYS[i]] = {0, 0}
+            table.insert(resource_keys, KEYS[i])
+        end
+        requested[KEYS[i]][1] = requested[KEYS[i]][1] + tonumber(ARGV[offset])
+        requested[KEYS[i]][2] = requested[KEYS[i]][2] + tonumber(ARGV[offset + 1])
+    end
+    local hostnames = {}
+    for _, key in ipairs(resource_keys) do
+        local available = redis.call('HMGET', key, ARGV[1], ARGV[2], ARGV[3])
+        if not available[1] then
+            return key
+        end
+        if tonumber(available[1]) < requested[key][1] or tonumber(available[2]) < requested[key][2] then
+            return 0
+        end
+        hostnames[key] = available[3]
+    end
+    for _, key in ipairs(resource_keys) do
+        redis.call('HINCRBY', key, ARGV[1], -requested[key][1])
+        redis.call('HINCRBY', key, ARGV[2], -requested[key][2])
+    end
+    local allocated_hostnames = {}
+    for i = 1, count do
+        local offset = 5 + (i - 1) * (2 + record_size)
+        redis.call('HSET', KEYS[count + i], unpack(ARGV, offset + 2, offset + 1 + record_size))
+        redis.call('HSET', KEYS[count + i], ARGV[3], hostnames[KEYS[i]])
+        allocated_hostnames[i] = hostnames[KEYS[i]]
+    end
+    return allocated_hostnames
+    """
+    """ Lua script checking and making several allocations, from one or more resources, all at once. """
+
+    _RELEASE_SCRIPT = """
+    -- KEYS: the resource key for each allocation, followed by the record key for each allocation
+    -- ARGV: the CPU and memory fields of resource hashes, then for each allocation its CPUs and its memory
+    -- Returns 1, or the key of a missing resource
+    local count = #KEYS / 2
+    for i = 1, count do
+        if redis.call('EXISTS', KEYS[i]) == 0 then
+            return KEYS[i]
+        end
+    end
+    for i = 1, count do
+        redis.call('HINCRBY', KEYS[i], ARGV[1], ARGV[1 + 2 * i])
+        redis.call('HINCRBY', KEYS[i], ARGV[2], ARGV[2 + 2 * i])
+        redis.call('DEL', KEYS[count + i])
+    end
+    return 1
     """
+    """ Lua script releasing several allocations, to one or more resources, all at once. """
 
     def __init__(self, resource_pool: str, redis_host: Optional[str] = None, redis_port: Optional[int] = None,
                  redis_pass: Optional[str] = None, **kwargs):
         super().__init__(redis_host=redis_host, redis_port=redis_port, redis_pass=redis_pass, **kwargs)
         self.resource_pool = resource_pool
         self.resource_pool_key = self.keynamehelper.create_key_name("resource_pool", self.resource_pool)
+        self._allocate_script = self.redis.register_script(self._ALLOCATE_SCRIPT)
+        self._release_script = self.redis.register_script(self._RELEASE_SCRIPT)
 
     def add_resource(self, resource: Resource, resource_pool_key: Optional[str] = None):
         """
@@ -75,9 +144,13 @@ class RedisManager(ResourceManager, RedisBacked):
         List[Resource]
             A list of all managed resource objects.
         """
-        for resource_id in self.get_resource_ids():
-            yield Resource.factory_init_from_dict(
-                self.redis.hgetall(Resource.generate_unique_id(resource_id, self.keynamehelper.separator)))
+        pipeline = self.redis.pipeline(transaction=False)
+        try:
+            for resource_id in self.get_resource_ids():
+                pipeline.hgetall(Resource.generate_unique_id(resource_id, self.keynamehelper.separator))
+            return [Resource.factory_init_from_dict(resource_hash) for resource_hash in pipeline.execute()]
+        finally:
+            pipeline.reset()
 
     def get_resource_ids(self) -> List[Union[str, int]]:
         """
@@ -156,15 +229,69 @@ class RedisManager(ResourceManager, RedisBacked):
                         pipeline.hmset(allocation.unique_id, allocation.to_dict())
                     else:
                         resource.release(cpus_allocated, mem_allocated)
+                    pipeline.execute()
                 except WatchError:
                     logging.debug("Write Conflict allocate_resource: {}. Retrying...".format(resource_key))
                     # Clear and try the transaction again
+                    allocation = None
                     pipeline.reset()
                     continue
-                pipeline.execute()
                 break
         return allocation
 
+    def allocate_resources(self, requests: Sequence[Tuple[str, int, int]]) -> Optional[List[ResourceAllocation]]:
+        """
+        Attempt to allocate exact amounts of assets from one or more resources, either all together or not at all.
+
+        The availability of every involved resource is checked, and all the allocations made, by a single Lua script
+        run atomically within Redis.
+
+        Parameters
+        ----------
+        requests : Sequence[Tuple[str, int, int]]
+            The resource id, number of CPUs, and amount of memory for each allocation, in order.
+
+        Returns
+        -------
+        Optional[List[ResourceAllocation]]
+            The allocations, ordered like ``requests``, or ``None`` if there were insufficient assets for any of them.
+
+        Raises
+        ------
+        ValueError
+            If any request is invalid due to either an unrecognized source resource or requested CPU count of less
+            than 1.
+        """
+        if len(requests) == 0:
+            return []
+        if any(requested_cpus <= 0 for _, requested_cpus, _ in requests):
+            raise ValueError("Invalid < 1 CPU allocation requested")
+
+        # Allocation keys are derived from creation times, so make sure each allocation has a distinct one
+        created = datetime.now()
+        allocations = []
+        for i, (resource_id, requested_cpus, requested_memory) in enumerate(requests):
+            # The hostname is filled in from the resource by the script
+            allocation = ResourceAllocation(resource_id, '', requested_cpus, requested_memory,
+                                            created + timedelta(microseconds=i))
+            allocation.unique_id_separator = self.keynamehelper.separator
+            allocations.append(allocation)
+
+        resource_keys = [Resource.generate_unique_id(a.resource_id, self.keynamehelper.separator) for a in allocations]
+        args = [Resource.get_cpu_hash_key(), Resource.get_memory_hash_key(), Resource.get_hostname_hash_key()]
+        args.append(len(allocations[0].to_dict()))
+        for allocation in allocations:
+            args.extend([allocation.cpu_count, allocation.memory])
+            for field_and_value in allocation.to_dict().items():
+                args.extend(field_and_value)
+
+        result = self._allocate_script(keys=resource_keys + [a.unique_id for a in allocations], args=args)
+        if isinstance(result, str):
+            raise ValueError("Invalid allocation request to unrecognized resource {}".format(result))
+        if not result:
+            return None
+        return [a.copy(update={'hostname': hostname}) for a, hostname in zip(allocations, result)]
+
     def release_resource(self, allocation: ResourceAllocation):
         """
         Release a resource allocated to the manager.
@@ -214,13 +341,32 @@ class RedisManager(ResourceManager, RedisBacked):
         """
         Release any allocated resources to the manager.
 
+        All the allocations are released at once by a single Lua script run atomically within Redis.
+
         Parameters
         ----------
         allocated_resources : Iterable[ResourceAllocation]
             An iterable of resource allocation objects.
+
+        Raises
+        ------
+        RuntimeError
+            If the source resource of any of the allocations does not exist, in which case nothing is released.
         """
-        for allocation in allocated_resources:
-            self.release_resource(allocation)
+        allocations = list(allocated_resources)
+        if len(allocations) == 0:
+            return
+        for allocation in allocations:
+            allocation.unique_id_separator = self.keynamehelper.separator
+        resource_keys = [Resource.generate_unique_id(a.resource_id, self.keynamehelper.separator) for a in allocations]
+        args = [Resource.get_cpu_hash_key(), Resource.get_memory_hash_key()]
+        for allocation in allocations:
+            args.extend([allocation.cpu_count, allocation.memory])
+
+        result = self._release_script(keys=resource_keys + [a.unique_id for a in allocations], args=args)
+        if isinstance(result, str):
+            raise RuntimeError("RedisManager::release_resources -- No key {} exists to release resources to".format(
+                result))
 
     def get_available_cpu_count(self) -> int:
         """
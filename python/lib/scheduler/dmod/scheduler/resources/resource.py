@@ -277,6 +277,30 @@ class Resource(SingleHostProcessingAssetPool):
         """
         return "CPUs"
 
+    @classmethod
+    def get_hostname_hash_key(cls) -> str:
+        """
+        Get the hostname key value for serialized dictionaries/hashes representations of objects.
+
+        Returns
+        -------
+        str
+            The hostname key value for serialized dictionaries/hashes representations.
+        """
+        return "Hostname"
+
+    @classmethod
+    def get_memory_hash_key(cls) -> str:
+        """
+        Get the memory key value for serialized dictionaries/hashes representations of objects.
+
+        Returns
+        -------
+        str
+            The memory key value for serialized dictionaries/hashes representations.
+        """
+        return "MemoryBytes"
+
     @classmethod
     def get_resource_enum_value(cls, enum_type: Union[Type[ResourceAvailability], Type[ResourceState]],
                                 text_val: str) -> Optional[Union[ResourceAvailability, ResourceState]]:
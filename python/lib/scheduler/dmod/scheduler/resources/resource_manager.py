@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 import logging
-from typing import Iterable, Optional, Union, List
+from typing import Callable, Iterable, Optional, Sequence, Tuple, Union, List
 from abc import ABC, abstractmethod
 from dmod.core.execution import AllocationAssetGrouping
+from .packing import plan_best_fit, plan_best_fit_decreasing, get_free_assets
 from .resource import Resource
 from .resource_allocation import ResourceAllocation
 
@@ -19,6 +20,9 @@ class ResourceManager(ABC):
         Abstract class for defining the API for Resource Managing
     """
 
+    _ALLOCATION_PLAN_ATTEMPTS = 3
+    """ Times an allocation plan is recomputed when resources change between planning and allocating it. """
+
     @abstractmethod
     def set_resources(self, resources: Iterable[Resource]):
         """
@@ -98,6 +102,64 @@ class ResourceManager(ABC):
         """
         pass
 
+    def allocate_resources(self, requests: Sequence[Tuple[str, int, int]]) -> Optional[List[ResourceAllocation]]:
+        """
+        Attempt to allocate exact amounts of assets from one or more resources, either all together or not at all.
+
+        This default implementation makes each allocation in turn with ::method:`allocate_resource`, releasing any that
+        were already made if one of them fails.  Implementations that can check and make all the allocations at once
+        should override it.
+
+        Parameters
+        ----------
+        requests : Sequence[Tuple[str, int, int]]
+            The resource id, number of CPUs, and amount of memory for each allocation, in order.
+
+        Returns
+        -------
+        Optional[List[ResourceAllocation]]
+            The allocations, ordered like ``requests``, or ``None`` if there were insufficient assets for any of them.
+        """
+        allocations = []
+        for resource_id, requested_cpus, requested_memory in requests:
+            alloc = self.allocate_resource(resource_id=resource_id, requested_cpus=requested_cpus,
+                                           requested_memory=requested_memory)
+            if alloc is None:
+                if len(allocations) > 0:
+                    self.release_resources(allocations)
+                return None
+            allocations.append(alloc)
+        return allocations
+
+    def _allocate_planned(self, plan: Callable[[], Optional[List[Tuple[str, int, int]]]]) -> List[
+        Optional[ResourceAllocation]]:
+        """
+        Compute an allocation plan from the current state of resources and then allocate it all at once.
+
+        If the resources change between planning and allocating so that the plan can no longer be fulfilled, the plan
+        is computed again from the updated resources, up to ::attribute:`_ALLOCATION_PLAN_ATTEMPTS` times.
+
+        Parameters
+        ----------
+        plan : Callable[[], Optional[List[Tuple[str, int, int]]]]
+            Function returning the resource id, number of CPUs, and amount of memory for each needed allocation, or
+            ``None`` if the current resources cannot satisfy the request.
+
+        Returns
+        -------
+        [ResourceAllocation]
+            List of one or more :class:`ResourceAllocation` if allocation successful, otherwise, [None]
+        """
+        for _ in range(self._ALLOCATION_PLAN_ATTEMPTS):
+            requests = plan()
+            if requests is None:
+                break
+            allocations = self.allocate_resources(requests)
+            if allocations is not None:
+                return allocations
+            logging.debug("Resources changed before planned allocations could be made; planning again")
+        return [None]
+
     @abstractmethod
     def release_resources(self, allocated_resources: Iterable[ResourceAllocation]):
         """
@@ -188,31 +250,16 @@ class ResourceManager(ABC):
             if node.cpu_count < cpus or node.memory < memory:
                 continue
             if asset_grouping == AllocationAssetGrouping.BUNDLE:
-                alloc = self.allocate_resource(node.resource_id, cpus, memory)
-                if alloc is None:
-                    continue
-                else:
-                    return [alloc]
-            allocations = []
-            mem = memory // cpus
-            for _ in range(cpus):
-                alloc = self.allocate_resource(resource_id=node.resource_id, requested_cpus=1, requested_memory=mem)
-                # If any individual allocation failed because assets ran out ...
-                if alloc is None:
-                    logging.warning(f"Unable to allocate {cpus!s} CPUs and {memory!s} memory from selected resource "
-                                    f"{node.hostname}, even though it appeared to have sufficient compute assets")
-                    # ... release anything that was allocated, and then bail on using this resource node
-                    if len(allocations) > 0:
-                        logging.warning(f"Releasing incomplete group of {len(allocations)!s} allocations from "
-                                        f"{node.hostname}")
-                        self.release_resources(allocations)
-                    # And break out of inner loop
-                    break
-                else:
-                    allocations.append(alloc)
-            # If the 1-cpu-per loop worked for each iteration, then we can return (otherwise, next iter in nodes loop)
-            if len(allocations) == cpus:
-                return allocations
+                requests = [(node.resource_id, cpus, memory)]
+            else:
+                requests = [(node.resource_id, 1, memory // cpus)] * cpus
+            allocations = self.allocate_resources(requests)
+            # If the allocations failed because assets ran out, move on to the next resource node
+            if allocations is None:
+                logging.warning(f"Unable to allocate {cpus!s} CPUs and {memory!s} memory from selected resource "
+                                f"{node.hostname}, even though it appeared to have sufficient compute assets")
+                continue
+            return allocations
 
         # If we iterate through all the resource nodes and haven't returned ...
         return [None]
@@ -245,46 +292,99 @@ class ResourceManager(ABC):
         self.validate_allocation_parameters(cpus, memory)
         # TODO: (later) consider another exec config enum that encapsulates the relationship between memory and cpu;
         #  e.g., sometimes memory should be the same amount per CPU, but other times maybe we want more memory on a box
-        allocations = []
-        cpus_left = cpus
-        mem_left = memory
-
-        def request_alloc(node_resource_id, cpus_need, mem_need):
-            requested_cpus = cpus_need if asset_grouping == AllocationAssetGrouping.BUNDLE else 1
-            requested_memory = mem_need if asset_grouping == AllocationAssetGrouping.BUNDLE else mem_need // cpus_need
-            return self.allocate_resource(node_resource_id, requested_cpus, requested_memory, partial=True)
-
-        # TODO: (later) this doesn't do a good job of accounting for the ratio of CPU to memory, though we'd also have
-        #  to assume what the user wanted
-        for res in self.get_useable_resources(): #i in range(len(resources)):
-            while cpus_left >= 0:
-                # Greedily allocate a (potentially) partial allocation on this resource
-                alloc = request_alloc(node_resource_id=res.resource_id, cpus_need=cpus_left, mem_need=mem_left)
-                if alloc is None:
-                    # Did not have sufficient resources or failed allocation
-                    # Break out of inner while loop
-                    break
-                # Disregard and release a partial allocation that provides below a min threshold, then move to next node
-                elif alloc.cpu_count == 0 or alloc.memory == 0:
-                    self.release_resources([alloc])
-                    # break out of inner while loop
-                    break
-                # Otherwise, append this allocation, update our outstanding quantities, and then allocate again
-                else:
-                    assert cpus >= alloc.cpu_count, f"Expected at most {cpus_left!s} cpus, got {alloc.cpu_count}"
-                    allocations.append(alloc)
-                    cpus_left -= alloc.cpu_count
-                    mem_left -= alloc.memory
-            # Here (back in outer loop), if we have all needed allocations, return (otherwise continue to next resource)
-            # TODO: (later) account for whether we actually got enough memory better here
-            assert cpus_left >= 0, f"Remaining CPUs to allocated should not be a negative number (was {cpus_left!s})"
-            if cpus_left == 0:
-                return allocations
 
-        # If there weren't enough resources and assets, roll back and release the acquired allocations
-        # TODO: (later) similarly, account for whether we actually got enough memory better here
-        self.release_resources(allocations)
-        return [None]
+        def plan_fill_nodes() -> Optional[List[Tuple[str, int, int]]]:
+            requests = []
+            cpus_left = cpus
+            mem_left = memory
+            # TODO: (later) this doesn't do a good job of accounting for the ratio of CPU to memory, though we'd also
+            #  have to assume what the user wanted
+            for res in self.get_useable_resources():
+                # Work against a copy, so planning doesn't change the resource itself
+                node = res.copy()
+                while cpus_left > 0:
+                    # Greedily plan a (potentially) partial allocation on this resource
+                    requested_cpus = cpus_left if asset_grouping == AllocationAssetGrouping.BUNDLE else 1
+                    requested_memory = mem_left if asset_grouping == AllocationAssetGrouping.BUNDLE else \
+                        mem_left // cpus_left
+                    cpus_allocated, mem_allocated, _ = node.allocate(requested_cpus, requested_memory)
+                    # Disregard a partial allocation that provides below a min threshold, then move to next node
+                    if cpus_allocated == 0 or mem_allocated == 0:
+                        break
+                    requests.append((res.resource_id, cpus_allocated, mem_allocated))
+                    cpus_left -= cpus_allocated
+                    mem_left -= mem_allocated
+                # If we have all needed allocations, we're done (otherwise continue to next resource)
+                # TODO: (later) account for whether we actually got enough memory better here
+                if cpus_left == 0:
+                    return requests
+            # There weren't enough resources and assets
+            return None
+
+        return self._allocate_planned(plan_fill_nodes)
+
+    def allocate_best_fit(self, cpus: int, memory: int,
+                          asset_grouping: AllocationAssetGrouping = AllocationAssetGrouping.BUNDLE) -> List[
+        Optional[ResourceAllocation]]:
+        """
+        Generate allocations of the requested assets from the resources they fit most tightly, per ``BEST_FIT``.
+
+        When some single :class:`Resource` node can fit the request, allocations come from the node that would be left
+        with the fewest free assets, keeping larger nodes open for larger requests.  Otherwise, assets are taken from
+        as few nodes as possible.  See :func:`plan_best_fit`.
+
+        For a ``BUNDLED`` :class:`AllocationAssetGrouping`, a single allocation is returned per :class:`Resource` node
+        containing all the assets allocated from that node. For ``SILO``, several per-node allocations are returned,
+        each with a single CPU and a roughly even share of the total requested memory.
+
+        Parameters
+        ----------
+            cpus: Total number of CPUs requested
+            memory: Amount of memory required in bytes
+            asset_grouping: The way compute assets from a single node are grouped into allocations
+
+        Returns
+        -------
+        [ResourceAllocation]
+            List of one or more :class:`ResourceAllocation` if allocation successful, otherwise, [None]
+        """
+        self.validate_allocation_parameters(cpus, memory)
+        return self._allocate_planned(
+            lambda: plan_best_fit(get_free_assets(self.get_resources()), cpus, memory, asset_grouping))
+
+    def allocate_best_fit_decreasing(self, requests: Sequence[Tuple[int, int]],
+                                     asset_grouping: AllocationAssetGrouping = AllocationAssetGrouping.BUNDLE,
+                                     backfill: bool = False, tiers: Optional[Sequence[int]] = None) -> List[
+        List[Optional[ResourceAllocation]]]:
+        """
+        Generate allocations for a whole queue of requests at once, packing them by best-fit-decreasing.
+
+        All requests are planned together against one snapshot of the resources with :func:`plan_best_fit_decreasing`,
+        which places larger requests first (within each priority tier) and, optionally, backfills smaller requests
+        behind a blocked one.  The allocations for each planned request are then made, all at once per request.
+
+        Parameters
+        ----------
+            requests: The total number of CPUs and amount of memory (in bytes) of each request
+            asset_grouping: The way compute assets from a single node are grouped into allocations
+            backfill: Whether requests may be allocated behind a blocked request, on nodes it does not need
+            tiers: Optional priority tier of each request, with ``0`` being the most important
+
+        Returns
+        -------
+        [[ResourceAllocation]]
+            For each request, in order, a list of one or more :class:`ResourceAllocation` if allocation was successful,
+            otherwise, [None]
+        """
+        for cpus, memory in requests:
+            self.validate_allocation_parameters(cpus, memory)
+        plans = plan_best_fit_decreasing(self.get_resources(), requests, asset_grouping, backfill, tiers)
+        results = []
+        for plan in plans:
+            # Resources could change after planning, in which case the request just waits for the next attempt
+            allocations = None if plan is None else self.allocate_resources(plan)
+            results.append([None] if allocations is None else allocations)
+        return results
 
     def allocate_round_robin(self, cpus: int, memory: int,
                              asset_grouping: AllocationAssetGrouping = AllocationAssetGrouping.BUNDLE) -> List[
@@ -319,48 +419,46 @@ class ResourceManager(ABC):
         """
         #TODO consider scaling memory per cpu
         self.validate_allocation_parameters(cpus, memory)
-        # Get all active and ready nodes, regardless of whether they are "allocateable" (i.e., not full)
-        resource_nodes = {r.resource_id: r for r in self.get_resources() if r.is_active() and r.is_ready()}
-
-        # Calculate in advance the exact amounts of CPUs and memory per node for the necessary balance
-        # This is slightly different from simply an even share due to discrete amounts and remainders
-        cpus_per_node, memory_per_node = dict(), dict()
-        num_nodes = min(cpus, len(resource_nodes))
-        cpu_share, cpu_remainder = divmod(cpus, num_nodes)
-        mem_share, mem_remainder = divmod(memory, num_nodes)
-
-        for node_id, node in resource_nodes.items():
-            # Early stopping for cases when we have more physical nodes than the requested number of CPUs
-            if sum(cpus_per_node.values()) == cpus:
-                break
-            # Each node must have at least per-node shares, UNLESS cpus < number of nodes (then not all nodes are used)
-            if cpus < len(resource_nodes) and (node.cpu_count < cpu_share or node.memory < mem_share):
-                continue
-            elif node.cpu_count < cpu_share or node.memory < mem_share:
-                return [None]
-            cpus_per_node[node_id] = cpu_share
-            memory_per_node[node_id] = mem_share
-            # But we also need to try to pick up a share of the remainders if we can
-            if node.cpu_count > cpu_share and cpu_remainder > 0:
-                cpus_per_node[node_id] += 1
-                cpu_remainder -= 1
-            if node.memory > mem_share and mem_remainder > 0:
-                memory_per_node[node_id] += 1
-                mem_remainder -= 1
-
-        # Sanity check that everything adds up to the required amounts
-        if sum(cpus_per_node.values()) != cpus or sum(memory_per_node.values()) != memory:
-            return [None]
 
-        allocations = []
-        for node_id in cpus_per_node.keys():
-            alloc_count = 1 if asset_grouping == AllocationAssetGrouping.BUNDLE else cpus_per_node[node_id]
-            for i in range(alloc_count):
-                alloc = self.allocate_resource(resource_id=node_id,
-                                               requested_cpus=cpus_per_node[node_id] // alloc_count,
-                                               requested_memory=memory_per_node[node_id] // alloc_count)
-                if not isinstance(alloc, ResourceAllocation):
-                    self.release_resources(allocations)
-                    return [None]
-                allocations.append(alloc)
-        return allocations
+        def plan_round_robin() -> Optional[List[Tuple[str, int, int]]]:
+            # Get all active and ready nodes, regardless of whether they are "allocateable" (i.e., not full)
+            resource_nodes = {r.resource_id: r for r in self.get_resources() if r.is_active() and r.is_ready()}
+
+            # Calculate in advance the exact amounts of CPUs and memory per node for the necessary balance
+            # This is slightly different from simply an even share due to discrete amounts and remainders
+            cpus_per_node, memory_per_node = dict(), dict()
+            num_nodes = min(cpus, len(resource_nodes))
+            cpu_share, cpu_remainder = divmod(cpus, num_nodes)
+            mem_share, mem_remainder = divmod(memory, num_nodes)
+
+            for node_id, node in resource_nodes.items():
+                # Early stopping for cases when we have more physical nodes than the requested number of CPUs
+                if sum(cpus_per_node.values()) == cpus:
+                    break
+                # Each node must have at least per-node shares, UNLESS cpus < number of nodes (then not all nodes used)
+                if cpus < len(resource_nodes) and (node.cpu_count < cpu_share or node.memory < mem_share):
+                    continue
+                elif node.cpu_count < cpu_share or node.memory < mem_share:
+                    return None
+                cpus_per_node[node_id] = cpu_share
+                memory_per_node[node_id] = mem_share
+                # But we also need to try to pick up a share of the remainders if we can
+                if node.cpu_count > cpu_share and cpu_remainder > 0:
+                    cpus_per_node[node_id] += 1
+                    cpu_remainder -= 1
+                if node.memory > mem_share and mem_remainder > 0:
+                    memory_per_node[node_id] += 1
+                    mem_remainder -= 1
+
+            # Sanity check that everything adds up to the required amounts
+            if sum(cpus_per_node.values()) != cpus or sum(memory_per_node.values()) != memory:
+                return None
+
+            requests = []
+            for node_id in cpus_per_node.keys():
+                alloc_count = 1 if asset_grouping == AllocationAssetGrouping.BUNDLE else cpus_per_node[node_id]
+                requests.extend([(node_id, cpus_per_node[node_id] // alloc_count,
+                                  memory_per_node[node_id] // alloc_count)] * alloc_count)
+            return requests
+
+        return self._allocate_planned(plan_round_robin)
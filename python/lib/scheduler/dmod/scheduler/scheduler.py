@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from requests.exceptions import ReadTimeout
 from dmod.communication import AbstractNgenRequest, MessageEventType, NGENRequest, NWMRequest, NgenCalibrationRequest
 from dmod.core.exception import DmodRuntimeError
 from dmod.core.meta_data import DataCategory, DataFormat
 from os import getenv
+from pathlib import Path
 import docker
 from docker.types import SecretReference
 from docker.models.services import Service as DockerService
@@ -142,7 +145,14 @@ class Launcher(SimpleDockerUtil):
     """
     TODO: Add class docstring for Launcher
     """
-    def __init__(self, images_and_domains_yaml, docker_client=None, api_client=None, **kwargs):
+    JOB_ID_LABEL = "dmod.job.id"
+    """ The label for the id of the job that a Docker service was started for. """
+
+    _OBJECT_STORE_SECRET_NAMES = ['object_store_exec_user_name', 'object_store_exec_user_passwd']
+    """ Names of the Docker secrets for object store data access that job services are given. """
+
+    def __init__(self, images_and_domains_yaml, docker_client=None, api_client=None, max_launch_workers: int = 8,
+                 **kwargs):
         """ FIXME
         Parameters
         ----------
@@ -150,9 +160,16 @@ class Launcher(SimpleDockerUtil):
             Docker API client
         api_client
             Docker Low-level API client
+        max_launch_workers
+            The most Docker services that may be created at once; should not exceed the client's connection pool size
         """
         super(Launcher, self).__init__(docker_client, api_client, **kwargs)
         self._images_and_domains_yaml = images_and_domains_yaml
+        self._images_and_domains: Optional[Tuple[float, dict]] = None
+        """ The modification time and contents of the images and domains YAML file, when last loaded. """
+        self._secret_references: Optional[List[SecretReference]] = None
+        """ The references to the object store secrets for services, until a service creation fails. """
+        self._launch_pool = ThreadPoolExecutor(max_workers=max_launch_workers, thread_name_prefix='launcher')
 
         #FIXME make networks, stack name __init__ params
 
@@ -207,6 +224,9 @@ class Launcher(SimpleDockerUtil):
             additional_kwargs['user'] = serviceParams.user
         if serviceParams.capabilities_to_add is not None and len(serviceParams.capabilities_to_add) > 0:
             additional_kwargs['cap_add'] = serviceParams.capabilities_to_add
+        # Containers get the job id label too, so their events can be tied back to the job
+        if self.JOB_ID_LABEL in serv_labels:
+            additional_kwargs['container_labels'] = {self.JOB_ID_LABEL: serv_labels[self.JOB_ID_LABEL]}
 
         healthcheck = docker.types.Healthcheck(test=["CMD-SHELL", 'echo Hello'],
                                                interval=1000000 * 10000 * 1,
@@ -233,12 +253,14 @@ class Launcher(SimpleDockerUtil):
             print("Connection to docker API timed out")
             raise
 
-        self.log_service(serv_name.split("_")[0], service.id)
+        self.log_service(serv_name.split("_")[0], service.id, docker_client=client,
+                         api_client=self.api_client or client.api)
 
         return service
 
     @staticmethod
-    def log_service(base_name: str, id: str):
+    def log_service(base_name: str, id: str, docker_client: Optional[docker.DockerClient] = None,
+                    api_client: Optional[docker.APIClient] = None):
         """
         Log information about service identified by base_name and id
 
@@ -248,10 +270,15 @@ class Launcher(SimpleDockerUtil):
             str containing the basename of the service, i.e. 'nwm-2.0'
         id
             identifier for the specific service, contatenated to base_name
+        docker_client
+            Optional Docker client to use, rather than creating (and then closing) a new one
+        api_client
+            Optional Docker low-level API client to use, rather than creating (and then closing) a new one
         """
-        #TODO how important is it to inspect/log from the same api/client as launcher is using?
-        api_client = docker.APIClient()
-        client = docker.from_env()
+        is_api_client_owned = api_client is None
+        is_client_owned = docker_client is None
+        api_client = docker.APIClient() if is_api_client_owned else api_client
+        client = docker.from_env() if is_client_owned else docker_client
 
         from inspect import stack
 
@@ -267,7 +294,7 @@ class Launcher(SimpleDockerUtil):
         logging.info("\n")
 
         # test out some service functions
-        serv_list = client.services.list(filters={'name':base_name})[0]
+        serv_list = client.services.list(filters={'id': id})[0]
         service_id = serv_list.id
         logging.info("service_id: {}".format(service_id))
 
@@ -276,8 +303,10 @@ class Launcher(SimpleDockerUtil):
         
         # pp(service_attrs)
         logging.info("\n")
-        api_client.close()
-        client.close()
+        if is_api_client_owned:
+            api_client.close()
+        if is_client_owned:
+            client.close()
 
     @staticmethod
     def build_host_list(job: 'Job') -> str:
@@ -541,6 +570,21 @@ class Launcher(SimpleDockerUtil):
             msg = "Unable to determine correct scheduler image for job {} with request of {} type"
             raise DmodRuntimeError(msg.format(job.job_id, job.model_request.__class__.__name__))
 
+    def _load_images_and_domains(self) -> dict:
+        """
+        Load the images and domains YAML file, only reading it again once it has been modified.
+
+        Returns
+        -------
+        dict
+            The contents of the images and domains YAML file.
+        """
+        modified = Path(self._images_and_domains_yaml).stat().st_mtime
+        if self._images_and_domains is None or self._images_and_domains[0] != modified:
+            with open(self._images_and_domains_yaml) as fn:
+                self._images_and_domains = (modified, yaml.safe_load(fn))
+        return self._images_and_domains[1]
+
     # TODO: look at removing once a better way of handling image select is finished
     def load_image_and_mounts(self, name: str, version: str, domain: str) -> tuple:
         """ TODO make this a static method, pass in image_and_domain_list file path
@@ -568,8 +612,7 @@ class Launcher(SimpleDockerUtil):
         """
 
         # Load the yaml file into dictionary
-        with open(self._images_and_domains_yaml) as fn:
-            yml_obj = yaml.safe_load(fn)
+        yml_obj = self._load_images_and_domains()
 
         try:
             model = yml_obj[name]
@@ -646,14 +689,36 @@ class Launcher(SimpleDockerUtil):
         for service in (self.docker_client.services.get(srv_name) for srv_name in job.allocation_service_names):
             service.remove()
 
-    def start_job(self, job: 'Job') -> Tuple[bool, tuple]:
+    def _get_secret_references(self) -> List[SecretReference]:
         """
-        Launch the necessary services to execute the given job, according to its obtained allocations.
+        Get the references to the Docker secrets for object store data access that job services are given.
 
-        Services/containers will have names corresponding to the values from ::attribute:`Job.allocation_service_names`.
-        As a result, they can later be mapped back to the associated job.
+        The references are looked up once and then reused, until they are discarded with
+        ::method:`_discard_secret_references` after a service could not be created (e.g., because a secret was
+        recreated with a new id).
+
+        Returns
+        -------
+        List[SecretReference]
+            The references to the secrets services need.
+        """
+        if self._secret_references is None:
+            # TODO: (later) might need to expand to use different users for different situations (create JobType?)
+            # Note that client gets docker.models.secrets.Secret objects, but service creation requires
+            #   docker.types.SecretReference objects, so have to do a little manipulation
+            self._secret_references = [self.get_secret_reference(name) for name in self._OBJECT_STORE_SECRET_NAMES]
+        return self._secret_references
 
-        Services themselves are created via a call to ::method:`create_service`.
+    def _discard_secret_references(self):
+        """
+        Discard any cached secret references, so they are looked up again the next time services are prepared.
+        """
+        self._secret_references = None
+
+    def _prepare_job_services(self, job: 'Job') -> Tuple[Optional[tuple], List[Tuple[DockerServiceParameters,
+                                                                                     List[str]]]]:
+        """
+        Prepare the parameters and command args of the Docker services to create for a job's allocations.
 
         Parameters
         ----------
@@ -662,15 +727,9 @@ class Launcher(SimpleDockerUtil):
 
         Returns
         -------
-        Tuple[bool, tuple]
-            A tuple with the first item being an indication of whether all necessary services were started successfully,
-            and the second item being a nested tuple of the service objects returned by ::method:`create_service` as
-            they were created.
-
-        See Also
-        -------
-        ::method:`create_service`
-        ::attribute:`Job.allocation_service_names`
+        Tuple[Optional[tuple], List[Tuple[DockerServiceParameters, List[str]]]]
+            Details of why the job cannot be started (in the form of the second item returned by ::method:`start_job`),
+            or ``None`` if it can, and the service parameters and command args for each of its allocations.
         """
         model = job.model_request.get_model_name()
 
@@ -685,31 +744,26 @@ class Launcher(SimpleDockerUtil):
             node_descriptions = ", ".join(f"Node {node.node_id}: {node.cpu_count} CPUs" for node in underallocated_nodes)
             message = f"Cannot start job {job}; all allocations must have at least one core but the following didn't: {node_descriptions}"
             logging.error(message)
-            return False, (message,)
+            return (message,), []
 
         image_tag = self.determine_image_for_job(job)
-
         #TODO better align labels/defaults with serviceparam class
         #FIXME if the stack.namespace needs to align with the stack name, this isn't correct
-        labels = {"com.docker.stack.image": image_tag, "com.docker.stack.namespace": model}
+        labels = {"com.docker.stack.image": image_tag, "com.docker.stack.namespace": model,
+                  self.JOB_ID_LABEL: str(job.job_id)}
+        secrets = self._get_secret_references()
 
         #This seems to be more of a dev check than anything required
         #self.write_hostfile(basename, cpusList)
         num_allocations = len(job.allocations) if job.allocations is not None else 0
         if num_allocations == 0:
             logging.error("Attempting to start job {} that has no allocations".format(str(job.job_id)))
-            return False, tuple()
-
-        service_per_allocation = []
+            return tuple(), []
 
-        # TODO: might want to adjust this in the future to be lazy in case not always needed
-        # Get the Docker Secrets for object store data access
-        # TODO (later): might need to expand to use different users for different situations (create JobType?)
-        # Note that client gets docker.models.secrets.Secret objects, but service creation requires
-        #   docker.types.SecretReference objects, so have to do a little manipulation
-        secrets = [self.get_secret_reference(secret_name) for secret_name in
-                   ['object_store_exec_user_name', 'object_store_exec_user_passwd']]
+        # Introduce a way to inject data access directly via env config, to potentially bypass things for testing
+        bind_mount_from_env = getenv('DMOD_JOB_WORKER_HOST_MOUNT')
 
+        services = []
         for alloc_index in range(num_allocations):
             alloc = job.allocations[alloc_index]
             constraints_str = f"node.hostname == {alloc.hostname}"
@@ -719,39 +773,149 @@ class Launcher(SimpleDockerUtil):
             mounts = [pattern.format(r.fulfilled_access_at, r.category.name.lower(), r.fulfilled_by) for r in
                       job.worker_data_requirements[alloc_index] if r.fulfilled_access_at is not None]
             #mounts.append('/local/model_as_a_service/docker_host_volumes/forcing_local:/dmod/datasets/forcing_local:rw')
-            # Introduce a way to inject data access directly via env config, to potentially bypass things for testing
-            bind_mount_from_env = getenv('DMOD_JOB_WORKER_HOST_MOUNT')
             if bind_mount_from_env is not None:
                 mounts.append(f'{bind_mount_from_env}:/dmod/datasets/from_env:rw')
 
             logging.info(f"Hostname: {alloc.hostname}")
 
             #FIXME important that all label values are strings, otherwise docker service create hangs
-            labels_tmp = {"Hostname": alloc.hostname, "cpus_alloc": str(alloc.cpu_count)}
-            labels.update(labels_tmp)
+            # Each service gets its own labels, since they may be created concurrently
+            service_labels = dict(labels)
+            service_labels.update({"Hostname": alloc.hostname, "cpus_alloc": str(alloc.cpu_count)})
 
             serv_name = job.allocation_service_names[alloc_index]
 
             # Create the docker service
-            service_params = DockerServiceParameters(image_tag=image_tag, constraints=constraints, labels=labels,
+            service_params = DockerServiceParameters(image_tag=image_tag, constraints=constraints,
+                                                     labels=service_labels,
                                                      hostname=job.allocation_service_names[alloc_index],
                                                      serv_name=serv_name, mounts=mounts, secrets=secrets)
-            
+
             if model == 'ngen':
                 # For ngen jobs (at least for the moment), the container initially needs root as the user for sshd
                 service_params.user = 'root'
                 # Also adding this for ngen
                 service_params.capabilities_to_add = ['SYS_ADMIN']
 
-            #TODO check for proper service creation, return False if doesn't work
-            service = self.create_service(serviceParams=service_params, idx=alloc_index,
-                                          docker_cmd_args=self._generate_docker_cmd_args(job, alloc_index))
-            
-            service_per_allocation.append(service)
+            services.append((service_params, self._generate_docker_cmd_args(job, alloc_index)))
+        return None, services
+
+    def _submit_services(self, services: List[Tuple[DockerServiceParameters, List[str]]]) -> List[Future]:
+        """
+        Submit the creation of Docker services to the launch worker pool.
+
+        Parameters
+        ----------
+        services : List[Tuple[DockerServiceParameters, List[str]]]
+            The parameters and command args of each service, as from ::method:`_prepare_job_services`.
+
+        Returns
+        -------
+        List[Future]
+            Futures for the services returned by ::method:`create_service`, in the same order.
+        """
+        return [self._launch_pool.submit(self.create_service, serviceParams=params, idx=i, docker_cmd_args=args)
+                for i, (params, args) in enumerate(services)]
+
+    def start_job(self, job: 'Job') -> Tuple[bool, tuple]:
+        """
+        Launch the necessary services to execute the given job, according to its obtained allocations.
+
+        Services/containers will have names corresponding to the values from ::attribute:`Job.allocation_service_names`.
+        As a result, they can later be mapped back to the associated job.
+
+        Services themselves are created via calls to ::method:`create_service`, made concurrently by the launch worker
+        pool.  Durations of the preparation and service creation stages are logged.
+
+        Parameters
+        ----------
+        job: Job
+            The job needing to be executed within the runtime environment.
+
+        Returns
+        -------
+        Tuple[bool, tuple]
+            A tuple with the first item being an indication of whether all necessary services were started successfully,
+            and the second item being a nested tuple of the service objects returned by ::method:`create_service` as
+            they were created.
+
+        See Also
+        -------
+        ::method:`create_service`
+        ::method:`start_jobs`
+        ::attribute:`Job.allocation_service_names`
+        """
+        start = time.perf_counter()
+        failure, services = self._prepare_job_services(job)
+        if failure is not None:
+            return False, failure
+        prepared = time.perf_counter()
+        try:
+            service_per_allocation = [future.result() for future in self._submit_services(services)]
+        except Exception:
+            # In case this was because of stale secret references
+            self._discard_secret_references()
+            raise
+        finished = time.perf_counter()
+        logging.info("Launched {} services for job {}: prepare {:.3f}s, create {:.3f}s".format(
+            len(service_per_allocation), job.job_id, prepared - start, finished - prepared))
 
         logging.info("\n")
         return True, tuple(service_per_allocation)
 
+    def start_jobs(self, jobs: List['Job']) -> List[Tuple[bool, tuple]]:
+        """
+        Launch the necessary services to execute each of several independent jobs, creating services concurrently.
+
+        All jobs are first prepared, and then the services for all of them are created through the launch worker pool,
+        so a burst of jobs takes about as long as the slowest service creations rather than the sum of all of them.
+        Unlike ::method:`start_job`, errors starting a job do not raise, but are instead returned in the second item of
+        that job's result.  Durations of the preparation and service creation stages are logged for the whole batch.
+
+        Parameters
+        ----------
+        jobs: List[Job]
+            The jobs needing to be executed within the runtime environment.
+
+        Returns
+        -------
+        List[Tuple[bool, tuple]]
+            For each job, in order, a tuple like that returned by ::method:`start_job`, except that the second item
+            holds the raised exception when one occurs.
+        """
+        start = time.perf_counter()
+        results: List[Optional[Tuple[bool, tuple]]] = [None] * len(jobs)
+        futures_by_job: Dict[int, List[Future]] = {}
+        for i, job in enumerate(jobs):
+            try:
+                failure, services = self._prepare_job_services(job)
+            except Exception as e:
+                logging.error("Launcher failed to prepare job {}".format(job.job_id))
+                logging.exception(e)
+                results[i] = (False, (e,))
+                continue
+            if failure is not None:
+                results[i] = (False, failure)
+            else:
+                futures_by_job[i] = self._submit_services(services)
+        prepared = time.perf_counter()
+
+        service_count = 0
+        for i, futures in futures_by_job.items():
+            try:
+                results[i] = (True, tuple(future.result() for future in futures))
+                service_count += len(futures)
+            except Exception as e:
+                logging.error("Launcher failed to start job {}".format(jobs[i].job_id))
+                logging.exception(e)
+                results[i] = (False, (e,))
+                # In case this was because of stale secret references
+                self._discard_secret_references()
+        finished = time.perf_counter()
+        logging.info("Launched {} services for {} of {} jobs: prepare {:.3f}s, create {:.3f}s".format(
+            service_count, sum(1 for r in results if r[0]), len(jobs), prepared - start, finished - prepared))
+        return results
+
     def stop_job(self, job: 'Job'):
         """
         Stop and remove services for a job; convenience alias for :py:meth:`remove_job_services`.
@@ -0,0 +1,142 @@
+"""
+Benchmark of concurrent resource allocation against a Redis instance.
+
+Several client threads repeatedly allocate and then release assets from the same small pool of resources, first using
+the per-allocation optimistic transactions of ::method:`ResourceManager.allocate_resources`, then using the scripted,
+all-at-once allocation of ::class:`RedisManager`.  Allocation latency, throughput, and failed allocations are reported
+for each, and the pool is checked to have all its assets back afterward.
+
+E.g.:
+    python -m dmod.scheduler.utils.allocation_benchmark --host localhost --port 6379 --clients 16 --paradigm fill-nodes
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Tuple
+from uuid import uuid4
+
+from dmod.core.execution import AllocationAssetGrouping, AllocationParadigm
+from ..resources import RedisManager, Resource, ResourceAllocation, ResourceManager
+
+
+class OptimisticRedisManager(RedisManager):
+    """
+    ::class:`RedisManager` that allocates and releases one resource at a time with optimistic transactions.
+    """
+
+    def allocate_resources(self, requests):
+        return ResourceManager.allocate_resources(self, requests)
+
+    def release_resources(self, allocated_resources: Iterable[ResourceAllocation]):
+        for allocation in allocated_resources:
+            self.release_resource(allocation)
+
+
+def _allocate(manager: RedisManager, paradigm: AllocationParadigm, cpus: int, memory: int,
+              asset_grouping: AllocationAssetGrouping) -> List[ResourceAllocation]:
+    if paradigm == AllocationParadigm.SINGLE_NODE:
+        return manager.allocate_single_node(cpus, memory, asset_grouping)
+    elif paradigm == AllocationParadigm.FILL_NODES:
+        return manager.allocate_fill_nodes(cpus, memory, asset_grouping)
+    else:
+        return manager.allocate_round_robin(cpus, memory, asset_grouping)
+
+
+def run_client(manager: RedisManager, args: argparse.Namespace) -> Tuple[List[float], int]:
+    """
+    Repeatedly allocate and release assets, timing each allocation.
+
+    Parameters
+    ----------
+    manager : RedisManager
+        The manager to allocate with.
+    args : argparse.Namespace
+        The parsed benchmark arguments.
+
+    Returns
+    -------
+    Tuple[List[float], int]
+        The seconds taken by each allocation, and the number of allocations that could not be made.
+    """
+    paradigm = AllocationParadigm.get_from_name(args.paradigm)
+    asset_grouping = AllocationAssetGrouping[args.asset_grouping.upper()]
+    durations, failures = [], 0
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        allocations = _allocate(manager, paradigm, args.job_cpus, args.job_memory, asset_grouping)
+        durations.append(time.perf_counter() - start)
+        if allocations[0] is None:
+            failures += 1
+        else:
+            manager.release_resources(allocations)
+    return durations, failures
+
+
+def run_benchmark(manager_type: type, args: argparse.Namespace):
+    """
+    Benchmark concurrent allocations made by the given type of manager, printing the results.
+
+    Parameters
+    ----------
+    manager_type : type
+        The ::class:`RedisManager` type to benchmark.
+    args : argparse.Namespace
+        The parsed benchmark arguments.
+    """
+    pool_name = "allocation_benchmark_{}".format(uuid4().hex)
+    manager = manager_type(pool_name, redis_host=args.host, redis_port=args.port, redis_pass=args.password)
+    resources = [Resource.factory_init_from_dict({'node_id': "{}-{}".format(pool_name, i),
+                                                  'Hostname': "benchmark-host-{}".format(i), 'Availability': "active",
+                                                  'State': "ready", 'CPUs': args.node_cpus,
+                                                  'MemoryBytes': args.node_memory})
+                 for i in range(args.nodes)]
+    manager.set_resources(resources)
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as executor:
+            results = list(executor.map(lambda _: run_client(manager, args), range(args.clients)))
+        elapsed = time.perf_counter() - start
+
+        durations = sorted(d for client_durations, _ in results for d in client_durations)
+        failures = sum(client_failures for _, client_failures in results)
+        restored = all(r.cpu_count == args.node_cpus and r.memory == args.node_memory for r in manager.get_resources())
+        print("{}: {} allocations in {:.2f}s ({:.1f}/s), mean {:.2f}ms, p95 {:.2f}ms, {} failed, assets restored: {}"
+              .format(manager_type.__name__, len(durations), elapsed, len(durations) / elapsed,
+                      1000 * statistics.mean(durations), 1000 * durations[int(0.95 * (len(durations) - 1))],
+                      failures, restored))
+    finally:
+        manager.redis.delete(manager.resource_pool_key, *[r.unique_id for r in resources])
+        for key in manager.redis.scan_iter("ResourceAllocation{}{}-*".format(manager.keynamehelper.separator,
+                                                                             pool_name)):
+            manager.redis.delete(key)
+
+
+def _handle_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent resource allocation against Redis.")
+    parser.add_argument('--host', default='localhost', help='The Redis host.')
+    parser.add_argument('--port', type=int, default=6379, help='The Redis port.')
+    parser.add_argument('--password', default=None, help='The Redis password.')
+    parser.add_argument('--clients', type=int, default=8, help='The number of concurrently allocating clients.')
+    parser.add_argument('--requests', type=int, default=200, help='The number of allocations made by each client.')
+    parser.add_argument('--nodes', type=int, default=4, help='The number of resources in the pool.')
+    parser.add_argument('--node-cpus', type=int, default=48, help='The number of CPUs on each resource.')
+    parser.add_argument('--node-memory', type=int, default=256 * 1024 ** 3, help='The memory on each resource.')
+    parser.add_argument('--job-cpus', type=int, default=16, help='The number of CPUs in each allocation request.')
+    parser.add_argument('--job-memory', type=int, default=8 * 1024 ** 3, help='The memory in each allocation request.')
+    parser.add_argument('--paradigm', default='fill-nodes', choices=['single-node', 'fill-nodes', 'round-robin'],
+                        help='The allocation paradigm to request.')
+    parser.add_argument('--asset-grouping', default='silo', choices=['bundle', 'silo'],
+                        help='How the assets from each resource are grouped into allocations.')
+    return parser.parse_args()
+
+
+def main():
+    args = _handle_args()
+    for manager_type in (OptimisticRedisManager, RedisManager):
+        run_benchmark(manager_type, args)
+
+
+if __name__ == '__main__':
+    main()
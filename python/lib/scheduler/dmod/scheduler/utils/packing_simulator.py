@@ -0,0 +1,195 @@
+"""
+Simulation comparing how different allocation strategies pack a synthetic queue of jobs onto resources.
+
+A trace of jobs with a mix of small and large requests, Poisson arrivals, and random run times is replayed against an
+in-memory pool of resources once per strategy.  Whenever a job arrives or finishes, queued jobs are allocated by:
+
+    * ``single-node`` / ``fill-nodes``:  the greedy paradigm, trying each queued job in arrival order
+    * ``best-fit-decreasing``:  ::method:`ResourceManager.allocate_best_fit_decreasing`, without backfill
+    * ``best-fit-backfill``:  ::method:`ResourceManager.allocate_best_fit_decreasing`, with backfill
+
+CPU utilization, mean and 95th percentile queue wait, and makespan are then reported for each.
+
+E.g.:
+    python -m dmod.scheduler.utils.packing_simulator --jobs 2000 --nodes 8 --seed 7
+"""
+import argparse
+import heapq
+import random
+import statistics
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from dmod.core.execution import AllocationAssetGrouping
+from ..resources import Resource, ResourceAllocation, ResourceManager
+
+STRATEGIES = ('single-node', 'fill-nodes', 'best-fit-decreasing', 'best-fit-backfill')
+
+
+class SimulatedJob(NamedTuple):
+    job_id: int
+    arrival: float
+    duration: float
+    cpus: int
+    memory: int
+
+
+class InMemoryResourceManager(ResourceManager):
+    """
+    Simple ::class:`ResourceManager` keeping its resources in memory.
+    """
+
+    def __init__(self, resources: Iterable[Resource]):
+        self._resources: Dict[str, Resource] = {}
+        self.set_resources(resources)
+
+    def set_resources(self, resources: Iterable[Resource]):
+        for resource in resources:
+            self._resources[resource.resource_id] = resource
+
+    def get_resources(self) -> List[Resource]:
+        return list(self._resources.values())
+
+    def get_resource_ids(self) -> List[str]:
+        return list(self._resources.keys())
+
+    def allocate_resource(self, resource_id: str, requested_cpus: int, requested_memory: int = 0,
+                          partial: bool = False) -> Optional[ResourceAllocation]:
+        resource = self._resources[resource_id]
+        cpus, memory, is_fully = resource.allocate(requested_cpus, requested_memory)
+        if is_fully or (partial and cpus > 0 and (memory > 0 or requested_memory == 0)):
+            return ResourceAllocation(resource_id, resource.hostname, cpus, memory)
+        resource.release(cpus, memory)
+        return None
+
+    def release_resources(self, allocated_resources: Iterable[ResourceAllocation]):
+        for allocation in allocated_resources:
+            self._resources[allocation.resource_id].release(allocation.cpu_count, allocation.memory)
+
+    def get_available_cpu_count(self) -> int:
+        return sum(r.cpu_count for r in self._resources.values() if r.is_allocatable())
+
+
+def generate_trace(args: argparse.Namespace) -> List[SimulatedJob]:
+    """
+    Generate a synthetic trace of jobs, mostly small but with a share of large, multi-node jobs.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed simulation arguments.
+
+    Returns
+    -------
+    List[SimulatedJob]
+        The jobs, ordered by arrival time.
+    """
+    rand = random.Random(args.seed)
+    jobs, now = [], 0.0
+    memory_per_cpu = args.node_memory // args.node_cpus
+    for job_id in range(args.jobs):
+        now += rand.expovariate(args.arrival_rate)
+        if rand.random() < args.large_fraction:
+            cpus = rand.randint(args.node_cpus // 2, 2 * args.node_cpus)
+        else:
+            cpus = rand.randint(1, args.node_cpus // 4)
+        memory = int(cpus * memory_per_cpu * rand.uniform(0.25, 1.0))
+        jobs.append(SimulatedJob(job_id, now, rand.expovariate(1 / args.mean_duration), cpus, memory))
+    return jobs
+
+
+def _schedule(manager: InMemoryResourceManager, strategy: str, queue: List[SimulatedJob]) -> List[
+        Tuple[SimulatedJob, List[ResourceAllocation]]]:
+    if strategy in ('best-fit-decreasing', 'best-fit-backfill'):
+        results = manager.allocate_best_fit_decreasing([(j.cpus, j.memory) for j in queue],
+                                                       backfill=strategy == 'best-fit-backfill')
+        return [(job, allocs) for job, allocs in zip(queue, results) if allocs[0] is not None]
+    started = []
+    for job in queue:
+        if strategy == 'single-node':
+            allocs = manager.allocate_single_node(job.cpus, job.memory, AllocationAssetGrouping.BUNDLE)
+        else:
+            allocs = manager.allocate_fill_nodes(job.cpus, job.memory, AllocationAssetGrouping.BUNDLE)
+        if allocs[0] is not None:
+            started.append((job, allocs))
+    return started
+
+
+def simulate(strategy: str, trace: List[SimulatedJob], args: argparse.Namespace) -> Dict[str, float]:
+    """
+    Replay a trace of jobs against a fresh pool of resources using the given strategy.
+
+    Parameters
+    ----------
+    strategy : str
+        The name of the allocation strategy, from ::attribute:`STRATEGIES`.
+    trace : List[SimulatedJob]
+        The jobs to replay, ordered by arrival time.
+    args : argparse.Namespace
+        The parsed simulation arguments.
+
+    Returns
+    -------
+    Dict[str, float]
+        The simulation results, keyed by name.
+    """
+    manager = InMemoryResourceManager(
+        Resource.factory_init_from_dict({'node_id': "Node-{:04d}".format(i), 'Hostname': "hostname{}".format(i),
+                                         'Availability': "active", 'State': "ready", 'CPUs': args.node_cpus,
+                                         'MemoryBytes': args.node_memory})
+        for i in range(args.nodes))
+    capacity = args.nodes * args.node_cpus
+    # Jobs that can never fit are left out, since no strategy could run them
+    trace = [j for j in trace if j.cpus <= capacity and j.memory <= args.nodes * args.node_memory]
+
+    # Events are (time, order, job id, job, allocations), with finishing jobs ordered ahead of arrivals at the same time
+    events = [(j.arrival, 1, j.job_id, j, None) for j in trace]
+    heapq.heapify(events)
+    queue: List[SimulatedJob] = []
+    waits, busy_cpu_time, now = [], 0.0, 0.0
+    while events:
+        now, _, _, job, allocations = heapq.heappop(events)
+        if allocations is None:
+            queue.append(job)
+        else:
+            manager.release_resources(allocations)
+        # Handle every event at this instant before scheduling
+        if events and events[0][0] == now:
+            continue
+        for started_job, allocs in _schedule(manager, strategy, queue):
+            queue.remove(started_job)
+            waits.append(now - started_job.arrival)
+            busy_cpu_time += started_job.cpus * started_job.duration
+            heapq.heappush(events, (now + started_job.duration, 0, started_job.job_id, started_job, allocs))
+
+    waits.sort()
+    return {'utilization': busy_cpu_time / (capacity * now), 'mean_wait': statistics.mean(waits),
+            'p95_wait': waits[int(0.95 * (len(waits) - 1))], 'makespan': now, 'unscheduled': len(queue)}
+
+
+def _handle_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simulate packing a synthetic job trace with each allocation strategy.")
+    parser.add_argument('--jobs', type=int, default=1000, help='The number of jobs in the trace.')
+    parser.add_argument('--nodes', type=int, default=8, help='The number of resources in the pool.')
+    parser.add_argument('--node-cpus', type=int, default=48, help='The number of CPUs on each resource.')
+    parser.add_argument('--node-memory', type=int, default=256 * 1024 ** 3, help='The memory on each resource.')
+    parser.add_argument('--arrival-rate', type=float, default=0.5, help='The mean number of job arrivals per second.')
+    parser.add_argument('--mean-duration', type=float, default=60.0, help='The mean job run time in seconds.')
+    parser.add_argument('--large-fraction', type=float, default=0.1, help='The fraction of jobs that are large.')
+    parser.add_argument('--seed', type=int, default=0, help='The random seed for generating the trace.')
+    parser.add_argument('--strategies', nargs='+', default=list(STRATEGIES), choices=STRATEGIES,
+                        help='The allocation strategies to simulate.')
+    return parser.parse_args()
+
+
+def main():
+    args = _handle_args()
+    trace = generate_trace(args)
+    for strategy in args.strategies:
+        results = simulate(strategy, trace, args)
+        print("{:>20}: utilization {:.1%}, mean wait {:.1f}s, p95 wait {:.1f}s, makespan {:.1f}s, {} unscheduled"
+              .format(strategy, results['utilization'], results['mean_wait'], results['p95_wait'],
+                      results['makespan'], results['unscheduled']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,441 @@
+"""
+Benchmark of scheduler throughput, running the real job manager, resource manager, and launcher.
+
+A synthetic trace of job arrivals (see ::func:`generate_trace`) is replayed against a ::class:`RedisBackedJobManager`
+running its usual ::method:`RedisBackedJobManager.manage_job_processing` loop, with a ::class:`RedisManager` for
+resources and a ::class:`Launcher` creating services through a fake Docker client that only simulates API latency.
+Jobs are submitted as ready for allocation, and simple stand-ins do the work of the other services:  moving allocated
+jobs on to scheduling, like the data service, and completing scheduled jobs after their run time, like the monitor.
+
+Reported are the submit-to-allocate and submit-to-schedule latency percentiles, the allocation throughput, and the
+number of Redis commands sent per job by the scheduler, by job submission, and by the stand-in services.  Results can
+also be appended as JSON lines to a file, to track scheduler performance over time.
+
+Either a Redis instance or, with ``--in-process``, an in-process stand-in from the ``fakeredis`` package is used.  Note
+that the scheduler's lock keys are not namespaced, so a Redis instance used by a running deployment should not be used.
+
+E.g.:
+    python -m dmod.scheduler.utils.scheduler_benchmark --in-process --jobs 500 --arrival-rate 20 --seed 7
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from dmod.communication import NWMRequest, SchedulerRequestMessage
+from ..job.job import JobExecPhase, JobExecStep, JobStatus, RequestedJob
+from ..job.job_manager import RedisBackedJobManager
+from ..job.job_util import JobUpdateConflictError
+from ..resources import RedisManager, Resource
+from ..scheduler import Launcher
+from .packing_simulator import SimulatedJob, generate_trace
+
+_KEY_PREFIX = 'benchmark'
+""" The operational mode passed to Redis-backed objects, which also serves as their key prefix. """
+
+
+class RedisCommandCounter:
+    """
+    Counter of the commands sent through the Redis clients attached to it, including those sent in pipelines.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _add(self, count: int):
+        with self._lock:
+            self.count += count
+
+    def attach(self, client):
+        """
+        Start counting the commands sent through the given client, including those sent in pipelines it creates.
+
+        Parameters
+        ----------
+        client
+            The Redis client.
+        """
+        execute_command, pipeline = client.execute_command, client.pipeline
+
+        def counted_execute_command(*args, **kwargs):
+            self._add(1)
+            return execute_command(*args, **kwargs)
+
+        def counted_pipeline(*args, **kwargs):
+            pipe = pipeline(*args, **kwargs)
+            execute, immediate_execute_command = pipe.execute, pipe.immediate_execute_command
+
+            def counted_execute(*a, **k):
+                self._add(len(pipe.command_stack))
+                return execute(*a, **k)
+
+            # Commands made while watching keys are sent right away, rather than queued
+            def counted_immediate_execute_command(*a, **k):
+                self._add(1)
+                return immediate_execute_command(*a, **k)
+
+            pipe.execute = counted_execute
+            pipe.immediate_execute_command = counted_immediate_execute_command
+            return pipe
+
+        client.execute_command = counted_execute_command
+        client.pipeline = counted_pipeline
+
+
+class _FakeService:
+
+    def __init__(self, attrs: dict):
+        self.attrs = attrs
+        self.id = attrs['ID']
+        self.name = attrs['Spec']['Name']
+
+
+class _FakeServiceCollection:
+
+    def __init__(self, create_seconds: float):
+        self._create_seconds = create_seconds
+        self._services: Dict[str, _FakeService] = {}
+        self._lock = threading.Lock()
+
+    def create(self, image: str, name: str, labels: Dict[str, str], constraints: List[str], **kwargs) -> _FakeService:
+        time.sleep(self._create_seconds)
+        service_id = uuid4().hex
+        service = _FakeService({'ID': service_id, 'CreatedAt': datetime.now().isoformat(),
+                                'Spec': {'Name': name, 'Labels': labels,
+                                         'TaskTemplate': {'ContainerSpec': {'Image': image},
+                                                          'Placement': {'Constraints': constraints}}}})
+        with self._lock:
+            self._services[service_id] = service
+        return service
+
+    def get(self, service_id: str) -> _FakeService:
+        with self._lock:
+            return self._services[service_id]
+
+    def list(self, filters: Optional[dict] = None) -> List[_FakeService]:
+        with self._lock:
+            services = list(self._services.values())
+        if filters is not None and 'id' in filters:
+            services = [s for s in services if s.id == filters['id']]
+        if filters is not None and 'name' in filters:
+            services = [s for s in services if s.name.startswith(filters['name'])]
+        return services
+
+
+class _FakeSecretCollection:
+
+    def get(self, secret_name: str):
+        return argparse.Namespace(id=secret_name, name=secret_name)
+
+
+class _FakeAPIClient:
+
+    def __init__(self, services: _FakeServiceCollection):
+        self._services = services
+
+    def inspect_service(self, service: str, insert_defaults: Optional[bool] = None) -> dict:
+        return self._services.get(service).attrs
+
+    def close(self):
+        pass
+
+
+class FakeDockerClient:
+    """
+    Stand-in for a Docker client, supporting what the ::class:`Launcher` needs to create services.
+
+    Services are only recorded, after sleeping for the given time to simulate the latency of the Docker API.
+    """
+
+    def __init__(self, create_seconds: float):
+        self.services = _FakeServiceCollection(create_seconds)
+        self.secrets = _FakeSecretCollection()
+        self.api = _FakeAPIClient(self.services)
+
+    def close(self):
+        pass
+
+
+class BenchmarkLauncher(Launcher):
+    """
+    ::class:`Launcher` that launches every job from the same image, so jobs need no real model configuration.
+    """
+
+    _IMAGE = '127.0.0.1:5000/benchmark:latest'
+
+    def determine_image_for_job(self, job: RequestedJob) -> str:
+        return self._IMAGE
+
+
+class BenchmarkJobManager(RedisBackedJobManager):
+    """
+    ::class:`RedisBackedJobManager` recording when each job is first saved at each exec step.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.saved_at: Dict[Tuple[str, JobExecStep], float] = {}
+        """ The ``perf_counter`` time when each job was first saved at each exec step, keyed by job id and step. """
+
+    def save_job(self, job: RequestedJob):
+        super().save_job(job)
+        self.saved_at.setdefault((str(job.job_id), job.status_step), time.perf_counter())
+
+
+class _InProcessRedisMixin:
+    """
+    Mixin for ::class:`RedisBacked` types, connecting them to an in-process stand-in for Redis instead.
+    """
+
+    _fake_redis_server = None
+
+    @classmethod
+    def _init_redis_client(cls, host: str, port: int, passwd: str, max_attempts: int, db_num: int):
+        import fakeredis
+        if _InProcessRedisMixin._fake_redis_server is None:
+            _InProcessRedisMixin._fake_redis_server = fakeredis.FakeServer()
+        return fakeredis.FakeRedis(server=_InProcessRedisMixin._fake_redis_server, decode_responses=True)
+
+
+def _redis_backed_type(base: type, args: argparse.Namespace) -> type:
+    return type(base.__name__, (_InProcessRedisMixin, base), {}) if args.in_process else base
+
+
+def _create_request(sim_job: SimulatedJob, args: argparse.Namespace) -> SchedulerRequestMessage:
+    model_request = NWMRequest.factory_init_from_deserialized_json(
+        {"model": {"nwm": {"config_data_id": str(sim_job.job_id), "data_requirements": [{"domain": {
+            "data_format": "NWM_CONFIG", "continuous": [],
+            "discrete": [{"variable": "data_id", "values": [str(sim_job.job_id)]}]},
+            "is_input": True, "category": "CONFIG"}]}},
+         "session_secret": uuid4().hex + uuid4().hex})
+    return SchedulerRequestMessage(model_request=model_request, user_id='benchmark', cpus=sim_job.cpus,
+                                   mem=sim_job.memory, allocation_paradigm=args.paradigm)
+
+
+def submit_jobs(job_util: RedisBackedJobManager, trace: List[SimulatedJob], args: argparse.Namespace,
+                submitted_at: Dict[str, float], durations: Dict[str, float]):
+    """
+    Submit the jobs of a trace at their arrival times, recording when each was submitted.
+
+    Jobs are saved already awaiting allocation, as they would be once the data and partitioning services are done.
+
+    Parameters
+    ----------
+    job_util : RedisBackedJobManager
+        The object used to save the jobs.
+    trace : List[SimulatedJob]
+        The jobs to submit, ordered by arrival time.
+    args : argparse.Namespace
+        The parsed benchmark arguments.
+    submitted_at : Dict[str, float]
+        Mapping to which the ``perf_counter`` time each job was submitted is added, keyed by job id.
+    durations : Dict[str, float]
+        Mapping to which the run time of each job is added, keyed by job id.
+    """
+    start = time.perf_counter()
+    for sim_job in trace:
+        delay = sim_job.arrival - (time.perf_counter() - start)
+        if delay > 0:
+            time.sleep(delay)
+        job = RequestedJob.factory_init_from_request(job_request=_create_request(sim_job, args))
+        job.set_job_id(uuid4())
+        job.set_status(JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION))
+        job_id = str(job.job_id)
+        durations[job_id] = sim_job.duration
+        submitted_at[job_id] = time.perf_counter()
+        job_util.save_job(job)
+
+
+def run_stand_in_services(job_manager: RedisBackedJobManager, durations: Dict[str, float],
+                          completed: Dict[str, float], stop: threading.Event, args: argparse.Namespace):
+    """
+    Do the minimal work of the other services for jobs, until stopped.
+
+    Allocated jobs are moved on to scheduling, and scheduled jobs are completed, with their allocations released, once
+    they have been scheduled for their run time.
+
+    Parameters
+    ----------
+    job_manager : RedisBackedJobManager
+        The object used to update jobs and release their allocations, separate from the one being benchmarked.
+    durations : Dict[str, float]
+        The run time of each job, keyed by job id.
+    completed : Dict[str, float]
+        Mapping to which the ``perf_counter`` time each job was completed is added, keyed by job id.
+    stop : threading.Event
+        Event that is set when the stand-ins should stop.
+    args : argparse.Namespace
+        The parsed benchmark arguments.
+    """
+    scheduled_at: Dict[str, float] = {}
+    while not stop.is_set():
+        for job in job_manager.get_jobs_for_exec_step(JobExecStep.AWAITING_DATA):
+            job.set_status_step(JobExecStep.AWAITING_SCHEDULING)
+            try:
+                job_manager.save_job(job)
+            except JobUpdateConflictError:
+                pass
+        now = time.perf_counter()
+        for job in job_manager.get_jobs_for_exec_step(JobExecStep.SCHEDULED):
+            job_id = str(job.job_id)
+            if now - scheduled_at.setdefault(job_id, now) < durations.get(job_id, 0.0):
+                continue
+            job.set_status_step(JobExecStep.COMPLETED)
+            if job_manager.release_allocations(job).success:
+                completed[job_id] = time.perf_counter()
+        stop.wait(args.poll_seconds)
+
+
+async def _run_scheduler(job_manager: BenchmarkJobManager, submitter: RedisBackedJobManager,
+                         stand_in: RedisBackedJobManager, trace: List[SimulatedJob],
+                         args: argparse.Namespace) -> Tuple[Dict[str, float], Dict[str, float]]:
+    submitted_at, durations, completed = {}, {}, {}
+    stop = threading.Event()
+    loop = asyncio.get_running_loop()
+    scheduler_task = asyncio.ensure_future(job_manager.manage_job_processing())
+    stand_in_future = loop.run_in_executor(None, run_stand_in_services, stand_in, durations, completed, stop, args)
+    try:
+        await loop.run_in_executor(None, submit_jobs, submitter, trace, args, submitted_at, durations)
+        deadline = time.perf_counter() + args.timeout
+        while len(completed) < len(trace) and time.perf_counter() < deadline:
+            await asyncio.sleep(args.poll_seconds)
+    finally:
+        stop.set()
+        scheduler_task.cancel()
+        await stand_in_future
+    return submitted_at, completed
+
+
+def _latency_percentiles(submitted_at: Dict[str, float], saved_at: Dict[Tuple[str, JobExecStep], float],
+                         step: JobExecStep) -> Dict[str, float]:
+    latencies = sorted(saved_at[(job_id, step)] - t for job_id, t in submitted_at.items() if (job_id, step) in saved_at)
+    if len(latencies) == 0:
+        return {}
+    return {'p50': latencies[int(0.5 * (len(latencies) - 1))], 'p95': latencies[int(0.95 * (len(latencies) - 1))],
+            'p99': latencies[int(0.99 * (len(latencies) - 1))], 'max': latencies[-1]}
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    """
+    Replay a synthetic trace of jobs through the scheduler, measuring its performance.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed benchmark arguments.
+
+    Returns
+    -------
+    dict
+        The benchmark results, keyed by name.
+    """
+    redis_kwargs = {'redis_host': args.host, 'redis_port': args.port, 'redis_pass': args.password,
+                    'type': _KEY_PREFIX}
+    pool_name = "scheduler_benchmark_{}".format(uuid4().hex)
+    resource_manager_type = _redis_backed_type(RedisManager, args)
+    job_manager_type = _redis_backed_type(RedisBackedJobManager, args)
+
+    resource_manager = resource_manager_type(pool_name, **redis_kwargs)
+    resources = [Resource.factory_init_from_dict({'node_id': "{}-{}".format(pool_name, i),
+                                                  'Hostname': "benchmark-host-{}".format(i), 'Availability': "active",
+                                                  'State': "ready", 'CPUs': args.node_cpus,
+                                                  'MemoryBytes': args.node_memory})
+                 for i in range(args.nodes)]
+    resource_manager.set_resources(resources)
+    launcher = BenchmarkLauncher(None, docker_client=FakeDockerClient(args.service_create_seconds),
+                                 max_launch_workers=args.launch_workers)
+    job_manager = _redis_backed_type(BenchmarkJobManager, args)(resource_manager, launcher,
+                                                                backfill_allocations=args.backfill, **redis_kwargs)
+    submitter = job_manager_type(resource_manager, launcher, **redis_kwargs)
+    stand_in_resource_manager = resource_manager_type(pool_name, **redis_kwargs)
+    stand_in = job_manager_type(stand_in_resource_manager, launcher, **redis_kwargs)
+
+    counters = {'scheduler': RedisCommandCounter(), 'submission': RedisCommandCounter(),
+                'stand_in_services': RedisCommandCounter()}
+    counters['scheduler'].attach(job_manager.redis)
+    counters['scheduler'].attach(resource_manager.redis)
+    counters['submission'].attach(submitter.redis)
+    counters['stand_in_services'].attach(stand_in.redis)
+    counters['stand_in_services'].attach(stand_in_resource_manager.redis)
+
+    capacity = args.nodes * args.node_cpus
+    # Jobs that can never fit are left out, since they would never be allocated
+    trace = [j for j in generate_trace(args) if j.cpus <= capacity and j.memory <= args.nodes * args.node_memory]
+
+    try:
+        start = time.perf_counter()
+        submitted_at, completed = asyncio.run(_run_scheduler(job_manager, submitter, stand_in, trace, args))
+        allocated_at = [t for (_, step), t in job_manager.saved_at.items() if step == JobExecStep.AWAITING_DATA]
+        return {
+            'timestamp': datetime.now().isoformat(), 'jobs': len(trace), 'allocated': len(allocated_at),
+            'scheduled': sum(1 for (_, step) in job_manager.saved_at if step == JobExecStep.SCHEDULED),
+            'completed': len(completed),
+            'allocation_throughput': len(allocated_at) / (max(allocated_at) - start) if allocated_at else 0.0,
+            'submit_to_allocate': _latency_percentiles(submitted_at, job_manager.saved_at, JobExecStep.AWAITING_DATA),
+            'submit_to_schedule': _latency_percentiles(submitted_at, job_manager.saved_at, JobExecStep.SCHEDULED),
+            'redis_commands_per_job': {name: c.count / max(len(trace), 1) for name, c in counters.items()},
+            'args': vars(args)}
+    finally:
+        job_manager._clean_keys(prefix=_KEY_PREFIX)
+        resource_manager.redis.delete(*[r.unique_id for r in resources])
+        for key in resource_manager.redis.scan_iter("ResourceAllocation{}{}-*".format(
+                resource_manager.keynamehelper.separator, pool_name)):
+            resource_manager.redis.delete(key)
+
+
+def _print_results(results: dict):
+    print("{} jobs: {} allocated, {} scheduled, {} completed".format(results['jobs'], results['allocated'],
+                                                                      results['scheduled'], results['completed']))
+    print("allocation throughput: {:.1f} jobs/s".format(results['allocation_throughput']))
+    for name in ('submit_to_allocate', 'submit_to_schedule'):
+        print("{} latency: {}".format(name.replace('_', '-'), ", ".join(
+            "{} {:.1f}ms".format(p, 1000 * v) for p, v in results[name].items())))
+    print("redis commands per job: {}".format(", ".join(
+        "{} {:.1f}".format(name, count) for name, count in results['redis_commands_per_job'].items())))
+
+
+def _handle_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark scheduler throughput on a synthetic job arrival trace.")
+    parser.add_argument('--host', default='localhost', help='The Redis host.')
+    parser.add_argument('--port', type=int, default=6379, help='The Redis port.')
+    parser.add_argument('--password', default=None, help='The Redis password.')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Use an in-process stand-in for Redis (requires the fakeredis package).')
+    parser.add_argument('--jobs', type=int, default=200, help='The number of jobs in the trace.')
+    parser.add_argument('--nodes', type=int, default=8, help='The number of resources in the pool.')
+    parser.add_argument('--node-cpus', type=int, default=48, help='The number of CPUs on each resource.')
+    parser.add_argument('--node-memory', type=int, default=256 * 1024 ** 3, help='The memory on each resource.')
+    parser.add_argument('--arrival-rate', type=float, default=20.0, help='The mean number of job arrivals per second.')
+    parser.add_argument('--mean-duration', type=float, default=1.0, help='The mean job run time in seconds.')
+    parser.add_argument('--large-fraction', type=float, default=0.1, help='The fraction of jobs that are large.')
+    parser.add_argument('--seed', type=int, default=0, help='The random seed for generating the trace.')
+    parser.add_argument('--paradigm', default='best-fit',
+                        choices=['single-node', 'fill-nodes', 'round-robin', 'best-fit'],
+                        help='The allocation paradigm requested by jobs.')
+    parser.add_argument('--backfill', action='store_true', help='Allow backfill when allocating best-fit jobs.')
+    parser.add_argument('--service-create-seconds', type=float, default=0.02,
+                        help='The simulated latency of creating a Docker service.')
+    parser.add_argument('--launch-workers', type=int, default=8, help='The most services the launcher creates at once.')
+    parser.add_argument('--poll-seconds', type=float, default=0.05, help='How often the stand-in services check jobs.')
+    parser.add_argument('--timeout', type=float, default=300.0,
+                        help='The most seconds to wait for jobs to complete after all are submitted.')
+    parser.add_argument('--output', default=None, help='Optional file to append the results to as a JSON line.')
+    return parser.parse_args()
+
+
+def main():
+    args = _handle_args()
+    results = run_benchmark(args)
+    _print_results(results)
+    if args.output is not None:
+        with open(args.output, 'a') as output_file:
+            output_file.write(json.dumps(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
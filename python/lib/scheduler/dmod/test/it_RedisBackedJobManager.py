@@ -2,6 +2,7 @@ import os
 import unittest
 from ..scheduler.job.job import Job, JobStatus, JobExecPhase, JobExecStep, RequestedJob, SchedulerRequestMessage
 from ..scheduler.job.job_manager import RedisBackedJobManager
+from ..scheduler.job.job_util import JobUpdateConflictError
 from ..scheduler.rsa_key_pair import RsaKeyPair
 from . import MockResourceManager, mock_resources
 from dmod.communication import NWMRequest
@@ -337,6 +338,83 @@ class IntegrationTestRedisBackedJobManager(unittest.TestCase):
 
         self.assertEqual(job_ids, active_job_ids)
 
+    # Test repeated loads of active jobs reflect later saves, and modifying loaded jobs doesn't affect later loads
+    def test_get_all_active_jobs_3_a(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+
+        first_loaded_job = self._job_manager.get_all_active_jobs()[0]
+        self.assertEqual(job.to_dict(), first_loaded_job.to_dict())
+
+        first_loaded_job.cpu_count += 100
+        self.assertEqual(job.cpu_count, self._job_manager.get_all_active_jobs()[0].cpu_count)
+
+        job.cpu_count += 50
+        self._job_manager.save_job(job)
+        self.assertEqual(job.cpu_count, self._job_manager.get_all_active_jobs()[0].cpu_count)
+
+    # Test loaded active jobs keep enum property values, whether or not they were loaded before
+    def test_get_all_active_jobs_3_b(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+
+        for loaded_job in (self._job_manager.get_all_active_jobs()[0], self._job_manager.get_all_active_jobs()[0]):
+            self.assertEqual(job.allocation_paradigm, loaded_job.allocation_paradigm)
+            self.assertEqual(job.status, loaded_job.status)
+
+    # Test get_jobs_for_status gets a saved job with that status
+    def test_get_jobs_for_status_1_a(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        jobs = self._job_manager.get_jobs_for_status(job.status)
+        self.assertEqual([job.job_id], [j.job_id for j in jobs])
+
+    # Test get_jobs_for_status no longer gets a saved job once its status has changed
+    def test_get_jobs_for_status_1_b(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        original_status = job.status
+        job.set_status_step(JobExecStep.AWAITING_PARTITIONING)
+        self._job_manager.save_job(job)
+        self.assertEqual([], self._job_manager.get_jobs_for_status(original_status))
+        self.assertEqual([job.job_id], [j.job_id for j in self._job_manager.get_jobs_for_status(job.status)])
+
+    # Test get_jobs_for_status no longer gets a job after it is deleted
+    def test_get_jobs_for_status_1_c(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        self._job_manager.delete_job(job.job_id)
+        self.assertEqual([], self._job_manager.get_jobs_for_status(job.status))
+
+    # Test get_jobs_for_exec_step gets only jobs at that step, highest allocation priority first
+    def test_get_jobs_for_exec_step_1_a(self):
+        jobs = [self._create_example_job_for_index(i) for i in range(3)]
+        for priority, job in zip([1, 3, 2], jobs):
+            job.set_status_step(JobExecStep.AWAITING_ALLOCATION)
+            job.set_allocation_priority(priority)
+            self._job_manager.save_job(job)
+        jobs[0].set_status_step(JobExecStep.AWAITING_PARTITIONING)
+        self._job_manager.save_job(jobs[0])
+
+        found_jobs = self._job_manager.get_jobs_for_exec_step(JobExecStep.AWAITING_ALLOCATION)
+        self.assertEqual([jobs[1].job_id, jobs[2].job_id], [j.job_id for j in found_jobs])
+
+    # Test get_jobs_for_exec_step returns no more than the given limit of jobs
+    def test_get_jobs_for_exec_step_1_b(self):
+        jobs = [self._create_example_job_for_index(i) for i in range(3)]
+        for priority, job in zip([1, 3, 2], jobs):
+            job.set_status_step(JobExecStep.AWAITING_ALLOCATION)
+            job.set_allocation_priority(priority)
+            self._job_manager.save_job(job)
+
+        found_jobs = self._job_manager.get_jobs_for_exec_step(JobExecStep.AWAITING_ALLOCATION, limit=1)
+        self.assertEqual([jobs[1].job_id], [j.job_id for j in found_jobs])
+
     # Test save_job saves a record (i.e., it later exists)
     def test_save_job_1_a(self):
         example_index = 0
@@ -388,6 +466,97 @@ class IntegrationTestRedisBackedJobManager(unittest.TestCase):
         saved_job = self._job_manager.retrieve_job(job.job_id)
         self.assertEqual(job.rsa_key_pair, saved_job.rsa_key_pair)
 
+    def _create_other_job_manager(self) -> RedisBackedJobManager:
+        return RedisBackedJobManager(resource_manager=self._resource_manager, launcher=self._launcher,
+                                     redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                     redis_pass=self.redis_test_pass, type=self._env_type)
+
+    # Test save_job rejects saving a job that was saved elsewhere after it was loaded
+    def test_save_job_3_a(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        other_manager = self._create_other_job_manager()
+        other_job = other_manager.retrieve_job(job.job_id)
+        loaded_job = self._job_manager.retrieve_job(job.job_id)
+        other_job.set_status_step(JobExecStep.AWAITING_ALLOCATION)
+        other_manager.save_job(other_job)
+        loaded_job.cpu_count += 100
+        self.assertRaises(JobUpdateConflictError, self._job_manager.save_job, loaded_job)
+        self.assertEqual(job.cpu_count, self._job_manager.retrieve_job(job.job_id).cpu_count)
+
+    # Test save_job saves changes to a job that was saved elsewhere, once the job is loaded again
+    def test_save_job_3_b(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        other_manager = self._create_other_job_manager()
+        other_job = other_manager.retrieve_job(job.job_id)
+        self._job_manager.retrieve_job(job.job_id)
+        other_manager.save_job(other_job)
+        reloaded_job = self._job_manager.retrieve_job(job.job_id)
+        reloaded_job.cpu_count += 100
+        self._job_manager.save_job(reloaded_job)
+        self.assertEqual(reloaded_job.cpu_count, other_manager.retrieve_job(job.job_id).cpu_count)
+
+    # Test save_job rejects a save made under a lock that expired and was then acquired elsewhere
+    def test_save_job_4_a(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        other_manager = self._create_other_job_manager()
+        self.assertTrue(self._job_manager.lock_active_jobs('lock_1', shard='test'))
+        loaded_job = self._job_manager.retrieve_job(job.job_id)
+        # Simulate the lock expiring
+        self._job_manager.redis.delete(self._job_manager._get_lock_key('test'))
+        self.assertTrue(other_manager.lock_active_jobs('lock_2', shard='test'))
+        loaded_job.cpu_count += 100
+        self.assertRaises(JobUpdateConflictError, self._job_manager.save_job, loaded_job)
+        self.assertFalse(self._job_manager.unlock_active_jobs('lock_1', shard='test'))
+        self.assertTrue(other_manager.unlock_active_jobs('lock_2', shard='test'))
+
+    # Test lock_active_jobs does not acquire a lock on a shard that is already locked
+    def test_lock_active_jobs_1_a(self):
+        other_manager = self._create_other_job_manager()
+        self.assertTrue(self._job_manager.lock_active_jobs('lock_1', shard='test'))
+        self.assertFalse(other_manager.lock_active_jobs('lock_2', shard='test'))
+        self.assertTrue(self._job_manager.unlock_active_jobs('lock_1', shard='test'))
+        self.assertTrue(other_manager.lock_active_jobs('lock_2', shard='test'))
+        self.assertTrue(other_manager.unlock_active_jobs('lock_2', shard='test'))
+
+    # Test lock_active_jobs acquires locks on different shards independently
+    def test_lock_active_jobs_1_b(self):
+        other_manager = self._create_other_job_manager()
+        self.assertTrue(self._job_manager.lock_active_jobs('lock_1', shard='test'))
+        self.assertTrue(other_manager.lock_active_jobs('lock_2', shard='other_test'))
+        self.assertTrue(self._job_manager.unlock_active_jobs('lock_1', shard='test'))
+        self.assertTrue(other_manager.unlock_active_jobs('lock_2', shard='other_test'))
+
+    # Test wait_for_job_event returns once a job is saved
+    def test_wait_for_job_event_1_a(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        self.assertTrue(self._job_manager.wait_for_job_event(timeout=1))
+
+    # Test wait_for_job_event times out when no job is saved, including after earlier events were consumed
+    def test_wait_for_job_event_1_b(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager.save_job(job)
+        self._job_manager.save_job(job)
+        self.assertTrue(self._job_manager.wait_for_job_event(timeout=1))
+        self.assertFalse(self._job_manager.wait_for_job_event(timeout=0.1))
+
+    # Test wait_for_job_event ignores events from the ignored source
+    def test_wait_for_job_event_1_c(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        self._job_manager._job_event_source = 'sweep'
+        self._job_manager.save_job(job)
+        self._job_manager._job_event_source = None
+        self.assertFalse(self._job_manager.wait_for_job_event(timeout=0.1, ignored_source='sweep'))
+
     # Test retrieve_job retrieves the expected Job object
     def test_retrieve_job_1_a(self):
         example_index = 0
@@ -432,6 +432,71 @@ class IntegrationTestRedisManager(unittest.TestCase):
         self.assertEqual(looked_up_resource_2nd.cpu_count, looked_up_resource_2nd.total_cpu_count)
         self.assertEqual(looked_up_resource_2nd.memory, looked_up_resource_2nd.total_memory)
 
+    def test_allocate_resources_1(self):
+        """
+            Test allocating from several resources at once, including more than one allocation from a single resource
+        """
+        self.resource_manager.set_resources(self.mock_resources[0:2])
+        first, second = self.mock_resources[0], self.mock_resources[1]
+        requests = [(first.resource_id, 2, 100), (first.resource_id, 3, 100), (second.resource_id, 10, 500)]
+        allocations = self.resource_manager.allocate_resources(requests)
+
+        self.assertEqual(len(allocations), 3)
+        self.assertEqual([(a.resource_id, a.cpu_count, a.memory) for a in allocations], requests)
+        self.assertEqual([a.hostname for a in allocations], [first.hostname, first.hostname, second.hostname])
+        self.assertEqual(len({a.unique_id for a in allocations}), 3)
+        for allocation in allocations:
+            self.assertEqual(ResourceAllocation.factory_init_from_dict(self.redis.hgetall(allocation.unique_id)),
+                             allocation)
+
+        looked_up_first = Resource.factory_init_from_dict(self.redis.hgetall(first.unique_id))
+        looked_up_second = Resource.factory_init_from_dict(self.redis.hgetall(second.unique_id))
+        self.assertEqual(looked_up_first.cpu_count, 0)
+        self.assertEqual(looked_up_first.memory, first.total_memory - 200)
+        self.assertEqual(looked_up_second.cpu_count, second.total_cpu_count - 10)
+        self.assertEqual(looked_up_second.memory, second.total_memory - 500)
+
+    def test_allocate_resources_1_a(self):
+        """
+            Test that nothing is allocated when any one of several allocations cannot be fulfilled
+        """
+        self.resource_manager.set_resources(self.mock_resources[0:2])
+        first, second = self.mock_resources[0], self.mock_resources[1]
+        requests = [(second.resource_id, 10, 500), (first.resource_id, 3, 100), (first.resource_id, 3, 100)]
+
+        self.assertIsNone(self.resource_manager.allocate_resources(requests))
+        for resource in (first, second):
+            looked_up = Resource.factory_init_from_dict(self.redis.hgetall(resource.unique_id))
+            self.assertEqual(looked_up.cpu_count, resource.total_cpu_count)
+            self.assertEqual(looked_up.memory, resource.total_memory)
+        self.assertEqual(self.redis.keys('ResourceAllocation*'), [])
+
+    def test_allocate_resources_1_b(self):
+        """
+            Test that allocating from an unrecognized resource raises a ValueError
+        """
+        self.resource_manager.set_resources(self.mock_resources[0:1])
+        requests = [(self.mock_resources[0].resource_id, 1, 100), ('Node-9999', 1, 100)]
+        self.assertRaises(ValueError, self.resource_manager.allocate_resources, requests)
+
+    def test_release_resources_2(self):
+        """
+            Test releasing several allocations from several resources at once
+        """
+        self.resource_manager.set_resources(self.mock_resources[0:2])
+        first, second = self.mock_resources[0], self.mock_resources[1]
+        allocations = self.resource_manager.allocate_resources([(first.resource_id, 2, 100),
+                                                                (first.resource_id, 3, 100),
+                                                                (second.resource_id, 10, 500)])
+        self.resource_manager.release_resources(allocations)
+
+        for resource in (first, second):
+            looked_up = Resource.factory_init_from_dict(self.redis.hgetall(resource.unique_id))
+            self.assertEqual(looked_up.cpu_count, resource.total_cpu_count)
+            self.assertEqual(looked_up.memory, resource.total_memory)
+        for allocation in allocations:
+            self.assertFalse(self.redis.exists(allocation.unique_id))
+
     def test_get_available_cpu_count_1(self):
         """
             Test that all available CPUS are reported with 1 resource
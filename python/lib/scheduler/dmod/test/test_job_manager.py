@@ -0,0 +1,80 @@
+import unittest
+from typing import List
+
+from ..scheduler.job import RequestedJob
+from ..scheduler.job.job import JobExecPhase, JobExecStep, JobStatus
+from ..scheduler.job.job_manager import RedisBackedJobManager
+from ..scheduler.resources import Resource, ResourceAllocation
+from .scheduler_test_utils import MockResourceManager, mock_job
+
+
+class MockJobManager(RedisBackedJobManager):
+    """
+    ::class:`RedisBackedJobManager`, strictly for unit testing, that allocates jobs without saving them in Redis.
+    """
+
+    def __init__(self, resource_manager: MockResourceManager):
+        self._resource_manager = resource_manager
+        self._launcher = None
+        self._backfill_allocations = False
+        self.saved_jobs: List[RequestedJob] = []
+
+    def _save_job_if_unchanged(self, job: RequestedJob) -> bool:
+        self.saved_jobs.append(job)
+        return True
+
+
+class TestRedisBackedJobManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.resource_manager = MockResourceManager()
+        self.resource_manager.set_resources([
+            Resource.factory_init_from_dict({'node_id': "Node-0001", 'Hostname': "hostname1", 'Availability': "active",
+                                             'State': "ready", 'CPUs': 4, 'MemoryBytes': 4000000})])
+        self.job_manager = MockJobManager(self.resource_manager)
+
+    def _create_job(self, cpus: int, strategy: str, priority: int) -> RequestedJob:
+        job = mock_job(cpus=cpus, mem=1000, strategy=strategy)
+        job.set_status(JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION))
+        job.set_allocation_priority(priority)
+        return job
+
+    def test__request_prioritized_allocations_1_a(self):
+        """
+        Test that a low priority best-fit job does not take the node a high priority single-node job needs.
+        """
+        high_job = self._create_job(cpus=4, strategy='single_node', priority=101)
+        low_job = self._create_job(cpus=2, strategy='best_fit', priority=10)
+        queues = self.job_manager.build_prioritized_pending_allocation_queues([high_job, low_job])
+
+        allocated = self.job_manager._request_prioritized_allocations(queues)
+
+        self.assertEqual(allocated, [high_job])
+        self.assertIsInstance(high_job.allocations[0], ResourceAllocation)
+        self.assertEqual(high_job.status_step, JobExecStep.AWAITING_DATA)
+        self.assertEqual(low_job.status_step, JobExecStep.AWAITING_ALLOCATION)
+
+    def test__request_prioritized_allocations_1_b(self):
+        """
+        Test that low priority jobs are not allocated while a high priority best-fit job is blocked.
+        """
+        high_job = self._create_job(cpus=8, strategy='best_fit', priority=101)
+        low_job = self._create_job(cpus=2, strategy='single_node', priority=10)
+        queues = self.job_manager.build_prioritized_pending_allocation_queues([high_job, low_job])
+
+        allocated = self.job_manager._request_prioritized_allocations(queues)
+
+        self.assertEqual(allocated, [])
+        self.assertEqual(low_job.status_step, JobExecStep.AWAITING_ALLOCATION)
+
+    def test__request_prioritized_allocations_1_c(self):
+        """
+        Test that low priority jobs are allocated once every high priority job is.
+        """
+        high_job = self._create_job(cpus=2, strategy='single_node', priority=101)
+        low_job = self._create_job(cpus=2, strategy='best_fit', priority=10)
+        queues = self.job_manager.build_prioritized_pending_allocation_queues([high_job, low_job])
+
+        allocated = self.job_manager._request_prioritized_allocations(queues)
+
+        self.assertEqual(allocated, [high_job, low_job])
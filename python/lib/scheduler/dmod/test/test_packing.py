@@ -0,0 +1,87 @@
+import unittest
+
+from dmod.core.execution import AllocationAssetGrouping
+from ..scheduler.resources.packing import get_free_assets, plan_best_fit, plan_best_fit_decreasing
+from ..scheduler.resources.resource import Resource
+
+
+class TestPacking(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.resources = [
+            Resource.factory_init_from_dict({'node_id': "Node-0001", 'Hostname': "hostname1", 'Availability': "active",
+                                             'State': "ready", 'CPUs': 8, 'MemoryBytes': 8000}),
+            Resource.factory_init_from_dict({'node_id': "Node-0002", 'Hostname': "hostname2", 'Availability': "active",
+                                             'State': "ready", 'CPUs': 16, 'MemoryBytes': 16000}),
+            Resource.factory_init_from_dict({'node_id': "Node-0003", 'Hostname': "hostname3", 'Availability': "active",
+                                             'State': "ready", 'CPUs': 4, 'MemoryBytes': 4000})]
+
+    def test_plan_best_fit_1_a(self):
+        """
+        Test that a request that fits on one resource is planned on the resource it fits most tightly.
+        """
+        assets = get_free_assets(self.resources)
+        plan = plan_best_fit(assets, 6, 1000)
+        self.assertEqual(plan, [("Node-0001", 6, 1000)])
+        self.assertEqual(assets["Node-0001"], [2, 7000])
+
+    def test_plan_best_fit_1_b(self):
+        """
+        Test that a request too large for any one resource is split across the fewest resources.
+        """
+        assets = get_free_assets(self.resources)
+        plan = plan_best_fit(assets, 20, 2000)
+        self.assertEqual(plan, [("Node-0002", 16, 1600), ("Node-0003", 4, 400)])
+
+    def test_plan_best_fit_1_c(self):
+        """
+        Test that a request larger than all the resources together is not planned and changes nothing.
+        """
+        assets = get_free_assets(self.resources)
+        self.assertIsNone(plan_best_fit(assets, 40, 1000))
+        self.assertEqual(assets, get_free_assets(self.resources))
+
+    def test_plan_best_fit_1_d(self):
+        """
+        Test that a ``SILO`` plan has single-CPU allocations with an even share of memory.
+        """
+        plan = plan_best_fit(get_free_assets(self.resources), 3, 900, AllocationAssetGrouping.SILO)
+        self.assertEqual(plan, [("Node-0003", 1, 300)] * 3)
+
+    def test_plan_best_fit_decreasing_1_a(self):
+        """
+        Test that larger requests are placed first, so that smaller ones fill in around them.
+        """
+        plans = plan_best_fit_decreasing(self.resources, [(4, 100), (16, 100), (8, 100)])
+        self.assertEqual(plans, [[("Node-0003", 4, 100)], [("Node-0002", 16, 100)], [("Node-0001", 8, 100)]])
+
+    def test_plan_best_fit_decreasing_1_b(self):
+        """
+        Test that requests in a lower tier are placed before larger requests in a higher one.
+        """
+        plans = plan_best_fit_decreasing(self.resources, [(16, 100), (4, 100)], tiers=[1, 0])
+        self.assertEqual(plans, [[("Node-0002", 16, 100)], [("Node-0003", 4, 100)]])
+
+    def test_plan_best_fit_decreasing_2_a(self):
+        """
+        Test that without backfill, nothing is placed after a blocked request.
+        """
+        self.resources[1].allocate(10, 1000)
+        plans = plan_best_fit_decreasing(self.resources, [(20, 100), (2, 100)])
+        self.assertEqual(plans, [None, None])
+
+    def test_plan_best_fit_decreasing_2_b(self):
+        """
+        Test that with backfill, requests after a blocked request are placed only on resources it has not reserved.
+        """
+        self.resources[1].allocate(10, 1000)
+        plans = plan_best_fit_decreasing(self.resources, [(20, 100), (2, 100)], backfill=True)
+        self.assertIsNone(plans[0])
+        self.assertEqual(plans[1], [("Node-0001", 2, 100)])
+
+    def test_plan_best_fit_decreasing_2_c(self):
+        """
+        Test that a request too large for all the resources together does not block others.
+        """
+        plans = plan_best_fit_decreasing(self.resources, [(64, 100), (2, 100)])
+        self.assertEqual(plans, [None, [("Node-0003", 2, 100)]])
@@ -1,8 +1,11 @@
+import docker
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
 from ..scheduler.job import RequestedJob
 from ..scheduler.resources import ResourceAllocation
-from ..scheduler.scheduler import Launcher
+from ..scheduler.scheduler import DockerServiceParameters, Launcher
 from dmod.core.meta_data import TimeRange
 from dmod.communication import NGENRequest, SchedulerRequestMessage
 
@@ -26,6 +29,104 @@ class NoCheckDockerLauncher(Launcher):
         pass
 
 
+class FakeSecretCollection:
+    """
+    Stand-in for a Docker client's secrets collection, with secrets that can be recreated with new ids.
+    """
+
+    def __init__(self, names: List[str]):
+        self.ids: Dict[str, str] = {name: '{}-0'.format(name) for name in names}
+        self.get_count = 0
+
+    def get(self, secret_name: str):
+        self.get_count += 1
+        return SimpleNamespace(id=self.ids[secret_name], name=secret_name)
+
+    def recreate(self, secret_name: str):
+        version = int(self.ids[secret_name].rsplit('-', 1)[-1])
+        self.ids[secret_name] = '{}-{}'.format(secret_name, version + 1)
+
+
+class FakeServiceLauncher(NoCheckDockerLauncher):
+    """
+    Launcher, strictly for unit testing, that only simulates creating services, failing like Docker for unknown secrets.
+    """
+
+    def determine_image_for_job(self, job) -> str:
+        return '127.0.0.1:5000/ngen:latest'
+
+    def _generate_docker_cmd_args(self, job, worker_index: int) -> List[str]:
+        return []
+
+    def create_service(self, serviceParams: DockerServiceParameters, idx: int, docker_cmd_args: List[str]):
+        for secret in serviceParams.secrets:
+            if self.docker_client.secrets.ids[secret['SecretName']] != secret['SecretID']:
+                raise docker.errors.APIError("secret not found: {}".format(secret['SecretID']))
+        return serviceParams.serv_name
+
+
+class TestLauncherSecrets(unittest.TestCase):
+
+    def setUp(self) -> None:
+        time_range = TimeRange.parse_from_string('2022-01-01 00:00:00 to 2022-03-01 00:00:00')
+        request = NGENRequest.factory_init_from_deserialized_json({
+            "allocation_paradigm": "SINGLE_NODE",
+            "cpu_count": 2,
+            "job_type": "ngen",
+            'request_body': {
+                'bmi_config_data_id': '02468',
+                'composite_config_data_id': 'composite02468',
+                'hydrofabric_data_id': '9876543210',
+                'hydrofabric_uid': '0123456789',
+                'realization_config_data_id': '02468',
+                'time_range': time_range.to_dict()
+            },
+            'session_secret': 'f21f27ac3d443c0948aab924bddefc64891c455a756ca77a4d86ec2f697cd13c'
+        })
+        self.jobs = []
+        for i in range(3):
+            job = RequestedJob(SchedulerRequestMessage(model_request=request, user_id='user', cpus=2, mem=1000,
+                                                       allocation_paradigm='SINGLE_NODE'))
+            job.set_allocations([ResourceAllocation('1', 'hostname1', 2, 1000)])
+            self.jobs.append(job)
+
+        self.secrets = FakeSecretCollection(Launcher._OBJECT_STORE_SECRET_NAMES)
+        docker_client = SimpleNamespace(secrets=self.secrets, close=lambda: None)
+        self.launcher = FakeServiceLauncher(images_and_domains_yaml=Path(__file__).parent/"image_and_domain.yaml",
+                                            docker_client=docker_client, api_client=docker_client)
+
+    def tearDown(self) -> None:
+        self.launcher._launch_pool.shutdown()
+
+    def test_start_jobs_1_a(self):
+        """ Test that secrets are looked up only once for several batches of jobs. """
+        results = self.launcher.start_jobs(self.jobs[:2]) + self.launcher.start_jobs(self.jobs[2:])
+        self.assertTrue(all(r[0] for r in results))
+        self.assertEqual(self.secrets.get_count, len(Launcher._OBJECT_STORE_SECRET_NAMES))
+
+    def test_start_jobs_1_b(self):
+        """ Test that jobs fail to start when a secret has been recreated since the references were cached. """
+        self.launcher.start_jobs(self.jobs[:1])
+        self.secrets.recreate(Launcher._OBJECT_STORE_SECRET_NAMES[0])
+        results = self.launcher.start_jobs(self.jobs[1:2])
+        self.assertFalse(results[0][0])
+
+    def test_start_jobs_1_c(self):
+        """ Test that after a job fails to start because a secret was recreated, the next batch of jobs starts. """
+        self.launcher.start_jobs(self.jobs[:1])
+        self.secrets.recreate(Launcher._OBJECT_STORE_SECRET_NAMES[0])
+        self.launcher.start_jobs(self.jobs[1:2])
+        results = self.launcher.start_jobs(self.jobs[2:])
+        self.assertEqual(results, [(True, tuple(self.jobs[2].allocation_service_names))])
+
+    def test_start_job_1_a(self):
+        """ Test that after a job fails to start because a secret was recreated, the next job starts. """
+        self.launcher.start_job(self.jobs[0])
+        self.secrets.recreate(Launcher._OBJECT_STORE_SECRET_NAMES[1])
+        self.assertRaises(docker.errors.APIError, self.launcher.start_job, self.jobs[1])
+        self.assertEqual(self.launcher.start_job(self.jobs[2]), (True, tuple(self.jobs[2].allocation_service_names)))
+
+
 class TestLauncher(unittest.TestCase):
 
     def setUp(self) -> None:
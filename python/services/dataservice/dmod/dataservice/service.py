@@ -15,7 +15,7 @@ from dmod.core.exception import DmodRuntimeError
 from dmod.modeldata.data.object_store_manager import ObjectStoreDatasetManager
 from dmod.modeldata.data.filesystem_manager import FilesystemDatasetManager
 from dmod.scheduler import SimpleDockerUtil
-from dmod.scheduler.job import Job, JobExecStep, JobUtil
+from dmod.scheduler.job import Job, JobExecStep, JobUpdateConflictError, JobUtil
 from pathlib import Path
 from typing import Dict, List, NoReturn, Optional, Set, Tuple, Type, TypeVar, Union
 from uuid import UUID, uuid4
@@ -703,6 +703,9 @@ class RequiredDataChecksManager:
     dataset_inquery_util : DatasetInqueryUtil
         Facilitates dataset detail queries and searches
     """
+    _JOB_LOCK_SHARD = 'data_check'
+    """ The shard of the active jobs lock held while checking data, so other services' updates are not blocked. """
+
     def __init__(
         self,
         job_util: JobUtil,
@@ -731,13 +734,10 @@ class RequiredDataChecksManager:
         logging.debug("Starting task loop for performing checks for required data for jobs.")
         while True:
             lock_id = str(uuid4())
-            while not self._job_util.lock_active_jobs(lock_id):
+            while not self._job_util.lock_active_jobs(lock_id, shard=self._JOB_LOCK_SHARD):
                 await asyncio.sleep(2)
 
-            for job in self._job_util.get_all_active_jobs():
-                if job.status_step != JobExecStep.AWAITING_DATA_CHECK:
-                    continue
-
+            for job in self._job_util.get_jobs_for_exec_step(JobExecStep.AWAITING_DATA_CHECK):
                 logging.debug("Checking if required data is available for job {}.".format(job.job_id))
                 # Check if all requirements for this job can be fulfilled, updating the job's status based on result
                 if await self.perform_checks_for_job(job):
@@ -754,7 +754,7 @@ class RequiredDataChecksManager:
                 except:
                     # TODO: logging would be good, and perhaps maybe retries
                     pass
-            self._job_util.unlock_active_jobs(lock_id)
+            self._job_util.unlock_active_jobs(lock_id, shard=self._JOB_LOCK_SHARD)
             await asyncio.sleep(5)
 
     def _create_output_datasets(self, job: Job):
@@ -958,6 +958,9 @@ class DataProvisionManager:
     provision_underway_tracker: ActiveOperationTracker
         Semaphore-like object for signaling that provisioning is underway
     """
+    _JOB_LOCK_SHARD = 'data_provision'
+    """ The shard of the active jobs lock held while provisioning, so other services' updates are not blocked. """
+
     def __init__(
         self,
         job_util: JobUtil,
@@ -982,13 +985,13 @@ class DataProvisionManager:
         logging.debug("Starting task loop for performing data provisioning for requested jobs.")
         while True:
             lock_id = str(uuid4())
-            while not self._job_util.lock_active_jobs(lock_id):
+            while not self._job_util.lock_active_jobs(lock_id, shard=self._JOB_LOCK_SHARD):
                 await asyncio.sleep(2)
 
             # Get any previously existing dataset users linked to any of the managers
             prior_users: Dict[UUID, DatasetUser] = _get_ds_users(self._managers)
 
-            for job in [j for j in self._job_util.get_all_active_jobs() if j.status_step == JobExecStep.AWAITING_DATA]:
+            for job in self._job_util.get_jobs_for_exec_step(JobExecStep.AWAITING_DATA):
                 logging.debug("Managing provisioning for job {} that is awaiting data.".format(job.job_id))
                 try:
                     # Block temp dataset purging and maintenance while we handle things here
@@ -1010,18 +1013,20 @@ class DataProvisionManager:
                     self._docker_s3fs_helper.init_volumes(job=job)
                 except Exception:
                     job.set_status_step(JobExecStep.DATA_FAILURE)
-                    self._job_util.save_job(job)
-                    continue
+                else:
+                    job.set_status_step(JobExecStep.AWAITING_SCHEDULING)
                 finally:
                     self._provision_underway_tracker.release()
 
-                job.set_status_step(JobExecStep.AWAITING_SCHEDULING)
-                self._job_util.save_job(job)
+                try:
+                    self._job_util.save_job(job)
+                except JobUpdateConflictError as e:
+                    logging.info("Discarding data provisioning update to job {}: {}".format(job.job_id, e))
 
             # Also, unlink usage for any previously existing, job-based users for which the job is no longer active ...
             self._unlink_finished_jobs(ds_users=prior_users)
 
-            self._job_util.unlock_active_jobs(lock_id)
+            self._job_util.unlock_active_jobs(lock_id, shard=self._JOB_LOCK_SHARD)
             await asyncio.sleep(5)
 
     def _unlink_finished_jobs(self, ds_users: Dict[UUID, DatasetUser]) -> Set[UUID]:
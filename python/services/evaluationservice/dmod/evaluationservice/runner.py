@@ -2,10 +2,11 @@
 import typing
 import os
 import sys
-import multiprocessing
 import json
 import signal
 
+from concurrent import futures
+
 from argparse import ArgumentParser
 
 import service
@@ -152,8 +153,8 @@ class JobArguments:
 
 def run_job(
     launch_message: dict,
-    worker_pool: multiprocessing.Pool
-) -> typing.Optional[multiprocessing.pool.AsyncResult]:
+    worker_pool: futures.Executor
+) -> typing.Optional[futures.Future]:
     if launch_message['type'] != 'message':
         # We exit because this isn't a useful message
         return
@@ -185,11 +186,12 @@ def run_job(
             verbosity=launch_parameters.get("verbosity"),
             start_delay=launch_parameters.get("start_delay")
         )
-        worker_pool.apply_async(
+        evaluation = worker_pool.submit(
             worker.evaluate,
-            kwds=arguments.kwargs
+            **arguments.kwargs
         )
         service.info(f"Evaluation for {launch_parameters['evaluation_id']} has been launched.")
+        return evaluation
     elif purpose in ("close", "kill", "terminate"):
         service.info("Exit message received. Closing the runner.")
         sys.exit(0)
@@ -232,7 +234,9 @@ def listen(
             )
             listener = connection.pubsub()
             listener.subscribe(channel)
-            with multiprocessing.Pool(processes=job_limit) as worker_pool:
+            # Unlike those of a multiprocessing.Pool, these processes aren't daemonic, so each evaluation may start
+            # processes of its own when more than one worker is requested through EVALUATION_WORKERS
+            with futures.ProcessPoolExecutor(max_workers=job_limit) as worker_pool:
                 for message in listener.listen():
                     run_job(message, worker_pool)
         except Exception as exception:
@@ -28,6 +28,7 @@ class Arguments(object):
         self.__verbosity: typing.Optional[Verbosity] = None
         self.__start_delay: int = 0
         self.__format: typing.Optional[str] = None
+        self.__workers: typing.Optional[int] = None
         self.__parse_command_line(*args)
 
     @property
@@ -66,6 +67,10 @@ class Arguments(object):
     def format(self):
         return self.__format
 
+    @property
+    def workers(self) -> typing.Optional[int]:
+        return self.__workers
+
     def __parse_command_line(self, *args):
         parser = ArgumentParser("Launches the worker script that starts and tracks an evaluation")
 
@@ -128,6 +133,14 @@ class Arguments(object):
             dest="format"
         )
 
+        parser.add_argument(
+            "--workers",
+            help="The number of processes that may score locations at once",
+            dest="workers",
+            type=int,
+            default=None
+        )
+
         # Parse the list of args if one is passed instead of args passed to the script
         if args:
             args = [str(arg) for arg in args]
@@ -151,6 +164,7 @@ class Arguments(object):
         self.__verbosity = Verbosity[verbosity]
         self.__start_delay = int(parameters.delay) if parameters.delay else 0
         self.__format = parameters.format
+        self.__workers = parameters.workers or int(os.environ.get("EVALUATION_WORKERS", 1))
 
 
 def evaluate(evaluation_id: str, definition_json: str, arguments: Arguments = None) -> dict:
@@ -166,6 +180,8 @@ def evaluate(evaluation_id: str, definition_json: str, arguments: Arguments = No
     else:
         verbosity = Verbosity[os.environ.get("EVALUATION_VERBOSITY", "NORMAL").upper()]
 
+    workers = arguments.workers if arguments else int(os.environ.get("EVALUATION_WORKERS", 1))
+
     should_publish = verbosity >= Verbosity.NORMAL
 
     sleep(delay_seconds)
@@ -205,7 +221,7 @@ def evaluate(evaluation_id: str, definition_json: str, arguments: Arguments = No
     }
 
     try:
-        evaluator = Evaluator(definition, communicators=communicators, verbosity=verbosity)
+        evaluator = Evaluator(definition, communicators=communicators, verbosity=verbosity, workers=workers)
         communicators.info(f"starting {evaluation_id}", publish=should_publish)
         results = evaluator.evaluate()
         communicators.info("Result: {:.2f}%".format(results.grade), publish=should_publish)
@@ -8,6 +8,15 @@ from dmod.monitor import RedisDockerSwarmMonitor
 
 def _handle_args():
     parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('--event-driven',
+                        help='Check jobs as Docker events show they may have changed, rather than only periodically',
+                        dest='event_driven',
+                        action='store_true')
+    parser.add_argument('--reconcile-interval',
+                        help='Set the seconds between checks of all jobs when event driven',
+                        dest='reconcile_interval',
+                        type=float,
+                        default=300)
 
     parser.prog = package_name
     return parser.parse_args()
@@ -98,7 +107,10 @@ def main():
     handler = MonitorService(monitor=monitor)
 
     # Create the additional async task for running the actual monitoring logic
-    handler.add_async_task(handler.exec_monitoring())
+    if args.event_driven:
+        handler.add_async_task(handler.exec_event_monitoring(reconcile_interval=args.reconcile_interval))
+    else:
+        handler.add_async_task(handler.exec_monitoring())
 
     handler.run()
 
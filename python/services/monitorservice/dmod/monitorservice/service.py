@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 from abc import ABC, abstractmethod
-from asyncio import CancelledError, sleep
+from asyncio import CancelledError, Queue, TimeoutError, get_running_loop, sleep, wait_for
 from websockets import WebSocketServerProtocol
 from websockets.exceptions import ConnectionClosed
-from dmod.scheduler.job import Job, JobStatus
+from dmod.scheduler.job import Job, JobStatus, JobUpdateConflictError
 from dmod.communication import MetadataPurpose, MetadataMessage, MetadataResponse, UpdateMessage, UpdateMessageResponse,\
     WebSocketInterface
 from dmod.monitor import Monitor
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Collection, Dict, List, Optional, Set, Tuple
 import json
 import logging
+import time
 import uuid
 
 logging.basicConfig(
@@ -45,8 +46,10 @@ class MonitorService(ABC):
     Core abstract class for monitor service, handling main service logic but abstracting connection details.
 
     The ::method:`exec_monitoring` method can be used to construct an async looping task to continuously monitor (in a
-    poll/sleep manner) for changes.  Alternatively, ::method:`run_monitor_check` can run the logic for monitoring and
-    queueing changes a single time.
+    poll/sleep manner) for changes.  For monitors that can watch for changes as they happen, the
+    ::method:`exec_event_monitoring` method instead constructs a task that checks jobs as soon as they may have changed,
+    while still periodically checking all jobs.  Alternatively, ::method:`run_monitor_check` can run the logic for
+    monitoring and queueing changes a single time.
 
     Connection details are abstracted, but certain things must be done by implementation when handling connections.
     First, details of opening connection and controlling what is monitored should be done over serialized
@@ -67,6 +70,12 @@ class MonitorService(ABC):
     _JOBS_OF_INTEREST_CONFIG_KEY = 'jobs_of_interest'
     """ The config key value for use in metadata messages to indicate the list of jobs of interest. """
 
+    _EVENT_BATCH_DELAY = 0.5
+    """ Seconds to collect further possibly-changed jobs after one is observed, before checking them together. """
+
+    _EVENT_WATCH_RETRY_DELAY = 5
+    """ Seconds to wait before watching for changes again after watching fails. """
+
     @staticmethod
     def _generate_update_msg(monitored_change: MonitoredChange) -> UpdateMessage:
         return UpdateMessage(object_id=str(monitored_change.job.job_id),
@@ -301,6 +310,61 @@ class MonitorService(ABC):
             self.run_monitor_check()
             await sleep(60)
 
+    async def exec_event_monitoring(self, reconcile_interval: float = 300):
+        """
+        Async task monitoring jobs as soon as the monitor observes they may have changed, and queuing monitored changes
+        that are of interest to parties with current connections to the service.
+
+        The ids of possibly changed jobs are read from ::method:`Monitor.watch_changed_job_ids` in a separate thread.
+        Ids observed close together are checked together with ::method:`run_monitor_check`.  All jobs are also checked
+        at the start and then every ``reconcile_interval`` seconds, to reconcile any changes that were not observed.
+
+        Parameters
+        ----------
+        reconcile_interval : float
+            Seconds between checks of all jobs.
+
+        See Also
+        ----------
+        ::method:`exec_monitoring`
+        ::method:`run_monitor_check`
+        """
+        loop = get_running_loop()
+        changed_job_ids: Queue = Queue()
+        is_watching = True
+
+        def forward_changed_job_ids():
+            while is_watching:
+                try:
+                    for job_id in self._monitor.watch_changed_job_ids():
+                        loop.call_soon_threadsafe(changed_job_ids.put_nowait, job_id)
+                except Exception as e:
+                    if is_watching:
+                        logging.error("Failed watching for changed jobs ({}); retrying".format(e))
+                        time.sleep(self._EVENT_WATCH_RETRY_DELAY)
+
+        watcher = loop.run_in_executor(None, forward_changed_job_ids)
+        try:
+            self.run_monitor_check()
+            next_reconcile = loop.time() + reconcile_interval
+            while True:
+                try:
+                    job_id = await wait_for(changed_job_ids.get(), timeout=max(0.0, next_reconcile - loop.time()))
+                except TimeoutError:
+                    self.run_monitor_check()
+                    next_reconcile = loop.time() + reconcile_interval
+                    continue
+                # A single change usually comes with several events, so collect those before checking
+                await sleep(self._EVENT_BATCH_DELAY)
+                job_ids = {job_id}
+                while not changed_job_ids.empty():
+                    job_ids.add(changed_job_ids.get_nowait())
+                self.run_monitor_check(job_ids)
+        finally:
+            is_watching = False
+            self._monitor.stop_watching()
+            await watcher
+
     @abstractmethod
     def get_connection_object(self, connection_id: str):
         """
@@ -374,24 +438,37 @@ class MonitorService(ABC):
         """
         return self._jobs_of_interest_by_connection
 
-    def run_monitor_check(self):
+    def run_monitor_check(self, job_ids: Optional[Collection[str]] = None):
         """
         Run a single check to monitor for jobs that have changed.
 
-        Run a single check monitoring for jobs that have changed, and enqueue such changes for any interested
-        connections.
+        Run a single check monitoring for jobs that have changed, save the changed jobs, and enqueue such changes for
+        any interested connections.
 
-        This is called from within each loop iteration of the async looping ::method:`exec_monitoring` function. It is
-        separated from the async routine for easier testing.
+        This is called from within each loop iteration of the async looping ::method:`exec_monitoring` and
+        ::method:`exec_event_monitoring` functions. It is separated from the async routines for easier testing.
+
+        Parameters
+        ----------
+        job_ids : Optional[Collection[str]]
+            Optional ids of the only jobs to check; by default, all monitored jobs are checked.
 
         See Also
         ----------
         ::method:`exec_monitoring`
+        ::method:`exec_event_monitoring`
         """
         # The are all dicts keyed by the job id value
-        jobs_with_changed_status, original_job_statuses, updated_job_statuses = self._monitor.monitor_jobs()
+        jobs_with_changed_status, original_job_statuses, updated_job_statuses = self._monitor.monitor_jobs(job_ids)
 
         for job_id in jobs_with_changed_status:
+            # Save right away, so things like releasing the job's resources can happen as soon as possible
+            try:
+                self._monitor.save_job(jobs_with_changed_status[job_id])
+            except JobUpdateConflictError as e:
+                # The job changed elsewhere since it was checked, so it will be checked again from its newer state
+                logging.info("Skipping monitored change: {}".format(e))
+                continue
             interested_connections = self._get_interested_connections(job_id)
             # If there are any interested connection, then for each ...
             for connection_id in interested_connections:
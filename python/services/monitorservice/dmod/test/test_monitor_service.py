@@ -1,19 +1,31 @@
+import asyncio
+import queue
+import threading
 import unittest
 import uuid
-from typing import List, Optional, Tuple, Dict
+from typing import Collection, Iterator, List, Optional, Set, Tuple, Dict
 from datetime import datetime
 from dmod.core.execution import AllocationParadigm
 from dmod.core.meta_data import TimeRange, StandardDatasetIndex
 from dmod.communication import NGENRequest, NGENRequestBody
 from ..monitorservice.service import Monitor, MonitorService, Job, JobStatus, MetadataMessage, MetadataPurpose,\
     MonitoredChange, MetadataResponse
-from dmod.scheduler.job import JobExecPhase, JobImpl, JobExecStep
+from dmod.scheduler.job import JobExecPhase, JobImpl, JobExecStep, JobUpdateConflictError
 
 
 class MockMonitor(Monitor):
 
     def __init__(self, monitored_jobs: List[Job] = None):
         self.jobs = monitored_jobs if monitored_jobs else []
+        self.saved_jobs: List[Job] = []
+        """ The jobs passed to ::method:`save_job` without a conflict, in order. """
+        self.conflicting_job_ids: Set[str] = set()
+        """ Ids of jobs for which ::method:`save_job` raises a ::class:`JobUpdateConflictError`. """
+        self.checked_job_ids: List[Optional[Collection[str]]] = []
+        """ The ``job_ids`` argument of each call to ::method:`monitor_jobs`, in order. """
+        self.changed_job_ids: queue.Queue = queue.Queue()
+        """ Ids for ::method:`watch_changed_job_ids` to yield, put there by tests as if observed. """
+        self._stop_event = threading.Event()
 
     @property
     def jobs(self) -> List[Job]:
@@ -58,6 +70,26 @@ class MockMonitor(Monitor):
         self.previous_statuses[job.job_id] = job.status
         return previous, job.status
 
+    def monitor_jobs(self, job_ids: Optional[Collection[str]] = None) -> Tuple[Dict[str, Job], Dict[str, JobStatus],
+                                                                                Dict[str, JobStatus]]:
+        self.checked_job_ids.append(job_ids)
+        return super().monitor_jobs(job_ids)
+
+    def save_job(self, job: Job):
+        if job.job_id in self.conflicting_job_ids:
+            raise JobUpdateConflictError("Job {} changed since it was loaded".format(job.job_id))
+        self.saved_jobs.append(job)
+
+    def stop_watching(self):
+        self._stop_event.set()
+
+    def watch_changed_job_ids(self) -> Iterator[str]:
+        while not self._stop_event.is_set():
+            try:
+                yield self.changed_job_ids.get(timeout=0.01)
+            except queue.Empty:
+                continue
+
 
 class MockMonitorService(MonitorService):
 
@@ -1014,3 +1046,87 @@ class TestMonitorService(unittest.TestCase):
         change = service._dequeue_monitored_change(conn_id)
 
         self.assertEqual(change.original_status, original_status)
+
+    # Test that each changed job is saved
+    def test_run_monitor_check_4_a(self):
+        service = self._services[1]
+        service.run_monitor_check()
+
+        self.assertEqual([j.job_id for j in service._monitor.saved_jobs], self._job_ids)
+
+    # Test that only the given jobs are checked and saved when job ids are given
+    def test_run_monitor_check_4_b(self):
+        service = self._services[1]
+        conn_id = service.register_connection(connection=self, jobs_of_interest=self._job_ids)
+        service.run_monitor_check(job_ids={self._job_ids[1]})
+
+        self.assertEqual([j.job_id for j in service._monitor.saved_jobs], [self._job_ids[1]])
+        self.assertEqual(service._dequeue_monitored_change(conn_id).job.job_id, self._job_ids[1])
+        self.assertIsNone(service._dequeue_monitored_change(conn_id))
+
+    # Test that a job that can't be saved because of a conflict is skipped, without any change being enqueued for it
+    def test_run_monitor_check_4_c(self):
+        service = self._services[1]
+        service._monitor.conflicting_job_ids.add(self._job_ids[0])
+        conn_id = service.register_connection(connection=self, jobs_of_interest=self._job_ids)
+        service.run_monitor_check()
+
+        changed_job_ids = []
+        change = service._dequeue_monitored_change(conn_id)
+        while change is not None:
+            changed_job_ids.append(change.job.job_id)
+            change = service._dequeue_monitored_change(conn_id)
+
+        self.assertEqual([j.job_id for j in service._monitor.saved_jobs], self._job_ids[1:])
+        self.assertEqual(changed_job_ids, self._job_ids[1:])
+
+    # Test that event monitoring checks all jobs at the start, then just the jobs observed to change
+    def test_exec_event_monitoring_1_a(self):
+        service = self._services[1]
+        service._EVENT_BATCH_DELAY = 0
+        monitor: MockMonitor = service._monitor
+
+        async def run_monitoring():
+            task = asyncio.ensure_future(service.exec_event_monitoring(reconcile_interval=3600))
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if len(monitor.saved_jobs) == len(self._jobs):
+                    break
+            job = self._jobs[1]
+            job.set_status(JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.RUNNING))
+            monitor.changed_job_ids.put(job.job_id)
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if len(monitor.saved_jobs) > len(self._jobs):
+                    break
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        asyncio.run(run_monitoring())
+
+        self.assertEqual(monitor.checked_job_ids, [None, {self._job_ids[1]}])
+        self.assertEqual([j.job_id for j in monitor.saved_jobs], self._job_ids + [self._job_ids[1]])
+
+    # Test that event monitoring checks all jobs again once the reconcile interval passes without observed changes
+    def test_exec_event_monitoring_1_b(self):
+        service = self._services[1]
+        monitor: MockMonitor = service._monitor
+
+        async def run_monitoring():
+            task = asyncio.ensure_future(service.exec_event_monitoring(reconcile_interval=0.05))
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if len(monitor.checked_job_ids) >= 2:
+                    break
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        asyncio.run(run_monitoring())
+
+        self.assertEqual(monitor.checked_job_ids[:2], [None, None])
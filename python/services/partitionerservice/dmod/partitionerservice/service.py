@@ -17,7 +17,7 @@ from dmod.core.dataset import Dataset
 from dmod.externalrequests.maas_request_handlers import DataServiceClient
 from dmod.modeldata.hydrofabric import HydrofabricFilesManager
 from dmod.scheduler import SimpleDockerUtil
-from dmod.scheduler.job import Job, JobExecStep, JobUtil
+from dmod.scheduler.job import Job, JobExecStep, JobUpdateConflictError, JobUtil
 from uuid import uuid4
 
 logging.basicConfig(
@@ -45,6 +45,8 @@ class ServiceManager(HydrofabricFilesManager, WebSocketInterface):
 
     _PARSEABLE_REQUEST_TYPES = [PartitionRequest]
     """ Parseable request types, which are all authenticated ::class:`ExternalRequest` subtypes for this implementation. """
+    _JOB_LOCK_SHARD = 'partitioning'
+    """ The shard of the active jobs lock held while partitioning, so only one instance partitions a job. """
 
     @classmethod
     def get_parseable_request_types(cls) -> List[Type[AbstractInitRequest]]:
@@ -483,11 +485,10 @@ class ServiceManager(HydrofabricFilesManager, WebSocketInterface):
         logging.info("Starting partitioner service management loop for job partition generation.")
         while True:
             lock_id = str(uuid4())
-            while not self._job_util.lock_active_jobs(lock_id):
+            while not self._job_util.lock_active_jobs(lock_id, shard=self._JOB_LOCK_SHARD):
                 await asyncio.sleep(2)
 
-            for job in (j for j in self._job_util.get_all_active_jobs() if
-                        j.status_step == JobExecStep.AWAITING_PARTITIONING):
+            for job in self._job_util.get_jobs_for_exec_step(JobExecStep.AWAITING_PARTITIONING):
                 partition_requirements = [r for r in job.data_requirements if
                                           r.domain.data_format == DataFormat.NGEN_PARTITION_CONFIG]
                 assert len(partition_requirements) <= 1
@@ -514,10 +515,12 @@ class ServiceManager(HydrofabricFilesManager, WebSocketInterface):
                 # Protect service task against problems with an individual save attempt
                 try:
                     self._job_util.save_job(job)
+                except JobUpdateConflictError as e:
+                    logging.info(f"Discarding partitioning update to job {job.job_id}: {e!s}")
                 except Exception as e:
                     logging.error(f"Partition service actions were successful for job {job.job_id}, but service could "
                                   f"not save updated job state due to {e.__class__.__name__}: {e!s}")
-            self._job_util.unlock_active_jobs(lock_id)
+            self._job_util.unlock_active_jobs(lock_id, shard=self._JOB_LOCK_SHARD)
             await asyncio.sleep(5)
 
 
@@ -41,6 +41,10 @@ def _handle_args():
                         help='yaml file with a list of resources to use',
                         dest='resource_list_file',
                         default='./resources.yaml')
+    parser.add_argument('--backfill-allocations',
+                        help='Allow best-fit jobs to be allocated behind blocked ones, on resources they do not need',
+                        dest='backfill_allocations',
+                        action='store_true')
     parser.add_argument('--pycharm-remote-debug',
                         help='Activate Pycharm remote debugging support',
                         dest='pycharm_debug',
@@ -163,7 +167,8 @@ def main():
     # TODO: look at handling if the value in args.images_and_domains_yaml doesn't correspond to an actual file
     launcher = Launcher(images_and_domains_yaml=args.images_and_domains_yaml, type="dev")
     # instantiate the job manager
-    job_manager: JobManager = JobManagerFactory.factory_create(resource_manager, launcher, host=redis_host, port=redis_port, redis_pass=redis_pass)
+    job_manager: JobManager = JobManagerFactory.factory_create(resource_manager, launcher, host=redis_host, port=redis_port, redis_pass=redis_pass,
+                                                               backfill_allocations=args.backfill_allocations)
 
     #Instansite the handle_job_request
     handler = SchedulerHandler(job_manager, ssl_dir=Path(args.ssl_dir), port=args.port)
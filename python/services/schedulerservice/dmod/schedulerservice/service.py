@@ -15,7 +15,7 @@ from dmod.communication import AbstractInitRequest, InvalidMessageResponse, Mess
 from dmod.communication.maas_request.job_message import (JobControlAction, JobControlRequest, JobControlResponse,
                                                          JobInfoRequest, JobInfoResponse, JobListRequest,
                                                          JobListResponse)
-from dmod.scheduler.job import Job, JobExecStep, JobManager, JobStatus
+from dmod.scheduler.job import Job, JobExecStep, JobManager, JobStatus, JobUpdateConflictError
 import json
 
 import asyncio
@@ -281,7 +281,13 @@ class SchedulerHandler(WebSocketInterface):
 
         # Save updates if something was actually modified
         if was_modified:
-            self._job_manager.save_job(job)
+            try:
+                self._job_manager.save_job(job)
+            except JobUpdateConflictError as e:
+                response = UpdateMessageResponse(digest=message.digest, object_found=True, success=False,
+                                                 reason='Job Changed Concurrently', response_text=str(e))
+                await websocket.send(str(response))
+                return
         response = UpdateMessageResponse(digest=message.digest, object_found=True, success=True,
                                          reason='Successful Update')
         await websocket.send(str(response))
@@ -5,6 +5,7 @@ import json
 from dmod.modeldata import SubsetDefinition, SubsetHandler
 from pathlib import Path
 from .cli import Cli
+from .files_manager import SubsetServiceFilesManager
 from . import name as package_name
 
 app = flask.Flask(__name__)
@@ -168,9 +169,10 @@ def main():
     nexus_data_path = args.files_directory.joinpath(args.nexus_data_file)
     crosswalk_path = args.files_directory.joinpath(args.crosswalk_file)
 
-    subset_handler = SubsetHandler.factory_create_from_geojson(catchment_data=catchment_data_path,
-                                                               nexus_data=nexus_data_path,
-                                                               cross_walk=crosswalk_path)
+    # Use the cached topology of the hydrofabric for upstream/downstream subsets, when its cache is current
+    files_manager = SubsetServiceFilesManager(catchment_data=catchment_data_path, nexus_data=nexus_data_path,
+                                              cross_walk=crosswalk_path)
+    subset_handler = SubsetHandler.factory_create_from_files_manager(files_manager)
 
     if args.partition_file or args.do_simple_subset or args.do_upstream_subset:
         cli = Cli(catchment_geojson=catchment_data_path, nexus_geojson=nexus_data_path, crosswalk_json=crosswalk_path,
@@ -0,0 +1,74 @@
+from dmod.modeldata.hydrofabric import GeoJsonHydrofabric, Hydrofabric, HydrofabricFilesManager
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class SubsetServiceFilesManager(HydrofabricFilesManager):
+    """
+    Manager of the single GeoJSON hydrofabric from which the service creates subsets.
+
+    Rather than searching a data directory, an instance is given the files of the hydrofabric directly.  It keeps the
+    hydrofabric object once loaded, so the hydrofabric is only loaded once, even when its topology cache is stale and
+    the topology must be obtained from the loaded hydrofabric.
+    """
+
+    def __init__(self, catchment_data: Path, nexus_data: Path, cross_walk: Path):
+        """
+        Initialize this instance.
+
+        Parameters
+        ----------
+        catchment_data : Path
+            The hydrofabric catchment data file.
+        nexus_data : Path
+            The hydrofabric nexus data file.
+        cross_walk : Path
+            The hydrofabric crosswalk file.
+        """
+        self._files: Tuple[Path, Path, Path] = (catchment_data, nexus_data, cross_walk)
+        self._hydrofabric: Optional[Hydrofabric] = None
+        super().__init__()
+
+    def find_hydrofabrics(self, recheck: bool = False):
+        """
+        Initialize the collections for managing the instance's single hydrofabric, from its given files.
+
+        Parameters
+        ----------
+        recheck : bool
+            Whether a full reset of the instance's lists should be performed.
+        """
+        if len(self._hydrofabric_files) > 0 and not recheck:
+            return
+        self._hydrofabric_files.clear()
+        self._hydrofabric_initializers.clear()
+        self._hydrofabric_uids.clear()
+        self._hydrofabric_files.append(self._files)
+        self._hydrofabric_initializers.append(GeoJsonHydrofabric.factory_create_from_data)
+        self._hydrofabric_uids.append(None)
+
+    def get_hydrofabric(self, hf_index: int, discard_cached: bool = False, **kwargs) -> Hydrofabric:
+        """
+        Get the hydrofabric object, loading it only if it has not already been loaded or ``discard_cached`` is set.
+
+        Parameters
+        ----------
+        hf_index : int
+            The lookup index of the hydrofabric.
+        discard_cached : bool
+            Whether an already-loaded hydrofabric object should be discarded and replaced with a newly created one.
+        kwargs
+            Optional keyword args, which are not used.
+
+        Returns
+        -------
+        Hydrofabric
+            The hydrofabric object.
+        """
+        if self._hydrofabric is None or discard_cached:
+            self._hydrofabric = super().get_hydrofabric(hf_index, discard_cached=discard_cached, **kwargs)
+        return self._hydrofabric
+
+    @property
+    def hydrofabric_data_root_dir(self) -> Path:
+        return self._files[0].parent